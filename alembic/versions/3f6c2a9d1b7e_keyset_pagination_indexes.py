@@ -0,0 +1,49 @@
+"""keyset_pagination_indexes
+
+Revision ID: 3f6c2a9d1b7e
+Revises: 8bb1b518a5ae
+Create Date: 2026-10-18 10:12:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6c2a9d1b7e'
+down_revision: Union[str, Sequence[str], None] = '8bb1b518a5ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('protocol_runs', schema=None) as batch_op:
+        batch_op.create_index('ix_protocol_runs_created_at_accession_id', ['created_at', 'accession_id'], unique=False)
+
+    with op.batch_alter_table('function_call_logs', schema=None) as batch_op:
+        batch_op.create_index('ix_function_call_logs_created_at_accession_id', ['created_at', 'accession_id'], unique=False)
+        batch_op.create_index('ix_function_call_logs_protocol_run_accession_id_accession_id', ['protocol_run_accession_id', 'accession_id'], unique=False)
+
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.create_index('ix_asset_reservations_created_at_accession_id', ['created_at', 'accession_id'], unique=False)
+
+    with op.batch_alter_table('schedule_history', schema=None) as batch_op:
+        batch_op.create_index('ix_schedule_history_created_at_accession_id', ['created_at', 'accession_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('schedule_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_schedule_history_created_at_accession_id')
+
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.drop_index('ix_asset_reservations_created_at_accession_id')
+
+    with op.batch_alter_table('function_call_logs', schema=None) as batch_op:
+        batch_op.drop_index('ix_function_call_logs_protocol_run_accession_id_accession_id')
+        batch_op.drop_index('ix_function_call_logs_created_at_accession_id')
+
+    with op.batch_alter_table('protocol_runs', schema=None) as batch_op:
+        batch_op.drop_index('ix_protocol_runs_created_at_accession_id')
@@ -0,0 +1,64 @@
+"""history_retention
+
+Revision ID: 7c1e4b2a9f30
+Revises: 3f6c2a9d1b7e
+Create Date: 2026-10-18 14:03:27.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+from sqlalchemy import Text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b2a9f30'
+down_revision: Union[str, Sequence[str], None] = '3f6c2a9d1b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('schedule_history_rollups',
+    sa.Column('accession_id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('properties_json', sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql'), nullable=True),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('event_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('to_status', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('duration_count', sa.Integer(), nullable=False),
+    sa.Column('duration_total_ms', sa.Integer(), nullable=False),
+    sa.Column('duration_min_ms', sa.Integer(), nullable=True),
+    sa.Column('duration_max_ms', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('accession_id')
+    )
+    with op.batch_alter_table('schedule_history_rollups', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_schedule_history_rollups_accession_id'), ['accession_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_schedule_history_rollups_name'), ['name'], unique=False)
+        batch_op.create_index(batch_op.f('ix_schedule_history_rollups_bucket_start'), ['bucket_start'], unique=False)
+        batch_op.create_index('ix_schedule_history_rollups_bucket_event_status', ['bucket_start', 'event_type', 'to_status'], unique=False)
+
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.create_index('ix_asset_reservations_status_expires_at', ['status', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.drop_index('ix_asset_reservations_status_expires_at')
+
+    with op.batch_alter_table('schedule_history_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ix_schedule_history_rollups_bucket_event_status')
+        batch_op.drop_index(batch_op.f('ix_schedule_history_rollups_bucket_start'))
+        batch_op.drop_index(batch_op.f('ix_schedule_history_rollups_name'))
+        batch_op.drop_index(batch_op.f('ix_schedule_history_rollups_accession_id'))
+
+    op.drop_table('schedule_history_rollups')
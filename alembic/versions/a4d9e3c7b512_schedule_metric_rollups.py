@@ -0,0 +1,211 @@
+"""schedule_metric_rollups
+
+Adds hourly rollups and histograms, and counts the schedule history events
+logged before rollups were maintained, so that every event is covered by its
+hourly and daily rollups from now on.
+
+Revision ID: a4d9e3c7b512
+Revises: 7c1e4b2a9f30
+Create Date: 2026-10-18 16:41:09.318274
+
+"""
+import math
+import uuid
+from datetime import timezone
+from typing import Sequence, Union
+
+import uuid_utils
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy import Text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9e3c7b512'
+down_revision: Union[str, Sequence[str], None] = '7c1e4b2a9f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the rollup rules in effect when this revision was written
+# (praxis.backend.services.schedule_metrics), so that later changes to the
+# application do not change what this migration does.
+HOURLY = 3600
+DAILY = 86400
+BINS_PER_DOUBLING = 4
+QUEUE_WAIT_KEY = 'queue_wait_ms'
+
+# Rollups store enum values; the history table stores enum names.
+EVENT_TYPE_VALUES = {
+    'SCHEDULE_CREATED': 'schedule_created',
+    'SCHEDULED': 'scheduled',
+    'STATUS_CHANGED': 'status_changed',
+    'EXECUTED': 'executed',
+    'COMPLETED': 'completed',
+    'FAILED': 'failed',
+    'CANCELLED': 'cancelled',
+    'RESCHEDULED': 'rescheduled',
+    'CONFLICT': 'conflict',
+    'TIMEOUT': 'timeout',
+    'PARTIAL_COMPLETION': 'partial_completion',
+    'INTERVENTION_REQUIRED': 'intervention_required',
+    'PRIORITY_CHANGED': 'priority_changed',
+    'UNKNOWN': 'unknown',
+}
+STATUS_VALUES = {
+    'QUEUED': 'queued',
+    'RESERVED': 'reserved',
+    'READY_TO_EXECUTE': 'ready_to_execute',
+    'CELERY_QUEUED': 'celery_queued',
+    'EXECUTING': 'executing',
+    'COMPLETED': 'completed',
+    'FAILED': 'failed',
+    'CANCELLED': 'cancelled',
+    'CONFLICT': 'asset_conflict',
+    'TIMEOUT': 'timeout',
+}
+
+
+def _floor_to_bucket(value, bucket_seconds):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if bucket_seconds == DAILY:
+        value = value.replace(hour=0)
+    return value
+
+
+def _histogram_bin(value_ms):
+    if value_ms < 1:
+        return 0
+    return 1 + int(math.log2(value_ms) * BINS_PER_DOUBLING)
+
+
+def _new_rollup():
+    rollup = {'event_count': 0, 'error_count': 0}
+    for measure in ('duration', 'queue_wait'):
+        rollup.update({
+            f'{measure}_count': 0,
+            f'{measure}_total_ms': 0,
+            f'{measure}_min_ms': None,
+            f'{measure}_max_ms': None,
+            f'{measure}_histogram_json': {},
+        })
+    return rollup
+
+
+def _add_measure(rollup, measure, value_ms):
+    if value_ms is None:
+        return
+    value_ms = int(value_ms)
+    rollup[f'{measure}_count'] += 1
+    rollup[f'{measure}_total_ms'] += value_ms
+    for extreme, pick in (('min', min), ('max', max)):
+        current = rollup[f'{measure}_{extreme}_ms']
+        rollup[f'{measure}_{extreme}_ms'] = value_ms if current is None else pick(current, value_ms)
+    histogram = rollup[f'{measure}_histogram_json']
+    bin_key = str(_histogram_bin(value_ms))
+    histogram[bin_key] = histogram.get(bin_key, 0) + 1
+
+
+def _count_event(rollups, event):
+    event_type = EVENT_TYPE_VALUES.get(event.event_type, event.event_type)
+    to_status = STATUS_VALUES.get(event.to_status, event.to_status)
+    queue_wait_ms = (event.event_data_json or {}).get(QUEUE_WAIT_KEY)
+    for bucket_seconds in (HOURLY, DAILY):
+        key = (bucket_seconds, _floor_to_bucket(event.created_at, bucket_seconds), event_type, to_status)
+        rollup = rollups.setdefault(key, _new_rollup())
+        rollup['event_count'] += 1
+        rollup['error_count'] += int(event.error_details is not None)
+        _add_measure(rollup, 'duration', event.override_duration_ms)
+        _add_measure(rollup, 'queue_wait', queue_wait_ms)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('schedule_history_rollups', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('bucket_seconds', sa.Integer(), server_default='86400', nullable=False))
+        batch_op.add_column(sa.Column('duration_histogram_json', sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql'), nullable=True))
+        batch_op.add_column(sa.Column('queue_wait_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('queue_wait_total_ms', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('queue_wait_min_ms', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('queue_wait_max_ms', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('queue_wait_histogram_json', sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql'), nullable=True))
+        batch_op.drop_index('ix_schedule_history_rollups_bucket_event_status')
+        batch_op.create_index('ix_schedule_history_rollups_bucket_event_status', ['bucket_seconds', 'bucket_start', 'event_type', 'to_status'], unique=False)
+
+    _backfill_rollups()
+
+
+def _backfill_rollups() -> None:
+    """Count existing schedule history events into hourly and daily rollups.
+
+    Existing (daily) rollups were written by the retention service for days it
+    compacted, after rebuilding them from all of their events, so events on
+    those days are already counted and are skipped.
+    """
+    history = sa.table(
+        'schedule_history',
+        sa.column('created_at', sa.DateTime()),
+        sa.column('event_type', sa.String()),
+        sa.column('to_status', sa.String()),
+        sa.column('error_details', sa.String()),
+        sa.column('override_duration_ms', sa.Integer()),
+        sa.column('event_data_json', sa.JSON()),
+    )
+    rollups = sa.table(
+        'schedule_history_rollups',
+        sa.column('accession_id', sa.Uuid()),
+        sa.column('bucket_seconds', sa.Integer()),
+        sa.column('bucket_start', sa.DateTime()),
+        sa.column('event_type', sa.String()),
+        sa.column('to_status', sa.String()),
+        *(sa.column(name, sa.Integer()) for name in (
+            'event_count', 'error_count',
+            'duration_count', 'duration_total_ms', 'duration_min_ms', 'duration_max_ms',
+            'queue_wait_count', 'queue_wait_total_ms', 'queue_wait_min_ms', 'queue_wait_max_ms',
+        )),
+        sa.column('duration_histogram_json', sa.JSON()),
+        sa.column('queue_wait_histogram_json', sa.JSON()),
+    )
+
+    bind = op.get_bind()
+    compacted_days = {
+        _floor_to_bucket(day, DAILY)
+        for day in bind.execute(sa.select(rollups.c.bucket_start).distinct()).scalars()
+    }
+    events = bind.execute(
+        sa.select(history).execution_options(yield_per=1000),
+    )
+    counted = {}
+    for event in events:
+        if _floor_to_bucket(event.created_at, DAILY) not in compacted_days:
+            _count_event(counted, event)
+    if counted:
+        op.bulk_insert(rollups, [
+            {
+                'accession_id': uuid.UUID(str(uuid_utils.uuid7())),
+                'bucket_seconds': bucket_seconds,
+                'bucket_start': bucket_start.replace(tzinfo=None),
+                'event_type': event_type,
+                'to_status': to_status,
+                **rollup,
+            }
+            for (bucket_seconds, bucket_start, event_type, to_status), rollup in counted.items()
+        ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM schedule_history_rollups WHERE bucket_seconds = 3600')
+    with op.batch_alter_table('schedule_history_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ix_schedule_history_rollups_bucket_event_status')
+        batch_op.create_index('ix_schedule_history_rollups_bucket_event_status', ['bucket_start', 'event_type', 'to_status'], unique=False)
+        batch_op.drop_column('queue_wait_histogram_json')
+        batch_op.drop_column('queue_wait_max_ms')
+        batch_op.drop_column('queue_wait_min_ms')
+        batch_op.drop_column('queue_wait_total_ms')
+        batch_op.drop_column('queue_wait_count')
+        batch_op.drop_column('duration_histogram_json')
+        batch_op.drop_column('bucket_seconds')
@@ -11,6 +11,7 @@ from starlette.responses import RedirectResponse
 
 from praxis.backend.api import (
   auth,
+  catalog,
   decks,
   discovery,
   execution,
@@ -294,6 +295,13 @@ app.add_middleware(
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],
+  expose_headers=[
+    "ETag",
+    "X-Catalog-Version",
+    "X-Next-Cursor",
+    "X-Total-Count",
+    "X-Total-Count-Estimated",
+  ],
 )
 
 # --- API Router Inclusion ---
@@ -311,6 +319,7 @@ app.include_router(machines.router, prefix="/api/v1/machines", tags=["Machines"]
 app.include_router(discovery.router, prefix="/api/v1/discovery", tags=["Discovery"])
 app.include_router(scheduler.router, prefix="/api/v1/scheduler", tags=["Scheduler"])
 app.include_router(execution.router, prefix="/api/v1/execution", tags=["Execution"])
+app.include_router(catalog.router, prefix="/api/v1/catalog", tags=["Catalog"])
 
 from praxis.backend.api import websockets
 
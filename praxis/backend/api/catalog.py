@@ -0,0 +1,100 @@
+"""Definition catalog snapshot API endpoints.
+
+Lets browser clients seed their local SQLite catalog from a single download
+and keep it current with small patches:
+
+- ``GET /version``: the current catalog version and per-table hashes;
+- ``GET /snapshot``: the catalog as a SQLite file, with the version as ETag;
+- ``GET /delta?since=<version>``: rows changed since a version the client holds.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.api.dependencies import get_db
+from praxis.backend.models.domain.catalog import CatalogDelta, CatalogVersion
+from praxis.backend.services.catalog_snapshot import catalog_snapshots
+
+router = APIRouter()
+
+SNAPSHOT_MEDIA_TYPE = "application/vnd.sqlite3"
+
+
+def _etag(version: str) -> str:
+  return f'"{version}"'
+
+
+def _matches_etag(if_none_match: str | None, version: str) -> bool:
+  if not if_none_match:
+    return False
+  candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+  return any(tag == "*" or tag.strip('"') == version for tag in candidates)
+
+
+@router.get("/version", response_model=CatalogVersion, status_code=status.HTTP_200_OK)
+async def get_catalog_version(
+  db: Annotated[AsyncSession, Depends(get_db)],
+) -> CatalogVersion:
+  """Return the current catalog version with row counts and hashes per table."""
+  snapshot = await catalog_snapshots.current(db)
+  return snapshot.describe()
+
+
+@router.get(
+  "/snapshot",
+  response_class=Response,
+  responses={
+    status.HTTP_200_OK: {"content": {SNAPSHOT_MEDIA_TYPE: {}}},
+    status.HTTP_304_NOT_MODIFIED: {"description": "The client already has this version."},
+  },
+)
+async def get_catalog_snapshot(
+  request: Request,
+  db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+  """Return the definition catalogs as a SQLite database file.
+
+  The response carries the catalog version as its ETag; a request whose
+  ``If-None-Match`` names the current version gets 304. The file is gzipped
+  when the client accepts it.
+  """
+  snapshot = await catalog_snapshots.current(db)
+  headers = {
+    "ETag": _etag(snapshot.version),
+    "X-Catalog-Version": snapshot.version,
+    "Cache-Control": "no-cache",
+    "Vary": "Accept-Encoding",
+  }
+  if _matches_etag(request.headers.get("if-none-match"), snapshot.version):
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+  compressed = "gzip" in request.headers.get("accept-encoding", "")
+  content = await catalog_snapshots.encode(snapshot, compressed=compressed)
+  if compressed:
+    headers["Content-Encoding"] = "gzip"
+  return Response(content=content, media_type=SNAPSHOT_MEDIA_TYPE, headers=headers)
+
+
+@router.get("/delta", response_model=CatalogDelta, status_code=status.HTTP_200_OK)
+async def get_catalog_delta(
+  response: Response,
+  db: Annotated[AsyncSession, Depends(get_db)],
+  since: Annotated[str, Query(description="The catalog version the client holds.")],
+) -> CatalogDelta:
+  """Return the rows upserted and deleted since version ``since``.
+
+  Responds 410 if that version is too old to diff against; the client should
+  then download the full snapshot.
+  """
+  snapshot = await catalog_snapshots.current(db)
+  delta = catalog_snapshots.delta(since, snapshot)
+  if delta is None:
+    raise HTTPException(
+      status_code=status.HTTP_410_GONE,
+      detail=f"Catalog version '{since}' is no longer available; download the snapshot.",
+    )
+  response.headers["ETag"] = _etag(snapshot.version)
+  response.headers["X-Catalog-Version"] = snapshot.version
+  return delta
@@ -0,0 +1,31 @@
+"""Compute executor API endpoints.
+
+Exposes queue depth and timing metrics of the shared executor that runs
+CPU-bound work (simulation, discovery, state reconstruction) off the event loop,
+and hit/miss metrics of the simulation result cache.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, status
+
+from praxis.backend.core.simulation.result_cache import get_simulation_result_cache
+from praxis.backend.utils.compute_executor import get_compute_executor
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_model=dict[str, Any], status_code=status.HTTP_200_OK)
+async def get_compute_metrics() -> dict[str, Any]:
+  """Return running/queued counts and average wait/run times per compute key."""
+  return get_compute_executor().metrics()
+
+
+@router.get(
+  "/simulation-cache/metrics",
+  response_model=dict[str, Any],
+  status_code=status.HTTP_200_OK,
+)
+async def get_simulation_cache_metrics() -> dict[str, Any]:
+  """Return this worker's simulation cache hits/misses and the shared entry count."""
+  return await get_simulation_result_cache().metrics()
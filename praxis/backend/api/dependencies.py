@@ -4,7 +4,7 @@ from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from praxis.backend.core.orchestrator import Orchestrator
 from praxis.backend.core.workcell_runtime import (
@@ -23,6 +23,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     yield session
 
 
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+  """Dependency to get the session factory, for work that outlives the request.
+
+  A streaming response body runs after ``get_db``'s session may already be
+  closed (FastAPI < 0.118 exits yield dependencies before streaming), so it
+  opens its own session from this factory.
+  """
+  return AsyncSessionLocal
+
+
 def get_orchestrator(request: Request) -> Orchestrator:
   """Get orchestrator instance from request state."""
   app = request.app
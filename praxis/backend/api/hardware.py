@@ -7,7 +7,7 @@ managing connections, and interactive hardware control (REPL).
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 
 from praxis.backend.services.hardware_connection_manager import (
@@ -17,24 +17,26 @@ from praxis.backend.services.hardware_connection_manager import (
 from praxis.backend.services.hardware_discovery import (
   ConnectionType,
   DeviceStatus,
-  HardwareDiscoveryService,
+  hardware_discovery,
 )
 from praxis.backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-# Singleton service instance
-_discovery_service = HardwareDiscoveryService()
-
 
 def get_connection_manager(request: Request) -> HardwareConnectionManager:
   """Dependency to get the hardware connection manager.
 
-  Uses the KeyValueStore from application state.
+  Returns the application's long-lived manager (which batches heartbeats and
+  publishes status events) when one was started, otherwise a manager over the
+  KeyValueStore from application state.
   """
+  manager = getattr(request.app.state, "connection_manager", None)
+  if manager is not None:
+    return manager
   kv_store = request.app.state.kv_store
-  return HardwareConnectionManager(kv_store)
+  return HardwareConnectionManager(kv_store, pubsub=getattr(request.app.state, "pubsub", None))
 
 
 # ============================================================================
@@ -180,10 +182,15 @@ class HeartbeatResponse(BaseModel):
   summary="Discover available hardware",
   description="Scan for connected hardware devices including serial ports, USB, network, and simulators.",
 )
-async def discover_hardware() -> DiscoveryResponse:
+async def discover_hardware(
+  refresh: Annotated[
+    bool,
+    Query(description="Scan now instead of answering from the background device table."),
+  ] = False,
+) -> DiscoveryResponse:
   """Discover all available hardware devices."""
   try:
-    devices = await _discovery_service.discover_all()
+    devices = await hardware_discovery.discover_all(refresh=refresh)
 
     # Convert dataclasses to response models
     device_responses = [
@@ -232,7 +239,7 @@ async def discover_hardware() -> DiscoveryResponse:
 )
 async def discover_serial() -> list[DiscoveredDeviceResponse]:
   """Discover serial/USB connected devices."""
-  devices = await _discovery_service.discover_serial_ports()
+  devices = await hardware_discovery.discover_serial_ports()
   return [
     DiscoveredDeviceResponse(
       id=d.id,
@@ -258,7 +265,7 @@ async def discover_serial() -> list[DiscoveredDeviceResponse]:
 )
 async def discover_simulators() -> list[DiscoveredDeviceResponse]:
   """List available simulator backends."""
-  devices = await _discovery_service.discover_simulators()
+  devices = await hardware_discovery.discover_simulators()
   return [
     DiscoveredDeviceResponse(
       id=d.id,
@@ -1,23 +1,153 @@
 """API Endpoints for Outputs and Well Data Outputs."""
 
-from fastapi import APIRouter
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated, Any
+from uuid import UUID
 
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.api.dependencies import get_db, get_db_session_factory
 from praxis.backend.api.utils.crud_router_factory import create_crud_router
 from praxis.backend.models.domain.outputs import (
   FunctionDataOutput,
   FunctionDataOutputCreate,
   FunctionDataOutputRead,
   FunctionDataOutputUpdate,
+  PlateDataAggregate,
+  PlateDataVisualization,
   WellDataOutput,
   WellDataOutputCreate,
   WellDataOutputRead,
   WellDataOutputUpdate,
 )
+from praxis.backend.models.enums import (
+  DataExportFormatEnum,
+  DataOutputTypeEnum,
+  PlateAggregationEnum,
+)
+from praxis.backend.services.output_export import (
+  DEFAULT_EXPORT_CHUNK_SIZE,
+  EXPORT_MEDIA_TYPES,
+  check_export_format_supported,
+  stream_well_data_export,
+)
 from praxis.backend.services.outputs import FunctionDataOutputCRUDService
+from praxis.backend.services.plate_viz import (
+  read_plate_data_aggregate,
+  read_plate_data_visualization,
+)
 from praxis.backend.services.well_outputs import WellDataOutputCRUDService
 
 router = APIRouter()
 
+
+async def _stream_with_own_session(
+  session_factory: async_sessionmaker[AsyncSession],
+  **export_options: Any,
+) -> AsyncIterator[bytes]:
+  async with session_factory() as db:
+    async for chunk in stream_well_data_export(db, **export_options):
+      yield chunk
+
+
+@router.get("/export/well-outputs", tags=["Well Data Outputs"])
+async def export_well_data_outputs(
+  session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_db_session_factory)],
+  *,
+  export_format: Annotated[DataExportFormatEnum, Query(alias="format")] = DataExportFormatEnum.CSV,
+  protocol_run_accession_id: UUID | None = None,
+  plate_resource_accession_id: UUID | None = None,
+  measurement_type: str | None = None,
+  data_type: DataOutputTypeEnum | None = None,
+  date_range_start: datetime | None = None,
+  date_range_end: datetime | None = None,
+  chunk_size: Annotated[int, Query(ge=1, le=100_000)] = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> StreamingResponse:
+  """Stream well data outputs as CSV, JSON lines, Arrow IPC or Parquet.
+
+  Rows are read with a server-side cursor and encoded page by page, so the
+  export runs in constant memory regardless of how many wells it covers. The
+  body is streamed after the request's own session may be closed, so it reads
+  through a session of its own.
+  """
+  try:
+    check_export_format_supported(export_format)
+  except ValueError as e:
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+  chunks = _stream_with_own_session(
+    session_factory,
+    export_format=export_format,
+    chunk_size=chunk_size,
+    protocol_run_accession_id=protocol_run_accession_id,
+    plate_resource_accession_id=plate_resource_accession_id,
+    measurement_type=measurement_type,
+    data_type=data_type,
+    date_range_start=date_range_start,
+    date_range_end=date_range_end,
+  )
+  filename = f"well_data_outputs.{export_format.value}"
+  return StreamingResponse(
+    chunks,
+    media_type=EXPORT_MEDIA_TYPES[export_format],
+    headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+  )
+
+
+@router.get(
+  "/plates/{plate_resource_accession_id}/visualization",
+  response_model=PlateDataVisualization,
+  tags=["Well Data Outputs"],
+)
+async def get_plate_data_visualization(
+  plate_resource_accession_id: UUID,
+  data_type: DataOutputTypeEnum,
+  db: Annotated[AsyncSession, Depends(get_db)],
+  protocol_run_accession_id: UUID | None = None,
+  function_call_log_accession_id: UUID | None = None,
+) -> PlateDataVisualization:
+  """Get the most recent heatmap data for a plate, served from the plate aggregate cache."""
+  visualization = await read_plate_data_visualization(
+    db,
+    plate_resource_accession_id=plate_resource_accession_id,
+    data_type=data_type,
+    protocol_run_accession_id=protocol_run_accession_id,
+    function_call_log_accession_id=function_call_log_accession_id,
+  )
+  if visualization is None:
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No plate data found")
+  return visualization
+
+
+@router.get(
+  "/plates/{plate_resource_accession_id}/aggregate",
+  response_model=PlateDataAggregate,
+  tags=["Well Data Outputs"],
+)
+async def get_plate_data_aggregate(
+  plate_resource_accession_id: UUID,
+  data_type: DataOutputTypeEnum,
+  db: Annotated[AsyncSession, Depends(get_db)],
+  method: PlateAggregationEnum = PlateAggregationEnum.LATEST,
+  protocol_run_accession_id: UUID | None = None,
+  function_call_log_accession_id: UUID | None = None,
+) -> PlateDataAggregate:
+  """Aggregate all timepoints of a plate (latest, mean, min, max or slope) per well."""
+  aggregate = await read_plate_data_aggregate(
+    db,
+    plate_resource_accession_id=plate_resource_accession_id,
+    data_type=data_type,
+    method=method,
+    protocol_run_accession_id=protocol_run_accession_id,
+    function_call_log_accession_id=function_call_log_accession_id,
+  )
+  if aggregate is None:
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No plate data found")
+  return aggregate
+
+
 router.include_router(
   create_crud_router(
     service=FunctionDataOutputCRUDService(FunctionDataOutput),
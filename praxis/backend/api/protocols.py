@@ -7,7 +7,7 @@ including protocol definitions, protocol runs, protocol execution, and simulatio
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
 
 from praxis.backend.api.dependencies import get_db, get_protocol_execution_service
@@ -40,6 +40,8 @@ from praxis.backend.models.domain.simulation import (
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.utils.protocol_serialization import serialize_protocol_function
 from praxis.backend.services.protocols import ProtocolRunService
+from praxis.backend.services.retention import ARCHIVE_MARKER, get_retention_service
+from praxis.backend.utils.compute_executor import run_compute
 
 router = APIRouter()
 
@@ -197,6 +199,77 @@ async def get_protocol_queue(
     ]
 
 
+def _wrap_state(plr_state: dict[str, Any] | None) -> StateSnapshot | None:
+  """Wrap a full PLR state in a StateSnapshot."""
+  if not plr_state:
+    return None
+  transformed = transform_plr_state(plr_state)
+  if not transformed:
+    return None
+  return StateSnapshot(
+    tips=TipStateSnapshot(**transformed["tips"]),
+    liquids=transformed["liquids"],
+    on_deck=transformed["on_deck"],
+    raw_plr_state=transformed["raw_plr_state"],
+  )
+
+
+def build_state_history(
+  run_id: str,
+  protocol_name: str | None,
+  initial_state: dict[str, Any] | None,
+  final_state: dict[str, Any] | None,
+  total_duration_ms: float | None,
+  logs: list[dict[str, Any]],
+) -> StateHistory:
+  """Replay stored state diffs into per-operation snapshots.
+
+  A pure function over plain data so it can run on the compute executor.
+  Each entry of ``logs`` holds the call's sequence index, ID, method name,
+  args, stored before/after state (full or ``_is_diff``), timing and status.
+  """
+  operations = []
+  current_full_state = initial_state or {}
+
+  def reconstruct(current, stored):
+    if not stored:
+      return current
+    if isinstance(stored, dict) and stored.get("_is_diff"):
+      return apply_diff(current, stored.get("diff"))
+    return stored
+
+  for log in logs:
+    # Reconstruct full states before transformation
+    full_state_before = reconstruct(current_full_state, log["state_before"])
+    current_full_state = full_state_before
+
+    full_state_after = reconstruct(current_full_state, log["state_after"])
+    current_full_state = full_state_after
+
+    operations.append(
+      OperationStateSnapshot(
+        operation_index=log["operation_index"],
+        operation_id=log["operation_id"],
+        method_name=log["method_name"],
+        args=log["args"],
+        state_before=_wrap_state(full_state_before),
+        state_after=_wrap_state(full_state_after),
+        timestamp=log["timestamp"],
+        duration_ms=log["duration_ms"],
+        status=log["status"],
+        error_message=log["error_message"],
+      )
+    )
+
+  return StateHistory(
+    run_id=run_id,
+    protocol_name=protocol_name,
+    operations=operations,
+    final_state=_wrap_state(final_state),
+    total_duration_ms=total_duration_ms,
+  )
+
+
 @router.get(
   "/runs/{run_id}/state-history",
   response_model=StateHistory,
@@ -205,9 +278,13 @@ async def get_protocol_queue(
 )
 async def get_run_state_history(
   run_id: UUID,
+  request: Request,
   execution_service: Annotated[ProtocolExecutionService, Depends(get_protocol_execution_service)],
 ) -> StateHistory:
-  """Get granular state history for a protocol run."""
+  """Get granular state history for a protocol run.
+
+  Diff replay and state transformation run on the compute executor.
+  """
   from sqlalchemy import select
   from sqlalchemy.orm import selectinload
   from praxis.backend.models.domain.protocol import FunctionCallLog
@@ -222,67 +299,56 @@ async def get_run_state_history(
     stmt = (
       select(FunctionCallLog)
       .where(FunctionCallLog.protocol_run_accession_id == run_id)
+      .options(selectinload(FunctionCallLog.executed_function_definition))
       .order_by(FunctionCallLog.sequence_in_run.asc())
     )
     result = await db_session.execute(stmt)
-    logs = result.scalars().all()
-
-    # 3. Reconstruct and Map to snapshots
-    operations = []
-    current_full_state = run.initial_state_json or {}
-
-    def reconstruct(current, stored):
-      if not stored:
-        return current
-      if isinstance(stored, dict) and stored.get("_is_diff"):
-        return apply_diff(current, stored.get("diff"))
-      return stored
-
-    for log in logs:
-      # Reconstruct full states before transformation
-      full_state_before = reconstruct(current_full_state, log.state_before_json)
-      current_full_state = full_state_before
-
-      full_state_after = reconstruct(current_full_state, log.state_after_json)
-      current_full_state = full_state_after
-
-      # Helper to wrap full PLR state in StateSnapshot
-      def wrap_state(plr_state):
-        if not plr_state:
-          return None
-        transformed = transform_plr_state(plr_state)
-        if not transformed:
-          return None
-        return StateSnapshot(
-          tips=TipStateSnapshot(**transformed["tips"]),
-          liquids=transformed["liquids"],
-          on_deck=transformed["on_deck"],
-          raw_plr_state=transformed["raw_plr_state"],
-        )
-
-      operations.append(
-        OperationStateSnapshot(
-          operation_index=log.sequence_in_run,
-          operation_id=str(log.accession_id),
-          method_name=log.executed_function_definition.name
+    call_logs = result.scalars().all()
+
+    # Payloads of compacted logs live in the retention archive
+    archived_partitions = {
+      log.properties_json[ARCHIVE_MARKER]
+      for log in call_logs
+      if log.properties_json and ARCHIVE_MARKER in log.properties_json
+    }
+    archived = (
+      await get_retention_service().read_call_payloads(archived_partitions)
+      if archived_partitions
+      else {}
+    )
+
+    logs = []
+    for log in call_logs:
+      payload = archived.get(str(log.accession_id), {})
+      input_args = log.input_args_json or payload.get("input_args_json")
+      logs.append(
+        {
+          "operation_index": log.sequence_in_run,
+          "operation_id": str(log.accession_id),
+          "method_name": log.executed_function_definition.name
           if log.executed_function_definition
           else "unknown",
-          args=log.input_args_json.get("kwargs") if log.input_args_json else {},
-          state_before=wrap_state(full_state_before),
-          state_after=wrap_state(full_state_after),
-          timestamp=log.start_time.isoformat() if log.start_time else None,
-          duration_ms=float(log.duration_ms) if log.duration_ms else None,
-          status=log.status.value.lower() if log.status else "completed",
-          error_message=log.error_message_text,
-        )
+          "args": input_args.get("kwargs") if input_args else {},
+          "state_before": log.state_before_json or payload.get("state_before_json"),
+          "state_after": log.state_after_json or payload.get("state_after_json"),
+          "timestamp": log.start_time.isoformat() if log.start_time else None,
+          "duration_ms": float(log.duration_ms) if log.duration_ms else None,
+          "status": log.status.value.lower() if log.status else "completed",
+          "error_message": log.error_message_text,
+        }
       )
 
-    return StateHistory(
-      run_id=str(run_id),
-      protocol_name=run.protocol_name,
-      operations=operations,
-      final_state=wrap_state(run.final_state_json),
-      total_duration_ms=float(run.duration_ms) if run.duration_ms else None,
+    # 3. Reconstruct and map to snapshots off the event loop
+    return await run_compute(
+      build_state_history,
+      str(run_id),
+      run.protocol_name,
+      run.initial_state_json,
+      run.final_state_json,
+      float(run.duration_ms) if run.duration_ms else None,
+      logs,
+      key="state_history",
+      request=request,
     )
 
 
@@ -303,6 +369,52 @@ router.include_router(
 # =============================================================================
 
 
+@router.get(
+  "/compatibility-matrix",
+  response_model=dict[str, Any],
+  status_code=status.HTTP_200_OK,
+  tags=["Protocol Capability Matching"],
+)
+async def get_compatibility_matrix(
+  db: Annotated[Any, Depends(get_db)],
+  protocol_ids: Annotated[list[UUID] | None, Query()] = None,
+) -> Any:
+  """Return the machines compatible with each protocol in one call.
+
+  Answers from the capability index. When ``protocol_ids`` is omitted, every
+  protocol definition is included.
+  """
+  from sqlalchemy import select
+
+  from praxis.backend.services.capability_index import capability_index
+
+  await capability_index.ensure_loaded(db)
+
+  stmt = select(
+    FunctionProtocolDefinition.accession_id,
+    FunctionProtocolDefinition.hardware_requirements_json,
+  )
+  if protocol_ids:
+    stmt = stmt.where(FunctionProtocolDefinition.accession_id.in_(protocol_ids))
+  rows = (await db.execute(stmt)).all()
+
+  matrix = capability_index.compatibility_matrix(rows)
+  return {
+    "machines": [
+      {
+        "accession_id": str(machine.accession_id),
+        "name": machine.name,
+        "machine_type": machine.machine_type,
+      }
+      for machine in capability_index.machines.values()
+    ],
+    "protocols": {
+      str(protocol_id): sorted(str(machine_id) for machine_id in machine_ids)
+      for protocol_id, machine_ids in matrix.items()
+    },
+  }
+
+
 @router.get(
   "/{accession_id}/compatibility",
   response_model=list[dict[str, Any]],  # TODO: Use proper Pydantic model
@@ -315,13 +427,10 @@ async def get_protocol_compatibility(
 ) -> Any:
   """Check protocol compatibility against all machines.
 
-  Returns a list of compatibility results for each available machine.
+  Returns a list of compatibility results for each available machine, answered
+  from the capability index rather than by loading and matching every machine.
   """
-  from sqlalchemy import select
-  from sqlalchemy.orm import selectinload
-
-  from praxis.backend.models.domain.machine import Machine
-  from praxis.backend.services.capability_matcher import capability_matcher
+  from praxis.backend.services.capability_index import capability_index
 
   # 1. Fetch protocol
   protocol = await db.get(FunctionProtocolDefinition, accession_id)
@@ -331,34 +440,22 @@ async def get_protocol_compatibility(
       detail=f"Protocol {accession_id} not found",
     )
 
-  # 2. Fetch all machines with definitions
-  stmt = select(Machine).options(selectinload(Machine.definition))
-  result = await db.execute(stmt)
-  machines = result.scalars().all()
-
-  # 3. Match
-  machine_tuples = [(m, m.definition) for m in machines]
-
-  results = capability_matcher.find_compatible_machines(protocol, machine_tuples)
-
-  # 4. Format response
-  # Note: CapabilityMatchResult is a Pydantic model, so we can return it directly if we want
-  # But we also want to return the machine details for the UI.
-  response = []
-  for machine, match_result in results:
-    response.append(
-      {
-        "machine": {
-          "accession_id": str(machine.accession_id),
-          "name": machine.name,
-          "machine_type": machine.definition.plr_category if machine.definition else "unknown",
-          # Add other machine details as needed
-        },
-        "compatibility": match_result.model_dump(),
-      }
-    )
+  # 2. Match against the indexed machine capabilities
+  await capability_index.ensure_loaded(db)
+  results = capability_index.match(protocol.accession_id, protocol.hardware_requirements_json)
 
-  return response
+  # 3. Format response
+  return [
+    {
+      "machine": {
+        "accession_id": str(machine.accession_id),
+        "name": machine.name,
+        "machine_type": machine.machine_type,
+      },
+      "compatibility": match_result.model_dump(),
+    }
+    for machine, match_result in results
+  ]
 
 
 # =============================================================================
@@ -410,6 +507,11 @@ class SimulationResponse(BaseModel):
   )
 
 
+def replay_graph(graph_dict: dict[str, Any]) -> GraphReplayResult:
+  """Replay a computation graph; module-level so process pools can pickle it."""
+  return GraphReplayEngine().replay(graph_dict)
+
+
 @router.post(
   "/definitions/{accession_id}/simulate",
   response_model=SimulationResponse,
@@ -418,6 +520,7 @@ class SimulationResponse(BaseModel):
 )
 async def simulate_protocol(
   accession_id: UUID,
+  http_request: Request,
   request: SimulationRequest | None = None,
   db: Annotated[Any, Depends(get_db)] = None,
 ) -> SimulationResponse:
@@ -463,10 +566,11 @@ async def simulate_protocol(
       replay_mode="graph",
     )
 
-  # Run graph replay
+  # Run graph replay on the compute executor
   try:
-    engine = GraphReplayEngine()
-    result: GraphReplayResult = engine.replay(graph_dict)
+    result: GraphReplayResult = await run_compute(
+      replay_graph, graph_dict, key="simulation", request=http_request
+    )
 
     # Convert violations to response format
     violations = [
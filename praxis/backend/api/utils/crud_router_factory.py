@@ -3,13 +3,18 @@
 from typing import Annotated, Any, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from praxis.backend.api.dependencies import get_db
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.services.utils.crud_base import CRUDBase
+from praxis.backend.services.utils.query_builder import (
+  encode_keyset_cursor,
+  is_keyset_pagination,
+  validate_pagination,
+)
 from praxis.backend.utils.db import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -48,10 +53,28 @@ def create_crud_router(
 
   @router.get(prefix, response_model=list[read_schema], tags=tags)  # type: ignore[invalid-type-form]
   async def get_multi(
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     filters: Annotated[SearchFilters, Depends()],
   ) -> list[ModelType]:
-    return await service.get_multi(db, filters=filters)
+    try:
+      validate_pagination(filters)
+    except ValueError as e:
+      raise HTTPException(status_code=400, detail=str(e)) from e
+
+    items = await service.get_multi(db, filters=filters)
+
+    if is_keyset_pagination(filters) and items and len(items) >= filters.limit:
+      response.headers["X-Next-Cursor"] = encode_keyset_cursor(items[-1], filters.sort_by)
+    if filters.count != "none":
+      total, is_estimate = await service.count(
+        db,
+        filters=filters,
+        estimated=filters.count == "estimated",
+      )
+      response.headers["X-Total-Count"] = str(total)
+      response.headers["X-Total-Count-Estimated"] = "true" if is_estimate else "false"
+    return items
 
   @router.get(f"{prefix}{sep}{{accession_id}}", response_model=read_schema, tags=tags)
   async def get(
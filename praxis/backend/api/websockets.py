@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from praxis.backend.services.hardware_connection_manager import EVENTS_CHANNEL
+
 if TYPE_CHECKING:
   from praxis.backend.core.orchestrator import Orchestrator
   from praxis.backend.services.mock_data_generator import MockTelemetryService
@@ -40,7 +42,9 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
       # Fetch current status
       try:
         # get_protocol_run_status returns a dict with keys like 'status', 'progress', 'logs', etc.
-        status_info = await orchestrator.protocol_run_service.get_protocol_run_status(run_uuid)
+        status_info = await orchestrator.protocol_run_service.get_protocol_run_status(
+          run_uuid, progress_store=orchestrator.state_store
+        )
 
         # Prepare message payload
         current_status = status_info.get("status")
@@ -68,7 +72,10 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
         await websocket.send_json(
           {
             "type": "progress",
-            "payload": {"progress": current_progress},
+            "payload": {
+              "progress": current_progress,
+              "estimate": status_info.get("progress_estimate"),
+            },
             "timestamp": str(asyncio.get_event_loop().time()),
           }
         )
@@ -159,3 +166,54 @@ async def websocket_endpoint(websocket: WebSocket, run_id: str):
     logger.error(f"WebSocket error: {e}")
     with contextlib.suppress(builtins.BaseException):
       await websocket.close(code=1011)
+
+
+@router.websocket("/hardware/connections")
+async def hardware_connections_endpoint(websocket: WebSocket):
+  """Stream hardware connection status transitions as they are published.
+
+  Sends the current connections first, then one "connection_event" message per
+  transition (connecting, connected, error, disconnected or expired). The
+  socket is read concurrently so that a client leaving ends the stream at once
+  rather than at the next event; the stream ending (the pub/sub closing at
+  shutdown) closes the socket.
+  """
+  await websocket.accept()
+  manager = getattr(websocket.app.state, "connection_manager", None)
+  pubsub = getattr(websocket.app.state, "pubsub", None)
+  if manager is None or pubsub is None:
+    await websocket.close(code=1011)
+    return
+
+  subscription = pubsub.subscribe(EVENTS_CHANNEL)
+
+  async def stream_events() -> None:
+    connections = await manager.list_connections()
+    await websocket.send_json(
+      {
+        "type": "connections",
+        "payload": [state.to_dict() for state in connections],
+      }
+    )
+    async for event in subscription:
+      await websocket.send_json({"type": "connection_event", "payload": event})
+
+  async def wait_for_disconnect() -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+      pass
+
+  stream = asyncio.create_task(stream_events())
+  receiver = asyncio.create_task(wait_for_disconnect())
+  try:
+    with contextlib.suppress(WebSocketDisconnect):
+      done, _ = await asyncio.wait({stream, receiver}, return_when=asyncio.FIRST_COMPLETED)
+      for task in done:
+        task.result()
+      if stream in done:
+        await websocket.close(code=1001)
+  finally:
+    for task in (stream, receiver):
+      task.cancel()
+    await asyncio.gather(stream, receiver, return_exceptions=True)
+    await subscription.unsubscribe()
+  logger.info("Hardware connection event stream disconnected")
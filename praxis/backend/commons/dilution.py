@@ -11,6 +11,8 @@ from praxis.utils.sanitation import (
 from pylabrobot.liquid_handling import LiquidHandler
 from pylabrobot.resources import Plate, TipRack, Well
 
+from .transfer_planning import TransferPlan, execute_transfer_plan, plan_transfers
+
 
 async def dilution_checks(
   n_dilutions: int,
@@ -172,8 +174,59 @@ async def optimal_dilution_transfer(
   dilution_tip_rack: TipRack,
   mix_cycles: int = 10,
   source_volumes: float | list[float] | None = None,
-):
-  pass
+) -> TransferPlan:
+  """Transfers a dilution step from source wells to target wells in parallel batches.
+
+  Each source well gives ``source_volume / dilution_factor`` to the target well at the same
+  position in ``target_wells``. Transfers are batched across channels, or onto the 96 head
+  when a whole plate is diluted at once, and a well that is both a target and a later
+  source is only read after it has been filled.
+
+  Args:
+    liquid_handler: LiquidHandler object
+    source_plate: Plate with the source wells
+    target_plate: Plate with the target wells
+    dilution_factor: Factor by which to dilute
+    source_wells: Indices of the wells in the source plate
+    target_wells: Indices of the wells in the target plate
+    dilution_tip_rack: TipRack to take tips from
+    mix_cycles: Number of mixing cycles after each dispense
+    source_volumes: Volume in the source wells. If None, will transfer the total well volume \
+      divided by the dilution factor.
+
+  Returns:
+    TransferPlan: The executed plan.
+
+  Raises:
+    ValueError: If the well lists differ in length or the dilution factor is not above 1.
+
+  """
+  if len(source_wells) != len(target_wells):
+    msg = "Source and target wells must have the same length."
+    raise ValueError(msg)
+  if dilution_factor <= 1:
+    msg = "Dilution factor must be greater than 1."
+    raise ValueError(msg)
+  sources = [source_plate.get_item(index) for index in source_wells]
+  targets = [target_plate.get_item(index) for index in target_wells]
+  if source_volumes is None:
+    volumes = [well.max_volume for well in sources]
+  elif isinstance(source_volumes, list):
+    volumes = source_volumes
+  else:
+    volumes = [source_volumes] * len(sources)
+  if len(volumes) != len(sources):
+    msg = "Source volumes must match the number of source wells."
+    raise ValueError(msg)
+  plan = plan_transfers(
+    [
+      (source, target, volume / dilution_factor)
+      for source, target, volume in zip(sources, targets, volumes, strict=True)
+    ],
+    num_channels=liquid_handler.backend.num_channels,
+  )
+  await execute_transfer_plan(liquid_handler, plan, [dilution_tip_rack], mix_cycles=mix_cycles)
+  return plan
 
 
 @liquid_handler_setup_check
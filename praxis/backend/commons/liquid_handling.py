@@ -19,6 +19,8 @@ from pylabrobot.resources import (
   Well,
 )
 
+from .transfer_planning import TransferPlan, execute_transfer_plan, plan_transfers
+
 
 async def split_along_columns(resources: list[Container]) -> list[list[Resource]]:
   """Splits a list of resources into sublists based on their column indices.
@@ -236,5 +238,68 @@ async def transfer_with_mixing96(
     await liquid_handler.drop_tips(tip_spots=transfer_tips)
 
 
-async def fast_optimal_transfer():
-  pass
+@liquid_handler_setup_check
+async def fast_optimal_transfer(
+  liquid_handler: LiquidHandler,
+  sources: Container | list[Container],
+  targets: Container | list[Container],
+  volumes: float | list[float],
+  tip_racks: TipRack | list[TipRack],
+  return_tips: bool = False,
+  mix_cycles: int = 0,
+  use_96_head: bool = True,
+) -> TransferPlan:
+  """Transfers liquid using as few channel-parallel batches as possible.
+
+  Transfers are grouped so that sources in one plate column and targets in one plate column
+  run on neighbouring channels together, full-plate transfers use the 96 head, and transfers
+  that depend on each other keep their order. Every transfer uses a fresh tip.
+
+  Args:
+    liquid_handler (LiquidHandler): The liquid handler object used for the transfer.
+    sources (Container | list[Container]): The source container(s). A single container is
+      used for every target.
+    targets (Container | list[Container]): The target container(s). A single container
+      receives from every source.
+    volumes (float | list[float]): The volume(s) of liquid to transfer.
+    tip_racks (TipRack | list[TipRack]): Fresh tip racks to take tips from.
+    return_tips (bool, optional): Whether to return the tips after the transfer. Defaults to
+      False.
+    mix_cycles (int, optional): Number of mixing cycles after each dispense. Defaults to 0.
+    use_96_head (bool, optional): Whether full-plate transfers may use the 96 head. Defaults
+      to True.
+
+  Returns:
+    TransferPlan: The executed plan, including the estimated time saved.
+
+  Raises:
+    ValueError: If the lengths of sources, targets and volumes cannot be matched.
+    ValueError: If the tip racks do not hold enough tips.
+
+  """
+  sources = sources if isinstance(sources, list) else [sources]
+  targets = targets if isinstance(targets, list) else [targets]
+  volumes = volumes if isinstance(volumes, list) else [volumes]
+  tip_racks = tip_racks if isinstance(tip_racks, list) else [tip_racks]
+  n_transfers = max(len(sources), len(targets), len(volumes))
+  if any(len(items) not in (1, n_transfers) for items in (sources, targets, volumes)):
+    msg = "Sources, targets and volumes must have the same length or a single item."
+    raise ValueError(msg)
+  transfers = [
+    (
+      sources[i if len(sources) > 1 else 0],
+      targets[i if len(targets) > 1 else 0],
+      float(volumes[i if len(volumes) > 1 else 0]),
+    )
+    for i in range(n_transfers)
+  ]
+  plan = plan_transfers(
+    transfers,
+    num_channels=liquid_handler.backend.num_channels,
+    max_volume=tip_racks[0].get_item(0).make_tip().maximal_volume,
+    use_96_head=use_96_head,
+  )
+  await execute_transfer_plan(
+    liquid_handler, plan, tip_racks, return_tips=return_tips, mix_cycles=mix_cycles,
+  )
+  return plan
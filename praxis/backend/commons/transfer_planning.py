@@ -0,0 +1,455 @@
+"""Plan arbitrary liquid transfers as channel-parallel batches.
+
+Cherry-picking and reformatting protocols usually come down to a list of
+``(source, target, volume)`` transfers. Issued one at a time they use a single
+channel of an 8-channel head and one tip pickup per transfer. ``plan_transfers``
+groups them into batches that the head can execute together:
+
+- Transfers whose sources sit in one column of one plate and whose targets sit
+  in one column of one plate are batched onto consecutive channels, as long as
+  both sides keep the rows in the same order and at least ``channel_spacing``
+  apart (the minimum channel pitch).
+- Identity transfers that cover every well of one 96-well plate into another
+  with the same volume are promoted to a single 96-head operation.
+- Transfers that depend on each other (reading a well an earlier transfer
+  dispensed into, or dispensing into a well an earlier transfer reads from)
+  are kept in order, so serial dilutions stay correct.
+
+``transfer_plan_operations`` turns a plan into liquid handler calls, assigning
+tips from the given racks, and ``execute_transfer_plan`` runs those calls on any
+object with the ``LiquidHandler`` method names: a real liquid handler, one with
+the chatterbox backend, or a ``StatefulTracedMachine`` for validation.
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from pylabrobot.liquid_handling.standard import Mix
+from pylabrobot.resources import Container, Plate, TipRack, TipSpot
+
+DEFAULT_NUM_CHANNELS = 8
+DEFAULT_CHANNEL_SPACING_MM = 9.0
+DEFAULT_MIX_FLOW_RATE = 100.0
+_HEAD96_WELLS = 96
+_COORDINATE_TOLERANCE_MM = 0.1
+_MOVES_PER_BATCH = 4  # tip rack, source, target, tip drop
+
+
+@dataclass(frozen=True)
+class Transfer:
+  """A single liquid transfer from one container to another."""
+
+  source: Container
+  target: Container
+  volume: float
+
+
+@dataclass
+class TransferBatch:
+  """Transfers executed together by one tip pickup."""
+
+  kind: Literal["channels", "head96"]
+  transfers: list[Transfer]
+
+  @property
+  def sources(self) -> list[Container]:
+    """Source containers, in channel order."""
+    return [t.source for t in self.transfers]
+
+  @property
+  def targets(self) -> list[Container]:
+    """Target containers, in channel order."""
+    return [t.target for t in self.transfers]
+
+  @property
+  def volumes(self) -> list[float]:
+    """Volumes, in channel order."""
+    return [t.volume for t in self.transfers]
+
+
+@dataclass(frozen=True)
+class TransferTiming:
+  """Rough per-step durations used to estimate plan run time, in seconds."""
+
+  tip_pickup_s: float = 6.0
+  aspirate_s: float = 4.0
+  dispense_s: float = 4.0
+  tip_drop_s: float = 5.0
+  head_move_s: float = 2.0
+
+  @property
+  def batch_s(self) -> float:
+    """Time for one pickup, aspirate, dispense and drop, including moves."""
+    return (
+      self.tip_pickup_s
+      + self.aspirate_s
+      + self.dispense_s
+      + self.tip_drop_s
+      + _MOVES_PER_BATCH * self.head_move_s
+    )
+
+
+@dataclass
+class TransferPlan:
+  """Batched transfers in execution order, with cost estimates."""
+
+  batches: list[TransferBatch]
+  num_transfers: int
+  timing: TransferTiming = field(default_factory=TransferTiming)
+
+  @property
+  def tip_pickups(self) -> int:
+    """Number of tip pickup operations."""
+    return len(self.batches)
+
+  @property
+  def head_moves(self) -> int:
+    """Number of head moves between labware positions."""
+    return _MOVES_PER_BATCH * len(self.batches)
+
+  @property
+  def estimated_time_s(self) -> float:
+    """Estimated run time of the plan."""
+    return len(self.batches) * self.timing.batch_s
+
+  @property
+  def baseline_time_s(self) -> float:
+    """Estimated run time when every transfer is issued on its own."""
+    return self.num_transfers * self.timing.batch_s
+
+  @property
+  def time_saved_s(self) -> float:
+    """Estimated time saved over issuing transfers one at a time."""
+    return self.baseline_time_s - self.estimated_time_s
+
+  def summary(self) -> dict[str, Any]:
+    """Return plan statistics suitable for logging or an API response."""
+    return {
+      "transfers": self.num_transfers,
+      "batches": len(self.batches),
+      "head96_batches": sum(1 for b in self.batches if b.kind == "head96"),
+      "tip_pickups": self.tip_pickups,
+      "head_moves": self.head_moves,
+      "estimated_time_s": round(self.estimated_time_s, 1),
+      "baseline_time_s": round(self.baseline_time_s, 1),
+      "time_saved_s": round(self.time_saved_s, 1),
+    }
+
+
+@dataclass(frozen=True)
+class PlannedOperation:
+  """One liquid handler call produced from a transfer plan."""
+
+  method: str
+  args: tuple[Any, ...] = ()
+  kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def _split_volumes(transfers: list[Transfer], max_volume: float | None) -> list[Transfer]:
+  if max_volume is None:
+    return transfers
+  split: list[Transfer] = []
+  for transfer in transfers:
+    passes = max(1, math.ceil(transfer.volume / max_volume - 1e-9))
+    split.extend(
+      Transfer(transfer.source, transfer.target, transfer.volume / passes) for _ in range(passes)
+    )
+  return split
+
+
+def _stages(transfers: list[Transfer]) -> list[list[Transfer]]:
+  """Split transfers into stages that can be reordered freely within themselves.
+
+  A transfer goes one stage after the latest earlier transfer that dispensed
+  into its source or aspirated from its target.
+  """
+  last_write: dict[int, int] = {}
+  last_read: dict[int, int] = {}
+  stages: list[list[Transfer]] = []
+  for transfer in transfers:
+    source_key, target_key = id(transfer.source), id(transfer.target)
+    stage = max(last_write.get(source_key, -1), last_read.get(target_key, -1)) + 1
+    if stage == len(stages):
+      stages.append([])
+    stages[stage].append(transfer)
+    last_read[source_key] = max(last_read.get(source_key, -1), stage)
+    last_write[target_key] = max(last_write.get(target_key, -1), stage)
+  return stages
+
+
+def _is_96_plate(resource: Any) -> bool:
+  return isinstance(resource, Plate) and resource.num_items == _HEAD96_WELLS
+
+
+def _promote_head96(
+  transfers: list[Transfer],
+) -> tuple[list[TransferBatch], list[Transfer]]:
+  """Pull out full-plate identity transfers that a 96 head can do in one go."""
+  buckets: dict[tuple[int, int, float], dict[int, list[int]]] = defaultdict(
+    lambda: defaultdict(list),
+  )
+  well_indices: dict[int, dict[str, int]] = {}
+
+  def index_of(plate: Plate, well: Container) -> int | None:
+    if id(plate) not in well_indices:
+      well_indices[id(plate)] = {item.name: i for i, item in enumerate(plate.get_all_items())}
+    return well_indices[id(plate)].get(well.name)
+
+  for position, transfer in enumerate(transfers):
+    source_plate, target_plate = transfer.source.parent, transfer.target.parent
+    if not (_is_96_plate(source_plate) and _is_96_plate(target_plate)):
+      continue
+    index = index_of(source_plate, transfer.source)  # type: ignore[arg-type]
+    if index is None or index_of(target_plate, transfer.target) != index:  # type: ignore[arg-type]
+      continue
+    buckets[id(source_plate), id(target_plate), transfer.volume][index].append(position)
+
+  batches: list[TransferBatch] = []
+  promoted: set[int] = set()
+  for by_index in buckets.values():
+    while len(by_index) == _HEAD96_WELLS and all(by_index.values()):
+      positions = [by_index[index].pop(0) for index in range(_HEAD96_WELLS)]
+      promoted.update(positions)
+      batches.append(TransferBatch("head96", [transfers[p] for p in positions]))
+  return batches, [t for p, t in enumerate(transfers) if p not in promoted]
+
+
+def _column_key(container: Container) -> tuple[int, float] | None:
+  if container.location is None:
+    return None
+  return id(container.parent), round(container.location.x, 1)
+
+
+def _batch_channels(
+  transfers: list[Transfer],
+  num_channels: int,
+  channel_spacing: float,
+) -> list[TransferBatch]:
+  """Greedily pack same-column transfers onto consecutive channels."""
+  groups: dict[tuple[Any, ...], list[Transfer]] = defaultdict(list)
+  for position, transfer in enumerate(transfers):
+    source_key, target_key = _column_key(transfer.source), _column_key(transfer.target)
+    if source_key is None or target_key is None:
+      groups["single", position].append(transfer)
+    else:
+      groups[source_key, target_key].append(transfer)
+
+  min_gap = channel_spacing - _COORDINATE_TOLERANCE_MM
+  batches: list[TransferBatch] = []
+  for group in groups.values():
+    # Channel 0 is the rearmost channel, so channels run from high y to low y.
+    remaining = sorted(group, key=lambda t: (-t.source.location.y, -t.target.location.y))  # type: ignore[union-attr]
+    while remaining:
+      batch = [remaining[0]]
+      rest: list[Transfer] = []
+      for transfer in remaining[1:]:
+        last = batch[-1]
+        if (
+          len(batch) < num_channels
+          and last.source.location.y - transfer.source.location.y >= min_gap  # type: ignore[union-attr]
+          and last.target.location.y - transfer.target.location.y >= min_gap  # type: ignore[union-attr]
+        ):
+          batch.append(transfer)
+        else:
+          rest.append(transfer)
+      batches.append(TransferBatch("channels", batch))
+      remaining = rest
+  return batches
+
+
+def _sweep_key(batch: TransferBatch) -> tuple[Any, ...]:
+  """Order batches left to right across each source plate to shorten head travel."""
+  first = batch.transfers[0]
+  source_parent = first.source.parent.name if first.source.parent else first.source.name
+  target_parent = first.target.parent.name if first.target.parent else first.target.name
+  source_x = first.source.location.x if first.source.location else 0.0
+  target_x = first.target.location.x if first.target.location else 0.0
+  return (batch.kind != "head96", source_parent, source_x, target_parent, target_x)
+
+
+def plan_transfers(
+  transfers: list[Transfer] | list[tuple[Container, Container, float]],
+  *,
+  num_channels: int = DEFAULT_NUM_CHANNELS,
+  channel_spacing: float = DEFAULT_CHANNEL_SPACING_MM,
+  max_volume: float | None = None,
+  use_96_head: bool = True,
+  timing: TransferTiming | None = None,
+) -> TransferPlan:
+  """Group transfers into channel-parallel batches.
+
+  Args:
+    transfers: Transfers, or ``(source, target, volume)`` tuples, in the order
+      they would be issued one at a time.
+    num_channels: Number of independent channels on the pipetting head.
+    channel_spacing: Minimum distance between neighbouring channels, in mm.
+    max_volume: Largest volume a tip holds. Larger transfers are split into
+      equal passes. If None, volumes are not split.
+    use_96_head: Whether full-plate transfers may be promoted to the 96 head.
+    timing: Step durations for the time estimate.
+
+  Returns:
+    TransferPlan: The batches in execution order.
+
+  Raises:
+    ValueError: If a volume is not positive or the head parameters are invalid.
+
+  """
+  if num_channels < 1:
+    msg = "num_channels must be at least 1."
+    raise ValueError(msg)
+  if max_volume is not None and max_volume <= 0:
+    msg = "max_volume must be positive."
+    raise ValueError(msg)
+  normalized = [t if isinstance(t, Transfer) else Transfer(*t) for t in transfers]
+  if any(t.volume <= 0 for t in normalized):
+    msg = "Transfer volumes must be positive."
+    raise ValueError(msg)
+
+  normalized = _split_volumes(normalized, max_volume)
+  batches: list[TransferBatch] = []
+  for stage in _stages(normalized):
+    head96: list[TransferBatch] = []
+    if use_96_head:
+      head96, stage = _promote_head96(stage)
+    stage_batches = head96 + _batch_channels(stage, num_channels, channel_spacing)
+    batches.extend(sorted(stage_batches, key=_sweep_key))
+  return TransferPlan(
+    batches=batches, num_transfers=len(normalized), timing=timing or TransferTiming()
+  )
+
+
+class _TipAllocator:
+  """Hand out tips column by column, keeping whole racks for the 96 head."""
+
+  def __init__(self, tip_racks: list[TipRack], head96_batches: int) -> None:
+    if head96_batches > len(tip_racks):
+      msg = f"{head96_batches} full tip rack(s) are needed for 96-head transfers."
+      raise ValueError(msg)
+    split = len(tip_racks) - head96_batches
+    self._channel_racks = tip_racks[:split]
+    self._head96_racks = tip_racks[split:]
+    self._rack = 0
+    self._column = 0
+    self._row = 0
+
+  def take_rack(self) -> TipRack:
+    return self._head96_racks.pop(0)
+
+  def take_column(self, count: int) -> list[TipSpot]:
+    """Return ``count`` adjacent tips from one column, skipping short remainders."""
+    while self._rack < len(self._channel_racks):
+      rack = self._channel_racks[self._rack]
+      if count > rack.num_items_y:
+        msg = f"Tip rack '{rack.name}' has fewer than {count} tips per column."
+        raise ValueError(msg)
+      if self._column < rack.num_items_x:
+        if self._row + count <= rack.num_items_y:
+          spots = [rack.get_item((self._row + i, self._column)) for i in range(count)]
+          self._row += count
+          return spots
+        self._column += 1
+        self._row = 0
+        continue
+      self._rack += 1
+      self._column = 0
+      self._row = 0
+    msg = "Not enough tips for the transfer plan."
+    raise ValueError(msg)
+
+
+def transfer_plan_operations(
+  plan: TransferPlan,
+  tip_racks: list[TipRack],
+  *,
+  return_tips: bool = False,
+  mix_cycles: int = 0,
+  mix_flow_rate: float = DEFAULT_MIX_FLOW_RATE,
+) -> list[PlannedOperation]:
+  """Translate a plan into liquid handler calls with tips assigned.
+
+  Args:
+    plan: The plan to translate.
+    tip_racks: Fresh tip racks. One whole rack is reserved per 96-head batch,
+      taken from the end of the list.
+    return_tips: Return tips to their rack instead of discarding them.
+    mix_cycles: Mix each target this many times with the transferred volume
+      after dispensing. 0 disables mixing.
+    mix_flow_rate: Flow rate for mixing, in uL/s.
+
+  Returns:
+    list[PlannedOperation]: The calls, in order.
+
+  Raises:
+    ValueError: If the racks do not hold enough tips.
+
+  """
+  allocator = _TipAllocator(tip_racks, sum(1 for b in plan.batches if b.kind == "head96"))
+  operations: list[PlannedOperation] = []
+
+  def mix(volume: float) -> Mix | None:
+    return Mix(volume, mix_cycles, mix_flow_rate) if mix_cycles > 0 else None
+
+  for batch in plan.batches:
+    if batch.kind == "head96":
+      rack = allocator.take_rack()
+      source_plate, target_plate = batch.sources[0].parent, batch.targets[0].parent
+      volume = batch.volumes[0]
+      operations += [
+        PlannedOperation("pick_up_tips96", (rack,)),
+        PlannedOperation("aspirate96", (source_plate,), {"volume": volume}),
+        PlannedOperation("dispense96", (target_plate,), {"volume": volume, "mix": mix(volume)}),
+        PlannedOperation("drop_tips96", (rack,))
+        if return_tips
+        else PlannedOperation("discard_tips96"),
+      ]
+      continue
+    channels = list(range(len(batch.transfers)))
+    tips = allocator.take_column(len(channels))
+    operations += [
+      PlannedOperation("pick_up_tips", (tips,), {"use_channels": channels}),
+      PlannedOperation("aspirate", (batch.sources, batch.volumes), {"use_channels": channels}),
+      PlannedOperation(
+        "dispense",
+        (batch.targets, batch.volumes),
+        {
+          "use_channels": channels,
+          "mix": [mix(v) for v in batch.volumes] if mix_cycles > 0 else None,
+        },
+      ),
+      PlannedOperation("drop_tips", (tips,), {"use_channels": channels})
+      if return_tips
+      else PlannedOperation("discard_tips", (), {"use_channels": channels}),
+    ]
+  return operations
+
+
+async def execute_transfer_plan(
+  liquid_handler: Any,
+  plan: TransferPlan,
+  tip_racks: list[TipRack],
+  *,
+  return_tips: bool = False,
+  mix_cycles: int = 0,
+  mix_flow_rate: float = DEFAULT_MIX_FLOW_RATE,
+) -> None:
+  """Run a transfer plan on a liquid handler or a tracer with the same methods.
+
+  See ``transfer_plan_operations`` for the arguments.
+  """
+  operations = transfer_plan_operations(
+    plan,
+    tip_racks,
+    return_tips=return_tips,
+    mix_cycles=mix_cycles,
+    mix_flow_rate=mix_flow_rate,
+  )
+  for operation in operations:
+    result = getattr(liquid_handler, operation.method)(*operation.args, **operation.kwargs)
+    if inspect.isawaitable(result):
+      await result
@@ -189,6 +189,107 @@ class PraxisConfiguration:
       return True
     return self.storage_backend in ("memory", "sqlite")
 
+  # --- Compute Executor Configuration ---
+  # Shared pool for CPU-bound work offloaded from async handlers.
+
+  @property
+  def _compute_section(self) -> dict[str, str]:
+    """Return the 'compute' section as a dictionary."""
+    return self._get_section_dict("compute")
+
+  @property
+  def compute_executor_kind(self) -> str:
+    """Return the compute executor kind, 'thread' (default) or 'process'.
+
+    Priority: PRAXIS_COMPUTE_EXECUTOR env var > [compute] executor > "thread"
+    """
+    return os.getenv("PRAXIS_COMPUTE_EXECUTOR") or self._compute_section.get("executor", "thread")
+
+  @property
+  def compute_max_workers(self) -> int | None:
+    """Return the compute pool size, or None to use the number of CPUs."""
+    value = os.getenv("PRAXIS_COMPUTE_WORKERS") or self._compute_section.get("max_workers")
+    return int(value) if value else None
+
+  @property
+  def compute_concurrency_limits(self) -> dict[str, int]:
+    """Return per-key concurrency limits, e.g. ``limits = simulation:2, discovery:1``."""
+    raw = os.getenv("PRAXIS_COMPUTE_LIMITS") or self._compute_section.get("limits", "")
+    limits: dict[str, int] = {}
+    for entry in raw.split(","):
+      key, _, value = entry.partition(":")
+      if key.strip() and value.strip():
+        limits[key.strip()] = int(value)
+    return limits
+
+  @property
+  def _retention_section(self) -> dict[str, str]:
+    """Return the 'retention' section as a dictionary."""
+    return self._get_section_dict("retention")
+
+  @property
+  def retention_enabled(self) -> bool:
+    """Return whether the background history compactor runs (default False).
+
+    Compaction moves rows out of the database, so it has to be enabled
+    explicitly once an archive directory has been chosen.
+    """
+    value = os.getenv("PRAXIS_RETENTION_ENABLED") or self._retention_section.get("enabled", "false")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+  @property
+  def retention_interval_seconds(self) -> int:
+    """Return the seconds between compaction passes (default one day)."""
+    value = os.getenv("PRAXIS_RETENTION_INTERVAL") or self._retention_section.get("interval")
+    return int(value) if value else 24 * 3600
+
+  @property
+  def retention_archive_directory(self) -> str:
+    """Return the absolute directory cold storage archives are written to."""
+    return os.getenv("PRAXIS_RETENTION_ARCHIVE_DIR") or self._retention_section.get(
+      "archive_directory", "/var/lib/praxis/archive"
+    )
+
+  @property
+  def retention_days(self) -> dict[str, int | None]:
+    """Return per-table retention periods in days, e.g. ``days = schedule_history:90``.
+
+    A value of ``off`` disables retention for that table.
+    """
+    raw = os.getenv("PRAXIS_RETENTION_DAYS") or self._retention_section.get("days", "")
+    days: dict[str, int | None] = {}
+    for entry in raw.split(","):
+      key, _, value = entry.partition(":")
+      if key.strip() and value.strip():
+        days[key.strip()] = None if value.strip().lower() == "off" else int(value)
+    return days
+
+  @property
+  def _hardware_section(self) -> dict[str, str]:
+    """Return the 'hardware' section as a dictionary."""
+    return self._get_section_dict("hardware")
+
+  @property
+  def hardware_discovery_background(self) -> bool:
+    """Return whether hardware discovery keeps running in the background (default False).
+
+    Background discovery browses mDNS and polls serial ports continuously, so
+    enable it only on the process attached to the lab hardware. Otherwise
+    devices are scanned on demand.
+    """
+    value = os.getenv("PRAXIS_HARDWARE_DISCOVERY_BACKGROUND") or self._hardware_section.get(
+      "discovery_background", "false"
+    )
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+  @property
+  def hardware_serial_poll_interval(self) -> float:
+    """Return the seconds between serial port scans of background discovery (default 2)."""
+    value = os.getenv("PRAXIS_HARDWARE_SERIAL_POLL_INTERVAL") or self._hardware_section.get(
+      "serial_poll_interval"
+    )
+    return float(value) if value else 2.0
+
   @property
   def _logging_section(self) -> dict[str, str]:
     """Return the 'logging' section as a dictionary."""
@@ -1,31 +1,166 @@
-"""Asset lock manager for Praxis."""
+"""Asset lock manager for Praxis.
 
+Locks live in a ``KeyValueStore`` (Redis in production, SQLite or memory in lite
+mode), so every API and worker process sharing the store agrees on who owns an
+asset. Each lock is a lease:
+
+- It is written with a TTL and renewed by a heartbeat while this process holds
+  it, so locks of a crashed process expire on their own.
+- It carries a fencing token from a per-asset counter. Tokens only grow, so a
+  holder whose lease lapsed can be told apart from the current one
+  (``check_fencing_token``).
+- Its key is recorded in a per-run index, so releasing every lock of a run
+  touches only the locks that run holds.
+
+A lock record never changes while it is held; acquiring, renewing and releasing
+are compare-and-set operations against that record, so they fail cleanly when
+another process has taken the asset in the meantime.
+"""
+
+import asyncio
+import contextlib
 import uuid
+from dataclasses import dataclass
 from typing import Any
 
 from praxis.backend.core.protocols.asset_lock_manager import IAssetLockManager
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.core.storage.protocols import KeyValueStore
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
 from praxis.backend.models.pydantic_internals.runtime import AcquireAssetLock
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LEASE_SECONDS = 60.0
+LOCK_KEY_PREFIX = "praxis:lock:asset:"
+FENCE_KEY_PREFIX = "praxis:lock:fence:"
+RUN_INDEX_KEY_PREFIX = "praxis:lock:run:"
+
+
+@dataclass(frozen=True)
+class AssetLease:
+  """A lock held on an asset."""
+
+  asset_type: str
+  asset_name: str
+  protocol_run_id: uuid.UUID
+  reservation_id: uuid.UUID
+  fencing_token: int
+  lease_seconds: float
+
+
+def _lease_from_record(record: dict[str, Any]) -> AssetLease:
+  lock = record["lock"]
+  return AssetLease(
+    asset_type=lock["asset_type"],
+    asset_name=lock["asset_name"],
+    protocol_run_id=uuid.UUID(lock["protocol_run_id"]),
+    reservation_id=uuid.UUID(lock["reservation_id"]),
+    fencing_token=record["fencing_token"],
+    lease_seconds=record["lease_seconds"],
+  )
 
 
 class AssetLockManager(IAssetLockManager):
-  """A simple in-memory asset lock manager."""
+  """Lease-based asset locks shared through a key-value store."""
+
+  def __init__(
+    self,
+    redis_url: str | None = None,
+    *,
+    kv_store: KeyValueStore | None = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    heartbeat_interval_seconds: float | None = None,
+  ) -> None:
+    """Initialize the AssetLockManager.
+
+    Args:
+        redis_url: Redis URL used when no ``kv_store`` is given.
+        kv_store: The store shared by all processes that coordinate locks.
+            Defaults to Redis at ``redis_url``, or a process-local in-memory
+            store when neither is given.
+        lease_seconds: Lease TTL for locks that do not set ``timeout_seconds``.
+        heartbeat_interval_seconds: How often held leases are renewed.
+            Defaults to a third of the shortest held lease.
 
-  def __init__(self, redis_url: str | None = None) -> None:
-    """Initialize the AssetLockManager."""
-    self._locks: dict[str, AcquireAssetLock] = {}
-    # Redis URL is ignored for in-memory implementation
+    """
+    if kv_store is None:
+      kv_store = (
+        RedisKeyValueStore.from_url(redis_url) if redis_url else InMemoryKeyValueStore()
+      )
+    self._kv = kv_store
+    self.lease_seconds = lease_seconds
+    self.heartbeat_interval_seconds = heartbeat_interval_seconds
+    # Records of the leases this process holds, with the lock data they were
+    # acquired with, keyed by lock key.
+    self._held: dict[str, tuple[dict[str, Any], AcquireAssetLock]] = {}
+    self._heartbeat_task: asyncio.Task | None = None
+
+  @staticmethod
+  def lock_key(asset_type: str, asset_name: str) -> str:
+    """Return the store key of an asset's lock."""
+    return f"{LOCK_KEY_PREFIX}{asset_type}:{asset_name}"
 
   async def initialize(self) -> None:
     """Initialize the asset lock manager."""
-    # No-op for in-memory implementation
+    # The store connects lazily and the heartbeat starts with the first lease.
+
+  async def close(self) -> None:
+    """Stop renewing leases; locks still held expire after their TTL."""
+    if self._heartbeat_task is not None:
+      self._heartbeat_task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._heartbeat_task
+      self._heartbeat_task = None
+    self._held.clear()
+
+  async def acquire(self, lock_data: AcquireAssetLock) -> AssetLease | None:
+    """Acquire a lease on an asset without waiting.
+
+    Acquiring an asset again under the same reservation renews the existing
+    lease and returns it.
+
+    Returns:
+        The lease, or None if another reservation holds the asset.
+
+    """
+    key = self.lock_key(lock_data.asset_type, lock_data.asset_name)
+    current = await self._kv.get(key)
+    if current is not None:
+      if current["lock"]["reservation_id"] != str(lock_data.reservation_id):
+        return None
+      if not await self._renew(key, current):
+        return None
+      self._held.setdefault(key, (current, lock_data))
+      self._ensure_heartbeat()
+      return _lease_from_record(current)
+
+    # Claim the asset first and draw the fencing token afterwards: a token drawn
+    # before the claim could be older than the token of a holder that claimed
+    # and released the asset in between.
+    lease_seconds = float(lock_data.timeout_seconds or self.lease_seconds)
+    claim = {
+      "lock": lock_data.model_dump(mode="json"),
+      "fencing_token": None,
+      "lease_seconds": lease_seconds,
+    }
+    if not await self._kv.compare_and_set(key, None, claim, lease_seconds):
+      return None
+    token = await self._kv.incr(
+      f"{FENCE_KEY_PREFIX}{lock_data.asset_type}:{lock_data.asset_name}",
+    )
+    record = {**claim, "fencing_token": token}
+    if not await self._kv.compare_and_set(key, claim, record, lease_seconds):
+      return None
+    self._held[key] = (record, lock_data)
+    await self._kv.sadd(self._run_index_key(lock_data.protocol_run_id), key)
+    self._ensure_heartbeat()
+    return _lease_from_record(record)
 
   async def acquire_asset_lock(self, lock_data: AcquireAssetLock) -> bool:
     """Acquire a lock on an asset."""
-    lock_key = f"{lock_data.asset_type}:{lock_data.asset_name}"
-    if lock_key in self._locks:
-      return False
-    self._locks[lock_key] = lock_data
-    return True
+    return await self.acquire(lock_data) is not None
 
   async def release_asset_lock(
     self,
@@ -34,24 +169,32 @@ class AssetLockManager(IAssetLockManager):
     reservation_id: uuid.UUID,
     protocol_run_id: uuid.UUID | None = None,
   ) -> bool:
-    """Release a lock on an asset."""
-    lock_key = f"{asset_type}:{asset_name}"
-    if lock_key in self._locks:
-      del self._locks[lock_key]
-      return True
-    return False
+    """Release a lock on an asset if ``reservation_id`` still owns it."""
+    key = self.lock_key(asset_type, asset_name)
+    current = await self._kv.get(key)
+    if current is None or current["lock"]["reservation_id"] != str(reservation_id):
+      return False
+    self._held.pop(key, None)
+    if not await self._kv.compare_and_set(key, current, None):
+      return False
+    await self._kv.srem(self._run_index_key(current["lock"]["protocol_run_id"]), key)
+    return True
 
   async def release_all_protocol_locks(self, protocol_run_id: uuid.UUID) -> int:
     """Release all locks held by a protocol run."""
-    keys_to_release = []
-    for key, lock in self._locks.items():
-      if lock.protocol_run_id == protocol_run_id:
-        keys_to_release.append(key)
-
+    index_key = self._run_index_key(protocol_run_id)
+    keys = await self._kv.smembers(index_key)
     count = 0
-    for key in keys_to_release:
-      del self._locks[key]
-      count += 1
+    for key in keys:
+      current = await self._kv.get(key)
+      if (
+        current is not None
+        and current["lock"]["protocol_run_id"] == str(protocol_run_id)
+        and await self._kv.compare_and_set(key, current, None)
+      ):
+        self._held.pop(key, None)
+        count += 1
+    await self._kv.srem(index_key, *keys)
     return count
 
   async def check_asset_availability(
@@ -59,12 +202,11 @@ class AssetLockManager(IAssetLockManager):
     asset_type: str,
     asset_name: str,
   ) -> dict[str, Any] | None:
-    """Check if an asset is currently available."""
-    lock_key = f"{asset_type}:{asset_name}"
-    lock = self._locks.get(lock_key)
-    if lock:
-      return lock.model_dump(mode="json")
-    return None
+    """Return the holder of an asset's lock, or None if the asset is free."""
+    record = await self._kv.get(self.lock_key(asset_type, asset_name))
+    if record is None:
+      return None
+    return {**record["lock"], "fencing_token": record["fencing_token"]}
 
   async def get_lock_status(
     self,
@@ -72,5 +214,51 @@ class AssetLockManager(IAssetLockManager):
     asset_name: str,
   ) -> AcquireAssetLock | None:
     """Get the lock status of an asset."""
-    lock_key = f"{asset_type}:{asset_name}"
-    return self._locks.get(lock_key)
+    key = self.lock_key(asset_type, asset_name)
+    record = await self._kv.get(key)
+    if record is None:
+      return None
+    held = self._held.get(key)
+    if held is not None and held[0] == record:
+      return held[1]
+    return AcquireAssetLock.model_validate(record["lock"])
+
+  async def check_fencing_token(self, asset_type: str, asset_name: str, token: int) -> bool:
+    """Return whether ``token`` belongs to the lease currently held on an asset."""
+    record = await self._kv.get(self.lock_key(asset_type, asset_name))
+    return record is not None and record["fencing_token"] == token
+
+  async def renew_leases(self) -> int:
+    """Extend every lease held by this process; returns how many are still held.
+
+    Leases that expired or were taken over since the last renewal are dropped.
+    """
+    for key, (record, _) in list(self._held.items()):
+      try:
+        renewed = await self._renew(key, record)
+      except Exception:
+        logger.exception("Failed to renew lease %s", key)
+        continue
+      if not renewed:
+        self._held.pop(key, None)
+        logger.warning("Lost lease %s (fencing token %s)", key, record["fencing_token"])
+    return len(self._held)
+
+  async def _renew(self, key: str, record: dict[str, Any]) -> bool:
+    return await self._kv.compare_and_set(key, record, record, record["lease_seconds"])
+
+  def _ensure_heartbeat(self) -> None:
+    if self._heartbeat_task is None or self._heartbeat_task.done():
+      self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+  async def _heartbeat(self) -> None:
+    while self._held:
+      interval = self.heartbeat_interval_seconds or min(
+        record["lease_seconds"] for record, _ in self._held.values()
+      ) / 3
+      await asyncio.sleep(interval)
+      await self.renew_leases()
+
+  @staticmethod
+  def _run_index_key(protocol_run_id: uuid.UUID | str) -> str:
+    return f"{RUN_INDEX_KEY_PREFIX}{protocol_run_id}"
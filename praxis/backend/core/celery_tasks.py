@@ -100,11 +100,11 @@ async def _execute_protocol_async(
   protocol_run_service: ProtocolRunService,
 ) -> dict[str, Any]:
   """Asynchronously executes a protocol run using the Orchestrator."""
-  validated_initial_state: PraxisState | None = None
   if initial_state is not None:
+    # The orchestrator loads the state into the run's PraxisState; only check it here.
     try:
-      validated_initial_state = PraxisState(run_accession_id=protocol_run_id)
-      validated_initial_state.update(initial_state)
+      for key, value in initial_state.items():
+        PraxisState.validate_item(key, value)
     except Exception as e:
       msg = f"Invalid initial_state format: {e}"
       raise ValueError(msg) from e
@@ -135,7 +135,7 @@ async def _execute_protocol_async(
       result_run_model = await orchestrator.execute_existing_protocol_run(
         protocol_run_model,
         input_parameters,
-        validated_initial_state.to_dict() if validated_initial_state else None,
+        dict(initial_state) if initial_state is not None else None,
       )
 
       return {
@@ -36,6 +36,8 @@ from .protocols.scheduler import IProtocolScheduler
 from .protocols.workcell import IWorkcell
 from .protocols.workcell_runtime import IWorkcellRuntime
 from .scheduler import ProtocolScheduler
+from .storage.protocols import KeyValueStore
+from .storage.redis_adapter import RedisKeyValueStore
 from .workcell import Workcell
 from .workcell_runtime import WorkcellRuntime
 
@@ -112,6 +114,11 @@ class Container(containers.DeclarativeContainer):
     decode_responses=True,
   )
 
+  kv_store: providers.Singleton[KeyValueStore] = providers.Singleton(
+    RedisKeyValueStore.from_url,
+    url=config.redis.url,
+  )
+
   # --- Celery ---
   celery_app: providers.Object[Celery] = providers.Object(celery_app)
 
@@ -137,7 +144,7 @@ class Container(containers.DeclarativeContainer):
   # Services will be registered here as we refactor them.
   asset_lock_manager: providers.Singleton[AssetLockManager] = providers.Singleton(
     AssetLockManager,
-    redis_client=redis_client,
+    redis_url=config.redis.url,
   )
 
   protocol_code_manager: providers.Singleton[ProtocolCodeManager] = providers.Singleton(
@@ -210,6 +217,7 @@ class Container(containers.DeclarativeContainer):
     protocol_code_manager=protocol_code_manager,
     protocol_run_service=protocol_run_service,
     protocol_definition_service=protocol_definition_service,
+    state_store=kv_store,
   )
 
   protocol_execution_service: providers.Factory[IProtocolExecutionService] = providers.Factory(
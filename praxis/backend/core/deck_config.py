@@ -161,8 +161,13 @@ def build_deck_from_config(config: DeckLayoutConfig) -> Any:
 
       # Place the resource
       if placement.slot:
-        # Slot-based placement
-        parent.assign_child_at_slot(resource, placement.slot)
+        slot: str | int = int(placement.slot) if placement.slot.isdigit() else placement.slot
+        if hasattr(parent, "assign_child_at_slot"):
+          # Slot-based placement
+          parent.assign_child_at_slot(resource, slot)
+        else:
+          # Carrier site placement (sites are addressed by index)
+          parent[slot] = resource
         logger.debug(
           "Placed %s at slot %s on %s",
           placement.name,
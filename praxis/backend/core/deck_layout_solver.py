@@ -0,0 +1,602 @@
+"""Automatic deck layout solver for unplaced protocol resources.
+
+Given a protocol computation graph, this module assigns every resource that
+still needs a place on the deck to a carrier site (carrier-based decks such as
+the Hamilton STAR) or a slot (slot-based decks such as the OT-2) so that the
+estimated travel of the pipetting head and the plate gripper is minimized.
+
+The travel model replays the graph's operation sequence: every operation moves
+the head (or, for ``move_*`` operations, the gripper) to the resources named in
+its arguments, and the cost of a layout is the summed straight-line distance of
+those moves. Site compatibility follows the ``resource_hierarchy`` rules: on a
+carrier-based deck a container needs the carrier category given by
+``CARRIER_FOR_CONTAINER``, and all resources on one carrier must share it.
+
+The search is a greedy construction followed by iterated local search (moves
+and swaps, then random perturbations of the best layout) that stops when the
+time budget runs out or the search stops improving.
+
+Usage:
+    solution = solve_deck_layout(graph, ["source", "dest", "tips"], deck_fqn=deck_fqn)
+    config = solution.config  # DeckLayoutConfig with carrier and resource placements
+    solution.predicted_travel_mm
+"""
+
+import math
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from pydantic import BaseModel, Field
+
+from praxis.backend.core.deck_config import DeckLayoutConfig, ResourcePlacement
+from praxis.backend.utils.plr_static_analysis.models import ProtocolComputationGraph
+from praxis.backend.utils.plr_static_analysis.resource_hierarchy import (
+  CARRIER_FOR_CONTAINER,
+  CARRIER_TYPES,
+  DIRECT_PARENT,
+  DeckLayoutType,
+  ResourceCategory,
+  get_registry,
+)
+
+# =============================================================================
+# Deck Geometry
+# =============================================================================
+
+# Hamilton rail geometry (see HamiltonDeck.rails_to_location).
+RAIL_ORIGIN_X = 100.0
+RAIL_PITCH = 22.5
+RAIL_Y = 63.0
+RAIL_Z = 100.0
+CARRIER_WIDTH_RAILS = 6
+CARRIER_SITES = 5
+CARRIER_SITE_Y = (8.5, 104.5, 200.5, 296.5, 392.5)
+CARRIER_SITE_X = 4.0
+
+# OT-2 slot origins; slot 12 is the fixed trash and is never assigned.
+OT_SLOT_LOCATIONS: dict[int, tuple[float, float]] = {
+  1: (115.65, 68.03),
+  2: (248.15, 68.03),
+  3: (380.65, 68.03),
+  4: (115.65, 158.53),
+  5: (248.15, 158.53),
+  6: (380.65, 158.53),
+  7: (115.65, 249.03),
+  8: (248.15, 249.03),
+  9: (380.65, 249.03),
+  10: (115.65, 339.53),
+  11: (248.15, 339.53),
+}
+
+# Default carrier classes used when the solver has to introduce a carrier.
+DEFAULT_CARRIER_FQNS: dict[ResourceCategory, str] = {
+  ResourceCategory.PLATE_CARRIER: "pylabrobot.resources.PLT_CAR_L5AC_A00",
+  ResourceCategory.TIP_CARRIER: "pylabrobot.resources.TIP_CAR_480_A00",
+  ResourceCategory.TROUGH_CARRIER: "pylabrobot.resources.Trough_CAR_5R60_A00",
+  ResourceCategory.CARRIER: "pylabrobot.resources.PLT_CAR_L5AC_A00",
+}
+
+GRIPPER_METHODS: frozenset[str] = frozenset({"move_plate", "move_lid", "move_resource"})
+
+DEFAULT_TIME_BUDGET_S = 0.25
+DEFAULT_GRIPPER_WEIGHT = 2.0
+DEFAULT_MAX_STALLED_ROUNDS = 30
+
+_IDENTIFIER = re.compile(r"^\s*([A-Za-z_]\w*)")
+_TRAILING_INT = re.compile(r"(\d+)\s*$")
+
+
+def num_rails_for_deck(deck_fqn: str | None) -> int:
+  """Return the number of rails of a carrier-based deck class."""
+  name = (deck_fqn or "").rsplit(".", 1)[-1].lower()
+  if "starlet" in name:
+    return 32
+  return 56
+
+
+# =============================================================================
+# Result Model
+# =============================================================================
+
+
+class DeckLayoutSolution(BaseModel):
+  """Result of solving a deck layout."""
+
+  config: DeckLayoutConfig = Field(description="Complete deck layout with all placements")
+  predicted_travel_mm: float = Field(
+    description="Weighted head plus gripper travel of the chosen layout"
+  )
+  head_travel_mm: float = 0.0
+  gripper_travel_mm: float = 0.0
+  initial_travel_mm: float = Field(
+    default=0.0, description="Travel of the greedy layout the search started from"
+  )
+  assignments: dict[str, str] = Field(
+    default_factory=dict, description="Resource variable -> human-readable location"
+  )
+  unplaced: list[str] = Field(
+    default_factory=list, description="Resources that did not fit on the deck"
+  )
+  evaluations: int = Field(default=0, description="Number of candidate moves evaluated")
+  search_time_s: float = 0.0
+
+
+# =============================================================================
+# Internal Structures
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Site:
+  """A location a container can be assigned to."""
+
+  index: int
+  x: float
+  y: float
+  track: int | None = None  # carrier track (first rail) on carrier-based decks
+  position: int = 0  # carrier site index, or slot number on slot-based decks
+
+
+@dataclass
+class _Item:
+  """A resource to place."""
+
+  name: str
+  category: ResourceCategory
+  carrier: ResourceCategory | None  # required carrier category, None on slot decks
+
+
+class _Problem:
+  """Sites, items and the travel model for one solve."""
+
+  def __init__(
+    self,
+    sites: list[_Site],
+    items: list[_Item],
+    fixed: dict[str, tuple[float, float]],
+    head_pairs: Counter,
+    gripper_pairs: Counter,
+    gripper_weight: float,
+  ) -> None:
+    self.sites = sites
+    self.items = items
+    self.index = {item.name: i for i, item in enumerate(items)}
+    self.fixed = fixed
+    self.gripper_weight = gripper_weight
+    # Pairs keyed by name; weights combine repeated transitions.
+    self.pairs: list[tuple[str, str, float]] = [
+      (a, b, float(n)) for (a, b), n in head_pairs.items()
+    ] + [(a, b, n * gripper_weight) for (a, b), n in gripper_pairs.items()]
+    self.head_pairs = head_pairs
+    self.gripper_pairs = gripper_pairs
+    self.evaluations = 0
+
+  def point(self, name: str, assignment: list[int | None]) -> tuple[float, float] | None:
+    if name in self.fixed:
+      return self.fixed[name]
+    i = self.index.get(name)
+    if i is None or assignment[i] is None:
+      return None
+    site = self.sites[assignment[i]]  # type: ignore[index]
+    return site.x, site.y
+
+  def cost(self, assignment: list[int | None]) -> float:
+    self.evaluations += 1
+    total = 0.0
+    for a, b, weight in self.pairs:
+      pa = self.point(a, assignment)
+      pb = self.point(b, assignment)
+      if pa is not None and pb is not None:
+        total += weight * math.dist(pa, pb)
+    return total
+
+  def travel(self, pairs: Counter, assignment: list[int | None]) -> float:
+    total = 0.0
+    for (a, b), n in pairs.items():
+      pa = self.point(a, assignment)
+      pb = self.point(b, assignment)
+      if pa is not None and pb is not None:
+        total += n * math.dist(pa, pb)
+    return total
+
+  def feasible(self, assignment: list[int | None]) -> bool:
+    """Check that every carrier track holds a single carrier category."""
+    track_category: dict[int, ResourceCategory] = {}
+    for item, site_index in zip(self.items, assignment, strict=True):
+      if site_index is None or item.carrier is None:
+        continue
+      track = self.sites[site_index].track
+      if track is None:
+        continue
+      if track_category.setdefault(track, item.carrier) != item.carrier:
+        return False
+    return True
+
+
+# =============================================================================
+# Solver
+# =============================================================================
+
+
+def _referenced_resource(argument: str, known: set[str]) -> str | None:
+  match = _IDENTIFIER.match(argument)
+  if match and match.group(1) in known:
+    return match.group(1)
+  return None
+
+
+def _transition_pairs(
+  graph: ProtocolComputationGraph,
+  known: set[str],
+) -> tuple[Counter, Counter]:
+  """Count head and gripper moves between resources along the operation sequence."""
+  head: Counter = Counter()
+  gripper: Counter = Counter()
+  head_at: str | None = None
+  gripper_at: str | None = None
+  for op in graph.ordered_operations():
+    refs = [
+      ref
+      for ref in (_referenced_resource(arg, known) for arg in op.arguments.values())
+      if ref is not None
+    ]
+    for ref in refs:
+      if op.method_name in GRIPPER_METHODS:
+        if gripper_at is not None and gripper_at != ref:
+          gripper[tuple(sorted((gripper_at, ref)))] += 1
+        gripper_at = ref
+      else:
+        if head_at is not None and head_at != ref:
+          head[tuple(sorted((head_at, ref)))] += 1
+        head_at = ref
+  return head, gripper
+
+
+def _item_category(graph: ProtocolComputationGraph, name: str) -> ResourceCategory:
+  registry = get_registry()
+  resource = graph.resources.get(name)
+  if resource is None:
+    return ResourceCategory.RESOURCE
+  if resource.is_container and resource.element_type:
+    element = registry.get_category(resource.element_type)
+    return DIRECT_PARENT.get(element, element)
+  category = registry.get_category(resource.declared_type)
+  return DIRECT_PARENT.get(category, category)
+
+
+def _parse_position(value: str) -> int | None:
+  match = _TRAILING_INT.search(value)
+  return int(match.group(1)) if match else None
+
+
+def _build_sites(
+  deck_type: DeckLayoutType,
+  deck_fqn: str | None,
+  blocked: set[int],
+) -> list[_Site]:
+  sites: list[_Site] = []
+  if deck_type == DeckLayoutType.SLOT_BASED:
+    for slot, (x, y) in OT_SLOT_LOCATIONS.items():
+      if slot not in blocked:
+        sites.append(_Site(index=len(sites), x=x, y=y, position=slot))
+    return sites
+
+  num_rails = num_rails_for_deck(deck_fqn)
+  for track in range(1, num_rails - CARRIER_WIDTH_RAILS + 2, CARRIER_WIDTH_RAILS):
+    if any(track <= rail < track + CARRIER_WIDTH_RAILS for rail in blocked):
+      continue
+    x = RAIL_ORIGIN_X + (track - 1) * RAIL_PITCH + CARRIER_SITE_X
+    for position, site_y in enumerate(CARRIER_SITE_Y):
+      sites.append(_Site(index=len(sites), x=x, y=RAIL_Y + site_y, track=track, position=position))
+  return sites
+
+
+def _fixed_points(
+  deck_type: DeckLayoutType,
+  resource_positions: dict[str, str],
+) -> tuple[dict[str, tuple[float, float]], set[int]]:
+  """Locate already-placed resources and the slots or rails they block."""
+  fixed: dict[str, tuple[float, float]] = {}
+  blocked: set[int] = set()
+  for name, value in resource_positions.items():
+    position = _parse_position(str(value))
+    if position is None:
+      continue
+    blocked.add(position)
+    if deck_type == DeckLayoutType.SLOT_BASED:
+      if position in OT_SLOT_LOCATIONS:
+        fixed[name] = OT_SLOT_LOCATIONS[position]
+    else:
+      x = RAIL_ORIGIN_X + (position - 1) * RAIL_PITCH + CARRIER_SITE_X
+      fixed[name] = (x, RAIL_Y + CARRIER_SITE_Y[CARRIER_SITES // 2])
+  return fixed, blocked
+
+
+def _greedy(problem: _Problem, order: list[int]) -> list[int | None]:
+  assignment: list[int | None] = [None] * len(problem.items)
+  used: set[int] = set()
+  for i in order:
+    best_site: int | None = None
+    best_cost = math.inf
+    for site in problem.sites:
+      if site.index in used:
+        continue
+      assignment[i] = site.index
+      if not problem.feasible(assignment):
+        continue
+      cost = problem.cost(assignment)
+      if cost < best_cost:
+        best_cost, best_site = cost, site.index
+    assignment[i] = best_site
+    if best_site is not None:
+      used.add(best_site)
+  return assignment
+
+
+def _local_search(
+  problem: _Problem,
+  assignment: list[int | None],
+  deadline: float,
+) -> tuple[list[int | None], float]:
+  """Apply improving relocations and swaps until none is left or time runs out."""
+  current = list(assignment)
+  current_cost = problem.cost(current)
+  improved = True
+  while improved and time.perf_counter() < deadline:
+    improved = False
+    occupant = {site: i for i, site in enumerate(current) if site is not None}
+    for i in range(len(current)):
+      if current[i] is None:
+        continue
+      for site in problem.sites:
+        if site.index == current[i]:
+          continue
+        candidate = list(current)
+        j = occupant.get(site.index)
+        candidate[i] = site.index
+        if j is not None:
+          candidate[j] = current[i]
+        if not problem.feasible(candidate):
+          continue
+        cost = problem.cost(candidate)
+        if cost < current_cost - 1e-9:
+          current, current_cost = candidate, cost
+          occupant = {s: k for k, s in enumerate(current) if s is not None}
+          improved = True
+      if time.perf_counter() >= deadline:
+        break
+  return current, current_cost
+
+
+def _perturb(
+  problem: _Problem,
+  assignment: list[int | None],
+  rng: random.Random,
+  strength: int,
+) -> list[int | None]:
+  candidate = list(assignment)
+  placed = [i for i, site in enumerate(candidate) if site is not None]
+  for _ in range(strength):
+    if len(placed) < 2:
+      break
+    i, j = rng.sample(placed, 2)
+    swapped = list(candidate)
+    swapped[i], swapped[j] = swapped[j], swapped[i]
+    if problem.feasible(swapped):
+      candidate = swapped
+  return candidate
+
+
+def solve_deck_layout(
+  graph: ProtocolComputationGraph,
+  resources: list[str],
+  *,
+  deck_type: DeckLayoutType = DeckLayoutType.CARRIER_BASED,
+  deck_fqn: str | None = None,
+  resource_positions: dict[str, str] | None = None,
+  resource_fqns: dict[str, str] | None = None,
+  time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+  gripper_weight: float = DEFAULT_GRIPPER_WEIGHT,
+  max_stalled_rounds: int = DEFAULT_MAX_STALLED_ROUNDS,
+  seed: int = 0,
+) -> DeckLayoutSolution:
+  """Assign resources to deck sites minimizing estimated head and gripper travel.
+
+  Args:
+      graph: The protocol computation graph providing the operation sequence.
+      resources: Variable names of the resources to place.
+      deck_type: Whether the deck is carrier-based or slot-based.
+      deck_fqn: Deck class FQN; selects the rail count and is copied to the config.
+      resource_positions: Already-placed resources (name -> slot or rail, e.g.
+          ``"rail_7"`` or ``"3"``). Their slots/rails are not reused and they
+          anchor the travel estimate.
+      resource_fqns: Resource class FQNs per variable, e.g. from matched assets.
+          Falls back to ``pylabrobot.resources.<declared type>``.
+      time_budget_s: Wall-clock budget for the local search.
+      gripper_weight: Relative cost of a millimetre of gripper travel.
+      max_stalled_rounds: Stop early after this many perturbation rounds
+          without improvement.
+      seed: Seed for the perturbation step, for reproducible layouts.
+
+  Returns:
+      DeckLayoutSolution with the deck config and its predicted travel.
+
+  """
+  started = time.perf_counter()
+  deadline = started + max(time_budget_s, 0.0)
+  resource_positions = resource_positions or {}
+  resource_fqns = resource_fqns or {}
+
+  fixed, blocked = _fixed_points(deck_type, resource_positions)
+  known = set(resources) | set(fixed)
+  head_pairs, gripper_pairs = _transition_pairs(graph, known)
+
+  # On carrier-based decks, resources that are carriers themselves take a whole
+  # track; everything else is an item assigned to a site.
+  carriers: list[str] = []
+  if deck_type == DeckLayoutType.CARRIER_BASED:
+    carriers = [name for name in resources if _item_category(graph, name) in CARRIER_TYPES]
+  item_names = [name for name in resources if name not in carriers]
+  all_sites = _build_sites(deck_type, deck_fqn, blocked)
+  carrier_tracks: dict[str, int] = {}
+  if carriers:
+    free_tracks = sorted({site.track for site in all_sites if site.track is not None})
+    for name, track in zip(carriers, free_tracks, strict=False):
+      carrier_tracks[name] = track
+      fixed[name] = (
+        RAIL_ORIGIN_X + (track - 1) * RAIL_PITCH + CARRIER_SITE_X,
+        RAIL_Y + CARRIER_SITE_Y[CARRIER_SITES // 2],
+      )
+    all_sites = [
+      _Site(index=k, x=s.x, y=s.y, track=s.track, position=s.position)
+      for k, s in enumerate(s for s in all_sites if s.track not in carrier_tracks.values())
+    ]
+
+  items = []
+  for name in item_names:
+    category = _item_category(graph, name)
+    carrier = None
+    if deck_type == DeckLayoutType.CARRIER_BASED:
+      carrier = CARRIER_FOR_CONTAINER.get(category, ResourceCategory.CARRIER)
+    items.append(_Item(name=name, category=category, carrier=carrier))
+
+  problem = _Problem(all_sites, items, fixed, head_pairs, gripper_pairs, gripper_weight)
+
+  # Most-travelled resources are placed first so they get the best sites.
+  involvement: Counter = Counter()
+  for a, b, weight in problem.pairs:
+    involvement[a] += weight
+    involvement[b] += weight
+  order = sorted(range(len(items)), key=lambda i: -involvement[items[i].name])
+  assignment = _greedy(problem, order)
+  initial_cost = problem.cost(assignment)
+
+  best, best_cost = _local_search(problem, assignment, deadline)
+  rng = random.Random(seed)  # noqa: S311 - seeded search perturbation, not security-sensitive
+  stalled = 0
+  while (
+    time.perf_counter() < deadline
+    and stalled < max_stalled_rounds
+    and len(items) > 1
+    and problem.pairs
+  ):
+    candidate = _perturb(problem, best, rng, strength=max(2, len(items) // 3))
+    candidate, cost = _local_search(problem, candidate, deadline)
+    if cost < best_cost - 1e-9:
+      best, best_cost = candidate, cost
+      stalled = 0
+    else:
+      stalled += 1
+
+  config, assignments = _layout_config(
+    graph,
+    problem,
+    best,
+    carrier_tracks,
+    deck_type=deck_type,
+    deck_fqn=deck_fqn,
+    resource_fqns=resource_fqns,
+  )
+  head = problem.travel(head_pairs, best)
+  gripper = problem.travel(gripper_pairs, best)
+  unplaced = [item.name for item, site in zip(items, best, strict=True) if site is None]
+  unplaced += [name for name in carriers if name not in carrier_tracks]
+  return DeckLayoutSolution(
+    config=config,
+    predicted_travel_mm=round(head + gripper_weight * gripper, 3),
+    head_travel_mm=round(head, 3),
+    gripper_travel_mm=round(gripper, 3),
+    initial_travel_mm=round(initial_cost, 3),
+    assignments=assignments,
+    unplaced=unplaced,
+    evaluations=problem.evaluations,
+    search_time_s=time.perf_counter() - started,
+  )
+
+
+def _layout_config(
+  graph: ProtocolComputationGraph,
+  problem: _Problem,
+  assignment: list[int | None],
+  carrier_tracks: dict[str, int],
+  *,
+  deck_type: DeckLayoutType,
+  deck_fqn: str | None,
+  resource_fqns: dict[str, str],
+) -> tuple[DeckLayoutConfig, dict[str, str]]:
+  """Turn a site assignment into carrier and resource placements."""
+
+  def fqn_for(name: str) -> str:
+    if name in resource_fqns:
+      return resource_fqns[name]
+    resource = graph.resources.get(name)
+    declared = resource.element_type if resource and resource.is_container else None
+    type_name = resource.declared_type if resource else "Resource"
+    if declared:
+      type_name = get_registry().get_parental_chain(declared).chain[0]
+    return f"pylabrobot.resources.{type_name}"
+
+  placements: list[ResourcePlacement] = []
+  assignments: dict[str, str] = {}
+
+  for name, track in carrier_tracks.items():
+    placements.append(
+      ResourcePlacement(
+        resource_fqn=fqn_for(name),
+        name=name,
+        position={"x": RAIL_ORIGIN_X + (track - 1) * RAIL_PITCH, "y": RAIL_Y, "z": RAIL_Z},
+      )
+    )
+    assignments[name] = f"rail {track}"
+
+  placed = sorted(
+    (
+      (problem.sites[site], item)
+      for item, site in zip(problem.items, assignment, strict=True)
+      if site is not None
+    ),
+    key=lambda pair: (pair[0].track or 0, pair[0].position),
+  )
+
+  if deck_type == DeckLayoutType.SLOT_BASED:
+    for site, item in placed:
+      placements.append(
+        ResourcePlacement(resource_fqn=fqn_for(item.name), name=item.name, slot=str(site.position))
+      )
+      assignments[item.name] = f"slot {site.position}"
+  else:
+    carrier_names: dict[int, str] = {}
+    for site, item in placed:
+      track = site.track or 1
+      if track not in carrier_names:
+        carrier = item.carrier or ResourceCategory.CARRIER
+        carrier_names[track] = f"{carrier.value}_rail_{track}"
+        placements.append(
+          ResourcePlacement(
+            resource_fqn=DEFAULT_CARRIER_FQNS.get(
+              carrier, DEFAULT_CARRIER_FQNS[ResourceCategory.CARRIER]
+            ),
+            name=carrier_names[track],
+            position={"x": RAIL_ORIGIN_X + (track - 1) * RAIL_PITCH, "y": RAIL_Y, "z": RAIL_Z},
+          )
+        )
+      placements.append(
+        ResourcePlacement(
+          resource_fqn=fqn_for(item.name),
+          name=item.name,
+          slot=str(site.position),
+          parent_name=carrier_names[track],
+        )
+      )
+      assignments[item.name] = f"rail {track}, site {site.position}"
+
+  config = DeckLayoutConfig(
+    deck_fqn=deck_fqn or "pylabrobot.resources.Deck",
+    deck_kwargs={},
+    placements=placements,
+    description=f"Auto-layout for {graph.protocol_name}",
+  )
+  return config, assignments
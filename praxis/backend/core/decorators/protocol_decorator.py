@@ -27,6 +27,8 @@ from praxis.backend.services.protocols import (
   log_function_call_start,
   protocol_run_service,
 )
+from praxis.backend.services.run_progress import run_progress
+from praxis.backend.services.state import PraxisState
 from praxis.backend.core.utils.state_diff import calculate_diff
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.run_control import (
@@ -106,6 +108,15 @@ async def _log_call_start(
       except Exception:  # pylint: disable=broad-except
         logger.warning("Failed to capture state_before for function call logging.")
 
+    if context.call_log_writer is not None:
+      return await context.call_log_writer.log_start(
+        protocol_run_orm_accession_id=context.run_accession_id,
+        function_definition_accession_id=function_def_db_id,
+        sequence_in_run=sequence_val,
+        input_args_json=serialized_input_args,
+        parent_function_call_log_accession_id=parent_log_id,
+        state_before_json=state_before,
+      )
     call_log_entry_model = await log_function_call_start(
       db=context.current_db_session,
       protocol_run_orm_accession_id=context.run_accession_id,
@@ -407,16 +418,22 @@ def protocol_function(
               except Exception:  # pylint: disable=broad-except
                 logger.warning("Failed to capture state_after for function call logging.")
 
-            await log_function_call_end(
-              db=context_for_this_call.current_db_session,
-              function_call_log_accession_id=current_call_log_db_accession_id,
-              status=status_enum_val,
-              return_value_json=serialized_result,
-              error_message=str(error) if error else None,
-              error_traceback=traceback.format_exc() if error else None,
-              duration_ms=duration_ms,
-              state_after_json=state_after,
-            )
+            end_kwargs = {
+              "function_call_log_accession_id": current_call_log_db_accession_id,
+              "status": status_enum_val,
+              "return_value_json": serialized_result,
+              "error_message": str(error) if error else None,
+              "error_traceback": traceback.format_exc() if error else None,
+              "duration_ms": duration_ms,
+              "state_after_json": state_after,
+            }
+            if context_for_this_call.call_log_writer is not None:
+              await context_for_this_call.call_log_writer.log_end(**end_kwargs)
+            else:
+              await log_function_call_end(
+                db=context_for_this_call.current_db_session,
+                **end_kwargs,
+              )
         except Exception:  # pylint: disable=broad-except
           # Broad except is justified here as we must not let a logging failure
           # interrupt the protocol's exception propagation.
@@ -425,6 +442,24 @@ def protocol_function(
             protocol_definition.name,
           )
 
+        if error is None:
+          await run_progress.observe_call(
+            context_for_this_call.run_accession_id,
+            protocol_definition.fqn,
+            duration_ms,
+          )
+
+        # Step boundary: persist the state changes the step made.
+        run_state = getattr(context_for_this_call, "canonical_state", None)
+        if isinstance(run_state, PraxisState):
+          try:
+            await run_state.flush()
+          except Exception:  # pylint: disable=broad-except
+            logger.exception(
+              "Failed to persist run state after '%s'",
+              protocol_definition.name,
+            )
+
       if error:
         if isinstance(error, ProtocolCancelledError):
           raise error
@@ -16,6 +16,7 @@ from praxis.backend.core.orchestrator.error_handling import ErrorHandlingMixin
 from praxis.backend.core.orchestrator.execution import ExecutionMixin
 from praxis.backend.core.orchestrator.protocol_preparation import ProtocolPreparationMixin
 from praxis.backend.core.protocol_code_manager import ProtocolCodeManager
+from praxis.backend.core.storage.protocols import KeyValueStore
 from praxis.backend.core.workcell_runtime import WorkcellRuntime
 from praxis.backend.utils.logging import get_logger
 
@@ -44,6 +45,7 @@ class Orchestrator(
     protocol_run_service: "ProtocolRunService | None" = None,
     protocol_definition_service: "ProtocolDefinitionCRUDService | None" = None,
     scheduler: Any | None = None,
+    state_store: KeyValueStore | None = None,
   ) -> None:
     """Initialize the Orchestrator.
 
@@ -56,6 +58,8 @@ class Orchestrator(
         protocol_run_service: Service for protocol run operations.
         protocol_definition_service: Service for protocol definition operations.
         scheduler: Instance of ProtocolScheduler for releasing reservations.
+        state_store: Store persisting the PraxisState of each run. If None,
+            run state is kept in the configured Redis server.
 
     Raises:
         ValueError: If any of the arguments are invalid.
@@ -67,6 +71,7 @@ class Orchestrator(
     self.workcell_runtime = workcell_runtime
     self.protocol_code_manager = protocol_code_manager or ProtocolCodeManager()
     self.scheduler = scheduler
+    self.state_store = state_store
 
     if not protocol_run_service or not protocol_definition_service:
       # For backwards compatibility with tests that might not provide them yet,
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from praxis.backend.core.protocol_code_manager import ProtocolCodeManager
 from praxis.backend.core.run_context import PraxisRunContext
+from praxis.backend.core.storage.protocols import KeyValueStore
 from praxis.backend.core.workcell_runtime import WorkcellRuntime
 from praxis.backend.models import (
   FunctionProtocolDefinition,
@@ -18,8 +19,10 @@ from praxis.backend.models import (
   ProtocolRunStatusEnum,
 )
 from praxis.backend.models.domain.protocol import ProtocolRunCreate
+from praxis.backend.services.call_log_writer import FunctionCallLogWriter
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.services.protocols import ProtocolRunService
+from praxis.backend.services.run_progress import run_progress
 from praxis.backend.services.state import PraxisState
 from praxis.backend.utils.errors import ProtocolCancelledError
 from praxis.backend.utils.logging import get_logger
@@ -38,6 +41,7 @@ class ExecutionMixin:
   protocol_code_manager: ProtocolCodeManager
   protocol_run_service: ProtocolRunService
   protocol_definition_service: ProtocolDefinitionCRUDService
+  state_store: KeyValueStore | None
 
   # Type hints for methods from other mixins
   async def _get_protocol_definition_orm_from_db(self, *args, **kwargs) -> Any: ...
@@ -46,6 +50,32 @@ class ExecutionMixin:
   async def _prepare_arguments(self, *args, **kwargs) -> Any: ...
   async def _finalize_protocol_run(self, *args, **kwargs) -> Any: ...
 
+  async def _close_call_log_writer(self, run_context: PraxisRunContext) -> None:
+    """Flush the run's batched function call logs before the run is finalized."""
+    writer = getattr(run_context, "call_log_writer", None)
+    if not isinstance(writer, FunctionCallLogWriter):
+      return
+    try:
+      await writer.close()
+    except Exception:  # pylint: disable=broad-except
+      logger.exception(
+        "ORCH: Failed to flush function call logs for run %s.",
+        run_context.run_accession_id,
+      )
+
+  async def _close_praxis_state(self, run_context: PraxisRunContext) -> None:
+    """Write the run's pending state changes before the run is finalized."""
+    state = getattr(run_context, "canonical_state", None)
+    if not isinstance(state, PraxisState):
+      return
+    try:
+      await state.close()
+    except Exception:  # pylint: disable=broad-except
+      logger.exception(
+        "ORCH: Failed to persist state for run %s.",
+        run_context.run_accession_id,
+      )
+
   async def _handle_pre_execution_checks(
     self,
     protocol_run_model: ProtocolRun,
@@ -165,6 +195,14 @@ class ExecutionMixin:
 
     self.workcell_runtime.add_state_listener(state_listener)
 
+    # Track progress against the definition's previous runs
+    await run_progress.start_run(
+      self.db_session_factory,
+      run_accession_id,
+      protocol_def_model,
+      kv_store=self.state_store,
+    )
+
     # Load deck construction function if specified
     deck_construction_func = None
     if protocol_pydantic_def.deck_construction_function_fqn:
@@ -215,6 +253,7 @@ class ExecutionMixin:
     commit_hash: str | None = None,
     source_name: str | None = None,
     is_simulation: bool = False,
+    synchronous_call_logging: bool = False,
   ) -> ProtocolRun:
     """Execute a specified protocol.
 
@@ -226,6 +265,9 @@ class ExecutionMixin:
         commit_hash: Optional commit hash for version control.
         source_name: Optional source name.
         is_simulation: If True, run in simulation mode (no hardware interaction).
+        synchronous_call_logging: If True, write each function call log before the
+            call proceeds instead of batching them in the background. Use this for
+            audit-critical runs.
 
     Returns:
         ProtocolRun: The completed protocol run record.
@@ -281,6 +323,7 @@ class ExecutionMixin:
         protocol_run_db_obj,
         initial_state_data,
         db_session,
+        synchronous_call_logging=synchronous_call_logging,
       )
       praxis_state = run_context.canonical_state  # For direct access in this method
 
@@ -326,6 +369,8 @@ class ExecutionMixin:
           db_session,
         )
       finally:
+        await self._close_call_log_writer(run_context)
+        await self._close_praxis_state(run_context)
         await self._finalize_protocol_run(
           protocol_run_db_obj,
           praxis_state,
@@ -339,6 +384,7 @@ class ExecutionMixin:
           await db_session.rollback()
 
         # Clean up active state cache
+        await run_progress.finish_run(run_accession_id)
         if self.protocol_run_service:
           self.protocol_run_service.remove_active_run_state(run_accession_id)
 
@@ -351,6 +397,7 @@ class ExecutionMixin:
     user_input_params: dict[str, Any] | None = None,
     initial_state_data: dict[str, Any] | None = None,
     is_simulation: bool = False,
+    synchronous_call_logging: bool = False,
   ) -> ProtocolRun:
     """Execute an existing protocol run (typically called from Celery workers).
 
@@ -359,6 +406,9 @@ class ExecutionMixin:
         user_input_params: User-provided input parameters.
         initial_state_data: Initial state data for the run.
         is_simulation: If True, run in simulation mode (no hardware interaction).
+        synchronous_call_logging: If True, write each function call log before the
+            call proceeds instead of batching them in the background. Use this for
+            audit-critical runs.
 
     Returns:
         ProtocolRun: The completed protocol run record.
@@ -408,6 +458,7 @@ class ExecutionMixin:
         protocol_run_model,
         initial_state_data,
         db_session,
+        synchronous_call_logging=synchronous_call_logging,
       )
       praxis_state = run_context.canonical_state
 
@@ -456,6 +507,8 @@ class ExecutionMixin:
           db_session,
         )
       finally:
+        await self._close_call_log_writer(run_context)
+        await self._close_praxis_state(run_context)
         # The ORM object might be stale after the try/except block, especially
         # if status was updated. We get the latest version before finalizing.
         final_run_model = await db_session.get(ProtocolRun, run_accession_id)
@@ -479,6 +532,7 @@ class ExecutionMixin:
           await db_session.rollback()
 
         # Clean up active state cache
+        await run_progress.finish_run(run_accession_id)
         if self.protocol_run_service:
           self.protocol_run_service.remove_active_run_state(run_accession_id)
 
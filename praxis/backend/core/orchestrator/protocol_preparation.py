@@ -4,16 +4,18 @@ import uuid
 from collections.abc import Callable
 from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from praxis.backend.core.protocol_code_manager import ProtocolCodeManager
 from praxis.backend.core.run_context import PraxisRunContext
+from praxis.backend.core.storage.protocols import KeyValueStore
 from praxis.backend.core.workcell_runtime import WorkcellRuntime
 from praxis.backend.models import (
   FunctionProtocolDefinition,
   FunctionProtocolDefinitionCreate,
   ProtocolRun,
 )
+from praxis.backend.services.call_log_writer import FunctionCallLogWriter
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.services.state import PraxisState
 from praxis.backend.utils.logging import get_logger
@@ -25,9 +27,11 @@ class ProtocolPreparationMixin:
   """Mixin for protocol preparation and argument processing."""
 
   # Type hints for dependencies expected from the main class
+  db_session_factory: async_sessionmaker[AsyncSession]
   protocol_code_manager: ProtocolCodeManager
   workcell_runtime: WorkcellRuntime
   protocol_definition_service: ProtocolDefinitionCRUDService
+  state_store: KeyValueStore | None
 
   async def _get_protocol_definition_orm_from_db(
     self,
@@ -64,9 +68,18 @@ class ProtocolPreparationMixin:
     protocol_run_model: ProtocolRun,
     initial_state_data: dict[str, Any],
     db_session: AsyncSession,
+    synchronous_call_logging: bool = False,
   ) -> PraxisRunContext:
-    """Initialize PraxisState and PraxisRunContext for a protocol run."""
-    praxis_state = PraxisState(run_accession_id=protocol_run_model.accession_id)
+    """Initialize PraxisState and PraxisRunContext for a protocol run.
+
+    Unless ``synchronous_call_logging`` is set, function call logs for the run are
+    written in batches by a ``FunctionCallLogWriter`` on its own sessions.
+    """
+    praxis_state = PraxisState(
+      store=self.state_store,
+      run_accession_id=protocol_run_model.accession_id,
+    )
+    await praxis_state.load()
     if initial_state_data:
       praxis_state.update(initial_state_data)
 
@@ -106,6 +119,9 @@ class ProtocolPreparationMixin:
       current_db_session=db_session,
       runtime=self.workcell_runtime,
       current_call_log_db_accession_id=None,
+      call_log_writer=(
+        None if synchronous_call_logging else FunctionCallLogWriter(self.db_session_factory)
+      ),
       _shared_run_data=shared_run_data,
     )
 
@@ -2,7 +2,9 @@
 
 This module provides a service that resolves protocol preconditions against
 the current deck state and available assets, generating deck configuration
-recommendations for unmet requirements.
+recommendations for unmet requirements. Placements for resources that are not
+yet on the deck come from the travel-minimizing auto-layout solver in
+``deck_layout_solver``.
 
 The resolver handles:
 - Resource placement preconditions (resource must be on deck)
@@ -16,6 +18,11 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from praxis.backend.core.deck_config import DeckLayoutConfig, ResourcePlacement
+from praxis.backend.core.deck_layout_solver import (
+  DEFAULT_TIME_BUDGET_S,
+  DeckLayoutSolution,
+  solve_deck_layout,
+)
 from praxis.backend.utils.plr_static_analysis.models import (
   PreconditionType,
   ProtocolComputationGraph,
@@ -84,6 +91,12 @@ class ResolutionResult(BaseModel):
   suggested_placements: list[ResourcePlacement] = Field(
     default_factory=list, description="Suggested resource placements"
   )
+  predicted_travel_mm: float | None = Field(
+    default=None, description="Estimated head and gripper travel of the deck config"
+  )
+  unplaced_resources: list[str] = Field(
+    default_factory=list, description="Resources the auto-layout could not fit on the deck"
+  )
 
   # Summary
   total_preconditions: int = 0
@@ -156,9 +169,15 @@ class PreconditionResolver:
 
   """
 
-  def __init__(self) -> None:
-    """Initialize the resolver."""
+  def __init__(self, layout_time_budget_s: float = DEFAULT_TIME_BUDGET_S) -> None:
+    """Initialize the resolver.
+
+    Args:
+        layout_time_budget_s: Time budget for the deck auto-layout search.
+
+    """
     self._registry = get_registry()
+    self.layout_time_budget_s = layout_time_budget_s
 
   def resolve(
     self,
@@ -207,10 +226,15 @@ class PreconditionResolver:
 
     # Generate deck configuration if needed
     if result.auto_satisfiable or result.needs_user_input:
-      result.deck_config = self._generate_deck_config(
-        graph, deck_state, result.auto_satisfiable + result.needs_user_input
+      layout = self._generate_deck_config(
+        graph, deck_state, result.auto_satisfiable + result.needs_user_input, available_assets
       )
-      result.suggested_placements = result.deck_config.placements if result.deck_config else []
+      result.deck_config = layout.config
+      result.suggested_placements = layout.config.placements
+      result.predicted_travel_mm = layout.predicted_travel_mm
+      result.unplaced_resources = layout.unplaced
+      if layout.unplaced:
+        result.requires_user_input = True
 
     # Generate summary
     result.summary = self._generate_summary(result)
@@ -418,53 +442,52 @@ class PreconditionResolver:
     graph: ProtocolComputationGraph,
     deck_state: DeckState,
     preconditions: list[PreconditionStatus],
-  ) -> DeckLayoutConfig:
+    available_assets: list[dict[str, Any]] | None = None,
+  ) -> DeckLayoutSolution:
     """Generate a deck configuration for preconditions.
 
+    Resources that need a placement are assigned to carrier sites or slots by
+    the auto-layout solver, which minimizes the head and gripper travel implied
+    by the graph's operation sequence.
+
     Args:
         graph: The computation graph.
         deck_state: Current deck state.
         preconditions: Preconditions that need placements.
+        available_assets: Available assets, used to pick concrete resource classes.
 
     Returns:
-        DeckLayoutConfig with recommended placements.
+        DeckLayoutSolution with the recommended DeckLayoutConfig and its score.
 
     """
-    placements: list[ResourcePlacement] = []
-    seen_resources: set[str] = set()
+    to_place: list[str] = []
+    resource_fqns: dict[str, str] = {}
 
     for precond_status in preconditions:
       if precond_status.precondition_type != PreconditionType.RESOURCE_ON_DECK:
         continue
 
       var_name = precond_status.resource_variable
-      if var_name in seen_resources:
-        continue
-
       resource = graph.resources.get(var_name)
-      if not resource:
+      if not resource or var_name in to_place:
         continue
 
-      seen_resources.add(var_name)
-
-      # Create a placement entry
-      # In production, this would include FQN lookup from asset catalog
-      placement = ResourcePlacement(
-        resource_fqn=f"pylabrobot.resources.{resource.declared_type}",  # Placeholder
-        name=var_name,
-        slot=None,  # To be filled by user or auto-layout
-        position=None,
-        rotation=None,
-        parent_name=None,
-      )
-      placements.append(placement)
-
-    return DeckLayoutConfig(
-      deck_fqn=deck_state.deck_fqn or "pylabrobot.resources.Deck",
-      deck_kwargs={},
-      placements=placements,
-      description=f"Generated deck config for {graph.protocol_name}",
+      to_place.append(var_name)
+      matches = self._find_matching_assets(resource, available_assets or [])
+      if matches and matches[0].asset_fqn:
+        resource_fqns[var_name] = matches[0].asset_fqn
+
+    solution = solve_deck_layout(
+      graph,
+      to_place,
+      deck_type=deck_state.deck_type,
+      deck_fqn=deck_state.deck_fqn,
+      resource_positions=deck_state.resource_positions,
+      resource_fqns=resource_fqns,
+      time_budget_s=self.layout_time_budget_s,
     )
+    solution.config.description = f"Generated deck config for {graph.protocol_name}"
+    return solution
 
   def _generate_summary(self, result: ResolutionResult) -> str:
     """Generate a human-readable summary of the resolution."""
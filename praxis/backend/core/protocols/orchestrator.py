@@ -23,6 +23,7 @@ class IOrchestrator(Protocol):
     commit_hash: str | None = None,
     source_name: str | None = None,
     is_simulation: bool = False,
+    synchronous_call_logging: bool = False,
   ) -> ProtocolRun: ...
 
   async def execute_existing_protocol_run(
@@ -31,4 +32,5 @@ class IOrchestrator(Protocol):
     user_input_params: dict[str, Any] | None = None,
     initial_state_data: dict[str, Any] | None = None,
     is_simulation: bool = False,
+    synchronous_call_logging: bool = False,
   ) -> ProtocolRun: ...
@@ -29,6 +29,7 @@ from pydantic import BaseModel
 from pylabrobot.resources import Deck, Resource
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from praxis.backend.services.call_log_writer import FunctionCallLogWriter
 from praxis.backend.services.state import PraxisState
 
 DeckInputType = str | os.PathLike | io.IOBase | Deck
@@ -70,6 +71,10 @@ class PraxisRunContext:
   """The last state snapshot that was logged (either before or after a call).
   Used to calculate diffs for subsequent logging entries.
   """
+  call_log_writer: FunctionCallLogWriter | None = None
+  """Batched writer for function call logs, shared across all calls in the run.
+  If None, calls are logged synchronously on `current_db_session`.
+  """
   _shared_run_data: dict[str, Any] = None  # type: ignore[assignment]
   """Internal dictionary shared across all nested contexts in a run.
   Used to hold mutable run-global data like the last logged state.
@@ -130,6 +135,7 @@ class PraxisRunContext:
       simulation_state=self.simulation_state,
       runtime=self.runtime,
       current_call_log_db_accession_id=new_parent_call_log_db_accession_id,
+      call_log_writer=self.call_log_writer,
       _shared_run_data=self._shared_run_data,
     )
     nested_ctx._call_sequence_next_val = self._call_sequence_next_val
@@ -21,6 +21,7 @@ from praxis.backend.models.enums import ProtocolRunStatusEnum
 from praxis.backend.models.pydantic_internals.runtime import RuntimeAssetRequirement
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.services.protocols import ProtocolRunService
+from praxis.backend.services.run_progress import run_progress
 from praxis.backend.utils.errors import AssetAcquisitionError, OrchestratorError
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.uuid import uuid7
@@ -177,6 +178,10 @@ class ProtocolScheduler:
           protocol_def,
           user_params,
         )
+        estimate = await run_progress.estimate_duration(self.db_session_factory, protocol_def)
+        estimated_duration_ms = int(estimate.mean_ms)
+        for requirement in requirements:
+          requirement.estimated_duration_ms = estimated_duration_ms
 
         try:
           await self.asset_reservation_manager.reserve_assets(
@@ -206,7 +211,7 @@ class ProtocolScheduler:
           protocol_run_id=protocol_run_model.accession_id,
           protocol_name=str(protocol_def.name),
           required_assets=requirements,
-          estimated_duration_ms=None,
+          estimated_duration_ms=estimated_duration_ms,
         )
         self._active_schedules[protocol_run_model.accession_id] = schedule_entry
 
@@ -17,6 +17,7 @@ Modules:
 - pipeline: Multi-level simulation orchestration
 - bounds_analyzer: Loop iteration analysis
 - failure_detector: Failure mode enumeration
+- result_cache: Content-addressed cache of simulation results
 """
 
 from praxis.backend.core.simulation.bounds_analyzer import (
@@ -35,6 +36,7 @@ from praxis.backend.core.simulation.failure_detector import (
 from praxis.backend.core.simulation.graph_replay import (
   GraphReplayEngine,
   GraphReplayResult,
+  LoopReplaySummary,
   ReplayState,
   ReplayViolation,
   replay_graph,
@@ -52,6 +54,12 @@ from praxis.backend.core.simulation.pipeline import (
   simulate_protocol,
   simulate_protocol_sync,
 )
+from praxis.backend.core.simulation.result_cache import (
+  SimulationResultCache,
+  configure_simulation_result_cache,
+  get_simulation_result_cache,
+  simulation_cache_key,
+)
 from praxis.backend.core.simulation.simulator import (
   SIMULATION_VERSION,
   ProtocolSimulationResult,
@@ -136,9 +144,15 @@ __all__ = [
   "analyze_protocol",
   "analyze_protocol_sync",
   "is_cache_valid",
+  # Result cache
+  "SimulationResultCache",
+  "configure_simulation_result_cache",
+  "get_simulation_result_cache",
+  "simulation_cache_key",
   # Graph replay (browser-compatible)
   "GraphReplayEngine",
   "GraphReplayResult",
+  "LoopReplaySummary",
   "ReplayState",
   "ReplayViolation",
   "replay_graph",
@@ -243,9 +243,13 @@ class BoundsAnalyzer:
         spec = self.infer_spec_from_type(name, resource.declared_type)
         self._resource_specs[name] = spec
 
-    # Find all foreach operations
+    # Find all loops and foreach operations
     bounds_map: dict[str, LoopBounds] = {}
 
+    for loop in graph.loops:
+      if loop.source_expression not in bounds_map:
+        bounds_map[loop.source_expression] = self.analyze_loop(loop.source_expression)
+
     for op in graph.operations:
       if op.foreach_source and op.foreach_source not in bounds_map:
         bounds = self.analyze_loop(op.foreach_source)
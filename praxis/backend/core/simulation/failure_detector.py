@@ -264,13 +264,11 @@ class FailureModeDetector:
 
   def _extract_resources(self, parameter_types: dict[str, str]) -> list[str]:
     """Extract resource names from parameter types."""
-    from praxis.common.type_inspection import extract_resource_types
+    from praxis.common.type_inspection import describe_type
 
-    resources = []
-    for name, type_hint in parameter_types.items():
-      if extract_resource_types(type_hint):
-        resources.append(name)
-    return resources
+    return [
+      name for name, type_hint in parameter_types.items() if describe_type(type_hint).resource_types
+    ]
 
   def _state_key(self, state: SimulationState) -> str:
     """Generate a hashable key for a state.
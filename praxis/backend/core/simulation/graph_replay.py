@@ -9,10 +9,18 @@ Key benefits:
 - Catches structural and state violations
 - Returns clear error messages
 
+Loops are replayed in O(body): each loop body is checked once against the
+state as one representative iteration. The iteration count (taken from the
+graph when exact, otherwise from `BoundsAnalyzer`) only scales the reported
+totals: `LoopReplaySummary` carries each body operation's
+`compute_aggregate_effect`, but those effects are not applied to the replay
+state, which tracks tip and deck presence rather than tip or volume counts.
+
 Limitations:
 - Cannot catch dynamic/runtime issues
 - Cannot execute conditional branches (uses static analysis)
-- Loop iterations estimated from items_x × items_y
+- Loop iterations without an exact count are estimated from items_x × items_y
+- Tip and volume depletion across loop iterations is not detected
 """
 
 from __future__ import annotations
@@ -23,6 +31,12 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from praxis.backend.core.simulation.bounds_analyzer import (
+  BoundsAnalyzer,
+  ItemizedResourceSpec,
+  LoopBounds,
+  compute_aggregate_effect,
+)
 from praxis.backend.core.simulation.method_contracts import get_contract
 from praxis.backend.core.simulation.state_models import (
   BooleanLiquidState,
@@ -30,8 +44,10 @@ from praxis.backend.core.simulation.state_models import (
   StateViolation,
   ViolationType,
 )
+from praxis.backend.utils.plr_static_analysis.compact_graph import CompactComputationGraph
 from praxis.backend.utils.plr_static_analysis.models import (
   GraphNodeType,
+  LoopNode,
   OperationNode,
   ProtocolComputationGraph,
 )
@@ -57,6 +73,21 @@ class ReplayViolation(BaseModel):
   line_number: int | None = Field(default=None, description="Source line if available")
 
 
+class LoopReplaySummary(BaseModel):
+  """Iteration count and aggregate effects of one replayed loop."""
+
+  loop_id: str = Field(description="ID of the loop (or legacy foreach node)")
+  source_expression: str = Field(description="Expression being iterated")
+  iteration_count: int | None = Field(default=None, description="Exact count, if known")
+  estimated_iterations: int = Field(description="Count used for totals when not exact")
+  is_bounded: bool = Field(default=False, description="Whether the count is known")
+  inferred_from: str | None = Field(default=None, description="How the count was determined")
+  body_operations: int = Field(default=0, description="Operations in one iteration")
+  aggregate_effects: list[dict[str, Any]] = Field(
+    default_factory=list, description="compute_aggregate_effect() of each body operation"
+  )
+
+
 class GraphReplayResult(BaseModel):
   """Result of replaying a computation graph."""
 
@@ -68,6 +99,14 @@ class GraphReplayResult(BaseModel):
 
   operations_executed: int = Field(default=0, description="Number of operations replayed")
 
+  operations_represented: int = Field(
+    default=0, description="Operations the replay stands for, counting every loop iteration"
+  )
+
+  loops: list[LoopReplaySummary] = Field(
+    default_factory=list, description="Per-loop iteration counts and aggregate effects"
+  )
+
   final_state_summary: dict[str, Any] = Field(
     default_factory=dict, description="Summary of final state"
   )
@@ -100,6 +139,24 @@ class ReplayState:
   errors: list[str] = field(default_factory=list)
   """Non-violation errors"""
 
+  operations: dict[str, OperationNode] = field(default_factory=dict)
+  """Operations by ID"""
+
+  loops: dict[str, LoopNode] = field(default_factory=dict)
+  """Loops by ID"""
+
+  bounds_analyzer: BoundsAnalyzer = field(default_factory=BoundsAnalyzer)
+  """Resolves symbolic loop counts from resource dimensions"""
+
+  loop_summaries: list[LoopReplaySummary] = field(default_factory=list)
+  """Summaries of replayed loops"""
+
+  operations_represented: int = 0
+  """Operations counted with loop multiplicity"""
+
+  multiplier: int = 1
+  """Iterations of the enclosing loops"""
+
 
 # =============================================================================
 # Graph Replay Engine
@@ -127,23 +184,29 @@ class GraphReplayEngine:
 
   def replay(
     self,
-    graph: ProtocolComputationGraph | dict[str, Any],
+    graph: ProtocolComputationGraph | CompactComputationGraph | dict[str, Any] | bytes,
     initial_state: SimulationState | None = None,
   ) -> GraphReplayResult:
     """Replay a computation graph with state simulation.
 
     Args:
-        graph: The computation graph to replay (Pydantic model or dict).
+        graph: The computation graph to replay (Pydantic model, dict, or compact
+            graph, either loaded or as the bytes from `CompactComputationGraph.to_bytes`).
         initial_state: Optional initial state (defaults to boolean with all true).
 
     Returns:
         GraphReplayResult with violations and state summary.
 
     """
-    # Parse graph if dict
-    if isinstance(graph, dict):
+    # Parse graph if dict or compact
+    if not isinstance(graph, ProtocolComputationGraph):
       try:
-        graph = ProtocolComputationGraph.model_validate(graph)
+        if isinstance(graph, bytes):
+          graph = CompactComputationGraph.from_bytes(graph)
+        if isinstance(graph, CompactComputationGraph):
+          graph = graph.to_graph()
+        else:
+          graph = ProtocolComputationGraph.model_validate(graph)
       except Exception as e:
         return GraphReplayResult(
           passed=False,
@@ -155,8 +218,13 @@ class GraphReplayEngine:
 
     # Process operations in execution order
     for i, op_id in enumerate(graph.execution_order):
+      if op_id in state.loops:
+        self._execute_loop(state.loops[op_id], graph, state, i)
+        state.operations_executed += 1
+        continue
+
       # Find operation by ID
-      operation = self._find_operation(graph, op_id)
+      operation = self._find_operation(state, op_id)
       if operation is None:
         state.errors.append(f"Operation {op_id} not found in graph")
         continue
@@ -170,6 +238,8 @@ class GraphReplayEngine:
       passed=len(state.violations) == 0 and len(state.errors) == 0,
       violations=state.violations,
       operations_executed=state.operations_executed,
+      operations_represented=state.operations_represented,
+      loops=state.loop_summaries,
       final_state_summary=self._summarize_state(state),
       replay_mode="graph",
       errors=state.errors,
@@ -209,18 +279,35 @@ class GraphReplayEngine:
         sim_state.liquid_state.set_has_liquid(var_name, True)
         sim_state.liquid_state.set_has_capacity(var_name, True)
 
-    return ReplayState(simulation_state=sim_state)
+    # Known dimensions take precedence over defaults inferred from the type
+    analyzer = BoundsAnalyzer()
+    for var_name, resource in graph.resources.items():
+      if resource.items_x and resource.items_y:
+        analyzer.add_resource_spec(
+          ItemizedResourceSpec(
+            resource_name=var_name,
+            resource_type=resource.declared_type,
+            items_x=resource.items_x,
+            items_y=resource.items_y,
+          )
+        )
+      else:
+        analyzer.add_resource_spec(analyzer.infer_spec_from_type(var_name, resource.declared_type))
+
+    return ReplayState(
+      simulation_state=sim_state,
+      operations={op.id: op for op in graph.operations},
+      loops={loop.id: loop for loop in graph.loops},
+      bounds_analyzer=analyzer,
+    )
 
   def _find_operation(
     self,
-    graph: ProtocolComputationGraph,
+    state: ReplayState,
     op_id: str,
   ) -> OperationNode | None:
     """Find operation by ID."""
-    for op in graph.operations:
-      if op.id == op_id:
-        return op
-    return None
+    return state.operations.get(op_id)
 
   def _execute_operation(
     self,
@@ -230,11 +317,16 @@ class GraphReplayEngine:
     index: int,
   ) -> None:
     """Execute a single operation and check for violations."""
-    # Handle foreach nodes (loops)
-    if operation.node_type == GraphNodeType.FOREACH:
+    # Handle foreach nodes (loops); operations inside a loop are FOREACH too
+    # but carry no body of their own
+    if operation.node_type == GraphNodeType.FOREACH and any(
+      body_id != operation.id for body_id in operation.foreach_body
+    ):
       self._execute_foreach(operation, graph, state, index)
       return
 
+    state.operations_represented += state.multiplier
+
     # Handle conditional nodes
     if operation.node_type == GraphNodeType.CONDITIONAL:
       # For now, we analyze both branches
@@ -273,19 +365,77 @@ class GraphReplayEngine:
     state: ReplayState,
     index: int,
   ) -> None:
-    """Execute a foreach loop node.
+    """Execute a foreach operation node (graphs without LoopNodes)."""
+    loop = LoopNode(
+      id=operation.id,
+      line_number=operation.line_number,
+      source_expression=operation.foreach_source or "",
+      body=[body_id for body_id in operation.foreach_body if body_id != operation.id],
+    )
+    self._execute_loop(loop, graph, state, index)
 
-    Uses items_x × items_y to estimate iteration count, then
-    executes body operations once (representing one iteration).
-    """
-    # Get iteration count estimate
-    self._estimate_loop_iterations(operation, graph)
+  def _execute_loop(
+    self,
+    loop: LoopNode,
+    graph: ProtocolComputationGraph,
+    state: ReplayState,
+    index: int,
+  ) -> None:
+    """Execute a loop body once and record its aggregate effects.
 
-    # Execute body operations (representing loop body)
-    for body_op_id in operation.foreach_body:
-      body_op = self._find_operation(graph, body_op_id)
-      if body_op:
+    The body is checked against the state as one representative iteration
+    instead of replaying every iteration. The iteration count scales
+    ``operations_represented`` and the reported aggregate effects; it is not
+    applied to the replay state.
+    """
+    bounds = self._loop_bounds(loop, graph, state)
+    iterations = bounds.exact_count or self._estimate_loop_iterations(loop, graph)
+    summary = LoopReplaySummary(
+      loop_id=loop.id,
+      source_expression=loop.source_expression,
+      iteration_count=bounds.exact_count,
+      estimated_iterations=iterations,
+      is_bounded=bounds.exact_count is not None,
+      inferred_from=bounds.inferred_from,
+    )
+    state.loop_summaries.append(summary)
+
+    outer_multiplier = state.multiplier
+    state.multiplier = outer_multiplier * iterations
+    try:
+      for body_id in loop.body:
+        if body_id in state.loops:
+          self._execute_loop(state.loops[body_id], graph, state, index)
+          continue
+        body_op = self._find_operation(state, body_id)
+        if body_op is None:
+          state.errors.append(f"Operation {body_id} not found in graph")
+          continue
         self._execute_operation(body_op, graph, state, index)
+        summary.body_operations += 1
+        summary.aggregate_effects.append(compute_aggregate_effect(body_op, bounds))
+    finally:
+      state.multiplier = outer_multiplier
+
+  def _loop_bounds(
+    self,
+    loop: LoopNode,
+    graph: ProtocolComputationGraph,
+    state: ReplayState,
+  ) -> LoopBounds:
+    """Return the loop's exact count if stored, otherwise analyze its source."""
+    if loop.iteration_count is not None:
+      return LoopBounds(
+        source_expression=loop.source_expression,
+        exact_count=loop.iteration_count,
+        min_count=loop.iteration_count,
+        max_count=loop.iteration_count,
+        inferred_from=loop.inferred_from or "graph",
+      )
+    bounds = state.bounds_analyzer.analyze_loop(loop.source_expression)
+    if loop.max_iterations is not None and bounds.max_count is None:
+      bounds.max_count = loop.max_iterations
+    return bounds
 
   def _execute_conditional(
     self,
@@ -300,13 +450,13 @@ class GraphReplayEngine:
     """
     # Execute true branch
     for branch_op_id in operation.true_branch:
-      branch_op = self._find_operation(graph, branch_op_id)
+      branch_op = self._find_operation(state, branch_op_id)
       if branch_op:
         self._execute_operation(branch_op, graph, state, index)
 
     # Execute false branch
     for branch_op_id in operation.false_branch:
-      branch_op = self._find_operation(graph, branch_op_id)
+      branch_op = self._find_operation(state, branch_op_id)
       if branch_op:
         self._execute_operation(branch_op, graph, state, index)
 
@@ -439,12 +589,14 @@ class GraphReplayEngine:
 
   def _estimate_loop_iterations(
     self,
-    operation: OperationNode,
+    loop: LoopNode,
     graph: ProtocolComputationGraph,
   ) -> int:
     """Estimate loop iterations from resource dimensions."""
-    if operation.foreach_source:
-      source_var = operation.foreach_source.split(".")[0]
+    if loop.max_iterations:
+      return loop.max_iterations
+    if loop.source_expression:
+      source_var = loop.source_expression.split(".")[0].split("[")[0]
       if source_var in graph.resources:
         resource = graph.resources[source_var]
         if resource.items_x and resource.items_y:
@@ -469,7 +621,7 @@ class GraphReplayEngine:
 
 
 def replay_graph(
-  graph: ProtocolComputationGraph | dict[str, Any],
+  graph: ProtocolComputationGraph | CompactComputationGraph | dict[str, Any] | bytes,
   initial_state: SimulationState | None = None,
 ) -> GraphReplayResult:
   """Replay a computation graph with state simulation.
@@ -8,12 +8,20 @@ This module orchestrates multi-level protocol simulation:
 
 The hierarchical approach enables efficient simulation by detecting
 issues at the cheapest level that can catch them.
+
+The protocol is executed once with stateful tracers, during the boolean
+pass, which also records every machine call. The symbolic and exact levels
+replay that call stream against their own state models instead of running
+the protocol's Python control flow again. Protocols whose trace evaluated a
+traced condition fall back to re-execution per level, because the branch a
+condition takes may depend on the state.
 """
 
 from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
@@ -24,13 +32,13 @@ from praxis.backend.core.simulation.state_models import (
   StateViolation,
 )
 from praxis.backend.core.simulation.stateful_tracers import (
+  RecordedCall,
   StatefulTracedMachine,
   StatefulTracedResource,
 )
 from praxis.backend.core.tracing.executor import (
   ProtocolTracingExecutor,
   TracingError,
-  infer_machine_type,
 )
 from praxis.backend.core.tracing.recorder import OperationRecorder
 from praxis.backend.utils.async_run import run_sync
@@ -38,7 +46,7 @@ from praxis.backend.utils.plr_static_analysis.resource_hierarchy import (
   DeckLayoutType,
   get_parental_chain,
 )
-from praxis.common.type_inspection import extract_resource_types
+from praxis.common.type_inspection import describe_type
 
 if TYPE_CHECKING:
   from collections.abc import Callable
@@ -62,7 +70,9 @@ class HierarchicalSimulationResult(BaseModel):
 
   passed: bool = Field(default=False, description="Whether simulation passed all levels")
 
-  level_completed: str = Field(default="none", description="Highest level completed without failure")
+  level_completed: str = Field(
+    default="none", description="Highest level completed without failure"
+  )
 
   level_failed: str | None = Field(default=None, description="Level at which simulation failed")
 
@@ -72,9 +82,13 @@ class HierarchicalSimulationResult(BaseModel):
     default_factory=list, description="Requirements inferred from simulation"
   )
 
-  computation_graph: dict[str, Any] | None = Field(default=None, description="Extracted computation graph")
+  computation_graph: dict[str, Any] | None = Field(
+    default=None, description="Extracted computation graph"
+  )
 
-  structural_error: str | None = Field(default=None, description="Structural error if Level 0 failed")
+  structural_error: str | None = Field(
+    default=None, description="Structural error if Level 0 failed"
+  )
 
   edge_cases: list[dict[str, Any]] = Field(
     default_factory=list, description="Edge cases detected at exact level"
@@ -88,6 +102,32 @@ class HierarchicalSimulationResult(BaseModel):
 # =============================================================================
 
 
+@dataclass
+class OperationTrace:
+  """Machine calls recorded by one stateful execution of a protocol."""
+
+  recorder: OperationRecorder
+  """Recorder holding the traced operation graph"""
+
+  machines: list[StatefulTracedMachine] = field(default_factory=list)
+  """Machine tracers, in parameter order"""
+
+  resources: list[str] = field(default_factory=list)
+  """Names of resource parameters"""
+
+  calls: list[RecordedCall] = field(default_factory=list)
+  """Machine calls in execution order"""
+
+  @cached_property
+  def replayable(self) -> bool:
+    """Whether the calls are independent of the state they were traced against.
+
+    A traced condition picks its branch during tracing, so a protocol that
+    evaluated one may take a different path against another state.
+    """
+    return not self.recorder.build_graph().has_conditionals
+
+
 @dataclass
 class StatefulSimulationResult:
   """Result of running protocol with stateful tracers."""
@@ -101,6 +141,9 @@ class StatefulSimulationResult:
   exception: Exception | None = None
   """Exception if execution failed"""
 
+  trace: OperationTrace | None = None
+  """Recorded calls, for replaying the execution against other states"""
+
 
 # =============================================================================
 # Hierarchical Simulator
@@ -110,14 +153,17 @@ class StatefulSimulationResult:
 class HierarchicalSimulator:
   """Runs protocol with state-aware tracers at multiple precision levels.
 
-  The simulator executes the protocol multiple times with increasing
-  precision, detecting issues at the cheapest level possible:
+  The simulator checks the protocol at increasing precision, detecting
+  issues at the cheapest level possible:
 
   1. Level 0 (Structural): Catch wrong methods, bad signatures
   2. Level 1 (Boolean): Catch missing tips, empty wells (fast)
   3. Level 2 (Symbolic): Catch constraint violations (medium)
   4. Level 3 (Exact): Catch numeric edge cases (precise)
 
+  Levels 2 and 3 replay the machine calls recorded during level 1 rather
+  than executing the protocol again (see `OperationTrace`).
+
   Usage:
       simulator = HierarchicalSimulator()
       result = await simulator.simulate(
@@ -134,14 +180,19 @@ class HierarchicalSimulator:
   def __init__(
     self,
     deck_layout_type: DeckLayoutType = DeckLayoutType.CARRIER_BASED,
+    replay: bool = True,
   ) -> None:
     """Initialize the simulator.
 
     Args:
         deck_layout_type: Type of deck layout for resource hierarchy.
+        replay: Evaluate the symbolic and exact levels by replaying the
+            boolean pass's recorded calls. If False, re-execute the protocol
+            for every level and edge case.
 
     """
     self._deck_layout_type = deck_layout_type
+    self._replay = replay
     self._base_executor = ProtocolTracingExecutor(deck_layout_type=deck_layout_type)
 
   async def simulate(
@@ -195,7 +246,7 @@ class HierarchicalSimulator:
 
     # Level 2: Symbolic state pass
     sym_state = bool_state.promote()
-    sym_result = await self._run_with_state(protocol_func, parameter_types, sym_state)
+    sym_result = await self._run_level(protocol_func, parameter_types, sym_state, bool_result.trace)
 
     if sym_result.violations and not run_all_levels:
       all_violations = bool_result.violations + sym_result.violations
@@ -215,7 +266,9 @@ class HierarchicalSimulator:
 
     for case in edge_cases:
       exact_state = sym_state.promote_to_exact_with_values(case)
-      exact_result = await self._run_with_state(protocol_func, parameter_types, exact_state)
+      exact_result = await self._run_level(
+        protocol_func, parameter_types, exact_state, bool_result.trace
+      )
       if exact_result.violations:
         exact_violations.extend(exact_result.violations)
 
@@ -290,11 +343,18 @@ class HierarchicalSimulator:
         state: Initial simulation state.
 
     Returns:
-        Result with final state and violations.
+        Result with final state, violations and the recorded call trace.
 
     """
     # Create stateful tracers
-    tracers = self._create_stateful_tracers(parameter_types, state)
+    trace = OperationTrace(
+      recorder=OperationRecorder(
+        protocol_fqn="simulation",
+        protocol_name="simulation",
+        parameter_types=parameter_types,
+      ),
+    )
+    tracers = self._create_stateful_tracers(parameter_types, state, trace)
 
     # Execute protocol
     try:
@@ -307,45 +367,105 @@ class HierarchicalSimulator:
 
     # Collect violations from all machine tracers
     violations: list[StateViolation] = []
-    for tracer in tracers.values():
-      if isinstance(tracer, StatefulTracedMachine):
-        violations.extend(tracer.violations)
+    for machine in trace.machines:
+      violations.extend(machine.violations)
+
+    return StatefulSimulationResult(
+      final_state=state,
+      violations=violations,
+      trace=trace,
+    )
+
+  async def _run_level(
+    self,
+    protocol_func: Callable[..., Any],
+    parameter_types: dict[str, str],
+    state: SimulationState,
+    trace: OperationTrace | None,
+  ) -> StatefulSimulationResult:
+    """Evaluate one precision level, by replay when the trace allows it."""
+    if self._replay and trace is not None and trace.replayable:
+      return self._replay_with_state(trace, state)
+    return await self._run_with_state(protocol_func, parameter_types, state)
+
+  def _replay_with_state(
+    self,
+    trace: OperationTrace,
+    state: SimulationState,
+  ) -> StatefulSimulationResult:
+    """Re-evaluate recorded machine calls against a new state.
+
+    Produces the same violations as executing the protocol again with
+    stateful tracers on ``state``, without running its control flow.
+
+    Args:
+        trace: Calls recorded by a previous stateful execution.
+        state: Initial simulation state for this level.
+
+    Returns:
+        Result with final state and violations.
+
+    """
+    for name in trace.resources:
+      self._prepare_resource_state(name, state)
+
+    machines = {
+      machine.name: StatefulTracedMachine(
+        name=machine.name,
+        recorder=trace.recorder,
+        declared_type=machine.declared_type,
+        machine_type=machine.machine_type,
+        state=state,
+        continue_on_violation=machine.continue_on_violation,
+      )
+      for machine in trace.machines
+    }
+    for call in trace.calls:
+      try:
+        machines[call.machine].replay_call(call)
+      except Exception:
+        # Execution would have stopped at the same call
+        break
+
+    violations: list[StateViolation] = []
+    for machine in machines.values():
+      violations.extend(machine.violations)
 
     return StatefulSimulationResult(
       final_state=state,
       violations=violations,
+      trace=trace,
     )
 
   def _create_stateful_tracers(
     self,
     parameter_types: dict[str, str],
     state: SimulationState,
+    trace: OperationTrace,
   ) -> dict[str, Any]:
     """Create stateful tracer objects for each parameter.
 
     Args:
         parameter_types: Mapping of parameter names to type hints.
         state: Simulation state to share among tracers.
+        trace: Trace that collects the machines, resources and calls.
 
     Returns:
         Dictionary of parameter names to tracer objects.
 
     """
-    # Create a recorder for tracking operations
-    recorder = OperationRecorder(
-      protocol_fqn="simulation",
-      protocol_name="simulation",
-      parameter_types=parameter_types,
-    )
-
     tracers: dict[str, Any] = {}
 
     for param_name, type_hint in parameter_types.items():
-      tracer = self._create_stateful_tracer_for_type(
-        param_name, type_hint, recorder, state
-      )
-      if tracer is not None:
-        tracers[param_name] = tracer
+      tracer = self._create_stateful_tracer_for_type(param_name, type_hint, trace.recorder, state)
+      if tracer is None:
+        continue
+      tracers[param_name] = tracer
+      if isinstance(tracer, StatefulTracedMachine):
+        tracer.call_log = trace.calls
+        trace.machines.append(tracer)
+      elif isinstance(tracer, StatefulTracedResource):
+        trace.resources.append(param_name)
 
     return tracers
 
@@ -357,19 +477,20 @@ class HierarchicalSimulator:
     state: SimulationState,
   ) -> Any:
     """Create appropriate stateful tracer for a type hint."""
+    descriptor = describe_type(type_hint)
+
     # Check for machine types
-    machine_type = infer_machine_type(type_hint)
-    if machine_type:
+    if descriptor.machine_type:
       return StatefulTracedMachine(
         name=name,
         recorder=recorder,
         declared_type=type_hint,
-        machine_type=machine_type,
+        machine_type=descriptor.machine_type,
         state=state,
       )
 
     # Check for PLR resource types
-    resource_types = extract_resource_types(type_hint)
+    resource_types = descriptor.resource_types
     if resource_types:
       primary_type = resource_types[0]
       chain = get_parental_chain(primary_type, self._deck_layout_type)
@@ -383,13 +504,7 @@ class HierarchicalSimulator:
         parental_chain=chain.chain,
       )
 
-      # Mark as on deck in state
-      state.deck_state.place_on_deck(name)
-
-      # Mark as having liquid (default assumption for source resources)
-      if isinstance(state.liquid_state, BooleanLiquidState):
-        state.liquid_state.set_has_liquid(name, True)
-        state.liquid_state.set_has_capacity(name, True)
+      self._prepare_resource_state(name, state)
 
       return StatefulTracedResource(
         name=name,
@@ -415,6 +530,16 @@ class HierarchicalSimulator:
 
     return None
 
+  def _prepare_resource_state(self, name: str, state: SimulationState) -> None:
+    """Apply the initial state assumptions for a resource parameter."""
+    # Mark as on deck in state
+    state.deck_state.place_on_deck(name)
+
+    # Mark as having liquid (default assumption for source resources)
+    if isinstance(state.liquid_state, BooleanLiquidState):
+      state.liquid_state.set_has_liquid(name, True)
+      state.liquid_state.set_has_capacity(name, True)
+
   def _get_default_for_primitive(self, type_hint: str) -> Any:
     """Get default value for primitive types."""
     defaults: dict[str, Any] = {
@@ -0,0 +1,417 @@
+"""Content-addressed cache of protocol simulation results.
+
+Simulating a protocol traces it at the structural, boolean and symbolic levels
+and once more per exact edge case, then enumerates failure modes. The result
+only depends on the protocol's code, its parameter types, the initial state and
+the simulator itself, so it is cached under a digest of exactly those inputs:
+
+- the protocol source, normalized through its AST so that formatting,
+  comments, the docstring, the function name and its decorators do not matter;
+- the normalized source of the module defining it, which covers the helpers and
+  module-level constants the protocol calls;
+- the parameter name -> type hint map;
+- a canonical form of the initial `SimulationState` (``"default"`` if none);
+- `SIMULATION_VERSION` and the simulator configuration.
+
+Definitions that share code (copies under different names in one module,
+re-discovered modules, re-submitted protocols) therefore share one cached
+result, while identical bodies calling different helpers do not.
+
+Entries live in a `KeyValueStore`, so with the Redis backend they are shared by
+every API and Celery worker. Each entry expires after ``ttl_seconds``; a hash
+of last-access times, one field per entry, evicts the least recently used
+entries once there are more than ``max_entries``. A hit rewrites only its own
+field, so concurrent workers never overwrite each other's accesses, and a single
+worker at a time evicts, holding a lease taken with ``compare_and_set``.
+
+Key Patterns:
+- "sim:result:{digest}" -> ProtocolSimulationResult cache dict
+- "sim:result:lru" -> hash {digest: last access (epoch seconds)}
+- "sim:result:eviction" -> lease of the worker currently evicting
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import hashlib
+import inspect
+import json
+import linecache
+import textwrap
+import time
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from praxis.backend.configure import PraxisConfiguration
+from praxis.backend.core.simulation.simulator import SIMULATION_VERSION, ProtocolSimulationResult
+from praxis.backend.core.storage import StorageBackend, StorageFactory
+from praxis.backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
+
+  from praxis.backend.core.simulation.state_models import SimulationState
+  from praxis.backend.core.storage.protocols import KeyValueStore
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "sim:result:"
+KEY_LRU_INDEX = "sim:result:lru"
+KEY_EVICTION_LEASE = "sim:result:eviction"
+EVICTION_LEASE_SECONDS = 30
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2048
+
+
+# =============================================================================
+# Cache Keys
+# =============================================================================
+
+
+def _strip_docstrings(tree: ast.Module) -> None:
+  for node in ast.walk(tree):
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef | ast.Module):
+      body = node.body
+      if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and isinstance(body[0].value.value, str)
+      ):
+        node.body = body[1:] or [ast.Pass()]
+
+
+def normalize_protocol_source(source: str) -> str:
+  """Return a canonical form of a protocol function's source.
+
+  The source is parsed and dumped back from its AST without docstrings, and the
+  top-level function is renamed and stripped of its decorators (registration
+  metadata such as the protocol name and version), so edits that cannot change
+  the simulation (comments, whitespace, quoting, renaming) keep the same form.
+  Source that does not parse is returned dedented and stripped.
+  """
+  source = textwrap.dedent(source)
+  try:
+    tree = ast.parse(source)
+  except SyntaxError:
+    return source.strip()
+
+  _strip_docstrings(tree)
+  for node in tree.body:
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+      node.name = "protocol"
+      node.decorator_list = []
+  return ast.dump(tree, annotate_fields=False, include_attributes=False)
+
+
+def normalize_module_source(source: str) -> str:
+  """Return a canonical form of a module's source, ignoring docstrings and formatting."""
+  try:
+    tree = ast.parse(source)
+  except SyntaxError:
+    return source.strip()
+  _strip_docstrings(tree)
+  return ast.dump(tree, annotate_fields=False, include_attributes=False)
+
+
+def protocol_source_hash(protocol_func: Callable[..., Any]) -> str | None:
+  """Hash a protocol function's normalized source together with its module's.
+
+  The module source covers the helpers and globals the function calls, which
+  its own source only names. Returns None if either source is unavailable.
+  """
+  try:
+    source = inspect.getsource(protocol_func)
+    module_source = "".join(linecache.getlines(inspect.getsourcefile(protocol_func) or ""))
+  except (OSError, TypeError):
+    return None
+  if not module_source:
+    return None
+  digest = hashlib.sha256(normalize_protocol_source(source).encode())
+  digest.update(b"\0")
+  digest.update(normalize_module_source(module_source).encode())
+  return digest.hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+  """Convert a (dataclass) state into a JSON-ready structure with a stable order."""
+  if dataclasses.is_dataclass(value) and not isinstance(value, type):
+    return {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)}
+  if isinstance(value, dict):
+    return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+  if isinstance(value, set | frozenset):
+    return sorted((_canonical(v) for v in value), key=repr)
+  if isinstance(value, list | tuple):
+    return [_canonical(v) for v in value]
+  if isinstance(value, Enum):
+    return value.value
+  if value is None or isinstance(value, bool | int | float | str):
+    return value
+  return repr(value)
+
+
+def initial_state_key(initial_state: SimulationState | None) -> str:
+  """Return a stable key for an initial simulation state."""
+  if initial_state is None:
+    return "default"
+  canonical = json.dumps(_canonical(initial_state), sort_keys=True, separators=(",", ":"))
+  return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def simulation_cache_key(
+  source_hash: str,
+  parameter_types: dict[str, str],
+  initial_state: SimulationState | None = None,
+  simulator_config: dict[str, Any] | None = None,
+  simulation_version: str = SIMULATION_VERSION,
+) -> str:
+  """Return the content digest identifying one simulation.
+
+  Args:
+      source_hash: Hash of the normalized protocol source.
+      parameter_types: Mapping of parameter names to type hints.
+      initial_state: Initial state the simulation starts from.
+      simulator_config: Simulator settings that affect the result.
+      simulation_version: Simulator version; bumping it invalidates all entries.
+
+  """
+  payload = {
+    "source": source_hash,
+    "parameters": dict(sorted(parameter_types.items())),
+    "initial_state": initial_state_key(initial_state),
+    "simulator": _canonical(simulator_config or {}),
+    "version": simulation_version,
+  }
+  encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+  return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+@dataclass
+class SimulationCacheMetrics:
+  """Counters for one process's use of the simulation result cache."""
+
+  hits: int = 0
+  misses: int = 0
+  stores: int = 0
+  evictions: int = 0
+  errors: int = 0
+
+  def as_dict(self) -> dict[str, Any]:
+    """Return the counters and the hit ratio."""
+    lookups = self.hits + self.misses
+    return {
+      **dataclasses.asdict(self),
+      "hit_ratio": self.hits / lookups if lookups else 0.0,
+    }
+
+
+class SimulationResultCache:
+  """Cache of `ProtocolSimulationResult` objects in a `KeyValueStore`.
+
+  Storage errors are logged and counted but never raised: a failing cache
+  degrades to re-simulating.
+
+  Usage:
+      cache = SimulationResultCache(kv_store)
+      key = simulation_cache_key(source_hash, parameter_types)
+      result = await cache.get(key)
+      if result is None:
+          result = simulate(...)
+          await cache.put(key, result)
+
+  """
+
+  def __init__(
+    self,
+    kv_store: KeyValueStore,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+  ) -> None:
+    """Initialize the cache.
+
+    Args:
+        kv_store: Store holding the entries; share it between workers.
+        ttl_seconds: Lifetime of an entry after it is stored.
+        max_entries: Entries kept before least recently used ones are evicted.
+
+    """
+    self._kv = kv_store
+    self.ttl_seconds = ttl_seconds
+    self.max_entries = max_entries
+    self._metrics = SimulationCacheMetrics()
+    self._owner = uuid.uuid4().hex
+
+  async def get(self, key: str) -> ProtocolSimulationResult | None:
+    """Return the cached result for a key, or None on a miss."""
+    try:
+      data = await self._kv.get(KEY_PREFIX + key)
+      result = ProtocolSimulationResult.from_cache_dict(data) if data else None
+    except Exception:
+      logger.warning("Simulation cache lookup failed for %s", key, exc_info=True)
+      self._metrics.errors += 1
+      result = None
+
+    if result is None:
+      self._metrics.misses += 1
+      # Drop the access time of an entry that expired, so it stops counting.
+      await self._forget(key)
+      return None
+
+    self._metrics.hits += 1
+    await self._touch(key)
+    return result
+
+  async def put(self, key: str, result: ProtocolSimulationResult) -> None:
+    """Store a result, evicting least recently used entries if over capacity."""
+    try:
+      await self._kv.set(KEY_PREFIX + key, result.to_cache_dict(), ttl_seconds=self.ttl_seconds)
+      self._metrics.stores += 1
+    except Exception:
+      logger.warning("Simulation cache store failed for %s", key, exc_info=True)
+      self._metrics.errors += 1
+      return
+    await self._touch(key)
+    await self._evict(key)
+
+  async def invalidate(self, key: str) -> bool:
+    """Remove one entry. Returns True if it existed."""
+    await self._forget(key)
+    return await self._kv.delete(KEY_PREFIX + key)
+
+  async def clear(self) -> int:
+    """Remove every entry and the index. Returns the number of entries removed."""
+    removed = 0
+    cursor: str | None = None
+    while True:
+      cursor, keys = await self._kv.scan(KEY_PREFIX, cursor)
+      for key in keys:
+        if key not in {KEY_LRU_INDEX, KEY_EVICTION_LEASE} and await self._kv.delete(key):
+          removed += 1
+      if cursor is None:
+        break
+    await self._kv.delete(KEY_LRU_INDEX)
+    return removed
+
+  async def metrics(self) -> dict[str, Any]:
+    """Return this process's counters plus the shared entry count."""
+    metrics = self._metrics.as_dict()
+    metrics["entries"] = len(await self._read_index())
+    metrics["max_entries"] = self.max_entries
+    metrics["ttl_seconds"] = self.ttl_seconds
+    return metrics
+
+  async def _read_index(self) -> dict[str, float]:
+    try:
+      return await self._kv.hgetall(KEY_LRU_INDEX)
+    except Exception:
+      logger.warning("Simulation cache index read failed", exc_info=True)
+      self._metrics.errors += 1
+      return {}
+
+  async def _touch(self, key: str) -> None:
+    """Record an access to ``key``."""
+    try:
+      await self._kv.hset(KEY_LRU_INDEX, {key: time.time()})
+    except Exception:
+      logger.warning("Simulation cache index write failed for %s", key, exc_info=True)
+      self._metrics.errors += 1
+
+  async def _forget(self, *keys: str) -> None:
+    """Remove access times from the index."""
+    try:
+      await self._kv.hdel(KEY_LRU_INDEX, *keys)
+    except Exception:
+      logger.warning("Simulation cache index write failed", exc_info=True)
+      self._metrics.errors += 1
+
+  async def _evict(self, stored_key: str) -> None:
+    """Enforce TTL and capacity after a store, unless another worker is evicting."""
+    lease = {"owner": self._owner, "acquired_at": time.time()}
+    try:
+      if not await self._kv.compare_and_set(
+        KEY_EVICTION_LEASE, None, lease, EVICTION_LEASE_SECONDS
+      ):
+        return
+    except Exception:
+      logger.warning("Simulation cache eviction lease failed", exc_info=True)
+      self._metrics.errors += 1
+      return
+
+    try:
+      index = await self._read_index()
+      expired_before = time.time() - self.ttl_seconds
+      stale = [k for k, accessed in index.items() if accessed < expired_before]
+      live = sorted(
+        (k for k, accessed in index.items() if accessed >= expired_before and k != stored_key),
+        key=index.__getitem__,
+      )
+      victims = live[: max(len(live) + 1 - self.max_entries, 0)]
+      if stale or victims:
+        # Drop the index fields first: an entry re-stored concurrently then
+        # leaves at worst a field without an entry, which ages out, never an
+        # entry that is invisible to eviction.
+        await self._forget(*stale, *victims)
+      for victim in victims:
+        try:
+          await self._kv.delete(KEY_PREFIX + victim)
+        except Exception:
+          logger.warning("Simulation cache eviction failed for %s", victim, exc_info=True)
+          self._metrics.errors += 1
+      self._metrics.evictions += len(victims)
+    finally:
+      try:
+        await self._kv.compare_and_set(KEY_EVICTION_LEASE, lease, None)
+      except Exception:
+        logger.warning("Simulation cache eviction lease release failed", exc_info=True)
+        self._metrics.errors += 1
+
+
+# =============================================================================
+# Shared Instance
+# =============================================================================
+
+_cache: SimulationResultCache | None = None
+
+
+def configure_simulation_result_cache(
+  kv_store: KeyValueStore,
+  ttl_seconds: int = DEFAULT_TTL_SECONDS,
+  max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> SimulationResultCache:
+  """Set the shared cache to use ``kv_store`` (called at application startup)."""
+  global _cache
+  _cache = SimulationResultCache(kv_store, ttl_seconds=ttl_seconds, max_entries=max_entries)
+  return _cache
+
+
+def get_simulation_result_cache() -> SimulationResultCache:
+  """Return the shared cache.
+
+  Processes that did not configure one at startup (e.g. Celery workers) get a
+  cache on the store selected by the ``storage_backend`` setting, which is
+  Redis in production and therefore shared with the API workers.
+  """
+  global _cache
+  if _cache is None:
+    config = PraxisConfiguration()
+    try:
+      backend = StorageBackend(config.storage_backend)
+    except ValueError:
+      backend = StorageBackend.POSTGRESQL
+    kv_store = StorageFactory.create_key_value_store(
+      backend,
+      host=config.redis_host,
+      port=config.redis_port,
+      db=config.redis_db,
+    )
+    _cache = SimulationResultCache(kv_store)
+  return _cache
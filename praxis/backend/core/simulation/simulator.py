@@ -139,6 +139,15 @@ class ProtocolSimulator:
     self._simulator = HierarchicalSimulator(deck_layout_type=deck_layout_type)
     self._detector = FailureModeDetector(max_states=max_failure_states)
 
+  @property
+  def cache_config(self) -> dict[str, Any]:
+    """Settings that affect results, for keying cached simulations."""
+    return {
+      "deck_layout_type": self._deck_layout_type.value,
+      "max_failure_states": self._max_failure_states,
+      "enable_failure_detection": self._enable_failure_detection,
+    }
+
   async def analyze_protocol(
     self,
     protocol_func: Callable[..., Any],
@@ -7,7 +7,10 @@ symbolic protocol execution.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from types import MethodType
 from typing import Any
 
 from praxis.backend.core.simulation.method_contracts import (
@@ -32,6 +35,349 @@ from praxis.backend.core.tracing.tracers import (
   TracedWellCollection,
 )
 
+# =============================================================================
+# Recorded Calls
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RecordedCall:
+  """A machine method call captured during a stateful trace.
+
+  Arguments are kept as the objects the protocol passed (tracers and
+  literals), so the call can be re-evaluated against another state without
+  running the protocol again.
+  """
+
+  machine: str
+  """Name of the machine parameter that received the call"""
+
+  method: str
+  """Method name"""
+
+  args: tuple[Any, ...] = ()
+  """Positional arguments"""
+
+  kwargs: dict[str, Any] = field(default_factory=dict)
+  """Keyword arguments"""
+
+
+# =============================================================================
+# Compiled Contracts
+# =============================================================================
+
+_ARG_PATTERNS: dict[str, tuple[str, ...]] = {
+  "pick_up_tips": ("tips",),
+  "pick_up_tips96": ("tip_rack",),
+  "drop_tips": ("tips",),
+  "drop_tips96": ("tip_rack",),
+  "aspirate": ("resource", "vol"),
+  "dispense": ("resource", "vol"),
+  "transfer": ("source", "target", "vol"),
+  "transfer_96": ("source", "target"),
+  "mix": ("resource", "vol", "repetitions"),
+}
+"""Positional argument names of common PLR methods"""
+
+_DEFAULT_ARG_NAMES = ("resource", "vol", "source", "target")
+
+_Check = Callable[["StatefulTracedMachine", str, dict[str, Any], list[StateViolation]], None]
+_Effect = Callable[["StatefulTracedMachine", dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class CompiledContract:
+  """A method contract compiled into the steps that evaluate one call.
+
+  Built once per (receiver type, method) by `compile_contract`: the positional
+  argument names are resolved up front and only the preconditions and effects
+  the contract declares are kept, so evaluating a call is a bind followed by a
+  few direct calls.
+  """
+
+  contract: MethodContract
+  """The source contract"""
+
+  arg_names: tuple[str, ...]
+  """Names bound to positional arguments, in order"""
+
+  checks: tuple[_Check, ...]
+  """Precondition checks; each appends its violations to the list it is given"""
+
+  effects: tuple[_Effect, ...]
+  """State effects, applied in order"""
+
+  def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Map a call's arguments to the names the contract refers to."""
+    arg_map = dict(zip(self.arg_names, args, strict=False))
+    if kwargs:
+      arg_map.update(kwargs)
+    return arg_map
+
+
+@functools.cache
+def compile_contract(receiver_type: str, method_name: str) -> CompiledContract | None:
+  """Compile the contract of a method, or return None if it has none.
+
+  Args:
+      receiver_type: Type of the receiver (e.g., 'liquid_handler').
+      method_name: Name of the method (e.g., 'aspirate').
+
+  Returns:
+      The compiled contract, shared by every call to that method.
+
+  """
+  contract = get_contract(receiver_type, method_name)
+  if contract is None:
+    return None
+  return CompiledContract(
+    contract=contract,
+    arg_names=_ARG_PATTERNS.get(contract.method_name, _DEFAULT_ARG_NAMES),
+    checks=_compile_checks(contract),
+    effects=_compile_effects(contract),
+  )
+
+
+@functools.cache
+def compile_dispatcher(receiver_type: str, method_name: str) -> Callable[..., TracedMethodResult]:
+  """Build the function that executes ``method_name`` on a stateful machine tracer.
+
+  The function takes the machine as its first argument, followed by the
+  call's arguments. It logs the call for replay, evaluates the compiled
+  contract and records the operation.
+  """
+  compiled = compile_contract(receiver_type, method_name)
+  result_suffix = f".{method_name}()"
+
+  def dispatch(machine: StatefulTracedMachine, *args: Any, **kwargs: Any) -> TracedMethodResult:
+    if machine.call_log is not None:
+      machine.call_log.append(RecordedCall(machine.name, method_name, args, kwargs))
+
+    op_id = machine._generate_op_id()
+    if compiled is None or machine._evaluate_compiled(compiled, op_id, args, kwargs):
+      # Record the operation with traced arguments by their symbolic names
+      machine.recorder.record_operation(
+        receiver=machine.name,
+        receiver_type=receiver_type,
+        method=method_name,
+        args=[arg.name if isinstance(arg, TracedValue) else repr(arg) for arg in args],
+        kwargs={k: v.name if isinstance(v, TracedValue) else repr(v) for k, v in kwargs.items()},
+      )
+
+    return TracedMethodResult(
+      name=machine.name + result_suffix,
+      recorder=machine.recorder,
+      declared_type="Any",
+      operation_id=op_id,
+    )
+
+  dispatch.__name__ = dispatch.__qualname__ = method_name
+  return dispatch
+
+
+def _compile_checks(contract: MethodContract) -> tuple[_Check, ...]:
+  method_name = contract.method_name
+  checks: list[_Check] = []
+  if contract.requires_tips:
+    checks.append(_tips_check(method_name, contract.requires_tips_count))
+  checks.extend(_on_deck_check(method_name, arg_name) for arg_name in contract.requires_on_deck)
+  if contract.requires_liquid_in:
+    checks.append(
+      _resource_check(
+        method_name,
+        contract.requires_liquid_in,
+        StatefulTracedMachine._check_liquid_present,
+      )
+    )
+  if contract.requires_capacity_in:
+    checks.append(
+      _resource_check(
+        method_name,
+        contract.requires_capacity_in,
+        StatefulTracedMachine._check_capacity_present,
+      )
+    )
+  return tuple(checks)
+
+
+def _tips_check(method_name: str, required_count: int | None) -> _Check:
+  def check(
+    machine: StatefulTracedMachine,
+    op_id: str,
+    arg_map: dict[str, Any],
+    violations: list[StateViolation],
+  ) -> None:
+    tip_state = machine.state.tip_state
+    if not tip_state.tips_loaded:
+      violations.append(
+        StateViolation(
+          violation_type=ViolationType.TIPS_NOT_LOADED,
+          operation_id=op_id,
+          method_name=method_name,
+          message=f"Method '{method_name}' requires tips to be loaded",
+          suggested_fix="Add pick_up_tips() before this operation",
+          state_level=machine.state.level,
+        )
+      )
+
+    # Check tip count if specified
+    if required_count and tip_state.tips_count < required_count:
+      violations.append(
+        StateViolation(
+          violation_type=ViolationType.INSUFFICIENT_TIPS,
+          operation_id=op_id,
+          method_name=method_name,
+          message=f"Method '{method_name}' requires {required_count} tips, "
+          f"but only {tip_state.tips_count} loaded",
+          suggested_fix=f"Use pick_up_tips96() or ensure {required_count} tips",
+          state_level=machine.state.level,
+          details={
+            "required": required_count,
+            "loaded": tip_state.tips_count,
+          },
+        )
+      )
+
+  return check
+
+
+def _on_deck_check(method_name: str, arg_name: str) -> _Check:
+  def check(
+    machine: StatefulTracedMachine,
+    op_id: str,
+    arg_map: dict[str, Any],
+    violations: list[StateViolation],
+  ) -> None:
+    resource = arg_map.get(arg_name)
+    if not resource:
+      return
+    resource_name = _resource_name(resource)
+    if not machine.state.deck_state.is_on_deck(resource_name):
+      violations.append(
+        StateViolation(
+          violation_type=ViolationType.RESOURCE_NOT_ON_DECK,
+          operation_id=op_id,
+          method_name=method_name,
+          resource_name=resource_name,
+          message=f"Resource '{resource_name}' must be on deck for '{method_name}'",
+          suggested_fix=f"Place '{resource_name}' on deck before this operation",
+          state_level=machine.state.level,
+        )
+      )
+
+  return check
+
+
+def _resource_check(
+  method_name: str,
+  arg_name: str,
+  check_resource: Callable[[StatefulTracedMachine, str, str, str], StateViolation | None],
+) -> _Check:
+  def check(
+    machine: StatefulTracedMachine,
+    op_id: str,
+    arg_map: dict[str, Any],
+    violations: list[StateViolation],
+  ) -> None:
+    resource = arg_map.get(arg_name)
+    if not resource:
+      return
+    violation = check_resource(machine, op_id, method_name, _resource_name(resource))
+    if violation:
+      violations.append(violation)
+
+  return check
+
+
+def _compile_effects(contract: MethodContract) -> tuple[_Effect, ...]:
+  effects: list[_Effect] = []
+  if contract.loads_tips:
+    effects.append(_load_tips_effect(contract.loads_tips_count or 1))
+  if contract.drops_tips:
+    effects.append(_drop_tips_effect)
+  if contract.aspirates_from:
+    effects.append(
+      _liquid_effect("aspirate", contract.aspirates_from, contract.aspirate_volume_arg)
+    )
+  if contract.dispenses_to:
+    effects.append(_liquid_effect("dispense", contract.dispenses_to, contract.dispense_volume_arg))
+  if contract.transfers_from_to:
+    effects.append(_transfer_effect(*contract.transfers_from_to))
+  return tuple(effects)
+
+
+def _load_tips_effect(count: int) -> _Effect:
+  def effect(machine: StatefulTracedMachine, arg_map: dict[str, Any]) -> None:
+    source = arg_map.get("tips") or arg_map.get("tip_rack")
+    machine.state.tip_state.load_tips(count, _resource_name(source) if source else None)
+
+  return effect
+
+
+def _drop_tips_effect(machine: StatefulTracedMachine, arg_map: dict[str, Any]) -> None:
+  machine.state.tip_state.drop_tips()
+
+
+def _liquid_effect(operation: str, arg_name: str, volume_arg: str | None) -> _Effect:
+  def effect(machine: StatefulTracedMachine, arg_map: dict[str, Any]) -> None:
+    resource = arg_map.get(arg_name)
+    if not resource:
+      return
+    resource_name = _resource_name(resource)
+    liquid_state = machine.state.liquid_state
+    if isinstance(liquid_state, BooleanLiquidState):
+      getattr(liquid_state, operation)(resource_name)
+    elif isinstance(liquid_state, SymbolicLiquidState):
+      vol_arg = arg_map.get(volume_arg, 50)
+      vol_symbol = str(vol_arg) if not isinstance(vol_arg, TracedValue) else "vol"
+      getattr(liquid_state, operation)(resource_name, vol_symbol)
+    elif isinstance(liquid_state, ExactLiquidState):
+      vol = _numeric_value(arg_map.get(volume_arg), 50.0)
+      getattr(liquid_state, operation)(resource_name, vol)
+
+  return effect
+
+
+def _transfer_effect(source_arg: str, dest_arg: str) -> _Effect:
+  def effect(machine: StatefulTracedMachine, arg_map: dict[str, Any]) -> None:
+    source = arg_map.get(source_arg)
+    dest = arg_map.get(dest_arg)
+    if not (source and dest):
+      return
+    liquid_state = machine.state.liquid_state
+    if isinstance(liquid_state, BooleanLiquidState):
+      liquid_state.transfer(_resource_name(source), _resource_name(dest))
+    elif isinstance(liquid_state, ExactLiquidState):
+      # For transfer, use a default volume if not specified
+      liquid_state.transfer(_resource_name(source), _resource_name(dest), 50.0)
+
+  return effect
+
+
+def _resource_name(value: Any) -> str:
+  """Extract resource name from a value."""
+  # str first: TracedValue is an ABC, whose isinstance checks are slower
+  if isinstance(value, str):
+    return value
+  if isinstance(value, TracedValue):
+    return value.name
+  return str(value)
+
+
+def _numeric_value(value: Any, default: float) -> float:
+  """Extract numeric value from an argument."""
+  if value is None:
+    return default
+  if isinstance(value, int | float):
+    return float(value)
+  if isinstance(value, str):
+    try:
+      return float(value)
+    except ValueError:
+      return default
+  return default
+
+
 # =============================================================================
 # Stateful Traced Machine
 # =============================================================================
@@ -50,6 +396,10 @@ class StatefulTracedMachine(TracedMachine):
   - Aspirating without tips loaded
   - Aspirating from empty wells
   - Dispensing to full wells
+
+  Calls go through dispatchers compiled once per (machine type, method) by
+  `compile_dispatcher`; each machine binds a method on first access and keeps
+  it, so later calls skip attribute interception.
   """
 
   state: SimulationState = field(default_factory=SimulationState.default_boolean)
@@ -61,6 +411,9 @@ class StatefulTracedMachine(TracedMachine):
   continue_on_violation: bool = True
   """Whether to continue execution after a violation"""
 
+  call_log: list[RecordedCall] | None = None
+  """If set, every method call is appended here for later replay"""
+
   _op_counter: int = field(default=0, init=False)
   """Counter for generating operation IDs"""
 
@@ -75,159 +428,61 @@ class StatefulTracedMachine(TracedMachine):
     if name.startswith("_"):
       raise AttributeError(name)
 
-    def method_proxy(*args: Any, **kwargs: Any) -> TracedMethodResult:
-      """Check preconditions, record operation, apply effects."""
-      op_id = self._generate_op_id()
-
-      # Get method contract
-      contract = get_contract(self.machine_type, name)
-
-      if contract:
-        # Check preconditions
-        violations = self._check_preconditions(op_id, name, contract, args, kwargs)
-        self.violations.extend(violations)
-
-        if violations and not self.continue_on_violation:
-          # Return early without applying effects
-          return TracedMethodResult(
-            name=f"{self.name}.{name}()",
-            recorder=self.recorder,
-            declared_type="Any",
-            operation_id=op_id,
-          )
-
-        # Apply effects (even if violation, to continue simulation)
-        self._apply_effects(name, contract, args, kwargs)
-
-      # Convert traced arguments to their symbolic names
-      recorded_args = []
-      for arg in args:
-        if isinstance(arg, TracedValue):
-          recorded_args.append(arg.name)
-        else:
-          recorded_args.append(repr(arg))
-
-      recorded_kwargs = {}
-      for k, v in kwargs.items():
-        if isinstance(v, TracedValue):
-          recorded_kwargs[k] = v.name
-        else:
-          recorded_kwargs[k] = repr(v)
-
-      # Record the operation
-      self.recorder.record_operation(
-        receiver=self.name,
-        receiver_type=self.machine_type,
-        method=name,
-        args=recorded_args,
-        kwargs=recorded_kwargs,
-      )
+    method = MethodType(compile_dispatcher(self.machine_type, name), self)
+    # Later lookups find the bound method in the instance dict
+    self.__dict__[name] = method
+    return method
 
-      return TracedMethodResult(
-        name=f"{self.name}.{name}()",
-        recorder=self.recorder,
-        declared_type="Any",
-        operation_id=op_id,
-      )
-
-    return method_proxy
-
-  def _check_preconditions(
+  def evaluate_call(
     self,
     op_id: str,
     method_name: str,
-    contract: MethodContract,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
-  ) -> list[StateViolation]:
-    """Check preconditions for an operation.
+  ) -> bool:
+    """Check a call's preconditions against the state and apply its effects.
 
     Args:
-        op_id: Operation identifier
-        method_name: Name of the method
-        contract: Method contract
-        args: Positional arguments
-        kwargs: Keyword arguments
+        op_id: Operation identifier for reported violations.
+        method_name: Name of the called method.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
 
     Returns:
-        List of violations found
+        False if a violation stopped the call (``continue_on_violation`` is
+        off), True otherwise.
 
     """
-    violations: list[StateViolation] = []
+    compiled = compile_contract(self.machine_type, method_name)
+    if compiled is None:
+      return True
+    return self._evaluate_compiled(compiled, op_id, args, kwargs)
 
-    # Build argument mapping for contract checking
-    arg_map = self._build_arg_map(contract, args, kwargs)
-
-    # Check tips requirement
-    if contract.requires_tips:
-      if not self.state.tip_state.tips_loaded:
-        violations.append(
-          StateViolation(
-            violation_type=ViolationType.TIPS_NOT_LOADED,
-            operation_id=op_id,
-            method_name=method_name,
-            message=f"Method '{method_name}' requires tips to be loaded",
-            suggested_fix="Add pick_up_tips() before this operation",
-            state_level=self.state.level,
-          )
-        )
+  def replay_call(self, call: RecordedCall) -> bool:
+    """Evaluate a call recorded by another tracer against this tracer's state."""
+    return self.evaluate_call(self._generate_op_id(), call.method, call.args, call.kwargs)
 
-      # Check tip count if specified
-      if contract.requires_tips_count:
-        if self.state.tip_state.tips_count < contract.requires_tips_count:
-          violations.append(
-            StateViolation(
-              violation_type=ViolationType.INSUFFICIENT_TIPS,
-              operation_id=op_id,
-              method_name=method_name,
-              message=f"Method '{method_name}' requires {contract.requires_tips_count} tips, "
-              f"but only {self.state.tip_state.tips_count} loaded",
-              suggested_fix=f"Use pick_up_tips96() or ensure {contract.requires_tips_count} tips",
-              state_level=self.state.level,
-              details={
-                "required": contract.requires_tips_count,
-                "loaded": self.state.tip_state.tips_count,
-              },
-            )
-          )
-
-    # Check deck placement
-    for arg_name in contract.requires_on_deck:
-      resource = arg_map.get(arg_name)
-      if resource:
-        resource_name = self._get_resource_name(resource)
-        if not self.state.deck_state.is_on_deck(resource_name):
-          violations.append(
-            StateViolation(
-              violation_type=ViolationType.RESOURCE_NOT_ON_DECK,
-              operation_id=op_id,
-              method_name=method_name,
-              resource_name=resource_name,
-              message=f"Resource '{resource_name}' must be on deck for '{method_name}'",
-              suggested_fix=f"Place '{resource_name}' on deck before this operation",
-              state_level=self.state.level,
-            )
-          )
-
-    # Check liquid requirements
-    if contract.requires_liquid_in:
-      resource = arg_map.get(contract.requires_liquid_in)
-      if resource:
-        resource_name = self._get_resource_name(resource)
-        violation = self._check_liquid_present(op_id, method_name, resource_name)
-        if violation:
-          violations.append(violation)
-
-    # Check capacity requirements
-    if contract.requires_capacity_in:
-      resource = arg_map.get(contract.requires_capacity_in)
-      if resource:
-        resource_name = self._get_resource_name(resource)
-        violation = self._check_capacity_present(op_id, method_name, resource_name)
-        if violation:
-          violations.append(violation)
-
-    return violations
+  def _evaluate_compiled(
+    self,
+    compiled: CompiledContract,
+    op_id: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+  ) -> bool:
+    """Run a compiled contract's checks and effects for one call."""
+    arg_map = compiled.bind(args, kwargs)
+    violations: list[StateViolation] = []
+    for check in compiled.checks:
+      check(self, op_id, arg_map, violations)
+    if violations:
+      self.violations.extend(violations)
+      if not self.continue_on_violation:
+        return False
+
+    # Apply effects (even if violation, to continue simulation)
+    for effect in compiled.effects:
+      effect(self, arg_map)
+    return True
 
   def _check_liquid_present(
     self,
@@ -313,137 +568,6 @@ class StatefulTracedMachine(TracedMachine):
 
     return None
 
-  def _apply_effects(
-    self,
-    method_name: str,
-    contract: MethodContract,
-    args: tuple[Any, ...],
-    kwargs: dict[str, Any],
-  ) -> None:
-    """Apply state effects from an operation.
-
-    Args:
-        method_name: Name of the method
-        contract: Method contract
-        args: Positional arguments
-        kwargs: Keyword arguments
-
-    """
-    arg_map = self._build_arg_map(contract, args, kwargs)
-
-    # Tip effects
-    if contract.loads_tips:
-      count = contract.loads_tips_count or 1
-      source = arg_map.get("tips") or arg_map.get("tip_rack")
-      source_name = self._get_resource_name(source) if source else None
-      self.state.tip_state.load_tips(count, source_name)
-
-    if contract.drops_tips:
-      self.state.tip_state.drop_tips()
-
-    # Liquid effects
-    liquid_state = self.state.liquid_state
-
-    if contract.aspirates_from:
-      resource = arg_map.get(contract.aspirates_from)
-      if resource:
-        resource_name = self._get_resource_name(resource)
-        if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.aspirate(resource_name)
-        elif isinstance(liquid_state, SymbolicLiquidState):
-          vol_arg = arg_map.get(contract.aspirate_volume_arg, 50)
-          vol_symbol = str(vol_arg) if not isinstance(vol_arg, TracedValue) else "vol"
-          liquid_state.aspirate(resource_name, vol_symbol)
-        elif isinstance(liquid_state, ExactLiquidState):
-          vol = self._get_numeric_value(arg_map.get(contract.aspirate_volume_arg), 50.0)
-          liquid_state.aspirate(resource_name, vol)
-
-    if contract.dispenses_to:
-      resource = arg_map.get(contract.dispenses_to)
-      if resource:
-        resource_name = self._get_resource_name(resource)
-        if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.dispense(resource_name)
-        elif isinstance(liquid_state, SymbolicLiquidState):
-          vol_arg = arg_map.get(contract.dispense_volume_arg, 50)
-          vol_symbol = str(vol_arg) if not isinstance(vol_arg, TracedValue) else "vol"
-          liquid_state.dispense(resource_name, vol_symbol)
-        elif isinstance(liquid_state, ExactLiquidState):
-          vol = self._get_numeric_value(arg_map.get(contract.dispense_volume_arg), 50.0)
-          liquid_state.dispense(resource_name, vol)
-
-    if contract.transfers_from_to:
-      source_arg, dest_arg = contract.transfers_from_to
-      source = arg_map.get(source_arg)
-      dest = arg_map.get(dest_arg)
-      if source and dest:
-        source_name = self._get_resource_name(source)
-        dest_name = self._get_resource_name(dest)
-        if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.transfer(source_name, dest_name)
-        elif isinstance(liquid_state, ExactLiquidState):
-          # For transfer, use a default volume if not specified
-          vol = 50.0  # Default transfer volume
-          liquid_state.transfer(source_name, dest_name, vol)
-
-  def _build_arg_map(
-    self,
-    contract: MethodContract,
-    args: tuple[Any, ...],
-    kwargs: dict[str, Any],
-  ) -> dict[str, Any]:
-    """Build a mapping of argument names to values.
-
-    Uses common PLR argument naming conventions.
-    """
-    # Common argument name patterns for different methods
-    arg_patterns: dict[str, list[str]] = {
-      "pick_up_tips": ["tips"],
-      "pick_up_tips96": ["tip_rack"],
-      "drop_tips": ["tips"],
-      "drop_tips96": ["tip_rack"],
-      "aspirate": ["resource", "vol"],
-      "dispense": ["resource", "vol"],
-      "transfer": ["source", "target", "vol"],
-      "transfer_96": ["source", "target"],
-      "mix": ["resource", "vol", "repetitions"],
-    }
-
-    arg_names = arg_patterns.get(contract.method_name, ["resource", "vol", "source", "target"])
-
-    result: dict[str, Any] = {}
-
-    # Map positional args
-    for i, arg in enumerate(args):
-      if i < len(arg_names):
-        result[arg_names[i]] = arg
-
-    # Merge keyword args
-    result.update(kwargs)
-
-    return result
-
-  def _get_resource_name(self, value: Any) -> str:
-    """Extract resource name from a value."""
-    if isinstance(value, TracedValue):
-      return value.name
-    if isinstance(value, str):
-      return value
-    return str(value)
-
-  def _get_numeric_value(self, value: Any, default: float) -> float:
-    """Extract numeric value from an argument."""
-    if value is None:
-      return default
-    if isinstance(value, int | float):
-      return float(value)
-    if isinstance(value, str):
-      try:
-        return float(value)
-      except ValueError:
-        return default
-    return default
-
 
 # =============================================================================
 # Stateful Traced Resource
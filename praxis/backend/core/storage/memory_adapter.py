@@ -15,18 +15,24 @@ Limitations:
 - Task chains and complex Celery features not supported
 """
 
+from __future__ import annotations
+
 import asyncio
+import bisect
 import contextlib
 import fnmatch
+import itertools
 import logging
 import time
 import uuid
-from collections.abc import AsyncIterator, Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from praxis.backend.core.storage.protocols import glob_prefix
+
+if TYPE_CHECKING:
+  from collections.abc import AsyncIterator, Callable, Iterator
 
-from praxis.backend.core.storage.protocols import (
-  Subscription,
-)
+  from praxis.backend.core.storage.protocols import Subscription
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +41,14 @@ class InMemoryKeyValueStore:
   """In-memory key-value store with TTL support.
 
   Thread-safe via asyncio.Lock. Uses a background task for TTL expiration.
+  Keys are also kept in a sorted list so prefix scans and pattern listings
+  only visit the matching range.
   """
 
   def __init__(self) -> None:
     """Initialize the in-memory store."""
     self._data: dict[str, tuple[Any, float | None]] = {}  # value, expiry time
+    self._sorted_keys: list[str] = []
     self._lock = asyncio.Lock()
     self._cleanup_task: asyncio.Task | None = None
     self._closed = False
@@ -60,24 +69,56 @@ class InMemoryKeyValueStore:
             key for key, (_, expiry) in self._data.items() if expiry is not None and expiry <= now
           ]
           for key in expired:
-            del self._data[key]
+            self._discard(key)
             logger.debug("TTL expired for key: %s", key)
       except asyncio.CancelledError:
         break
       except Exception:
         logger.exception("Error in TTL cleanup task")
 
+  def _put(self, key: str, value: Any, expiry: float | None) -> None:
+    """Store an entry and index its key; the caller holds the lock."""
+    if key not in self._data:
+      bisect.insort(self._sorted_keys, key)
+    self._data[key] = (value, expiry)
+
+  def _discard(self, key: str) -> bool:
+    """Remove an entry and its index slot; the caller holds the lock."""
+    if self._data.pop(key, None) is None:
+      return False
+    del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+    return True
+
+  def _live_value(self, key: str) -> Any | None:
+    """Return the unexpired value under ``key``; the caller holds the lock."""
+    entry = self._data.get(key)
+    if entry is None:
+      return None
+    value, expiry = entry
+    if expiry is not None and expiry <= time.time():
+      self._discard(key)
+      return None
+    return value
+
+  def _keys_with_prefix(self, prefix: str, after: str | None = None) -> Iterator[str]:
+    """Yield live keys starting with ``prefix`` in order; the caller holds the lock."""
+    now = time.time()
+    if after is not None and after >= prefix:
+      index = bisect.bisect_right(self._sorted_keys, after)
+    else:
+      index = bisect.bisect_left(self._sorted_keys, prefix)
+    for key in self._sorted_keys[index:]:
+      if not key.startswith(prefix):
+        return
+      expiry = self._data[key][1]
+      if expiry is None or expiry > now:
+        yield key
+
   async def get(self, key: str) -> Any | None:
     """Retrieve a value by key."""
     await self._start_cleanup_task()
     async with self._lock:
-      if key not in self._data:
-        return None
-      value, expiry = self._data[key]
-      if expiry is not None and expiry <= time.time():
-        del self._data[key]
-        return None
-      return value
+      return self._live_value(key)
 
   async def set(
     self,
@@ -89,14 +130,13 @@ class InMemoryKeyValueStore:
     await self._start_cleanup_task()
     expiry = time.time() + ttl_seconds if ttl_seconds is not None else None
     async with self._lock:
-      self._data[key] = (value, expiry)
+      self._put(key, value, expiry)
     logger.debug("Set key: %s (TTL: %s)", key, ttl_seconds)
 
   async def delete(self, key: str) -> bool:
     """Delete a key."""
     async with self._lock:
-      if key in self._data:
-        del self._data[key]
+      if self._discard(key):
         logger.debug("Deleted key: %s", key)
         return True
       return False
@@ -104,23 +144,120 @@ class InMemoryKeyValueStore:
   async def exists(self, key: str) -> bool:
     """Check if a key exists."""
     async with self._lock:
-      if key not in self._data:
-        return False
-      _, expiry = self._data[key]
-      if expiry is not None and expiry <= time.time():
-        del self._data[key]
-        return False
-      return True
+      return self._live_value(key) is not None
 
   async def keys(self, pattern: str = "*") -> list[str]:
     """List keys matching a glob pattern."""
-    now = time.time()
     async with self._lock:
-      result = []
-      for key, (_, expiry) in self._data.items():
-        if (expiry is None or expiry > now) and fnmatch.fnmatch(key, pattern):
-          result.append(key)
-      return result
+      return [
+        key
+        for key in self._keys_with_prefix(glob_prefix(pattern))
+        if fnmatch.fnmatchcase(key, pattern)
+      ]
+
+  async def mget(self, keys: list[str]) -> list[Any | None]:
+    """Retrieve several values at once."""
+    await self._start_cleanup_task()
+    async with self._lock:
+      return [self._live_value(key) for key in keys]
+
+  async def mset(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+    """Store several values at once with an optional shared TTL."""
+    await self._start_cleanup_task()
+    expiry = time.time() + ttl_seconds if ttl_seconds is not None else None
+    async with self._lock:
+      for key, value in items.items():
+        self._put(key, value, expiry)
+
+  async def scan(
+    self,
+    prefix: str = "",
+    cursor: str | None = None,
+    count: int = 100,
+  ) -> tuple[str | None, list[str]]:
+    """Return one page of keys starting with ``prefix``."""
+    async with self._lock:
+      page = list(itertools.islice(self._keys_with_prefix(prefix, cursor), count))
+    return (page[-1] if len(page) == count else None), page
+
+  async def incr(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter."""
+    async with self._lock:
+      value = int(self._live_value(key) or 0) + amount
+      expiry = self._data[key][1] if key in self._data else None
+      self._put(key, value, expiry)
+      return value
+
+  async def sadd(self, key: str, *members: str) -> int:
+    """Add members to a set; returns how many were new."""
+    if not members:
+      return 0
+    async with self._lock:
+      current = self._live_value(key) or set()
+      added = set(members) - current
+      self._put(key, current | added, None)
+      return len(added)
+
+  async def srem(self, key: str, *members: str) -> int:
+    """Remove members from a set; returns how many were present."""
+    async with self._lock:
+      current = self._live_value(key) or set()
+      removed = current & set(members)
+      if removed == current:
+        self._discard(key)
+      elif removed:
+        self._put(key, current - removed, None)
+      return len(removed)
+
+  async def smembers(self, key: str) -> set[str]:
+    """Return the members of a set."""
+    async with self._lock:
+      return set(self._live_value(key) or ())
+
+  async def hset(self, key: str, mapping: dict[str, Any]) -> int:
+    """Store fields of a hash; returns how many were new."""
+    if not mapping:
+      return 0
+    async with self._lock:
+      current = self._live_value(key) or {}
+      added = len(mapping.keys() - current.keys())
+      self._put(key, {**current, **mapping}, None)
+      return added
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Remove fields from a hash; returns how many were present."""
+    async with self._lock:
+      current = self._live_value(key) or {}
+      removed = current.keys() & set(fields)
+      if removed and removed == current.keys():
+        self._discard(key)
+      elif removed:
+        self._put(key, {f: v for f, v in current.items() if f not in removed}, None)
+      return len(removed)
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Return all fields of a hash."""
+    async with self._lock:
+      return dict(self._live_value(key) or {})
+
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: float | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals ``expected``."""
+    await self._start_cleanup_task()
+    async with self._lock:
+      if self._live_value(key) != expected:
+        return False
+      if value is None:
+        self._discard(key)
+      else:
+        expiry = time.time() + ttl_seconds if ttl_seconds is not None else None
+        self._put(key, value, expiry)
+      return True
 
   async def close(self) -> None:
     """Close the store and stop cleanup task."""
@@ -130,22 +267,30 @@ class InMemoryKeyValueStore:
       with contextlib.suppress(asyncio.CancelledError):
         await self._cleanup_task
     self._data.clear()
+    self._sorted_keys.clear()
     logger.info("InMemoryKeyValueStore closed")
 
 
 class InMemorySubscription:
   """A subscription to an in-memory pub/sub channel."""
 
-  def __init__(self, channel: str, queue: asyncio.Queue[Any]) -> None:
+  def __init__(
+    self,
+    channel: str,
+    queue: asyncio.Queue[Any],
+    subscribers: list[asyncio.Queue[Any]] | None = None,
+  ) -> None:
     """Initialize the subscription.
 
     Args:
         channel: The channel name.
         queue: The queue to receive messages from.
+        subscribers: The channel's queues, which ``queue`` leaves on unsubscribe.
 
     """
     self._channel = channel
     self._queue = queue
+    self._subscribers = subscribers
     self._closed = False
 
   def __aiter__(self) -> AsyncIterator[Any]:
@@ -167,6 +312,9 @@ class InMemorySubscription:
   async def unsubscribe(self) -> None:
     """Unsubscribe from the channel."""
     self._closed = True
+    if self._subscribers is not None:
+      with contextlib.suppress(ValueError):
+        self._subscribers.remove(self._queue)
     # Put sentinel to unblock waiting readers
     with contextlib.suppress(asyncio.QueueFull):
       self._queue.put_nowait(StopAsyncIteration)
@@ -205,7 +353,7 @@ class InMemoryPubSub:
       self._channels[channel] = []
     self._channels[channel].append(queue)
     logger.debug("Subscribed to channel: %s", channel)
-    return InMemorySubscription(channel, queue)
+    return InMemorySubscription(channel, queue, self._channels[channel])
 
   async def close(self) -> None:
     """Close all subscriptions."""
@@ -10,8 +10,21 @@ that can have multiple implementations:
 Each protocol uses @runtime_checkable to allow isinstance() checks.
 """
 
-from collections.abc import AsyncIterator
-from typing import Any, Protocol, runtime_checkable
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+  from collections.abc import AsyncIterator
+
+_GLOB_SPECIAL = re.compile(r"[*?\[]")
+
+
+def glob_prefix(pattern: str) -> str:
+  """Return the literal prefix of a glob pattern (the part before any wildcard)."""
+  match = _GLOB_SPECIAL.search(pattern)
+  return pattern[: match.start()] if match else pattern
 
 
 @runtime_checkable
@@ -93,6 +106,142 @@ class KeyValueStore(Protocol):
     """
     ...
 
+  async def mget(self, keys: list[str]) -> list[Any | None]:
+    """Retrieve several values in one round trip.
+
+    Args:
+        keys: The keys to look up.
+
+    Returns:
+        The values in the order of ``keys``, with None for missing keys.
+
+    """
+    ...
+
+  async def mset(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+    """Store several values in one round trip.
+
+    Args:
+        items: Mapping of keys to JSON-serializable values.
+        ttl_seconds: Optional time-to-live applied to every key.
+
+    """
+    ...
+
+  async def scan(
+    self,
+    prefix: str = "",
+    cursor: str | None = None,
+    count: int = 100,
+  ) -> tuple[str | None, list[str]]:
+    """Page through the keys that start with ``prefix``.
+
+    Unlike ``keys``, each call only does work proportional to ``count``.
+
+    Args:
+        prefix: Literal key prefix ("" matches all keys).
+        cursor: The cursor returned by the previous call, or None to start.
+        count: Page size hint.
+
+    Returns:
+        The cursor for the next page (None once the scan is complete) and the
+        keys of this page.
+
+    """
+    ...
+
+  async def sadd(self, key: str, *members: str) -> int:
+    """Atomically add members to the set stored at ``key``.
+
+    Set keys may be deleted, checked and listed like other keys, but must
+    only be read and written through the set operations.
+
+    Returns:
+        The number of members that were not already present.
+
+    """
+    ...
+
+  async def srem(self, key: str, *members: str) -> int:
+    """Atomically remove members from a set; an emptied set is deleted.
+
+    Returns:
+        The number of members that were present.
+
+    """
+    ...
+
+  async def smembers(self, key: str) -> set[str]:
+    """Return the members of a set (empty if the key does not exist)."""
+    ...
+
+  async def hset(self, key: str, mapping: dict[str, Any]) -> int:
+    """Store fields of the hash at ``key`` in one round trip.
+
+    Like sets, hash keys may be deleted, checked and listed like other keys,
+    but must only be read and written through the hash operations.
+
+    Args:
+        key: The hash key.
+        mapping: Field names mapped to JSON-serializable values.
+
+    Returns:
+        The number of fields that did not exist before.
+
+    """
+    ...
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Remove fields from a hash; an emptied hash is deleted.
+
+    Returns:
+        The number of fields that were present.
+
+    """
+    ...
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Return all fields of a hash (empty if the key does not exist)."""
+    ...
+
+  async def incr(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter.
+
+    Args:
+        key: The counter key. A missing key counts from 0.
+        amount: The increment (may be negative).
+
+    Returns:
+        The counter value after the increment.
+
+    """
+    ...
+
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: float | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals ``expected``.
+
+    Values are compared by their JSON serialization, so ``expected`` should be
+    a value previously returned by ``get``.
+
+    Args:
+        key: The key to update.
+        expected: The value the key must currently hold, or None to require
+            that the key is absent (or expired).
+        value: The new value, or None to delete the key.
+        ttl_seconds: Optional time-to-live for the new value.
+
+    Returns:
+        True if the swap happened, False if the current value did not match.
+
+    """
+    ...
+
   async def close(self) -> None:
     """Close the connection and release resources.
 
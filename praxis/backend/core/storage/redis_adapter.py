@@ -6,23 +6,64 @@ protocols, enabling interchangeable usage with in-memory adapters.
 Uses redis.asyncio for async operations.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
-from collections.abc import AsyncIterator
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+  from collections.abc import AsyncIterator
 
-from praxis.backend.core.storage.protocols import (
-  Subscription,
-)
+  from praxis.backend.core.storage.protocols import Subscription
 
 logger = logging.getLogger(__name__)
 
+# KEYS[1]: key; ARGV: expected JSON ("" = absent), new JSON ("" = delete), TTL ms (0 = none).
+_COMPARE_AND_SET_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if ARGV[1] == '' then
+  if current then return 0 end
+elseif current ~= ARGV[1] then
+  return 0
+end
+if ARGV[2] == '' then
+  redis.call('DEL', KEYS[1])
+elseif tonumber(ARGV[3]) > 0 then
+  redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+else
+  redis.call('SET', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+_GLOB_ESCAPE = re.compile(r"[*?\[\]\\]")
+
+
+def _decode(data: bytes | str) -> str:
+  return data.decode() if isinstance(data, bytes) else data
+
+
+def _loads(data: bytes | str | None) -> Any | None:
+  if data is None:
+    return None
+  try:
+    return json.loads(data)
+  except json.JSONDecodeError:
+    # Return raw bytes/string if not JSON
+    return _decode(data)
+
 
 class RedisKeyValueStore:
   """Redis-backed key-value store.
 
   Wraps redis.asyncio.Redis to conform to the KeyValueStore protocol.
+  redis.asyncio connections belong to the event loop that opened them, while
+  Celery tasks run each coroutine on a new loop (see ``run_sync``), so one
+  client is kept per running loop and those of closed loops are discarded.
   """
 
   def __init__(
@@ -45,43 +86,56 @@ class RedisKeyValueStore:
     self._port = port
     self._db = db
     self._password = password
-    self._client: Any = None  # redis.asyncio.Redis
+    self._clients: dict[asyncio.AbstractEventLoop, Any] = {}  # redis.asyncio.Redis per loop
+
+  @classmethod
+  def from_url(cls, url: str) -> RedisKeyValueStore:
+    """Create a store from a ``redis://[:password@]host[:port][/db]`` URL."""
+    parts = urlsplit(url)
+    db = parts.path.lstrip("/")
+    return cls(
+      host=parts.hostname or "localhost",
+      port=parts.port or 6379,
+      db=int(db) if db else 0,
+      password=parts.password,
+    )
 
-  async def _get_client(self) -> Any:
-    """Get or create the Redis client."""
-    if self._client is None:
-      try:
-        import redis.asyncio as aioredis
-      except ImportError:
-        msg = "redis package not installed. Install with: pip install redis"
-        raise ImportError(msg) from None
+  def _create_client(self) -> Any:
+    """Create a Redis client for the running event loop."""
+    try:
+      import redis.asyncio as aioredis
+    except ImportError:
+      msg = "redis package not installed. Install with: pip install redis"
+      raise ImportError(msg) from None
 
-      self._client = aioredis.Redis(
-        host=self._host,
-        port=self._port,
-        db=self._db,
-        password=self._password,
-        decode_responses=False,
-      )
+    return aioredis.Redis(
+      host=self._host,
+      port=self._port,
+      db=self._db,
+      password=self._password,
+      decode_responses=False,
+    )
+
+  async def _get_client(self) -> Any:
+    """Get or create the Redis client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = self._clients.get(loop)
+    if client is None:
+      for stale in [other for other in self._clients if other.is_closed()]:
+        del self._clients[stale]
+      client = self._clients[loop] = self._create_client()
       logger.info(
         "Connected to Redis at %s:%s/%s",
         self._host,
         self._port,
         self._db,
       )
-    return self._client
+    return client
 
   async def get(self, key: str) -> Any | None:
     """Retrieve a value by key."""
     client = await self._get_client()
-    data = await client.get(key)
-    if data is None:
-      return None
-    try:
-      return json.loads(data)
-    except json.JSONDecodeError:
-      # Return raw bytes/string if not JSON
-      return data.decode() if isinstance(data, bytes) else data
+    return _loads(await client.get(key))
 
   async def set(
     self,
@@ -109,17 +163,126 @@ class RedisKeyValueStore:
     return await client.exists(key) > 0
 
   async def keys(self, pattern: str = "*") -> list[str]:
-    """List keys matching a pattern."""
+    """List keys matching a pattern.
+
+    Iterates with SCAN rather than the blocking, O(N) KEYS command.
+    """
+    client = await self._get_client()
+    return [_decode(k) async for k in client.scan_iter(match=pattern, count=1000)]
+
+  async def mget(self, keys: list[str]) -> list[Any | None]:
+    """Retrieve several values with one MGET."""
+    if not keys:
+      return []
+    client = await self._get_client()
+    return [_loads(data) for data in await client.mget(keys)]
+
+  async def mset(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+    """Store several values in one pipelined round trip."""
+    if not items:
+      return
+    client = await self._get_client()
+    async with client.pipeline(transaction=False) as pipe:
+      for key, value in items.items():
+        pipe.set(key, json.dumps(value), ex=ttl_seconds)
+      await pipe.execute()
+
+  async def scan(
+    self,
+    prefix: str = "",
+    cursor: str | None = None,
+    count: int = 100,
+  ) -> tuple[str | None, list[str]]:
+    """Return one SCAN page of keys starting with ``prefix``.
+
+    As with Redis SCAN, pages may be shorter than ``count`` (even empty)
+    before the scan is complete.
+    """
+    client = await self._get_client()
+    next_cursor, raw_keys = await client.scan(
+      cursor=int(cursor or 0),
+      match=_GLOB_ESCAPE.sub(r"\\\g<0>", prefix) + "*",
+      count=count,
+    )
+    return (str(next_cursor) if int(next_cursor) else None), [_decode(k) for k in raw_keys]
+
+  async def sadd(self, key: str, *members: str) -> int:
+    """Add members to a set; returns how many were new."""
+    if not members:
+      return 0
+    client = await self._get_client()
+    return int(await client.sadd(key, *members))
+
+  async def srem(self, key: str, *members: str) -> int:
+    """Remove members from a set; returns how many were present."""
+    if not members:
+      return 0
+    client = await self._get_client()
+    return int(await client.srem(key, *members))
+
+  async def smembers(self, key: str) -> set[str]:
+    """Return the members of a set."""
+    client = await self._get_client()
+    return {_decode(member) for member in await client.smembers(key)}
+
+  async def hset(self, key: str, mapping: dict[str, Any]) -> int:
+    """Store fields of a hash with one HSET; returns how many were new."""
+    if not mapping:
+      return 0
     client = await self._get_client()
-    # Redis KEYS command returns bytes
-    raw_keys = await client.keys(pattern)
-    return [k.decode() if isinstance(k, bytes) else k for k in raw_keys]
+    return int(
+      await client.hset(
+        key, mapping={field: json.dumps(value) for field, value in mapping.items()}
+      ),
+    )
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Remove fields from a hash; returns how many were present."""
+    if not fields:
+      return 0
+    client = await self._get_client()
+    return int(await client.hdel(key, *fields))
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Return all fields of a hash."""
+    client = await self._get_client()
+    return {_decode(field): _loads(value) for field, value in (await client.hgetall(key)).items()}
+
+  async def incr(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter."""
+    client = await self._get_client()
+    return int(await client.incrby(key, amount))
+
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: float | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals ``expected``.
+
+    Runs as a Lua script so the comparison and the write cannot interleave
+    with other clients.
+    """
+    client = await self._get_client()
+    ttl_ms = max(int(ttl_seconds * 1000), 1) if ttl_seconds is not None else 0
+    swapped = await client.eval(
+      _COMPARE_AND_SET_SCRIPT,
+      1,
+      key,
+      "" if expected is None else json.dumps(expected),
+      "" if value is None else json.dumps(value),
+      ttl_ms,
+    )
+    return bool(swapped)
 
   async def close(self) -> None:
-    """Close the Redis connection."""
-    if self._client is not None:
-      await self._client.aclose()
-      self._client = None
+    """Close the Redis connection of the running loop and forget the others."""
+    client = self._clients.pop(asyncio.get_running_loop(), None)
+    self._clients.clear()
+    if client is not None:
+      await client.aclose()
       logger.info("Redis connection closed")
 
 
@@ -7,7 +7,8 @@ the KeyValueStore protocol with full TTL support.
 Features:
 - Persistent storage (survives process restarts)
 - TTL support with lazy expiration
-- fnmatch-based pattern matching for keys()
+- Prefix scans and pattern listings served from the primary-key index
+- Native sets and hashes in side tables (one row per member or field)
 - Single file database (no external dependencies)
 
 Usage:
@@ -16,6 +17,8 @@ Usage:
     state = await store.get("hw:conn:device-1")
 """
 
+from __future__ import annotations
+
 import asyncio
 import contextlib
 import fnmatch
@@ -24,8 +27,30 @@ import logging
 import time
 from typing import Any
 
+from praxis.backend.core.storage.protocols import glob_prefix
+
 logger = logging.getLogger(__name__)
 
+# SQLite's default limit on bound parameters is 999 on older builds.
+_MGET_CHUNK = 500
+
+
+def _prefix_range(prefix: str, after: str | None = None) -> tuple[str, list[str]]:
+  """Return a WHERE fragment limiting ``key`` to a prefix (and past a cursor).
+
+  Range comparisons on the primary key use its index, unlike LIKE or a
+  Python-side filter, and need no escaping of wildcard characters.
+  """
+  clauses: list[str] = []
+  params: list[str] = []
+  if prefix:
+    clauses.append("key >= ? AND key < ?")
+    params += [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+  if after is not None:
+    clauses.append("key > ?")
+    params.append(after)
+  return (" AND ".join(clauses) or "1"), params
+
 
 class SqliteKeyValueStore:
   """SQLite-backed key-value store with TTL support.
@@ -74,6 +99,21 @@ class SqliteKeyValueStore:
           expires_at REAL
         )
       """)
+      await self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS kv_sets (
+          key TEXT NOT NULL,
+          member TEXT NOT NULL,
+          PRIMARY KEY (key, member)
+        ) WITHOUT ROWID
+      """)
+      await self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS kv_hashes (
+          key TEXT NOT NULL,
+          field TEXT NOT NULL,
+          value TEXT NOT NULL,
+          PRIMARY KEY (key, field)
+        ) WITHOUT ROWID
+      """)
       # Create index for expiration cleanup
       await self._conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_kv_expires
@@ -196,9 +236,11 @@ class SqliteKeyValueStore:
         "DELETE FROM kv_store WHERE key = ?",
         (key,),
       )
+      set_cursor = await conn.execute("DELETE FROM kv_sets WHERE key = ?", (key,))
+      hash_cursor = await conn.execute("DELETE FROM kv_hashes WHERE key = ?", (key,))
       await conn.commit()
 
-      deleted = cursor.rowcount > 0
+      deleted = cursor.rowcount > 0 or set_cursor.rowcount > 0 or hash_cursor.rowcount > 0
       if deleted:
         logger.debug("Deleted key: %s", key)
       return deleted
@@ -222,15 +264,46 @@ class SqliteKeyValueStore:
         SELECT 1 FROM kv_store
         WHERE key = ?
         AND (expires_at IS NULL OR expires_at > ?)
+        UNION ALL
+        SELECT 1 FROM kv_sets WHERE key = ?
+        UNION ALL
+        SELECT 1 FROM kv_hashes WHERE key = ?
+        LIMIT 1
         """,
-        (key, now),
+        (key, now, key, key),
       )
       row = await cursor.fetchone()
       return row is not None
 
+  async def _select_keys(
+    self,
+    conn: Any,
+    prefix: str,
+    after: str | None = None,
+    limit: int = -1,
+  ) -> list[str]:
+    """Return live keys (values, sets and hashes) in a prefix range, in key order."""
+    where, params = _prefix_range(prefix, after)
+    cursor = await conn.execute(
+      f"""
+      SELECT key FROM kv_store
+      WHERE {where} AND (expires_at IS NULL OR expires_at > ?)
+      UNION
+      SELECT key FROM kv_sets WHERE {where}
+      UNION
+      SELECT key FROM kv_hashes WHERE {where}
+      ORDER BY key
+      LIMIT ?
+      """,  # noqa: S608
+      (*params, time.time(), *params, *params, limit),
+    )
+    return [key for (key,) in await cursor.fetchall()]
+
   async def keys(self, pattern: str = "*") -> list[str]:
     """List keys matching a glob pattern.
 
+    Only keys in the range of the pattern's literal prefix are read.
+
     Args:
         pattern: Glob-style pattern (e.g., "user:*"). Default "*" matches all.
 
@@ -238,27 +311,250 @@ class SqliteKeyValueStore:
         List of matching keys.
 
     """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      keys = await self._select_keys(conn, glob_prefix(pattern))
+    return [key for key in keys if fnmatch.fnmatchcase(key, pattern)]
+
+  async def scan(
+    self,
+    prefix: str = "",
+    cursor: str | None = None,
+    count: int = 100,
+  ) -> tuple[str | None, list[str]]:
+    """Return one page of keys starting with ``prefix``.
+
+    The cursor is the last key of the previous page.
+
+    Args:
+        prefix: Literal key prefix ("" matches all keys).
+        cursor: The cursor returned by the previous call, or None to start.
+        count: Page size.
+
+    Returns:
+        The cursor for the next page (None once complete) and this page's keys.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      page = await self._select_keys(conn, prefix, cursor, count)
+    return (page[-1] if len(page) == count else None), page
+
+  async def mget(self, keys: list[str]) -> list[Any | None]:
+    """Retrieve several values with one query per 500 keys.
+
+    Args:
+        keys: The keys to look up.
+
+    Returns:
+        The values in the order of ``keys``, with None for missing keys.
+
+    """
+    found: dict[str, Any] = {}
     async with self._lock:
       conn = await self._ensure_connection()
       now = time.time()
+      for start in range(0, len(keys), _MGET_CHUNK):
+        chunk = keys[start : start + _MGET_CHUNK]
+        cursor = await conn.execute(
+          f"""
+          SELECT key, value FROM kv_store
+          WHERE key IN ({", ".join("?" * len(chunk))})
+          AND (expires_at IS NULL OR expires_at > ?)
+          """,  # noqa: S608
+          (*chunk, now),
+        )
+        found.update((key, json.loads(value)) for key, value in await cursor.fetchall())
+    return [found.get(key) for key in keys]
+
+  async def mset(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+    """Store several values in a single transaction.
+
+    Args:
+        items: Mapping of keys to JSON-serializable values.
+        ttl_seconds: Optional time-to-live applied to every key.
+
+    """
+    expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+    async with self._lock:
+      conn = await self._ensure_connection()
+      await conn.executemany(
+        "INSERT OR REPLACE INTO kv_store (key, value, expires_at) VALUES (?, ?, ?)",
+        [(key, json.dumps(value), expires_at) for key, value in items.items()],
+      )
+      await conn.commit()
+
+  async def sadd(self, key: str, *members: str) -> int:
+    """Add members to a set; returns how many were new."""
+    if not members:
+      return 0
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.executemany(
+        "INSERT OR IGNORE INTO kv_sets (key, member) VALUES (?, ?)",
+        [(key, member) for member in members],
+      )
+      await conn.commit()
+      return cursor.rowcount
 
-      # Fetch all non-expired keys
+  async def srem(self, key: str, *members: str) -> int:
+    """Remove members from a set; returns how many were present."""
+    if not members:
+      return 0
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.executemany(
+        "DELETE FROM kv_sets WHERE key = ? AND member = ?",
+        [(key, member) for member in members],
+      )
+      await conn.commit()
+      return cursor.rowcount
+
+  async def smembers(self, key: str) -> set[str]:
+    """Return the members of a set."""
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.execute("SELECT member FROM kv_sets WHERE key = ?", (key,))
+      return {member for (member,) in await cursor.fetchall()}
+
+  async def hset(self, key: str, mapping: dict[str, Any]) -> int:
+    """Store fields of a hash in one transaction; returns how many were new."""
+    if not mapping:
+      return 0
+    async with self._lock:
+      conn = await self._ensure_connection()
+      fields = list(mapping)
+      existing = 0
+      for start in range(0, len(fields), _MGET_CHUNK):
+        chunk = fields[start : start + _MGET_CHUNK]
+        cursor = await conn.execute(
+          f"""
+          SELECT COUNT(*) FROM kv_hashes
+          WHERE key = ? AND field IN ({", ".join("?" * len(chunk))})
+          """,  # noqa: S608
+          (key, *chunk),
+        )
+        (found,) = await cursor.fetchone()
+        existing += found
+      await conn.executemany(
+        "INSERT OR REPLACE INTO kv_hashes (key, field, value) VALUES (?, ?, ?)",
+        [(key, field, json.dumps(value)) for field, value in mapping.items()],
+      )
+      await conn.commit()
+      return len(mapping) - existing
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Remove fields from a hash; returns how many were present."""
+    if not fields:
+      return 0
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.executemany(
+        "DELETE FROM kv_hashes WHERE key = ? AND field = ?",
+        [(key, field) for field in fields],
+      )
+      await conn.commit()
+      return cursor.rowcount
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Return all fields of a hash."""
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.execute("SELECT field, value FROM kv_hashes WHERE key = ?", (key,))
+      return {field: json.loads(value) for field, value in await cursor.fetchall()}
+
+  async def incr(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter.
+
+    Args:
+        key: The counter key. A missing or expired key counts from 0.
+        amount: The increment (may be negative).
+
+    Returns:
+        The counter value after the increment.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      now = time.time()
       cursor = await conn.execute(
         """
-        SELECT key FROM kv_store
-        WHERE expires_at IS NULL OR expires_at > ?
+        INSERT INTO kv_store (key, value, expires_at) VALUES (?, ?, NULL)
+        ON CONFLICT(key) DO UPDATE SET
+          value = CASE WHEN expires_at IS NOT NULL AND expires_at <= ? THEN excluded.value
+                  ELSE CAST(CAST(value AS INTEGER) + ? AS TEXT) END,
+          expires_at = CASE WHEN expires_at IS NOT NULL AND expires_at <= ? THEN NULL
+                       ELSE expires_at END
+        RETURNING value
         """,
-        (now,),
+        (key, json.dumps(amount), now, amount, now),
       )
-      rows = await cursor.fetchall()
+      (value_json,) = await cursor.fetchone()
+      await cursor.close()
+      await conn.commit()
+      return int(value_json)
 
-      # Filter by pattern using fnmatch
-      result = []
-      for (key,) in rows:
-        if fnmatch.fnmatch(key, pattern):
-          result.append(key)
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: float | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals ``expected``.
+
+    Each case is a single conditional statement, so the swap is also atomic
+    between processes sharing the database file.
 
-      return result
+    Args:
+        key: The key to update.
+        expected: The value the key must currently hold, or None to require
+            that the key is absent (or expired).
+        value: The new value, or None to delete the key.
+        ttl_seconds: Optional time-to-live for the new value.
+
+    Returns:
+        True if the swap happened, False if the current value did not match.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      now = time.time()
+      expires_at = now + ttl_seconds if ttl_seconds is not None else None
+      value_json = json.dumps(value)
+      live = "(expires_at IS NULL OR expires_at > ?)"
+
+      if expected is None and value is None:
+        cursor = await conn.execute(
+          f"SELECT 1 FROM kv_store WHERE key = ? AND {live}",  # noqa: S608
+          (key, now),
+        )
+        return await cursor.fetchone() is None
+      if expected is None:
+        cursor = await conn.execute(
+          """
+          INSERT INTO kv_store (key, value, expires_at) VALUES (?, ?, ?)
+          ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value, expires_at = excluded.expires_at
+          WHERE kv_store.expires_at IS NOT NULL AND kv_store.expires_at <= ?
+          """,
+          (key, value_json, expires_at, now),
+        )
+      elif value is None:
+        cursor = await conn.execute(
+          f"DELETE FROM kv_store WHERE key = ? AND value = ? AND {live}",  # noqa: S608
+          (key, json.dumps(expected), now),
+        )
+      else:
+        cursor = await conn.execute(
+          f"""
+          UPDATE kv_store SET value = ?, expires_at = ?
+          WHERE key = ? AND value = ? AND {live}
+          """,  # noqa: S608
+          (value_json, expires_at, key, json.dumps(expected), now),
+        )
+      await conn.commit()
+      return cursor.rowcount > 0
 
   async def close(self) -> None:
     """Close the database connection and release resources.
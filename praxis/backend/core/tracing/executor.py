@@ -21,11 +21,7 @@ from praxis.backend.utils.plr_static_analysis.resource_hierarchy import (
   DeckLayoutType,
   get_parental_chain,
 )
-from praxis.common.type_inspection import (
-  extract_resource_types,
-  is_container_type,
-  get_element_type,
-)
+from praxis.common.type_inspection import describe_type
 
 if TYPE_CHECKING:
   from collections.abc import Callable
@@ -49,30 +45,10 @@ class TracingError(Exception):
 # Machine Type Detection
 # =============================================================================
 
-MACHINE_TYPE_PATTERNS: dict[str, str] = {
-  "LiquidHandler": "liquid_handler",
-  "PlateReader": "plate_reader",
-  "HeaterShaker": "heater_shaker",
-  "Shaker": "shaker",
-  "Centrifuge": "centrifuge",
-  "Thermocycler": "thermocycler",
-  "TemperatureController": "temperature_controller",
-  "Incubator": "incubator",
-  "Pump": "pump",
-  "PumpArray": "pump_array",
-  "Fan": "fan",
-  "Sealer": "sealer",
-  "Peeler": "peeler",
-  "PowderDispenser": "powder_dispenser",
-}
-
 
 def infer_machine_type(type_hint: str) -> str | None:
   """Infer machine type from a type hint string."""
-  for pattern, machine_type in MACHINE_TYPE_PATTERNS.items():
-    if pattern in type_hint:
-      return machine_type
-  return None
+  return describe_type(type_hint).machine_type
 
 
 # =============================================================================
@@ -217,19 +193,20 @@ class ProtocolTracingExecutor:
         A tracer object, or None for non-traceable types.
 
     """
+    descriptor = describe_type(type_hint)
+
     # Check for machine types
-    machine_type = infer_machine_type(type_hint)
-    if machine_type:
+    if descriptor.machine_type:
       return TracedMachine(
         name=name,
         recorder=recorder,
         declared_type=type_hint,
-        machine_type=machine_type,
+        machine_type=descriptor.machine_type,
       )
 
     # Check for container of resources (e.g. list[Well])
-    if is_container_type(type_hint):
-      element_type = get_element_type(type_hint)
+    if descriptor.is_container:
+      element_type = descriptor.element_type
       # We only support itemized collections of specific resource types
       if element_type in {"Well", "TipSpot", "Tube", "Spot"}:
         return TracedContainerElementCollection(
@@ -241,7 +218,7 @@ class ProtocolTracingExecutor:
         )
 
     # Check for PLR resource types
-    resource_types = extract_resource_types(type_hint)
+    resource_types = descriptor.resource_types
     if resource_types:
       primary_type = resource_types[0]
       chain = get_parental_chain(primary_type, self._deck_layout_type)
@@ -2,14 +2,21 @@
 
 This module provides the OperationRecorder class that collects operations
 recorded during protocol tracing and builds them into a ProtocolComputationGraph.
+
+Loops are stored once: operations recorded while iterating a traced collection
+form the body of a `LoopNode`, and runs of identical iterations unrolled by
+plain Python loops (``for i in range(384): ...``) are collapsed into a loop
+with an exact iteration count when the graph is built.
 """
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 
 from praxis.backend.utils.plr_static_analysis.models import (
   GraphNodeType,
+  LoopNode,
   OperationNode,
   PreconditionType,
   ProtocolComputationGraph,
@@ -17,6 +24,14 @@ from praxis.backend.utils.plr_static_analysis.models import (
   StatePrecondition,
 )
 
+MIN_COLLAPSED_REPEATS = 3
+"""Consecutive identical iterations needed before they are collapsed into a loop"""
+
+MAX_COLLAPSED_PERIOD = 64
+"""Longest iteration body (in nodes) considered when collapsing repeats"""
+
+_SUBSCRIPT = re.compile(r"\[[^\[\]]*\]")
+
 # =============================================================================
 # Loop/Conditional Context
 # =============================================================================
@@ -32,8 +47,11 @@ class LoopContext:
   source_collection: str
   """Collection being iterated"""
 
+  loop_id: str = ""
+  """ID of the LoopNode this context builds"""
+
   operation_ids: list[str] = field(default_factory=list)
-  """Operations recorded inside this loop"""
+  """Operations and nested loops recorded inside this loop"""
 
 
 @dataclass
@@ -93,10 +111,12 @@ class OperationRecorder:
     self._resources: dict[str, ResourceNode] = {}
     self._preconditions: list[StatePrecondition] = []
     self._execution_order: list[str] = []
+    self._loops: list[LoopNode] = []
 
     # Counters
     self._op_counter = 0
     self._precond_counter = 0
+    self._loop_counter = 0
 
     # Control flow tracking
     self._loop_stack: list[LoopContext] = []
@@ -121,6 +141,11 @@ class OperationRecorder:
     self._precond_counter += 1
     return f"traced_precond_{self._precond_counter}"
 
+  def _generate_loop_id(self) -> str:
+    """Generate a unique loop ID."""
+    self._loop_counter += 1
+    return f"traced_loop_{self._loop_counter}"
+
   # ---------------------------------------------------------------------------
   # Operation Recording
   # ---------------------------------------------------------------------------
@@ -195,15 +220,16 @@ class OperationRecorder:
     if self._loop_stack:
       self._loop_stack[-1].operation_ids.append(op_id)
       operation.foreach_source = self._loop_stack[-1].source_collection
-    elif self._conditional_stack:
-      ctx = self._conditional_stack[-1]
-      if ctx.in_true_branch:
-        ctx.true_branch_ops.append(op_id)
-      else:
-        ctx.false_branch_ops.append(op_id)
+    else:
+      if self._conditional_stack:
+        ctx = self._conditional_stack[-1]
+        if ctx.in_true_branch:
+          ctx.true_branch_ops.append(op_id)
+        else:
+          ctx.false_branch_ops.append(op_id)
+      self._execution_order.append(op_id)
 
     self._operations.append(operation)
-    self._execution_order.append(op_id)
 
     return op_id
 
@@ -313,18 +339,34 @@ class OperationRecorder:
     """
     self._has_loops = True
     self._loop_stack.append(
-      LoopContext(iterator_var=iterator_var, source_collection=source_collection)
+      LoopContext(
+        iterator_var=iterator_var,
+        source_collection=source_collection,
+        loop_id=self._generate_loop_id(),
+      )
     )
 
   def exit_loop(self) -> None:
-    """Record exiting a loop."""
+    """Record exiting a loop.
+
+    The operations recorded since `enter_loop` become the body of a LoopNode,
+    which takes their place in the enclosing loop or execution order. Its
+    iteration count is left symbolic (the source collection expression).
+    """
     if self._loop_stack:
       ctx = self._loop_stack.pop()
-      # Mark operations as part of foreach
-      for op_id in ctx.operation_ids:
-        for op in self._operations:
-          if op.id == op_id:
-            op.foreach_body.append(op_id)
+      self._loops.append(
+        LoopNode(
+          id=ctx.loop_id,
+          loop_variable=ctx.iterator_var,
+          source_expression=ctx.source_collection,
+          body=ctx.operation_ids,
+        )
+      )
+      if self._loop_stack:
+        self._loop_stack[-1].operation_ids.append(ctx.loop_id)
+      else:
+        self._execution_order.append(ctx.loop_id)
 
   def enter_conditional(self, condition_expr: str) -> None:
     """Record entering a conditional.
@@ -350,22 +392,206 @@ class OperationRecorder:
   # Graph Building
   # ---------------------------------------------------------------------------
 
-  def build_graph(self) -> ProtocolComputationGraph:
+  def build_graph(self, collapse_repeats: bool = True) -> ProtocolComputationGraph:
     """Build the final computation graph from recorded operations.
 
+    Args:
+        collapse_repeats: Collapse runs of identical iterations into loops.
+
     Returns:
         A ProtocolComputationGraph containing all recorded data.
 
     """
-    return ProtocolComputationGraph(
+    graph = ProtocolComputationGraph(
       protocol_fqn=self._protocol_fqn,
       protocol_name=self._protocol_name,
       operations=self._operations,
       resources=self._resources,
       preconditions=self._preconditions,
       execution_order=self._execution_order,
+      loops=self._loops,
       machine_types=sorted(self._machine_types),
       resource_types=sorted(self._resource_types),
       has_loops=self._has_loops,
       has_conditionals=self._has_conditionals,
     )
+    if collapse_repeats:
+      graph = collapse_repeated_iterations(graph, first_loop_number=self._loop_counter + 1)
+    return graph
+
+
+# =============================================================================
+# Repeated Iteration Collapsing
+# =============================================================================
+
+
+def collapse_repeated_iterations(
+  graph: ProtocolComputationGraph,
+  min_repeats: int = MIN_COLLAPSED_REPEATS,
+  max_period: int = MAX_COLLAPSED_PERIOD,
+  first_loop_number: int | None = None,
+) -> ProtocolComputationGraph:
+  """Collapse consecutive identical iterations into loops with exact counts.
+
+  Two iterations are identical when their nodes call the same methods on the
+  same receivers with the same arguments up to subscripts, so
+  ``lh.aspirate(plate[0], 10)`` and ``lh.aspirate(plate[1], 10)`` match but
+  different volumes do not. The first iteration is kept as the loop body;
+  the nodes and preconditions of the others are dropped, and preconditions
+  they satisfied point at the matching node of the first iteration instead.
+
+  Args:
+      graph: Graph to collapse. It is not modified.
+      min_repeats: Minimum number of consecutive identical iterations.
+      max_period: Maximum number of nodes in one iteration.
+      first_loop_number: Number used for the first new loop ID
+          (``traced_loop_{n}``); defaults to one past the existing loops.
+
+  Returns:
+      A new graph, or ``graph`` itself if nothing was collapsed.
+
+  """
+  collapser = _RepeatCollapser(
+    graph,
+    min_repeats=min_repeats,
+    max_period=max_period,
+    first_loop_number=first_loop_number or len(graph.loops) + 1,
+  )
+  # Traced loops are listed innermost first, so nested bodies collapse bottom-up.
+  for loop in graph.loops:
+    collapser.loops[loop.id].body = collapser.collapse(loop.body)
+  execution_order = collapser.collapse(graph.execution_order)
+  if not collapser.dropped:
+    return graph
+
+  dropped_preconditions = {
+    precond_id
+    for op_id in collapser.dropped
+    if op_id in collapser.operations
+    for precond_id in collapser.operations[op_id].preconditions
+  }
+  preconditions = []
+  for precond in graph.preconditions:
+    if precond.id in dropped_preconditions:
+      continue
+    kept = precond.model_copy()
+    if kept.satisfied_by in collapser.dropped:
+      kept.satisfied_by = collapser.dropped[kept.satisfied_by]
+    preconditions.append(kept)
+
+  return graph.model_copy(
+    update={
+      "operations": [op for op in collapser.operations.values() if op.id not in collapser.dropped],
+      "loops": [loop for loop in collapser.loops.values() if loop.id not in collapser.dropped],
+      "preconditions": preconditions,
+      "execution_order": execution_order,
+      "has_loops": True,
+    },
+    deep=True,
+  )
+
+
+class _RepeatCollapser:
+  """Finds and folds runs of identical iterations in node ID sequences."""
+
+  def __init__(
+    self,
+    graph: ProtocolComputationGraph,
+    min_repeats: int,
+    max_period: int,
+    first_loop_number: int,
+  ) -> None:
+    # Deep copies: collapsing rewrites nodes, and the input graph must not change
+    self.operations = {op.id: op.model_copy(deep=True) for op in graph.operations}
+    self.loops = {loop.id: loop.model_copy(deep=True) for loop in graph.loops}
+    self.min_repeats = min_repeats
+    self.max_period = max_period
+    self.dropped: dict[str, str] = {}
+    """Dropped node ID -> the node of the first iteration it repeats"""
+    self._next_loop = first_loop_number
+    self._signature_ids: dict[tuple, int] = {}
+
+  def collapse(self, node_ids: list[str]) -> list[str]:
+    """Return ``node_ids`` with each run of repeated iterations replaced by a loop.
+
+    Passes repeat until nothing changes, so runs of loops created by an
+    earlier pass (outer loops around unrolled inner loops) collapse too.
+    """
+    while True:
+      collapsed = self._collapse_once(node_ids)
+      if len(collapsed) == len(node_ids):
+        return collapsed
+      node_ids = collapsed
+
+  def _collapse_once(self, node_ids: list[str]) -> list[str]:
+    signatures = [self._signature_id(node_id) for node_id in node_ids]
+    collapsed: list[str] = []
+    i = 0
+    n = len(node_ids)
+    while i < n:
+      best_covered, best_period = 0, 0
+      for period in range(1, min(self.max_period, (n - i) // self.min_repeats) + 1):
+        first = signatures[i : i + period]
+        repeats = 1
+        while signatures[i + repeats * period : i + (repeats + 1) * period] == first:
+          repeats += 1
+        if repeats >= self.min_repeats and repeats * period > best_covered:
+          best_covered, best_period = repeats * period, period
+      if not best_covered:
+        collapsed.append(node_ids[i])
+        i += 1
+        continue
+
+      repeats = best_covered // best_period
+      body = node_ids[i : i + best_period]
+      for offset in range(best_period, best_covered):
+        self._drop(node_ids[i + offset], body[offset % best_period])
+      collapsed.append(self._new_loop(body, repeats))
+      i += best_covered
+    return collapsed
+
+  def _new_loop(self, body: list[str], repeats: int) -> str:
+    loop_id = f"traced_loop_{self._next_loop}"
+    self._next_loop += 1
+    source = f"range({repeats})"
+    for node_id in body:
+      op = self.operations.get(node_id)
+      if op is not None:
+        op.node_type = GraphNodeType.FOREACH
+        op.foreach_source = op.foreach_source or source
+    self.loops[loop_id] = LoopNode(
+      id=loop_id,
+      source_expression=source,
+      body=self.collapse(body),
+      iteration_count=repeats,
+      max_iterations=repeats,
+      inferred_from="collapsed repeated iterations",
+    )
+    return loop_id
+
+  def _drop(self, node_id: str, kept_id: str) -> None:
+    self.dropped[node_id] = kept_id
+    loop = self.loops.get(node_id)
+    kept = self.loops.get(kept_id)
+    if loop is not None and kept is not None:
+      for child_id, kept_child_id in zip(loop.body, kept.body, strict=False):
+        self._drop(child_id, kept_child_id)
+
+  def _signature_id(self, node_id: str) -> int:
+    signature = self._signature(node_id)
+    return self._signature_ids.setdefault(signature, len(self._signature_ids))
+
+  def _signature(self, node_id: str) -> tuple:
+    op = self.operations.get(node_id)
+    if op is not None:
+      arguments = tuple(sorted((k, _SUBSCRIPT.sub("[*]", v)) for k, v in op.arguments.items()))
+      return ("op", op.receiver_variable, op.receiver_type, op.method_name, arguments)
+    loop = self.loops.get(node_id)
+    if loop is not None:
+      return (
+        "loop",
+        _SUBSCRIPT.sub("[*]", loop.source_expression),
+        loop.iteration_count,
+        tuple(self._signature_id(child) for child in loop.body),
+      )
+    return ("unknown", node_id)
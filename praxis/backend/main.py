@@ -11,6 +11,8 @@ from starlette.responses import RedirectResponse
 
 from praxis.backend.api import (
   auth,
+  catalog,
+  compute,
   decks,
   discovery,
   hardware,
@@ -29,6 +31,7 @@ from praxis.backend.core.asset_manager import AssetManager
 from praxis.backend.core.celery import celery_app, configure_celery_app
 from praxis.backend.core.filesystem import FileSystem
 from praxis.backend.core.orchestrator import Orchestrator
+from praxis.backend.core.simulation.result_cache import configure_simulation_result_cache
 from praxis.backend.core.storage import StorageBackend, StorageFactory
 from praxis.backend.core.workcell import Workcell
 from praxis.backend.core.workcell_runtime import WorkcellRuntime
@@ -36,21 +39,31 @@ from praxis.backend.models.domain.deck import Deck, DeckDefinition
 from praxis.backend.models.domain.machine import Machine
 from praxis.backend.models.domain.resource import Resource
 from praxis.backend.models.domain.workcell import Workcell
+from praxis.backend.services.capability_index import configure_capability_index
 from praxis.backend.services.deck import DeckService
 from praxis.backend.services.deck_type_definition import DeckTypeDefinitionService
 from praxis.backend.services.discovery_service import DiscoveryService
+from praxis.backend.services.hardware_connection_manager import HardwareConnectionManager
+from praxis.backend.services.hardware_discovery import hardware_discovery
 from praxis.backend.services.machine import MachineService
 from praxis.backend.services.machine_type_definition import MachineTypeDefinitionService
+from praxis.backend.services.plate_aggregate_cache import configure_plate_aggregate_cache
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.services.resource import ResourceService
 from praxis.backend.services.resource_type_definition import ResourceTypeDefinitionService
+from praxis.backend.services.retention import RetentionService, configure_retention_service
 from praxis.backend.services.workcell import WorkcellService
+from praxis.backend.utils.compute_executor import (
+  configure_compute_executor,
+  shutdown_compute_executor,
+)
 from praxis.backend.utils.db import (
   AsyncSessionLocal,
   init_praxis_db_schema,
 )
 
 if TYPE_CHECKING:
+  from praxis.backend.core.storage import PubSub
   from praxis.backend.services.praxis_orm_service import PraxisDBService
 
 from praxis.backend.utils.db import (
@@ -98,9 +111,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
   asset_manager: AssetManager | None = None
   workcell_runtime: WorkcellRuntime | None = None
   discovery_service: DiscoveryService | None = None
+  retention_service: RetentionService | None = None
+  connection_manager: HardwareConnectionManager | None = None
+  asset_lock_manager: AssetLockManager | None = None
+  pubsub: PubSub | None = None
   try:
     logger.info("Application startup sequence initiated...")
 
+    configure_compute_executor(
+      kind=praxis_config.compute_executor_kind,  # type: ignore[arg-type]
+      max_workers=praxis_config.compute_max_workers,
+      limits=praxis_config.compute_concurrency_limits,
+    )
+
     # Determine storage backend from configuration
     storage_backend_str = praxis_config.storage_backend
     is_lite = praxis_config.is_lite_mode
@@ -117,20 +140,50 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Create key-value store and task queue based on backend
     kv_store = StorageFactory.create_key_value_store(storage_backend)
+    pubsub = StorageFactory.create_pubsub(storage_backend)
     task_queue = StorageFactory.create_task_queue(storage_backend)
     app.state.kv_store = kv_store
+    app.state.pubsub = pubsub
     app.state.task_queue = task_queue
+    configure_simulation_result_cache(kv_store)
+    configure_plate_aggregate_cache(kv_store)
+    configure_capability_index(kv_store)
     logger.info(
       "Storage layer initialized: kv_store=%s, task_queue=%s",
       type(kv_store).__name__,
       type(task_queue).__name__,
     )
 
+    connection_manager = HardwareConnectionManager(kv_store, pubsub=pubsub)
+    connection_manager.start()
+    app.state.connection_manager = connection_manager
+
+    hardware_discovery.pubsub = pubsub
+    if praxis_config.hardware_discovery_background:
+      try:
+        await hardware_discovery.start(
+          serial_poll_interval=praxis_config.hardware_serial_poll_interval,
+        )
+      except Exception:
+        logger.exception("Could not start background hardware discovery")
+
     logger.info("Initializing Praxis database schema...")
     engine = getattr(app.state, "async_engine", None)
     await init_praxis_db_schema(engine=engine)
     logger.info("Praxis database schema initialization complete.")
 
+    retention_service = configure_retention_service(
+      praxis_config.retention_archive_directory,
+      praxis_config.retention_days,
+    )
+    if praxis_config.retention_enabled:
+      retention_service.start(
+        AsyncSessionLocal,
+        kv_store,
+        interval_seconds=praxis_config.retention_interval_seconds,
+      )
+      logger.info("History compactor started (retention: %s).", retention_service.policy.days)
+
     # Initialize AssetManager and WorkcellRuntime
     logger.info("Initializing AssetManager and WorkcellRuntime...")
 
@@ -156,7 +209,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
       )
     logger.info("WorkcellRuntime initialized successfully.")
     async with AsyncSessionLocal() as db_session:  # Use async with for session
-      asset_lock_manager = AssetLockManager()
+      asset_lock_manager = AssetLockManager(kv_store=kv_store)
+      await asset_lock_manager.initialize()
       resource_type_definition_service = ResourceTypeDefinitionService(db_session)
       asset_manager = AssetManager(
         db_session=db_session,
@@ -192,6 +246,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         db_session_factory=AsyncSessionLocal,
         asset_manager=asset_manager,
         workcell_runtime=workcell_runtime,
+        state_store=kv_store,
       )
       logger.info("Orchestrator dependencies initialized.")
 
@@ -267,6 +322,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await db_service_instance.close()
         logger.info("PraxisDBService closed.")
 
+      if retention_service:
+        await retention_service.stop()
+
+      if connection_manager:
+        await connection_manager.stop()
+
+      await hardware_discovery.stop()
+
+      if asset_lock_manager:
+        await asset_lock_manager.close()
+
+      # Ends the event streams of connected websockets.
+      if pubsub:
+        await pubsub.close()
+
+      shutdown_compute_executor(wait=False)
+
       # Dispose of the SQLAlchemy engine for the main Praxis DB
       logger.info("Disposing of Praxis SQLAlchemy engine...")
       await praxis_async_engine.dispose()
@@ -307,6 +379,13 @@ app.add_middleware(
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],
+  expose_headers=[
+    "ETag",
+    "X-Catalog-Version",
+    "X-Next-Cursor",
+    "X-Total-Count",
+    "X-Total-Count-Estimated",
+  ],
 )
 
 # --- API Router Inclusion ---
@@ -330,6 +409,8 @@ app.include_router(
 app.include_router(hardware.router, prefix="/api/v1/hardware", tags=["Hardware"])
 app.include_router(discovery.router, prefix="/api/v1/discovery", tags=["Discovery"])
 app.include_router(scheduler.router, prefix="/api/v1/scheduler", tags=["Scheduler"])
+app.include_router(compute.router, prefix="/api/v1/compute", tags=["Compute"])
+app.include_router(catalog.router, prefix="/api/v1/catalog", tags=["Catalog"])
 
 from praxis.backend.api import repl, websockets
 
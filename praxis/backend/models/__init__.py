@@ -93,6 +93,9 @@ from .domain.schedule import (
 from .domain.schedule import (
   ScheduleHistory as ScheduleHistory,
 )
+from .domain.schedule import (
+  ScheduleHistoryRollup as ScheduleHistoryRollup,
+)
 from .domain.schedule import (
   SchedulerMetricsView,
 )
@@ -251,6 +254,7 @@ __all__ = [
   "RuntimeAssetRequirement",
   "ScheduleEntry",
   "ScheduleHistory",
+  "ScheduleHistoryRollup",
   "ScheduleStatusEnum",
   "SchedulerMetricsView",
   "SpatialContextEnum",
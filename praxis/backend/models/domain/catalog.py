@@ -0,0 +1,43 @@
+"""Response models for the definition catalog snapshot endpoints."""
+
+from typing import Any
+
+from sqlmodel import Field, SQLModel
+
+
+class CatalogTableVersion(SQLModel):
+  """Row count and content hash of one catalog table."""
+
+  rows: int
+  hash: str
+
+
+class CatalogVersion(SQLModel):
+  """The current catalog version and what it contains."""
+
+  version: str = Field(description="Content hash of all catalog tables; also the snapshot ETag.")
+  generated_at: str
+  tables: dict[str, CatalogTableVersion]
+
+
+class CatalogTableDelta(SQLModel):
+  """Changes to one catalog table between two versions."""
+
+  columns: list[str] = Field(description="Column order of the rows in ``upserts``.")
+  primary_key: str
+  upserts: list[list[Any]] = Field(
+    default_factory=list,
+    description="New or changed rows, with values encoded as in the SQLite snapshot.",
+  )
+  deletes: list[str] = Field(default_factory=list, description="Primary keys of removed rows.")
+
+
+class CatalogDelta(SQLModel):
+  """A patch turning the catalog at ``from_version`` into ``to_version``."""
+
+  from_version: str
+  to_version: str
+  tables: dict[str, CatalogTableDelta] = Field(
+    default_factory=dict,
+    description="Only tables with changes are listed.",
+  )
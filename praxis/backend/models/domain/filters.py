@@ -1,7 +1,7 @@
 """Unified SQLModel definitions for Search and Filter criteria."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import UUID7, ConfigDict
 from sqlmodel import Field, SQLModel
@@ -13,6 +13,21 @@ class SearchFilters(SQLModel):
   limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of results to return.")
   offset: int = Field(default=0, ge=0, description="Number of results to skip before returning.")
   sort_by: str | None = Field(default=None, description="Field to sort by.")
+  keyset: bool = Field(
+    default=False,
+    description="Use keyset (cursor) pagination instead of offset pagination. Results are "
+    "ordered by `sort_by`, which must be `accession_id` or `created_at` (optionally prefixed "
+    "with '-'), and the cursor for the next page is returned in the `X-Next-Cursor` header.",
+  )
+  cursor: str | None = Field(
+    default=None,
+    description="Opaque cursor from a previous page's `X-Next-Cursor` header. Implies `keyset`.",
+  )
+  count: Literal["none", "exact", "estimated"] = Field(
+    default="none",
+    description="Whether to report the total number of matching rows in the `X-Total-Count` "
+    "header. `estimated` uses planner statistics or a capped count and is cheap on large tables.",
+  )
   plr_category: str | None = Field(default=None, description="Filter by PyLabRobot category.")
   search_filters: dict[str, Any] | None = Field(
     default=None,
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
+from pydantic import ConfigDict
 from sqlalchemy import Column
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
@@ -11,7 +12,11 @@ from sqlmodel import Field, Relationship, SQLModel
 
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.sqlmodel_base import PraxisBase
-from praxis.backend.models.enums import DataOutputTypeEnum, SpatialContextEnum
+from praxis.backend.models.enums import (
+  DataOutputTypeEnum,
+  PlateAggregationEnum,
+  SpatialContextEnum,
+)
 from praxis.backend.utils.db import JsonVariant
 
 if TYPE_CHECKING:
@@ -276,6 +281,24 @@ class PlateDataVisualization(PraxisBase):
   units: str | None = Field(None, description="Data units")
 
 
+class PlateDataAggregate(SQLModel):
+  """Model for plate data reduced across one or more timepoints."""
+
+  plate_resource_accession_id: uuid.UUID = Field(..., description="ID of the plate resource")
+  data_type: DataOutputTypeEnum = Field(..., description="Type of data being aggregated")
+  method: PlateAggregationEnum = Field(..., description="Per-well reduction applied")
+  timepoint_count: int = Field(..., description="Number of timepoints aggregated")
+  first_timestamp: datetime | None = Field(None, description="Earliest aggregated timepoint")
+  last_timestamp: datetime | None = Field(None, description="Latest aggregated timepoint")
+  plate_layout: dict[str, Any] = Field(..., description="Plate layout information")
+  grid: list[list[float | None]] = Field(
+    ..., description="Aggregated value per well, row-major; null where no data"
+  )
+  data_range: dict[str, float] = Field(..., description="Min/max of the aggregated grid")
+
+  model_config = ConfigDict(use_enum_values=True)
+
+
 class ProtocolRunDataSummary(PraxisBase):
   """Model for summarizing all data from a protocol run."""
 
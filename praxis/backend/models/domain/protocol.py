@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Column, UniqueConstraint
+from sqlalchemy import Column, Index, UniqueConstraint
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 from sqlmodel import Field, Relationship, SQLModel
@@ -453,6 +453,9 @@ class ProtocolRun(ProtocolRunBase, table=True):
   """ProtocolRun ORM model - represents a protocol execution."""
 
   __tablename__ = "protocol_runs"
+  __table_args__ = (
+    Index("ix_protocol_runs_created_at_accession_id", "created_at", "accession_id"),
+  )
 
   status: ProtocolRunStatusEnum = Field(
     default=ProtocolRunStatusEnum.PENDING,
@@ -604,6 +607,14 @@ class FunctionCallLog(FunctionCallLogBase, table=True):
   """FunctionCallLog ORM model."""
 
   __tablename__ = "function_call_logs"
+  __table_args__ = (
+    Index("ix_function_call_logs_created_at_accession_id", "created_at", "accession_id"),
+    Index(
+      "ix_function_call_logs_protocol_run_accession_id_accession_id",
+      "protocol_run_accession_id",
+      "accession_id",
+    ),
+  )
 
   status: FunctionCallStatusEnum = Field(
     default=FunctionCallStatusEnum.UNKNOWN,
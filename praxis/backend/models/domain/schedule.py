@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import computed_field
-from sqlalchemy import UUID, Column
+from sqlalchemy import UUID, Column, Index
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -165,6 +165,10 @@ class AssetReservation(AssetReservationBase, table=True):
   """AssetReservation ORM model - represents a reservation of an asset for a schedule entry."""
 
   __tablename__ = "asset_reservations"
+  __table_args__ = (
+    Index("ix_asset_reservations_created_at_accession_id", "created_at", "accession_id"),
+    Index("ix_asset_reservations_status_expires_at", "status", "expires_at"),
+  )
 
   status: AssetReservationStatusEnum = Field(
     default=AssetReservationStatusEnum.PENDING,
@@ -308,6 +312,9 @@ class ScheduleHistoryBase(PraxisBase):
 
 class ScheduleHistory(ScheduleHistoryBase, table=True):
   __tablename__ = "schedule_history"
+  __table_args__ = (
+    Index("ix_schedule_history_created_at_accession_id", "created_at", "accession_id"),
+  )
 
   event_type: ScheduleHistoryEventEnum = Field(
     default=ScheduleHistoryEventEnum.STATUS_CHANGED,
@@ -355,6 +362,55 @@ class ScheduleHistoryUpdate(SQLModel):
   event_end: datetime | None = None
 
 
+# =============================================================================
+# Schedule History Rollups
+# =============================================================================
+
+
+class ScheduleHistoryRollup(PraxisBase, table=True):
+  """Hourly or daily aggregate of schedule history events.
+
+  One row per (bucket, event type, new status), maintained as events are
+  logged, so scheduling metrics over any period are answered by merging a few
+  rollups instead of scanning the history. Rollups outlive the raw rows once
+  these are compacted by the retention service.
+  """
+
+  __tablename__ = "schedule_history_rollups"
+  __table_args__ = (
+    Index(
+      "ix_schedule_history_rollups_bucket_event_status",
+      "bucket_seconds",
+      "bucket_start",
+      "event_type",
+      "to_status",
+    ),
+  )
+
+  bucket_seconds: int = Field(
+    default=86400, sa_column_kwargs={"server_default": "86400"}, description="3600 or 86400"
+  )
+  bucket_start: datetime = Field(index=True, description="Start of the bucket (UTC)")
+  event_type: str = Field(description="ScheduleHistoryEventEnum value")
+  to_status: str | None = Field(default=None, description="ScheduleStatusEnum value")
+  event_count: int = Field(default=0)
+  error_count: int = Field(default=0)
+  duration_count: int = Field(default=0, description="Events with a recorded duration")
+  duration_total_ms: int = Field(default=0)
+  duration_min_ms: int | None = Field(default=None)
+  duration_max_ms: int | None = Field(default=None)
+  duration_histogram_json: dict[str, int] | None = Field(
+    default=None, sa_type=JsonVariant, description="Log-scale histogram bin -> count"
+  )
+  queue_wait_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+  queue_wait_total_ms: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+  queue_wait_min_ms: int | None = Field(default=None)
+  queue_wait_max_ms: int | None = Field(default=None)
+  queue_wait_histogram_json: dict[str, int] | None = Field(
+    default=None, sa_type=JsonVariant, description="Log-scale histogram bin -> count"
+  )
+
+
 # =============================================================================
 # Scheduler Metrics View
 # =============================================================================
@@ -2,7 +2,12 @@
 
 from .asset import AssetReservationStatusEnum, AssetType
 from .machine import BackendTypeEnum, MachineCategoryEnum, MachineStatusEnum
-from .outputs import DataOutputTypeEnum, SpatialContextEnum
+from .outputs import (
+  DataExportFormatEnum,
+  DataOutputTypeEnum,
+  PlateAggregationEnum,
+  SpatialContextEnum,
+)
 from .plr_category import PLRCategory, get_category_from_class, infer_category_from_name
 from .protocol import FunctionCallStatusEnum, ProtocolRunStatusEnum, ProtocolSourceStatusEnum
 from .resolution import ResolutionActionEnum, ResolutionTypeEnum
@@ -14,11 +19,13 @@ __all__ = [
   "AssetReservationStatusEnum",
   "AssetType",
   "BackendTypeEnum",
+  "DataExportFormatEnum",
   "DataOutputTypeEnum",
   "FunctionCallStatusEnum",
   "MachineCategoryEnum",
   "MachineStatusEnum",
   "PLRCategory",
+  "PlateAggregationEnum",
   "ProtocolRunStatusEnum",
   "ProtocolSourceStatusEnum",
   "ResourceCategoryEnum",
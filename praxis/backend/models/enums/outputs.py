@@ -6,6 +6,10 @@ Classes:
   SpatialContextEnum (enum.Enum): Enum representing the spatial context of data outputs, indicating
   where the data was collected or to what it pertains (e.g., well-specific, plate-level,
   machine-level).
+  DataExportFormatEnum (enum.Enum): Enum representing the encodings supported when streaming data
+  outputs out of the system (CSV, JSON lines, Arrow IPC, Parquet).
+  PlateAggregationEnum (enum.Enum): Enum representing how multiple timepoints of plate data are
+  reduced to a single heatmap.
 """
 
 import enum
@@ -56,3 +60,22 @@ class SpatialContextEnum(str, enum.Enum):
   DECK_POSITION = "deck_position"  # Data tied to deck position
   GLOBAL = "global"  # Run-level data without specific location
   # Note: NO UNKNOWN here; unknown fallback lives in DataOutputTypeEnum
+
+
+class DataExportFormatEnum(str, enum.Enum):
+  """Enumeration for streaming data export formats."""
+
+  CSV = "csv"
+  JSONL = "jsonl"  # Newline-delimited JSON
+  ARROW = "arrow"  # Arrow IPC stream; requires pyarrow
+  PARQUET = "parquet"  # Requires pyarrow
+
+
+class PlateAggregationEnum(str, enum.Enum):
+  """Enumeration for reducing multiple plate reads to a single grid."""
+
+  LATEST = "latest"  # Most recent value per well
+  MEAN = "mean"
+  MIN = "min"
+  MAX = "max"
+  SLOPE = "slope"  # Least-squares rate of change per second
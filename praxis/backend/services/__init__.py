@@ -11,14 +11,19 @@ They are conveniently imported and re-exported in the `__init__.py` file
 to provide a single point of access for all data services.
 """
 
+from praxis.backend.services.call_log_writer import FunctionCallLogWriter
 from praxis.backend.services.deck import deck_service
 from praxis.backend.services.deck_type_definition import DeckTypeDefinitionService
 from praxis.backend.services.discovery_service import DiscoveryService
 from praxis.backend.services.machine import machine_service
+from praxis.backend.services.output_export import stream_well_data_export
 from praxis.backend.services.outputs import (
   FunctionDataOutputCRUDService,
 )
-from praxis.backend.services.plate_viz import read_plate_data_visualization
+from praxis.backend.services.plate_viz import (
+  read_plate_data_aggregate,
+  read_plate_data_visualization,
+)
 from praxis.backend.services.praxis_orm_service import PraxisDBService
 from praxis.backend.services.protocol_output_data import (
   read_protocol_run_data_summary,
@@ -29,6 +34,8 @@ from praxis.backend.services.resource_type_definition import ResourceTypeDefinit
 from praxis.backend.services.workcell import workcell_service
 
 __all__ = [
+  # Call Log Writer
+  "FunctionCallLogWriter",
   # Deck
   "deck_service",
   # Deck Type Definition
@@ -38,7 +45,10 @@ __all__ = [
   "FunctionDataOutputCRUDService",
   # Machine
   "machine_service",
+  # Output Export
+  "stream_well_data_export",
   # Plate Viz
+  "read_plate_data_aggregate",
   "read_plate_data_visualization",
   # Praxis ORM Service
   "PraxisDBService",
@@ -2,10 +2,10 @@
 
 This module provides an async-compatible state management service that uses
 the KeyValueStore protocol, enabling both Redis-backed (production) and
-in-memory (lite) backends.
+in-memory (lite) backends. State is stored in the same layout as
+``PraxisState``: a hash under ``praxis_state:{run_id}`` with one field per key.
 """
 
-import json
 import uuid
 from collections.abc import ItemsView, KeysView, ValuesView
 from typing import Any, TypeVar
@@ -34,7 +34,7 @@ class AsyncPraxisState:
 
   Attributes:
     run_accession_id (uuid.UUID): A unique identifier for the application run.
-    store_key (str): The key used to store the state in the KeyValueStore.
+    store_key (str): The key of the hash holding the state in the KeyValueStore.
     _store (KeyValueStore): The storage backend.
     _data (dict[str, Any]): The internal dictionary holding the state data.
 
@@ -72,27 +72,7 @@ class AsyncPraxisState:
   async def _load_from_store(self) -> None:
     """Load the state data from the KeyValueStore."""
     try:
-      stored_data = await self._store.get(self.store_key)
-      if stored_data is not None:
-        if isinstance(stored_data, dict):
-          self._data = stored_data
-        elif isinstance(stored_data, str):
-          self._data = json.loads(stored_data)
-        else:
-          logger.warning(
-            "Unexpected data type from store for run %s: %s",
-            self.run_accession_id,
-            type(stored_data),
-          )
-          self._data = {}
-      else:
-        self._data = {}
-    except json.JSONDecodeError:
-      logger.exception(
-        "JSONDecodeError while loading state for run %s",
-        self.run_accession_id,
-      )
-      self._data = {}
+      self._data = await self._store.hgetall(self.store_key)
     except Exception:
       logger.exception(
         "Failed to load state for run %s from store",
@@ -100,16 +80,10 @@ class AsyncPraxisState:
       )
       self._data = {}
 
-  async def _save_to_store(self) -> None:
-    """Save the current state data to the KeyValueStore."""
+  async def _save_fields(self, fields: dict[str, Any]) -> None:
+    """Write the given fields of the state hash."""
     try:
-      await self._store.set(self.store_key, self._data)
-    except TypeError:
-      logger.exception(
-        "TypeError during JSON serialization for run %s. State data may not be "
-        "fully JSON serializable.",
-        self.run_accession_id,
-      )
+      await self._store.hset(self.store_key, fields)
     except Exception:
       logger.exception(
         "Failed to save state for run %s to store",
@@ -130,7 +104,7 @@ class AsyncPraxisState:
       msg = "Key cannot be an empty string."
       raise ValueError(msg)
     self._data[key] = value
-    await self._save_to_store()
+    await self._save_fields({key: value})
 
   async def delete_async(self, key: str) -> None:
     """Delete a value from the state data and persist asynchronously."""
@@ -138,7 +112,15 @@ class AsyncPraxisState:
       msg = f"Key '{key}' not found in state data for run {self.run_accession_id}."
       raise KeyError(msg)
     del self._data[key]
-    await self._save_to_store()
+    try:
+      await self._store.hdel(self.store_key, key)
+    except Exception:
+      logger.exception(
+        "Failed to delete key '%s' of state for run %s from store",
+        key,
+        self.run_accession_id,
+      )
+      raise
 
   def get(self, key: str, default: T | None = None) -> T | None:
     """Retrieve a value from the state data using the given key."""
@@ -147,7 +129,8 @@ class AsyncPraxisState:
   async def update_async(self, data_dict: dict[str, Any]) -> None:
     """Update the state data with the given dictionary and persist."""
     self._data.update(data_dict)
-    await self._save_to_store()
+    if data_dict:
+      await self._save_fields(data_dict)
 
   def to_dict(self) -> dict[str, Any]:
     """Return a copy of the internal state data dictionary."""
@@ -0,0 +1,230 @@
+"""Batched, asynchronous writer for function call logs.
+
+Every ``@protocol_function`` call writes a start and an end record to
+``function_call_logs``. Doing that inline costs two round trips per call on the
+run's session. The ``FunctionCallLogWriter`` instead enqueues the records on a
+bounded in-process buffer and a background task flushes them with multi-row
+statements on its own session:
+
+- start records are inserted in one ``executemany`` INSERT per batch;
+- end records whose start is in the same batch are folded into the INSERT row;
+- the remaining end records are applied in one ``executemany`` UPDATE.
+
+Accession IDs are generated when the record is enqueued, so callers get the ID
+immediately and can use it as the parent of nested calls. When the buffer is
+full, ``log_start``/``log_end`` wait for the writer to catch up (backpressure).
+``flush`` and ``close`` block until everything enqueued so far is written, and
+the orchestrator calls ``close`` when it finalizes a run, whether it succeeded
+or failed. Runs that need every record committed before the call returns keep
+using the synchronous ``log_function_call_start``/``log_function_call_end``.
+"""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.models.domain.protocol import FunctionCallLog
+from praxis.backend.models.enums import FunctionCallStatusEnum
+from praxis.backend.utils.logging import get_logger
+from praxis.backend.utils.uuid import uuid7
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_BATCH_SIZE = 200
+
+_END_COLUMNS = (
+  "status",
+  "end_time",
+  "duration_ms",
+  "return_value_json",
+  "error_message_text",
+  "error_traceback_text",
+  "state_after_json",
+)
+
+
+@dataclass
+class _CallStart:
+  values: dict[str, Any]
+
+
+@dataclass
+class _CallEnd:
+  accession_id: uuid.UUID
+  values: dict[str, Any] = field(default_factory=dict)
+
+
+class FunctionCallLogWriter:
+  """Buffer function call log records and write them in batches.
+
+  Args:
+      session_factory: Factory for the sessions the background task writes with.
+          The writer never touches the run's own session, so protocol code and
+          the writer can use the database concurrently.
+      max_pending: Capacity of the buffer. Producers wait once it is full.
+      batch_size: Maximum number of records written per batch.
+
+  """
+
+  def __init__(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+  ) -> None:
+    """Initialize the writer. The background task starts on the first record."""
+    if max_pending < 1 or batch_size < 1:
+      msg = "max_pending and batch_size must be positive."
+      raise ValueError(msg)
+    self.session_factory = session_factory
+    self.batch_size = batch_size
+    self._queue: asyncio.Queue[_CallStart | _CallEnd] = asyncio.Queue(maxsize=max_pending)
+    self._task: asyncio.Task | None = None
+    self._closed = False
+    self.records_written = 0
+    self.records_failed = 0
+    self.batches_written = 0
+
+  async def log_start(
+    self,
+    protocol_run_orm_accession_id: uuid.UUID,
+    function_definition_accession_id: uuid.UUID,
+    sequence_in_run: int,
+    input_args_json: str,
+    parent_function_call_log_accession_id: uuid.UUID | None = None,
+    state_before_json: dict[str, Any] | None = None,
+  ) -> uuid.UUID:
+    """Enqueue the start of a function call and return its accession ID."""
+    call_id = uuid7()
+    values = dict.fromkeys(_END_COLUMNS)
+    values.update(
+      {
+        "accession_id": call_id,
+        "name": f"call_{call_id}",
+        "protocol_run_accession_id": protocol_run_orm_accession_id,
+        "function_protocol_definition_accession_id": function_definition_accession_id,
+        "sequence_in_run": sequence_in_run,
+        "input_args_json": json.loads(input_args_json),
+        "parent_function_call_log_accession_id": parent_function_call_log_accession_id,
+        "status": FunctionCallStatusEnum.SUCCESS,
+        "start_time": datetime.now(UTC),
+        "state_before_json": state_before_json,
+      }
+    )
+    await self._put(_CallStart(values))
+    return call_id
+
+  async def log_end(
+    self,
+    function_call_log_accession_id: uuid.UUID,
+    status: FunctionCallStatusEnum,
+    return_value_json: str | None = None,
+    error_message: str | None = None,
+    error_traceback: str | None = None,
+    duration_ms: float | None = None,
+    state_after_json: dict[str, Any] | None = None,
+  ) -> None:
+    """Enqueue the end of a function call."""
+    await self._put(
+      _CallEnd(
+        function_call_log_accession_id,
+        {
+          "status": status,
+          "end_time": datetime.now(UTC),
+          "duration_ms": int(duration_ms) if duration_ms else None,
+          "return_value_json": json.loads(return_value_json) if return_value_json else None,
+          "error_message_text": error_message,
+          "error_traceback_text": error_traceback,
+          "state_after_json": state_after_json,
+        },
+      ),
+    )
+
+  @property
+  def pending(self) -> int:
+    """Number of records enqueued but not yet written."""
+    return self._queue.qsize()
+
+  async def flush(self) -> None:
+    """Wait until every record enqueued so far has been written."""
+    if self._task is None:
+      return
+    await self._queue.join()
+
+  async def close(self) -> None:
+    """Flush outstanding records and stop the background task."""
+    if self._closed:
+      return
+    self._closed = True
+    await self.flush()
+    if self._task is not None:
+      self._task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._task
+      self._task = None
+    if self.records_failed:
+      logger.error(
+        "Function call log writer closed with %d record(s) that could not be written.",
+        self.records_failed,
+      )
+
+  async def _put(self, record: _CallStart | _CallEnd) -> None:
+    if self._closed:
+      msg = "FunctionCallLogWriter is closed."
+      raise RuntimeError(msg)
+    if self._task is None:
+      self._task = asyncio.create_task(self._run(), name="function-call-log-writer")
+    await self._queue.put(record)
+
+  async def _run(self) -> None:
+    """Write batches until cancelled.
+
+    A batch is whatever has accumulated in the buffer (up to ``batch_size``)
+    while the previous batch was being written, so batches grow with load
+    without adding latency when the writer is idle.
+    """
+    while True:
+      batch = [await self._queue.get()]
+      while len(batch) < self.batch_size and not self._queue.empty():
+        batch.append(self._queue.get_nowait())
+      try:
+        await self._write_batch(batch)
+        self.records_written += len(batch)
+        self.batches_written += 1
+      except Exception:  # pylint: disable=broad-except
+        # A failed batch must not stop the writer or the protocol run.
+        self.records_failed += len(batch)
+        logger.exception("Failed to write %d function call log record(s).", len(batch))
+      finally:
+        for _ in batch:
+          self._queue.task_done()
+
+  async def _write_batch(self, batch: list[_CallStart | _CallEnd]) -> None:
+    inserts: dict[uuid.UUID, dict[str, Any]] = {}
+    updates: list[dict[str, Any]] = []
+    for record in batch:
+      if isinstance(record, _CallStart):
+        inserts[record.values["accession_id"]] = record.values
+      elif record.accession_id in inserts:
+        inserts[record.accession_id].update(record.values)
+      else:
+        updates.append({"b_accession_id": record.accession_id, **record.values})
+
+    table = FunctionCallLog.__table__  # type: ignore[attr-defined]
+    async with self.session_factory() as session:
+      if inserts:
+        await session.execute(insert(table), list(inserts.values()))
+      if updates:
+        # The keys of each parameter set become the SET clause.
+        stmt = update(table).where(table.c.accession_id == bindparam("b_accession_id"))
+        await session.execute(stmt, updates)
+      await session.commit()
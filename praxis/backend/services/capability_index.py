@@ -0,0 +1,422 @@
+"""In-process index of normalized machine capabilities.
+
+praxis.backend.services.capability_index
+
+The protocol picker asks "which machines can run this protocol?" for every
+protocol card it shows. Answering that with `CapabilityMatcherService` means
+loading every machine with its definition, re-parsing the protocol's
+requirements JSON and re-merging each machine's capabilities per request, i.e.
+an N x M loop per page view.
+
+`CapabilityIndex` materializes the merged capabilities of every machine once
+and keeps inverted indexes over them:
+
+- capability name -> machines that have it;
+- (capability name, value) -> machines whose value equals it.
+
+Each distinct requirement resolves to the set of machines satisfying it
+(equality requirements through the value index, comparisons by evaluating only
+the machines that have the capability) and is memoized until the index
+changes, so compatibility for a protocol is a set intersection and a full
+protocols x machines matrix costs one pass over the distinct requirements.
+
+The machine and machine definition services invalidate entries once their
+writes have committed; invalidated machines are reloaded on the next query.
+Every invalidation also bumps a version counter in the key-value store, and an
+index whose copy was built from an older version than the store's reloads in
+full, so writes made by other workers are picked up too. The shared instance
+uses a process-local store until `configure_capability_index` is called at
+startup. Entries older than ``max_age_s`` trigger a full reload as a safety net
+for writes that bypass the services.
+"""
+
+import json
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, TypeVar, cast
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from praxis.backend.core.storage import KeyValueStore
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.machine import Machine
+from praxis.backend.services.capability_matcher import CapabilityMatcherService, capability_matcher
+from praxis.backend.utils.logging import get_logger
+from praxis.backend.utils.plr_static_analysis.models import (
+  CapabilityMatchResult,
+  CapabilityRequirement,
+  ProtocolRequirements,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_AGE_S = 300.0
+DEFAULT_MAX_CACHED_REQUIREMENTS = 1024
+VERSION_KEY = "capability_index:version"
+
+RequirementKey = tuple[str, str, Hashable]
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def normalize_capability_value(value: Any) -> Hashable:
+  """Return a hashable key such that equal capability values get equal keys.
+
+  Numbers compare by value (``8 == 8.0``), booleans stay distinct from
+  numbers, and JSON containers are keyed by their canonical serialization.
+  """
+  if isinstance(value, bool) or value is None:
+    return ("const", value)
+  if isinstance(value, int | float):
+    return ("num", float(value))
+  if isinstance(value, str):
+    return ("str", value)
+  return ("json", json.dumps(value, sort_keys=True, default=str))
+
+
+@dataclass(frozen=True)
+class IndexedMachine:
+  """A machine and its merged (discovered + user-configured) capabilities."""
+
+  accession_id: UUID
+  name: str
+  machine_type: str
+  machine_definition_accession_id: UUID | None
+  capabilities: dict[str, Any] = field(hash=False, compare=False)
+
+
+class CapabilityIndex:
+  """Answer protocol/machine compatibility queries from precomputed capability sets."""
+
+  def __init__(
+    self,
+    matcher: CapabilityMatcherService = capability_matcher,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+    max_cached_requirements: int = DEFAULT_MAX_CACHED_REQUIREMENTS,
+    kv_store: KeyValueStore | None = None,
+  ) -> None:
+    """Initialize an empty index; it is populated on the first query.
+
+    Args:
+      matcher: Matcher whose capability merging and comparison rules are used.
+      max_age_s: Age after which the whole index is reloaded.
+      max_cached_requirements: Number of parsed requirement sets kept.
+      kv_store: Store holding the shared version counter. Must be shared by
+        every process that writes or queries machines; defaults to a
+        process-local store.
+
+    """
+    self.matcher = matcher
+    self.kv_store: KeyValueStore = kv_store or InMemoryKeyValueStore()
+    self.max_age_s = max_age_s
+    self.max_cached_requirements = max_cached_requirements
+    self._machines: dict[UUID, IndexedMachine] = {}
+    self._by_capability: dict[str, set[UUID]] = defaultdict(set)
+    self._by_value: dict[tuple[str, Hashable], set[UUID]] = defaultdict(set)
+    self._by_definition: dict[UUID, set[UUID]] = defaultdict(set)
+    self._satisfying: dict[RequirementKey, frozenset[UUID]] = {}
+    self._parsed: OrderedDict[str, ProtocolRequirements] = OrderedDict()
+    self._dirty: set[UUID] = set()
+    self._loaded_at: float | None = None
+    self._shared_version: int | None = None
+    self.version = 0
+
+  # ---------------------------------------------------------------------------
+  # Maintenance
+  # ---------------------------------------------------------------------------
+
+  @property
+  def machines(self) -> dict[UUID, IndexedMachine]:
+    """Indexed machines by accession ID."""
+    return self._machines
+
+  def clear(self) -> None:
+    """Drop the local copy; the next query reloads it in full."""
+    self._loaded_at = None
+    self._shared_version = None
+    self._dirty.clear()
+
+  async def invalidate_machine(self, machine_accession_id: UUID) -> None:
+    """Reload a machine on the next query, in every process.
+
+    Call once the transaction that created or updated it has committed.
+    """
+    if await self._bump_version():
+      self._dirty.add(machine_accession_id)
+
+  async def remove_machine(self, machine_accession_id: UUID) -> None:
+    """Drop a deleted machine from the index, in every process."""
+    if await self._bump_version():
+      self._dirty.discard(machine_accession_id)
+      self._unindex(machine_accession_id)
+
+  async def invalidate_definition(self, machine_definition_accession_id: UUID) -> None:
+    """Reload every machine built on a machine definition whose capabilities changed."""
+    if await self._bump_version():
+      self._dirty.update(self._by_definition.get(machine_definition_accession_id, ()))
+
+  async def invalidate_all(self) -> None:
+    """Rebuild the whole index on the next query, in every process."""
+    await self.kv_store.incr(VERSION_KEY)
+    self._loaded_at = None
+
+  async def _bump_version(self) -> bool:
+    """Bump the shared version and return whether the local copy can be patched.
+
+    If another process changed machines since the local copy was loaded, the
+    copy is dropped instead and rebuilt in full on the next query.
+    """
+    version = await self.kv_store.incr(VERSION_KEY)
+    if self._loaded_at is None or self._shared_version != version - 1:
+      self._loaded_at = None
+      return False
+    self._shared_version = version
+    return True
+
+  async def ensure_loaded(self, db: AsyncSession) -> None:
+    """Bring the index up to date, loading only what changed since the last query."""
+    # Read the version before loading anything, so writes racing the load
+    # leave the index behind and force another reload.
+    version = int(await self.kv_store.get(VERSION_KEY) or 0)
+    if (
+      self._loaded_at is None
+      or version != self._shared_version
+      or time.monotonic() - self._loaded_at > self.max_age_s
+    ):
+      await self._load(db, None, version)
+      return
+    if self._dirty:
+      await self._load(db, set(self._dirty), version)
+
+  async def _load(self, db: AsyncSession, machine_ids: set[UUID] | None, version: int) -> None:
+    # Machines invalidated while the query runs may have been read before
+    # their write, so only the ones pending now are cleared afterwards.
+    pending = set(self._dirty)
+    seen_version = self._shared_version
+    stmt = select(Machine).options(selectinload(Machine.machine_definition))
+    if machine_ids is not None:
+      stmt = stmt.where(Machine.accession_id.in_(machine_ids))
+    result = await db.execute(stmt)
+    loaded = result.scalars().all()
+
+    if machine_ids is None:
+      self._machines.clear()
+      self._by_capability.clear()
+      self._by_value.clear()
+      self._by_definition.clear()
+      self._loaded_at = time.monotonic()
+    else:
+      for machine_id in machine_ids:
+        self._unindex(machine_id)
+    self._dirty -= pending
+    if self._shared_version == seen_version:
+      self._shared_version = version
+
+    for machine in loaded:
+      self._index(machine)
+    self._changed()
+    logger.debug(
+      "Capability index loaded %d machine(s) (%s).",
+      len(loaded),
+      "full" if machine_ids is None else "incremental",
+    )
+
+  def _index(self, machine: Machine) -> None:
+    definition = machine.machine_definition
+    entry = IndexedMachine(
+      accession_id=machine.accession_id,
+      name=machine.name,
+      machine_type=definition.plr_category if definition and definition.plr_category else "unknown",
+      machine_definition_accession_id=machine.machine_definition_accession_id,
+      capabilities=self.matcher._merge_machine_capabilities(machine, definition),
+    )
+    self._machines[entry.accession_id] = entry
+    if entry.machine_definition_accession_id is not None:
+      self._by_definition[entry.machine_definition_accession_id].add(entry.accession_id)
+    for name, value in entry.capabilities.items():
+      self._by_capability[name].add(entry.accession_id)
+      self._by_value[name, normalize_capability_value(value)].add(entry.accession_id)
+
+  def _unindex(self, machine_id: UUID) -> None:
+    entry = self._machines.pop(machine_id, None)
+    if entry is None:
+      return
+    if entry.machine_definition_accession_id is not None:
+      self._by_definition[entry.machine_definition_accession_id].discard(machine_id)
+    for name, value in entry.capabilities.items():
+      self._by_capability[name].discard(machine_id)
+      self._by_value[name, normalize_capability_value(value)].discard(machine_id)
+    self._changed()
+
+  def _changed(self) -> None:
+    self._satisfying.clear()
+    self.version += 1
+
+  # ---------------------------------------------------------------------------
+  # Queries
+  # ---------------------------------------------------------------------------
+
+  def parse_requirements(self, requirements_json: dict[str, Any] | None) -> ProtocolRequirements:
+    """Parse a protocol's requirements JSON, memoized by its canonical form."""
+    if not requirements_json:
+      return ProtocolRequirements()
+    key = json.dumps(requirements_json, sort_keys=True, default=str)
+    parsed = self._parsed.get(key)
+    if parsed is None:
+      parsed = self.matcher._parse_requirements(requirements_json)
+      self._parsed[key] = parsed
+      if len(self._parsed) > self.max_cached_requirements:
+        self._parsed.popitem(last=False)
+    else:
+      self._parsed.move_to_end(key)
+    return parsed
+
+  def machines_satisfying(self, requirement: CapabilityRequirement) -> frozenset[UUID]:
+    """Return the IDs of machines that satisfy a single requirement."""
+    key = (
+      requirement.capability_name,
+      requirement.operator,
+      normalize_capability_value(requirement.expected_value),
+    )
+    cached = self._satisfying.get(key)
+    if cached is not None:
+      return cached
+
+    name = requirement.capability_name
+    if requirement.operator == "eq":
+      satisfying = frozenset(self._by_value.get((name, key[2]), ()))
+    else:
+      satisfying = frozenset(
+        machine_id
+        for machine_id in self._by_capability.get(name, ())
+        if self._check(requirement, self._machines[machine_id].capabilities)
+      )
+    self._satisfying[key] = satisfying
+    return satisfying
+
+  def compatible_machine_ids(self, requirements_json: dict[str, Any] | None) -> frozenset[UUID]:
+    """Return the IDs of machines that satisfy every requirement."""
+    compatible = frozenset(self._machines)
+    for requirement in self.parse_requirements(requirements_json).requirements:
+      compatible &= self.machines_satisfying(requirement)
+      if not compatible:
+        break
+    return compatible
+
+  def match(
+    self,
+    protocol_accession_id: UUID,
+    requirements_json: dict[str, Any] | None,
+  ) -> list[tuple[IndexedMachine, CapabilityMatchResult]]:
+    """Match one protocol against every indexed machine.
+
+    Produces the same results as `CapabilityMatcherService.find_compatible_machines`.
+    """
+    requirements = self.parse_requirements(requirements_json).requirements
+    protocol_id = str(protocol_accession_id)
+    if not requirements:
+      return [
+        (
+          machine,
+          CapabilityMatchResult(
+            is_compatible=True,
+            machine_id=str(machine.accession_id),
+            protocol_id=protocol_id,
+            warnings=["No hardware requirements found for protocol."],
+          ),
+        )
+        for machine in self._machines.values()
+      ]
+
+    satisfying = [self.machines_satisfying(requirement) for requirement in requirements]
+    results = []
+    for machine in self._machines.values():
+      matched: list[str] = []
+      missing: list[CapabilityRequirement] = []
+      for requirement, machines in zip(requirements, satisfying, strict=True):
+        if machine.accession_id in machines:
+          matched.append(requirement.capability_name)
+        else:
+          missing.append(requirement)
+      results.append(
+        (
+          machine,
+          CapabilityMatchResult(
+            is_compatible=not missing,
+            missing_capabilities=missing,
+            matched_capabilities=matched,
+            machine_id=str(machine.accession_id),
+            protocol_id=protocol_id,
+          ),
+        ),
+      )
+    return results
+
+  def compatibility_matrix(
+    self,
+    protocols: Iterable[tuple[UUID, dict[str, Any] | None]],
+  ) -> dict[UUID, frozenset[UUID]]:
+    """Map each protocol to the IDs of the machines compatible with it.
+
+    Args:
+      protocols: ``(protocol accession ID, hardware requirements JSON)`` pairs.
+
+    """
+    return {
+      protocol_id: self.compatible_machine_ids(requirements_json)
+      for protocol_id, requirements_json in protocols
+    }
+
+  def _check(self, requirement: CapabilityRequirement, capabilities: dict[str, Any]) -> bool:
+    try:
+      return self.matcher._check_requirement(requirement, capabilities)
+    except TypeError:
+      # Incomparable types (e.g. "8" > 4) cannot satisfy the requirement.
+      return False
+
+
+def _invalidates(
+  invalidate: Callable[[CapabilityIndex, UUID], Awaitable[None]],
+) -> Callable[[F], F]:
+  """Build a decorator applying ``invalidate`` to the entity a service method wrote.
+
+  The entity is identified by the ``accession_id`` argument (deletes) or else
+  by the returned model; methods that return ``None`` changed nothing.
+  """
+
+  def decorator(func: F) -> F:
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+      result = await func(*args, **kwargs)
+      if result is not None:
+        accession_id = kwargs.get("accession_id", result.accession_id)
+        await invalidate(capability_index, accession_id)
+      return result
+
+    return cast("F", wrapper)
+
+  return decorator
+
+
+# Service method decorators. Apply them on top of ``handle_db_transaction`` so
+# no process reloads a machine before the write is committed.
+invalidates_machine = _invalidates(CapabilityIndex.invalidate_machine)
+removes_machine = _invalidates(CapabilityIndex.remove_machine)
+invalidates_definition = _invalidates(CapabilityIndex.invalidate_definition)
+
+
+def configure_capability_index(kv_store: KeyValueStore) -> CapabilityIndex:
+  """Keep the shared index's version in ``kv_store`` (called at application startup)."""
+  capability_index.kv_store = kv_store
+  capability_index.clear()
+  return capability_index
+
+
+# Singleton instance for convenience
+capability_index = CapabilityIndex()
@@ -0,0 +1,351 @@
+"""Versioned snapshots of the definition catalogs for browser clients.
+
+praxis.backend.services.catalog_snapshot
+
+The browser client keeps its own SQLite copy of the resource, machine, deck and
+protocol definition catalogs. Seeding it row by row from the REST endpoints is
+slow, and the bundled ``praxis.db`` goes stale as soon as the server's catalog
+changes.
+
+`CatalogSnapshotService` reads the catalog tables from the live database into
+an immutable `CatalogSnapshot` whose version is a content hash of every row.
+The version doubles as an ETag: a client downloads the snapshot as a single
+SQLite file once, then asks for the delta from the version it holds, which
+lists only the rows upserted or deleted since.
+
+Whether the catalog changed is checked with a cheap per-table fingerprint
+(row count and latest timestamp). The full tables are only re-read when the
+fingerprint moves or the snapshot is older than ``max_age_s``, as a safety net
+for writes that do not touch the timestamps. The last ``max_versions``
+snapshots are retained to answer deltas; unchanged rows are shared between
+them.
+"""
+
+import asyncio
+import enum
+import gzip
+import hashlib
+import json
+import sqlite3
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Table, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.catalog import (
+  CatalogDelta,
+  CatalogTableDelta,
+  CatalogTableVersion,
+  CatalogVersion,
+)
+from praxis.backend.models.domain.deck import DeckDefinition, DeckPositionDefinition
+from praxis.backend.models.domain.machine import MachineDefinition
+from praxis.backend.models.domain.machine_backend import MachineBackendDefinition
+from praxis.backend.models.domain.machine_frontend import MachineFrontendDefinition
+from praxis.backend.models.domain.protocol import (
+  AssetRequirement,
+  FunctionProtocolDefinition,
+  ParameterDefinition,
+)
+from praxis.backend.models.domain.resource import ResourceDefinition
+from praxis.backend.utils.compute_executor import run_compute
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_AGE_S = 300.0
+DEFAULT_MAX_VERSIONS = 8
+SNAPSHOT_PAGE_SIZE = 8192
+METADATA_TABLE = "_catalog_metadata"
+
+# Catalog tables, in foreign-key order.
+CATALOG_TABLES: tuple[Table, ...] = tuple(
+  model.__table__  # type: ignore[attr-defined]
+  for model in (
+    ResourceDefinition,
+    DeckDefinition,
+    DeckPositionDefinition,
+    MachineFrontendDefinition,
+    MachineDefinition,
+    MachineBackendDefinition,
+    FunctionProtocolDefinition,
+    ParameterDefinition,
+    AssetRequirement,
+  )
+)
+
+_AFFINITIES = {bool: "INTEGER", int: "INTEGER", float: "REAL", bytes: "BLOB"}
+
+
+def to_sqlite_value(value: Any) -> Any:
+  """Encode a column value the way the browser schema stores it."""
+  if value is None or isinstance(value, str | int | float | bytes):
+    return int(value) if isinstance(value, bool) else value
+  if isinstance(value, enum.Enum):
+    return to_sqlite_value(value.value)
+  if isinstance(value, UUID):
+    return str(value)
+  if isinstance(value, datetime | date):
+    return value.isoformat()
+  return json.dumps(value, default=str)
+
+
+def _affinity(column: Any) -> str:
+  try:
+    python_type = column.type.python_type
+  except NotImplementedError:
+    return "TEXT"
+  return _AFFINITIES.get(python_type, "TEXT")
+
+
+def _row_hash(row: tuple) -> str:
+  return hashlib.blake2b(json.dumps(row, default=str).encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class CatalogTable:
+  """The rows of one catalog table, keyed by primary key."""
+
+  name: str
+  columns: tuple[str, ...]
+  affinities: tuple[str, ...]
+  primary_key: str
+  rows: dict[str, tuple] = field(repr=False)
+  row_hashes: dict[str, str] = field(repr=False)
+
+  @property
+  def content_hash(self) -> str:
+    """Order-independent hash of the table's rows."""
+    digest = hashlib.sha256()
+    for key in sorted(self.row_hashes):
+      digest.update(f"{key}\0{self.row_hashes[key]}\n".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class CatalogSnapshot:
+  """An immutable view of the catalog tables at one version."""
+
+  version: str
+  generated_at: datetime
+  tables: dict[str, CatalogTable]
+  _encoded: dict[bool, bytes] = field(default_factory=dict, repr=False)
+
+  def describe(self) -> CatalogVersion:
+    """Summarize the snapshot for the version endpoint."""
+    return CatalogVersion(
+      version=self.version,
+      generated_at=self.generated_at.isoformat(),
+      tables={
+        name: CatalogTableVersion(rows=len(table.rows), hash=table.content_hash)
+        for name, table in self.tables.items()
+      },
+    )
+
+
+def build_sqlite_snapshot(snapshot: CatalogSnapshot) -> bytes:
+  """Write a snapshot to a standalone SQLite database file and return its bytes.
+
+  Column names match the browser schema, so a client can copy each table with
+  ``INSERT OR REPLACE INTO main.<table> (<columns>) SELECT <columns> FROM
+  snapshot.<table>`` after attaching the file. The version is stored in the
+  ``_catalog_metadata`` table.
+  """
+  with tempfile.TemporaryDirectory() as directory:
+    path = Path(directory) / "catalog.db"
+    conn = sqlite3.connect(path)
+    try:
+      conn.execute(f"PRAGMA page_size = {SNAPSHOT_PAGE_SIZE}")
+      with conn:
+        conn.execute(f"CREATE TABLE {METADATA_TABLE} (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.executemany(
+          f"INSERT INTO {METADATA_TABLE} (key, value) VALUES (?, ?)",  # noqa: S608 - constant
+          [
+            ("version", snapshot.version),
+            ("generated_at", snapshot.generated_at.isoformat()),
+          ],
+        )
+        for table in snapshot.tables.values():
+          columns = ", ".join(
+            f'"{name}" {affinity}'
+            for name, affinity in zip(table.columns, table.affinities, strict=True)
+          )
+          conn.execute(
+            f'CREATE TABLE "{table.name}" ({columns}, PRIMARY KEY ("{table.primary_key}"))'
+          )
+          placeholders = ", ".join("?" * len(table.columns))
+          # Table names come from CATALOG_TABLES; values are bound as parameters
+          conn.executemany(
+            f'INSERT INTO "{table.name}" VALUES ({placeholders})',  # noqa: S608
+            table.rows.values(),
+          )
+      conn.execute("VACUUM")
+    finally:
+      conn.close()
+    return path.read_bytes()
+
+
+def _encode_snapshot(snapshot: CatalogSnapshot, compressed: bool) -> bytes:
+  data = build_sqlite_snapshot(snapshot)
+  return gzip.compress(data, compresslevel=6) if compressed else data
+
+
+class CatalogSnapshotService:
+  """Serve catalog snapshots and deltas, rebuilding them only when the catalog changes."""
+
+  def __init__(
+    self,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+    max_versions: int = DEFAULT_MAX_VERSIONS,
+  ) -> None:
+    """Initialize an empty service; the first request loads the catalog."""
+    self.max_age_s = max_age_s
+    self.max_versions = max_versions
+    self._history: OrderedDict[str, CatalogSnapshot] = OrderedDict()
+    self._fingerprint: tuple | None = None
+    self._checked_at: float | None = None
+    self._lock = asyncio.Lock()
+
+  @property
+  def latest(self) -> CatalogSnapshot | None:
+    """The most recently loaded snapshot, if any."""
+    return next(reversed(self._history.values()), None)
+
+  def get(self, version: str) -> CatalogSnapshot | None:
+    """Return a retained snapshot by version."""
+    return self._history.get(version)
+
+  def invalidate(self) -> None:
+    """Re-read the catalog tables on the next request."""
+    self._fingerprint = None
+
+  async def current(self, db: AsyncSession) -> CatalogSnapshot:
+    """Return the snapshot of the catalog as it is now."""
+    async with self._lock:
+      fingerprint = await self._fingerprint_of(db)
+      latest = self.latest
+      if (
+        latest is not None
+        and fingerprint == self._fingerprint
+        and self._checked_at is not None
+        and time.monotonic() - self._checked_at <= self.max_age_s
+      ):
+        return latest
+
+      snapshot = await self._load(db, latest)
+      self._fingerprint = fingerprint
+      self._checked_at = time.monotonic()
+      if latest is not None and snapshot.version == latest.version:
+        return latest
+
+      if latest is not None:
+        latest._encoded.clear()
+      self._history[snapshot.version] = snapshot
+      while len(self._history) > self.max_versions:
+        self._history.popitem(last=False)
+      logger.info(
+        "Catalog snapshot %s loaded (%d rows).",
+        snapshot.version,
+        sum(len(table.rows) for table in snapshot.tables.values()),
+      )
+      return snapshot
+
+  async def encode(self, snapshot: CatalogSnapshot, compressed: bool = False) -> bytes:
+    """Return the snapshot as a SQLite file (optionally gzipped), building it once."""
+    encoded = snapshot._encoded.get(compressed)
+    if encoded is None:
+      encoded = await run_compute(
+        _encode_snapshot,
+        snapshot,
+        compressed,
+        key="catalog_snapshot",
+        use_process=False,
+      )
+      if snapshot is self.latest:
+        snapshot._encoded[compressed] = encoded
+    return encoded
+
+  def delta(self, since: str, snapshot: CatalogSnapshot) -> CatalogDelta | None:
+    """Return the changes from version ``since`` to ``snapshot``.
+
+    Returns None if ``since`` is no longer retained; the client should then
+    download the full snapshot.
+    """
+    base = self._history.get(since)
+    if base is None:
+      return None
+    tables: dict[str, CatalogTableDelta] = {}
+    for name, table in snapshot.tables.items():
+      base_hashes = base.tables[name].row_hashes if name in base.tables else {}
+      upserts = [
+        list(table.rows[key])
+        for key, row_hash in table.row_hashes.items()
+        if base_hashes.get(key) != row_hash
+      ]
+      deletes = [key for key in base_hashes if key not in table.rows]
+      if upserts or deletes:
+        tables[name] = CatalogTableDelta(
+          columns=list(table.columns),
+          primary_key=table.primary_key,
+          upserts=upserts,
+          deletes=deletes,
+        )
+    return CatalogDelta(from_version=since, to_version=snapshot.version, tables=tables)
+
+  async def _fingerprint_of(self, db: AsyncSession) -> tuple:
+    fingerprint = []
+    for table in CATALOG_TABLES:
+      stmt = select(
+        func.count(),
+        func.max(func.coalesce(table.c.updated_at, table.c.created_at)),
+      ).select_from(table)
+      fingerprint.append(tuple((await db.execute(stmt)).one()))
+    return tuple(fingerprint)
+
+  async def _load(self, db: AsyncSession, previous: CatalogSnapshot | None) -> CatalogSnapshot:
+    tables: dict[str, CatalogTable] = {}
+    for table in CATALOG_TABLES:
+      columns = tuple(table.columns)
+      primary_key = next(iter(table.primary_key.columns)).name
+      key_index = [column.name for column in columns].index(primary_key)
+      previous_table = previous.tables.get(table.name) if previous is not None else None
+      rows: dict[str, tuple] = {}
+      row_hashes: dict[str, str] = {}
+      result = await db.execute(select(*columns).order_by(table.c[primary_key]))
+      for raw in result.all():
+        row = tuple(to_sqlite_value(value) for value in raw)
+        key = str(row[key_index])
+        row_hash = _row_hash(row)
+        if previous_table is not None and previous_table.row_hashes.get(key) == row_hash:
+          # Share unchanged rows with the previous version.
+          row = previous_table.rows[key]
+        rows[key] = row
+        row_hashes[key] = row_hash
+      tables[table.name] = CatalogTable(
+        name=table.name,
+        columns=tuple(column.name for column in columns),
+        affinities=tuple(_affinity(column) for column in columns),
+        primary_key=primary_key,
+        rows=rows,
+        row_hashes=row_hashes,
+      )
+
+    digest = hashlib.sha256()
+    for name, table in tables.items():
+      digest.update(f"{name}\0{table.content_hash}\n".encode())
+    return CatalogSnapshot(
+      version=digest.hexdigest()[:32],
+      generated_at=datetime.now(timezone.utc),
+      tables=tables,
+    )
+
+
+# Singleton instance for convenience
+catalog_snapshots = CatalogSnapshotService()
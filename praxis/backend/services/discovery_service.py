@@ -30,7 +30,6 @@ from praxis.backend.models.domain.deck import (
 )
 from praxis.backend.models.domain.protocol import (
   FunctionProtocolDefinitionCreate,
-  FunctionProtocolDefinitionUpdate,
 )
 from praxis.backend.services.deck_type_definition import DeckTypeDefinitionService
 from praxis.backend.services.machine_type_definition import MachineTypeDefinitionService
@@ -39,12 +38,16 @@ from praxis.backend.services.resource_type_definition import (
   ResourceTypeDefinitionService,
 )
 from praxis.backend.services.simulation_service import SimulationService
+from praxis.backend.utils.compute_executor import run_compute
 from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (
   ProtocolFunctionVisitor,
 )
 
 logger = logging.getLogger(__name__)
 
+# Definitions written per transaction during discovery; a failing chunk is retried row by row
+PROTOCOL_UPSERT_CHUNK_SIZE = 100
+
 
 class DeckVisitor(ast.NodeVisitor):
   """AST visitor to find deck definitions."""
@@ -54,7 +57,7 @@ class DeckVisitor(ast.NodeVisitor):
     self.file_path = file_path
     self.definitions: list[dict[str, Any]] = []
 
-  def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+  def visit_ClassDef(self, node: ast.ClassDef) -> None:
     """Visit a class definition."""
     for base in node.bases:
       if isinstance(base, ast.Name) and base.id == "Deck":
@@ -140,7 +143,12 @@ class DiscoveryService:
         logger.info("Machine type definitions synchronized.")
 
         logger.info("Synchronizing deck type definitions...")
-        deck_definitions = self._extract_deck_definitions_from_paths(protocol_search_paths)
+        deck_definitions = await run_compute(
+          self._extract_deck_definitions_from_paths,
+          protocol_search_paths,
+          key="discovery",
+          use_process=False,
+        )
         for deck_data in deck_definitions:
           deck_pydantic_model = DeckTypeDefinitionCreate(**deck_data)
           existing_def = await deck_service.get_by_fqn(
@@ -194,6 +202,23 @@ class DiscoveryService:
     )
     logger.info("All definitions synchronized.")
 
+  async def _upsert_protocol_definitions(
+    self,
+    definitions: list[FunctionProtocolDefinitionCreate],
+  ) -> list[Any]:
+    """Upsert ``definitions`` in one transaction, rolling it back on failure."""
+    async with self.db_session_factory() as session:
+      try:
+        upsert_result = await self.protocol_definition_service.bulk_upsert(
+          db=session,
+          definitions=definitions,
+        )
+        await session.commit()
+      except Exception:
+        await session.rollback()
+        raise
+    return upsert_result.definitions
+
   def _extract_protocol_definitions_from_paths(
     self,
     search_paths: Sequence[str | Path],
@@ -305,8 +330,12 @@ class DiscoveryService:
       "DiscoveryService: Starting protocol discovery in paths: %s...",
       search_paths,
     )
-    extracted_definitions = self._extract_protocol_definitions_from_paths(
+    # LibCST parsing of every protocol module is CPU-bound; keep it off the event loop.
+    extracted_definitions = await run_compute(
+      self._extract_protocol_definitions_from_paths,
       search_paths,
+      key="discovery",
+      use_process=False,
     )
 
     if not extracted_definitions:
@@ -324,48 +353,44 @@ class DiscoveryService:
         "DiscoveryService: No DB session factory provided. Cannot upsert protocol definitions.",
       )
       return []
-    async with self.db_session_factory() as session:
-      for protocol_data in extracted_definitions:
-        protocol_pydantic_model = FunctionProtocolDefinitionCreate(
-          **protocol_data,
+
+    protocol_models: list[FunctionProtocolDefinitionCreate] = []
+    for protocol_data in extracted_definitions:
+      try:
+        protocol_models.append(FunctionProtocolDefinitionCreate(**protocol_data))
+      except ValueError:
+        logger.exception(
+          "ERROR: Failed to process protocol '%s v%s'.",
+          protocol_data.get("name"),
+          protocol_data.get("version"),
+        )
+
+    for start in range(0, len(protocol_models), PROTOCOL_UPSERT_CHUNK_SIZE):
+      chunk = protocol_models[start : start + PROTOCOL_UPSERT_CHUNK_SIZE]
+      try:
+        upserted_definitions_model.extend(await self._upsert_protocol_definitions(chunk))
+        continue
+      except Exception:
+        logger.warning(
+          "Bulk upsert of %d protocol definition(s) failed; retrying them one by one.",
+          len(chunk),
+          exc_info=True,
         )
-        protocol_name_for_error = protocol_pydantic_model.name
-        protocol_version_for_error = protocol_pydantic_model.version
+      # Isolate the failing definition(s) so the rest of the chunk is still stored
+      for protocol_model in chunk:
         try:
-          existing_def = await self.protocol_definition_service.get_by_fqn(
-            db=session,
-            fqn=f"{protocol_pydantic_model.module_name}.{protocol_pydantic_model.function_name}",
+          upserted_definitions_model.extend(
+            await self._upsert_protocol_definitions([protocol_model]),
           )
-
-          if existing_def:
-            update_data = FunctionProtocolDefinitionUpdate(
-              **protocol_pydantic_model.model_dump(),
-            )
-            def_model = await self.protocol_definition_service.update(
-              db=session,
-              db_obj=existing_def,
-              obj_in=update_data,
-            )
-          else:
-            def_model = await self.protocol_definition_service.create(
-              db=session,
-              obj_in=protocol_pydantic_model,
-            )
-
-          upserted_definitions_model.append(def_model)
-
-        except (ValueError, RuntimeError):
+        except Exception:
           logger.exception(
-            "ERROR: Failed to process or upsert protocol '%s v%s'.",
-            protocol_name_for_error,
-            protocol_version_for_error,
+            "ERROR: Failed to upsert protocol '%s v%s'.",
+            protocol_model.name,
+            protocol_model.version,
           )
-    num_successful_upserts = len(
-      [d for d in upserted_definitions_model if hasattr(d, "id") and d.accession_id is not None],
-    )
     logger.info(
       "Successfully upserted %d protocol definition(s) to DB.",
-      num_successful_upserts,
+      len(upserted_definitions_model),
     )
 
     # Run simulation on discovered protocols if enabled
@@ -6,41 +6,67 @@ or SQLite (lite mode), ensuring they survive server restarts.
 
 Features:
 - Connection state persistence across restarts
-- TTL-based heartbeat for automatic cleanup of stale connections
+- Heartbeat-based expiry of stale connections
 - Multi-worker safe (via Redis or SQLite file locking)
 - Mode-agnostic (works with both Redis and SQLite backends)
+- Status transitions published on PubSub
 
 Key Patterns:
-- "hw:conn:{device_id}" -> ConnectionState JSON
-- "hw:conn:index" -> JSON list of active device IDs
+- "hw:connections" -> hash with two fields per device:
+  - "state:{device_id}" -> ConnectionState JSON, written on status changes
+  - "beat:{device_id}" -> ISO timestamp of the latest heartbeat
+
+Listing every connection is a single ``hgetall``. Heartbeats only touch the
+small "beat:" fields; once started, the manager buffers them and writes all
+pending heartbeats with one ``hset`` per interval instead of rewriting each
+device's state. A device whose latest heartbeat is older than the TTL is
+considered gone: it is removed the next time the table is read, which a
+started manager also does periodically in the background.
+
+Status transitions (connecting, connected, error, disconnected, including
+expiry) are published on the ``hw:connection_events`` channel.
 
 Usage:
-    manager = HardwareConnectionManager(kv_store)
+    manager = HardwareConnectionManager(kv_store, pubsub=pubsub)
+    manager.start()
     state = await manager.connect("device-123", "Backend", {"port": "/dev/ttyUSB0"})
     await manager.heartbeat("device-123")
     connections = await manager.list_connections()
     await manager.disconnect("device-123")
+    await manager.stop()
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
-  from praxis.backend.core.storage.protocols import KeyValueStore
+  from praxis.backend.core.storage.protocols import KeyValueStore, PubSub
 
 logger = logging.getLogger(__name__)
 
 # Key patterns for KV store
-KEY_PREFIX = "hw:conn:"
-KEY_INDEX = "hw:conn:index"
+KEY_CONNECTIONS = "hw:connections"
+STATE_FIELD_PREFIX = "state:"
+BEAT_FIELD_PREFIX = "beat:"
+
+# PubSub channel for connection status transitions
+EVENTS_CHANNEL = "hw:connection_events"
 
 # Connection TTL (seconds) - connections without heartbeat are considered stale
 CONNECTION_TTL = 120  # 2 minutes
 
+# How often a started manager writes buffered heartbeats (seconds)
+HEARTBEAT_FLUSH_INTERVAL = 5.0
+
+ConnectionStatus = Literal["connecting", "connected", "disconnected", "error"]
+
 
 @dataclass
 class ConnectionState:
@@ -58,7 +84,7 @@ class ConnectionState:
   """
 
   device_id: str
-  status: Literal["connecting", "connected", "disconnected", "error"]
+  status: ConnectionStatus
   connected_at: datetime | None
   last_heartbeat: datetime
   backend_class: str | None
@@ -98,9 +124,14 @@ class HardwareConnectionManager:
   allowing connection status to survive server restarts. It uses a heartbeat
   mechanism with TTL to automatically clean up stale connections.
 
+  Until `start` is called, every heartbeat is written through immediately.
+  A started manager (one per process, held for the application lifetime)
+  batches heartbeats and sweeps for expired connections in the background.
+
   Example:
       kv_store = StorageFactory.create_key_value_store(backend)
-      manager = HardwareConnectionManager(kv_store)
+      manager = HardwareConnectionManager(kv_store, pubsub=pubsub)
+      manager.start()
 
       # Connect to a device
       state = await manager.connect(
@@ -117,13 +148,17 @@ class HardwareConnectionManager:
 
       # Disconnect
       await manager.disconnect("serial-/dev/ttyUSB0")
+      await manager.stop()
 
   """
 
   def __init__(
     self,
     kv_store: KeyValueStore,
-    ttl_seconds: int = CONNECTION_TTL,
+    ttl_seconds: float = CONNECTION_TTL,
+    pubsub: PubSub | None = None,
+    flush_interval_seconds: float = HEARTBEAT_FLUSH_INTERVAL,
+    sweep_interval_seconds: float | None = None,
   ) -> None:
     """Initialize the connection manager.
 
@@ -132,30 +167,162 @@ class HardwareConnectionManager:
         ttl_seconds: Time-to-live for connections without heartbeat.
             Connections that don't receive a heartbeat within this
             time are considered stale.
+        pubsub: Where to publish status transitions (optional).
+        flush_interval_seconds: How often a started manager writes
+            buffered heartbeats.
+        sweep_interval_seconds: How often a started manager looks for
+            expired connections. Defaults to half the TTL.
 
     """
     self._kv = kv_store
     self._ttl = ttl_seconds
-
-  def _get_key(self, device_id: str) -> str:
-    """Get the KV store key for a device."""
-    return f"{KEY_PREFIX}{device_id}"
-
-  async def _add_to_index(self, device_id: str) -> None:
-    """Add device to the index of active connections."""
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-    if device_id not in index:
-      index.append(device_id)
-      await self._kv.set(KEY_INDEX, index)
-
-  async def _remove_from_index(self, device_id: str) -> None:
-    """Remove device from the index of active connections."""
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-    if device_id in index:
-      index.remove(device_id)
-      await self._kv.set(KEY_INDEX, index)
+    self._pubsub = pubsub
+    self._flush_interval = flush_interval_seconds
+    if sweep_interval_seconds is None:
+      sweep_interval_seconds = ttl_seconds / 2
+    self._sweep_interval = sweep_interval_seconds
+    # This process's view of the connection table, refreshed on every read.
+    self._known: dict[str, ConnectionState] = {}
+    self._pending_beats: dict[str, datetime] = {}
+    self._task: asyncio.Task[None] | None = None
+
+  @staticmethod
+  def _state_field(device_id: str) -> str:
+    return f"{STATE_FIELD_PREFIX}{device_id}"
+
+  @staticmethod
+  def _beat_field(device_id: str) -> str:
+    return f"{BEAT_FIELD_PREFIX}{device_id}"
+
+  # ---------------------------------------------------------------------------
+  # Background batching
+  # ---------------------------------------------------------------------------
+
+  def start(self) -> None:
+    """Start batching heartbeats and sweeping expired connections."""
+    if self._task is not None and not self._task.done():
+      return
+    self._task = asyncio.create_task(self._run(), name="hardware-connection-heartbeats")
+
+  async def stop(self) -> None:
+    """Stop the background task and write any buffered heartbeats."""
+    if self._task is not None:
+      self._task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._task
+      self._task = None
+    await self.flush()
+
+  async def _run(self) -> None:
+    last_sweep = time.monotonic()
+    while True:
+      await asyncio.sleep(self._flush_interval)
+      try:
+        await self.flush()
+        if time.monotonic() - last_sweep >= self._sweep_interval:
+          last_sweep = time.monotonic()
+          await self._load()
+      except Exception:
+        logger.exception("Failed to refresh hardware connection heartbeats")
+
+  async def flush(self) -> None:
+    """Write all buffered heartbeats in one round trip."""
+    pending, self._pending_beats = self._pending_beats, {}
+    if not pending:
+      return
+    try:
+      await self._kv.hset(
+        KEY_CONNECTIONS,
+        {self._beat_field(device_id): at.isoformat() for device_id, at in pending.items()},
+      )
+    except BaseException:
+      # Keep them for the next attempt, unless a newer heartbeat arrived meanwhile.
+      for device_id, at in pending.items():
+        self._pending_beats.setdefault(device_id, at)
+      raise
+    logger.debug("Flushed %d heartbeats", len(pending))
+
+  # ---------------------------------------------------------------------------
+  # Reads and writes
+  # ---------------------------------------------------------------------------
+
+  async def _write(self, state: ConnectionState) -> None:
+    previous = self._known.get(state.device_id)
+    await self._kv.hset(
+      KEY_CONNECTIONS,
+      {
+        self._state_field(state.device_id): state.to_dict(),
+        self._beat_field(state.device_id): state.last_heartbeat.isoformat(),
+      },
+    )
+    self._pending_beats.pop(state.device_id, None)
+    self._known[state.device_id] = state
+    if previous is None or previous.status != state.status or state.status == "error":
+      await self._publish(state, previous.status if previous else None)
+
+  async def _load(self) -> dict[str, ConnectionState]:
+    """Read the whole connection table and remove expired connections."""
+    fields = await self._kv.hgetall(KEY_CONNECTIONS)
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(seconds=self._ttl)
+    live: dict[str, ConnectionState] = {}
+    expired: list[ConnectionState] = []
+    orphan_beats: list[str] = []
+
+    for field, value in fields.items():
+      if field.startswith(STATE_FIELD_PREFIX):
+        state = ConnectionState.from_dict(value)
+        beats = [state.last_heartbeat]
+        beat = fields.get(self._beat_field(state.device_id))
+        if beat is not None:
+          beats.append(datetime.fromisoformat(beat))
+        if state.device_id in self._pending_beats:
+          beats.append(self._pending_beats[state.device_id])
+        state.last_heartbeat = max(beats)
+        if state.last_heartbeat < cutoff:
+          expired.append(state)
+        else:
+          live[state.device_id] = state
+      elif field.startswith(BEAT_FIELD_PREFIX):
+        device_id = field.removeprefix(BEAT_FIELD_PREFIX)
+        if self._state_field(device_id) not in fields and datetime.fromisoformat(value) < cutoff:
+          orphan_beats.append(field)
+
+    for state in expired:
+      # Only the worker whose delete succeeds reports the expiry.
+      if await self._kv.hdel(KEY_CONNECTIONS, self._state_field(state.device_id)):
+        logger.info("Device connection expired: %s", state.device_id)
+        await self._publish(state, state.status, status="disconnected", reason="expired")
+      orphan_beats.append(self._beat_field(state.device_id))
+      self._pending_beats.pop(state.device_id, None)
+    if orphan_beats:
+      await self._kv.hdel(KEY_CONNECTIONS, *orphan_beats)
+
+    self._known = dict(live)
+    return live
+
+  async def _publish(
+    self,
+    state: ConnectionState,
+    previous_status: ConnectionStatus | None,
+    status: ConnectionStatus | None = None,
+    reason: str | None = None,
+  ) -> None:
+    if self._pubsub is None:
+      return
+    event = {
+      "device_id": state.device_id,
+      "status": status or state.status,
+      "previous_status": previous_status,
+      "backend_class": state.backend_class,
+      "error_message": state.error_message,
+      "reason": reason,
+      "timestamp": datetime.now(UTC).isoformat(),
+    }
+    try:
+      await self._pubsub.publish(EVENTS_CHANNEL, event)
+    except Exception:
+      logger.exception("Failed to publish connection event for %s", state.device_id)
 
   async def connect(
     self,
@@ -184,14 +351,10 @@ class HardwareConnectionManager:
       config=config or {},
       error_message=None,
     )
-
-    # Store with TTL
-    key = self._get_key(device_id)
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
-    await self._add_to_index(device_id)
+    await self._write(state)
 
     logger.info(
-      "Device connected: %s (backend: %s, TTL: %ds)",
+      "Device connected: %s (backend: %s, TTL: %ss)",
       device_id,
       backend_class,
       self._ttl,
@@ -225,10 +388,7 @@ class HardwareConnectionManager:
       config=config or {},
       error_message=None,
     )
-
-    key = self._get_key(device_id)
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
-    await self._add_to_index(device_id)
+    await self._write(state)
 
     logger.info("Device connecting: %s (backend: %s)", device_id, backend_class)
     return state
@@ -243,19 +403,23 @@ class HardwareConnectionManager:
         True if the device was disconnected, False if it wasn't connected.
 
     """
-    key = self._get_key(device_id)
-    existed = await self._kv.delete(key)
-    await self._remove_from_index(device_id)
+    self._pending_beats.pop(device_id, None)
+    state = self._known.pop(device_id, None)
+    existed = bool(await self._kv.hdel(KEY_CONNECTIONS, self._state_field(device_id)))
+    await self._kv.hdel(KEY_CONNECTIONS, self._beat_field(device_id))
 
     if existed:
       logger.info("Device disconnected: %s", device_id)
+      if state is not None:
+        await self._publish(state, state.status, status="disconnected")
     return existed
 
   async def heartbeat(self, device_id: str) -> ConnectionState | None:
     """Update the heartbeat timestamp for a connection.
 
     This should be called periodically to keep the connection alive.
-    Connections without heartbeats will expire after TTL.
+    Connections without heartbeats will expire after TTL. A started manager
+    buffers the heartbeat and writes it with the next batch.
 
     Args:
         device_id: Unique identifier for the device.
@@ -264,18 +428,17 @@ class HardwareConnectionManager:
         The updated connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
+    state = self._known.get(device_id)
+    if state is None:
+      state = (await self._load()).get(device_id)
+    if state is None:
       logger.warning("Heartbeat for unknown device: %s", device_id)
       return None
 
-    state = ConnectionState.from_dict(data)
     state.last_heartbeat = datetime.now(UTC)
-
-    # Refresh TTL
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
+    self._pending_beats[device_id] = state.last_heartbeat
+    if self._task is None:
+      await self.flush()
     logger.debug("Heartbeat received: %s", device_id)
     return state
 
@@ -289,13 +452,7 @@ class HardwareConnectionManager:
         The connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
-      return None
-
-    return ConnectionState.from_dict(data)
+    return (await self._load()).get(device_id)
 
   async def set_error(
     self,
@@ -312,20 +469,18 @@ class HardwareConnectionManager:
         The updated connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
+    current = self._known.get(device_id) or (await self._load()).get(device_id)
+    if current is None:
       logger.warning("Set error for unknown device: %s", device_id)
       return None
 
-    state = ConnectionState.from_dict(data)
+    state = ConnectionState.from_dict(current.to_dict())
     state.status = "error"
     state.error_message = error_message
     state.last_heartbeat = datetime.now(UTC)
 
-    # Keep TTL active so error state is visible
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
+    # Keep the heartbeat fresh so the error state is visible
+    await self._write(state)
     logger.error("Device error: %s - %s", device_id, error_message)
     return state
 
@@ -336,31 +491,9 @@ class HardwareConnectionManager:
         List of all current connection states.
 
     """
-    # Get device IDs from index
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-
-    connections: list[ConnectionState] = []
-    stale_ids: list[str] = []
-
-    for device_id in index:
-      state = await self.get_connection(device_id)
-      if state is not None:
-        connections.append(state)
-      else:
-        # Connection expired, mark for cleanup
-        stale_ids.append(device_id)
-
-    # Clean up stale entries from index
-    for device_id in stale_ids:
-      await self._remove_from_index(device_id)
-
-    logger.debug(
-      "Listed %d connections (%d stale removed)",
-      len(connections),
-      len(stale_ids),
-    )
-    return connections
+    connections = await self._load()
+    logger.debug("Listed %d connections", len(connections))
+    return [connections[device_id] for device_id in sorted(connections)]
 
   async def clear_all(self) -> int:
     """Clear all connection states.
@@ -369,12 +502,12 @@ class HardwareConnectionManager:
         Number of connections cleared.
 
     """
-    connections = await self.list_connections()
-    count = len(connections)
-
-    for state in connections:
-      await self._kv.delete(self._get_key(state.device_id))
-
-    await self._kv.delete(KEY_INDEX)
-    logger.info("Cleared %d connections", count)
-    return count
+    connections = await self._load()
+    await self._kv.delete(KEY_CONNECTIONS)
+    self._known.clear()
+    self._pending_beats.clear()
+    for state in connections.values():
+      await self._publish(state, state.status, status="disconnected")
+
+    logger.info("Cleared %d connections", len(connections))
+    return len(connections)
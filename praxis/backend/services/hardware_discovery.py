@@ -7,17 +7,46 @@ Supports:
 - Serial/USB devices via pyserial
 - Network devices via mDNS/Zeroconf (Opentrons, Tecan, Hamilton, etc.)
 - PyLabRobot simulators
+
+Once started, the service keeps a device table current in the background: a
+long-lived Zeroconf browser adds and removes network devices as they announce
+or withdraw themselves, and serial ports are polled every few seconds. Each
+change is published on the ``hw:discovery_events`` channel, and
+`HardwareDiscoveryService.discover_all` answers from the table without
+waiting. A forced refresh (or any call on a service that was not started)
+scans all sources concurrently; concurrent callers share one scan.
+
+Background discovery is off by default (``[hardware] discovery_background``)
+and should be enabled only in the process that runs next to the hardware.
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import dataclasses
 import logging
-from collections.abc import Callable
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
+
+  from praxis.backend.core.storage.protocols import PubSub
 
 logger = logging.getLogger(__name__)
 
+# PubSub channel for device table changes
+DISCOVERY_EVENTS_CHANNEL = "hw:discovery_events"
+
+# Sources of the device table, in listing order
+SOURCES = ("serial", "simulator", "network")
+
+# How long the result of an on-demand scan is reused (seconds)
+DEFAULT_MAX_AGE_S = 30.0
+
 
 class NetworkSignature(TypedDict):
   """Type definition for network device signatures."""
@@ -61,6 +90,59 @@ class DiscoveredDevice:
   plr_backend: str | None = None  # Suggested PyLabRobot backend class
   properties: dict[str, Any] | None = None
 
+  def to_dict(self) -> dict[str, Any]:
+    """Convert to JSON-serializable dictionary."""
+    data = dataclasses.asdict(self)
+    data["connection_type"] = self.connection_type.value
+    data["status"] = self.status.value
+    return data
+
+
+class _MdnsListener:
+  """Zeroconf listener that resolves services and reports them to a callback.
+
+  Zeroconf calls it from its own thread; ``on_change`` receives the service
+  type, the service name and its resolved info (None once it is removed).
+  """
+
+  def __init__(self, on_change: Callable[[str, str, dict[str, Any] | None], None]) -> None:
+    self._on_change = on_change
+
+  def add_service(self, zc: Any, type_: str, name: str) -> None:
+    """Called when a service is discovered."""
+    self._resolve(zc, type_, name)
+
+  def update_service(self, zc: Any, type_: str, name: str) -> None:
+    """Called when a service is updated."""
+    self._resolve(zc, type_, name)
+
+  def remove_service(self, zc: Any, type_: str, name: str) -> None:
+    """Called when a service is removed."""
+    self._on_change(type_, name, None)
+
+  def _resolve(self, zc: Any, type_: str, name: str) -> None:
+    try:
+      info = zc.get_service_info(type_, name, timeout=1000)
+    except Exception as e:
+      logger.debug("Error getting service info for %s: %s", name, e)
+      return
+    if not info:
+      return
+    logger.debug("mDNS discovered: %s (%s)", name, type_)
+    self._on_change(
+      type_,
+      name,
+      {
+        "addresses": [str(addr) for addr in info.parsed_addresses()],
+        "port": info.port,
+        "server": info.server,
+        "properties": {
+          k.decode() if isinstance(k, bytes) else k: v.decode() if isinstance(v, bytes) else v
+          for k, v in (info.properties or {}).items()
+        },
+      },
+    )
+
 
 class HardwareDiscoveryService:
   """Service for discovering available hardware devices."""
@@ -125,9 +207,195 @@ class HardwareDiscoveryService:
     },
   }
 
-  def __init__(self) -> None:
-    """Initialize the hardware discovery service."""
+  def __init__(
+    self,
+    pubsub: PubSub | None = None,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+  ) -> None:
+    """Initialize the hardware discovery service.
+
+    Args:
+        pubsub: Where to publish device table changes (optional).
+        max_age_s: How long a stopped service reuses its last scan.
+
+    """
+    self.pubsub = pubsub
+    self.max_age_s = max_age_s
+    self.version = 0
+    self._table: dict[str, dict[str, DiscoveredDevice]] = {source: {} for source in SOURCES}
     self._cached_devices: list[DiscoveredDevice] = []
+    self._scanned_at: float | None = None
+    self._scan_task: asyncio.Future[list[DiscoveredDevice]] | None = None
+    self._serial_task: asyncio.Task[None] | None = None
+    self._zeroconf: Any = None
+    self._browsers: list[Any] = []
+    self._mdns_ids: dict[tuple[str, str], str] = {}
+    self._loop: asyncio.AbstractEventLoop | None = None
+    self._publishing: set[asyncio.Task[Any]] = set()
+
+  # ---------------------------------------------------------------------------
+  # Background discovery
+  # ---------------------------------------------------------------------------
+
+  @property
+  def running(self) -> bool:
+    """Whether the background pollers maintain the device table."""
+    return self._serial_task is not None
+
+  async def start(
+    self,
+    serial_poll_interval: float = 2.0,
+    browse_network: bool = True,
+  ) -> None:
+    """Start maintaining the device table in the background.
+
+    Args:
+        serial_poll_interval: Seconds between serial port scans.
+        browse_network: Whether to run a long-lived mDNS browser.
+
+    """
+    if self.running:
+      return
+    self._loop = asyncio.get_running_loop()
+    self._replace_source("simulator", await self.discover_simulators())
+    self._serial_task = asyncio.create_task(
+      self._poll_serial(serial_poll_interval),
+      name="hardware-discovery-serial",
+    )
+    if browse_network:
+      await self._start_browser()
+    self._scanned_at = time.monotonic()
+    logger.info("Background hardware discovery started.")
+
+  async def stop(self) -> None:
+    """Stop the background pollers; the table keeps its last contents."""
+    if self._serial_task is not None:
+      self._serial_task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._serial_task
+      self._serial_task = None
+    if self._zeroconf is not None:
+      zeroconf, browsers = self._zeroconf, self._browsers
+      self._zeroconf, self._browsers = None, []
+
+      def _close() -> None:
+        for browser in browsers:
+          browser.cancel()
+        zeroconf.close()
+
+      await asyncio.to_thread(_close)
+    self._mdns_ids.clear()
+
+  async def _poll_serial(self, interval: float) -> None:
+    while True:
+      try:
+        self._replace_source("serial", await self.discover_serial_ports())
+      except Exception:
+        logger.exception("Serial port poll failed")
+      await asyncio.sleep(interval)
+
+  async def _start_browser(self) -> None:
+    try:
+      from zeroconf import ServiceBrowser, Zeroconf
+    except ImportError:
+      logger.warning("zeroconf not installed. Background network discovery unavailable.")
+      return
+
+    listener = _MdnsListener(self._on_mdns_change)
+
+    def _open() -> tuple[Any, list[Any]]:
+      zeroconf = Zeroconf()
+      return zeroconf, [
+        ServiceBrowser(zeroconf, stype, listener) for stype in self.NETWORK_SERVICE_TYPES
+      ]
+
+    try:
+      self._zeroconf, self._browsers = await asyncio.to_thread(_open)
+    except Exception:
+      logger.exception("Could not start the mDNS browser")
+
+  def _on_mdns_change(self, service_type: str, name: str, info: dict[str, Any] | None) -> None:
+    """Apply an mDNS change on the event loop (called from Zeroconf's thread)."""
+    if self._loop is not None and not self._loop.is_closed():
+      self._loop.call_soon_threadsafe(self._apply_mdns_change, service_type, name, info)
+
+  def _apply_mdns_change(
+    self,
+    service_type: str,
+    name: str,
+    info: dict[str, Any] | None,
+  ) -> None:
+    key = (service_type, name)
+    if info is None:
+      device_id = self._mdns_ids.pop(key, None)
+      # A device may advertise several services; keep it while any remains.
+      if device_id is not None and device_id not in self._mdns_ids.values():
+        self._remove("network", device_id)
+      return
+    device = self._parse_network_device(service_type, name, info)
+    if device is not None:
+      self._mdns_ids[key] = device.id
+      self._upsert("network", device)
+
+  # ---------------------------------------------------------------------------
+  # Device table
+  # ---------------------------------------------------------------------------
+
+  @property
+  def devices(self) -> list[DiscoveredDevice]:
+    """The current device table: serial devices, then simulators, then network devices."""
+    return self._cached_devices
+
+  def _upsert(self, source: str, device: DiscoveredDevice) -> None:
+    previous = self._table[source].get(device.id)
+    if previous == device:
+      return
+    self._table[source][device.id] = device
+    self._changed([("added" if previous is None else "updated", device)])
+
+  def _remove(self, source: str, device_id: str) -> None:
+    device = self._table[source].pop(device_id, None)
+    if device is not None:
+      self._changed([("removed", device)])
+
+  def _replace_source(self, source: str, devices: list[DiscoveredDevice]) -> None:
+    previous = self._table[source]
+    current = {device.id: device for device in devices}
+    changes = [
+      ("removed", device) for device_id, device in previous.items() if device_id not in current
+    ]
+    for device_id, device in current.items():
+      if device_id not in previous:
+        changes.append(("added", device))
+      elif previous[device_id] != device:
+        changes.append(("updated", device))
+    self._table[source] = current
+    self._changed(changes)
+
+  def _changed(self, changes: list[tuple[str, DiscoveredDevice]]) -> None:
+    if not changes:
+      return
+    self.version += 1
+    self._cached_devices = [device for source in SOURCES for device in self._table[source].values()]
+    for change, device in changes:
+      logger.debug("Device %s: %s", change, device.id)
+    if self.pubsub is not None:
+      events = [
+        {"type": change, "version": self.version, "device": device.to_dict()}
+        for change, device in changes
+      ]
+      task = asyncio.get_running_loop().create_task(self._publish(events))
+      self._publishing.add(task)
+      task.add_done_callback(self._publishing.discard)
+
+  async def _publish(self, events: list[dict[str, Any]]) -> None:
+    if self.pubsub is None:
+      return
+    try:
+      for event in events:
+        await self.pubsub.publish(DISCOVERY_EVENTS_CHANNEL, event)
+    except Exception:
+      logger.exception("Failed to publish hardware discovery events")
 
   async def discover_serial_ports(self) -> list[DiscoveredDevice]:
     """Discover devices connected via serial/USB ports.
@@ -142,7 +410,7 @@ class HardwareDiscoveryService:
       # Try to import serial.tools.list_ports
       from serial.tools import list_ports
 
-      ports = list_ports.comports()
+      ports = await asyncio.to_thread(list_ports.comports)
       for port in ports:
         device_info = self._identify_device(port.vid, port.pid)
 
@@ -233,55 +501,24 @@ class HardwareDiscoveryService:
     devices: list[DiscoveredDevice] = []
 
     try:
-      from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
+      from zeroconf import ServiceBrowser, Zeroconf
     except ImportError:
       logger.warning(
-        "zeroconf not installed. Network discovery unavailable. "
-        "Install with: pip install zeroconf"
+        "zeroconf not installed. Network discovery unavailable. Install with: pip install zeroconf"
       )
       return devices
 
-    class LabDeviceListener(ServiceListener):
-      """Listener for mDNS service discovery."""
-
-      def __init__(self) -> None:
-        self.discovered: list[tuple[str, str, dict[str, Any]]] = []
-
-      def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
-        """Called when a service is discovered."""
-        try:
-          info = zc.get_service_info(type_, name, timeout=1000)
-          if info:
-            self.discovered.append(
-              (
-                type_,
-                name,
-                {
-                  "addresses": [str(addr) for addr in info.parsed_addresses()],
-                  "port": info.port,
-                  "server": info.server,
-                  "properties": {
-                    k.decode() if isinstance(k, bytes) else k: v.decode()
-                    if isinstance(v, bytes)
-                    else v
-                    for k, v in (info.properties or {}).items()
-                  },
-                },
-              )
-            )
-            logger.debug("mDNS discovered: %s (%s)", name, type_)
-        except Exception as e:
-          logger.debug("Error getting service info for %s: %s", name, e)
-
-      def remove_service(self, zc: Zeroconf, type_: str, name: str) -> None:
-        """Called when a service is removed."""
-
-      def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
-        """Called when a service is updated."""
+    discovered: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def _collect(service_type: str, name: str, info: dict[str, Any] | None) -> None:
+      if info is None:
+        discovered.pop((service_type, name), None)
+      else:
+        discovered[(service_type, name)] = info
 
     try:
       zeroconf = Zeroconf()
-      listener = LabDeviceListener()
+      listener = _MdnsListener(_collect)
 
       # Start browsers for all service types
       browsers = [ServiceBrowser(zeroconf, stype, listener) for stype in self.NETWORK_SERVICE_TYPES]
@@ -290,7 +527,7 @@ class HardwareDiscoveryService:
       await asyncio.sleep(timeout)
 
       # Process discovered devices
-      for stype, name, info in listener.discovered:
+      for (stype, name), info in list(discovered.items()):
         device = self._parse_network_device(stype, name, info)
         if device:
           devices.append(device)
@@ -398,39 +635,53 @@ class HardwareDiscoveryService:
 
     return None
 
-  async def discover_all(self) -> list[DiscoveredDevice]:
+  async def discover_all(self, refresh: bool = False) -> list[DiscoveredDevice]:
     """Discover all available hardware devices.
 
+    A started service answers from its background-maintained table. Otherwise
+    the result of the last scan is reused for ``max_age_s`` seconds.
+
+    Args:
+        refresh: Scan now instead. Serial ports, simulators and (unless the
+            background browser already tracks them) network devices are
+            scanned concurrently.
+
     Returns:
         Combined list of all discovered devices.
 
     """
-    all_devices: list[DiscoveredDevice] = []
-
-    # Discover serial devices
-    serial_devices = await self.discover_serial_ports()
-    all_devices.extend(serial_devices)
-
-    # Discover simulators
-    simulators = await self.discover_simulators()
-    all_devices.extend(simulators)
-
-    # Discover network devices
-    network_devices = await self.discover_network_devices()
-    all_devices.extend(network_devices)
-
-    # Cache for quick access
-    self._cached_devices = all_devices
+    if not refresh:
+      if self.running:
+        return self.devices
+      if self._scanned_at is not None and time.monotonic() - self._scanned_at < self.max_age_s:
+        return self.devices
+
+    # Concurrent callers share one scan.
+    if self._scan_task is None or self._scan_task.done():
+      self._scan_task = asyncio.ensure_future(self._scan())
+    return await asyncio.shield(self._scan_task)
+
+  async def _scan(self) -> list[DiscoveredDevice]:
+    scans = [self.discover_serial_ports(), self.discover_simulators()]
+    browsing = self._zeroconf is not None
+    if not browsing:
+      scans.append(self.discover_network_devices())
+    serial_devices, simulators, *network = await asyncio.gather(*scans)
+
+    self._replace_source("serial", serial_devices)
+    self._replace_source("simulator", simulators)
+    if not browsing:
+      self._replace_source("network", network[0])
+    self._scanned_at = time.monotonic()
 
     logger.info(
       "Discovered %d devices: %d serial, %d simulators, %d network",
-      len(all_devices),
-      len(serial_devices),
-      len(simulators),
-      len(network_devices),
+      len(self.devices),
+      len(self._table["serial"]),
+      len(self._table["simulator"]),
+      len(self._table["network"]),
     )
-
-    return all_devices
+    return self.devices
 
   def _identify_device(self, vid: int | None, pid: int | None) -> dict[str, str]:
     """Identify a device by its USB VID/PID.
@@ -454,4 +705,8 @@ class HardwareDiscoveryService:
         Cached list of discovered devices.
 
     """
-    return self._cached_devices
+    return self.devices
+
+
+# Singleton instance for convenience
+hardware_discovery = HardwareDiscoveryService()
@@ -22,6 +22,7 @@ from praxis.backend.models.domain.machine import (
   MachineUpdate,
 )
 from praxis.backend.models.enums import MachineStatusEnum
+from praxis.backend.services.capability_index import invalidates_machine, removes_machine
 from praxis.backend.services.entity_linking import (
   _create_or_link_resource_counterpart_for_machine,
   synchronize_machine_resource_names,
@@ -41,6 +42,7 @@ logger = get_logger(__name__)
 class MachineService(CRUDBase[Machine, MachineCreate, MachineUpdate]):
   """Service for machine-related operations."""
 
+  @invalidates_machine
   @handle_db_transaction
   async def create(
     self,
@@ -81,6 +83,7 @@ class MachineService(CRUDBase[Machine, MachineCreate, MachineUpdate]):
     logger.info("%s Successfully committed new machine.", log_prefix)
     return machine_model
 
+  @invalidates_machine
   @handle_db_transaction
   async def update(
     self,
@@ -235,6 +238,7 @@ class MachineService(CRUDBase[Machine, MachineCreate, MachineUpdate]):
     )
     return machine_model
 
+  @removes_machine
   @handle_db_transaction
   async def remove(self, db: AsyncSession, *, accession_id: UUID) -> Machine | None:
     """Delete a specific machine by its ID."""
@@ -14,6 +14,7 @@ from praxis.backend.models.domain.machine_frontend import MachineFrontendDefinit
 from praxis.backend.models.enums import BackendTypeEnum
 from praxis.backend.services.plr_type_base import DiscoverableTypeServiceBase
 from praxis.backend.services.utils.crud_base import CRUDBase
+from praxis.backend.utils.compute_executor import run_compute
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.plr_static_analysis import (
   BACKEND_TYPE_TO_FRONTEND_FQN,
@@ -66,7 +67,10 @@ class MachineBackendDefinitionService(
     logger.info("Discovering machine backend types via static analysis...")
 
     # Use static analysis to discover backends
-    all_discovered = self.parser.discover_backend_classes()
+    # LibCST parsing is CPU-bound; keep it off the event loop.
+    all_discovered = await run_compute(
+      self.parser.discover_backend_classes, key="discovery", use_process=False
+    )
     logger.info("Discovered %d backend classes total.", len(all_discovered))
 
     synced_definitions = []
@@ -13,6 +13,7 @@ from praxis.backend.models.domain.machine_frontend import (
 from praxis.backend.models.enums import MachineCategoryEnum
 from praxis.backend.services.plr_type_base import DiscoverableTypeServiceBase
 from praxis.backend.services.utils.crud_base import CRUDBase
+from praxis.backend.utils.compute_executor import run_compute
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.plr_static_analysis import (
   MACHINE_FRONTEND_TYPES,
@@ -70,7 +71,10 @@ class MachineFrontendDefinitionService(
     logger.info("Discovering machine frontend types via static analysis...")
 
     # Assumes discover_frontend_classes() exists or is added to parser
-    all_discovered = self.parser.discover_frontend_classes()
+    # LibCST parsing is CPU-bound; keep it off the event loop.
+    all_discovered = await run_compute(
+      self.parser.discover_frontend_classes, key="discovery", use_process=False
+    )
     logger.info("Discovered %d machine frontend types total.", len(all_discovered))
 
     synced_definitions = []
@@ -1,6 +1,7 @@
 """Service layer for Machine Type Definition Management."""
 
 from pathlib import Path
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,8 +13,11 @@ from praxis.backend.models.domain.machine import (
   MachineDefinitionCreate,
   MachineDefinitionUpdate,
 )
+from praxis.backend.services.capability_index import capability_index, invalidates_definition
 from praxis.backend.services.plr_type_base import DiscoverableTypeServiceBase
 from praxis.backend.services.utils.crud_base import CRUDBase
+from praxis.backend.utils.compute_executor import run_compute
+from praxis.backend.utils.db_decorator import handle_db_transaction
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.plr_static_analysis import (
   BACKEND_TYPE_TO_FRONTEND_FQN,
@@ -73,7 +77,10 @@ class MachineTypeDefinitionService(
     logger.info("Discovering machine types via static analysis...")
 
     # Use static analysis to discover machines
-    all_discovered = self.parser.discover_machine_classes()
+    # LibCST parsing is CPU-bound; keep it off the event loop.
+    all_discovered = await run_compute(
+      self.parser.discover_machine_classes, key="discovery", use_process=False
+    )
     logger.info("Discovered %d machine types total.", len(all_discovered))
 
     # Group simulated backends by frontend type
@@ -101,6 +108,7 @@ class MachineTypeDefinitionService(
       synced_definitions.append(definition)
 
     await self.db.commit()
+    await capability_index.invalidate_all()
     logger.info("Synchronized %d machine definitions.", len(synced_definitions))
     return synced_definitions
 
@@ -225,3 +233,21 @@ class MachineTypeDefinitionCRUDService(
   ],
 ):
   """CRUD service for machine type definitions."""
+
+  @invalidates_definition
+  @handle_db_transaction
+  async def update(
+    self,
+    db: AsyncSession,
+    *,
+    db_obj: MachineDefinition,
+    obj_in: MachineDefinitionUpdate,
+  ) -> MachineDefinition:
+    """Update a machine definition and refresh the capabilities of its machines."""
+    return await super().update(db=db, db_obj=db_obj, obj_in=obj_in)
+
+  @invalidates_definition
+  @handle_db_transaction
+  async def remove(self, db: AsyncSession, *, accession_id: UUID) -> MachineDefinition | None:
+    """Delete a machine definition and refresh the capabilities of its machines."""
+    return await super().remove(db, accession_id=accession_id)
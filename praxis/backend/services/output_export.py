@@ -0,0 +1,335 @@
+"""Streaming export of well-level run data outputs.
+
+praxis.backend.services.output_export
+
+Long kinetic runs can produce hundreds of thousands of `WellDataOutput` rows.
+Materializing them as ORM objects and Pydantic models before responding is
+slow and memory heavy, so this module pages through the rows with a
+server-side cursor, selects plain column tuples, and encodes each page into a
+self-contained chunk (CSV, JSON lines, Arrow IPC or Parquet). Memory use is
+bounded by ``chunk_size`` regardless of how many rows the export selects.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.outputs import FunctionDataOutput, WellDataOutput
+from praxis.backend.models.enums import DataExportFormatEnum, DataOutputTypeEnum
+from praxis.backend.utils.logging import get_logger
+
+try:
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+except ImportError:  # Arrow and Parquet exports are optional
+  pa = None
+  pq = None
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORT_CHUNK_SIZE = 5000
+
+WELL_EXPORT_COLUMNS: tuple[str, ...] = (
+  "well_data_output_accession_id",
+  "protocol_run_accession_id",
+  "function_data_output_accession_id",
+  "plate_resource_accession_id",
+  "data_type",
+  "measurement_type",
+  "measurement_timestamp",
+  "well_name",
+  "well_row",
+  "well_column",
+  "well_index",
+  "data_value",
+  "unit",
+)
+
+EXPORT_MEDIA_TYPES: dict[DataExportFormatEnum, str] = {
+  DataExportFormatEnum.CSV: "text/csv",
+  DataExportFormatEnum.JSONL: "application/x-ndjson",
+  DataExportFormatEnum.ARROW: "application/vnd.apache.arrow.stream",
+  DataExportFormatEnum.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def build_well_data_export_query(
+  *,
+  protocol_run_accession_id: UUID | None = None,
+  plate_resource_accession_id: UUID | None = None,
+  measurement_type: str | None = None,
+  data_type: DataOutputTypeEnum | None = None,
+  date_range_start: datetime | None = None,
+  date_range_end: datetime | None = None,
+) -> Select:
+  """Build a column-only SELECT for well data outputs.
+
+  Only scalar columns are selected so rows are never hydrated into ORM
+  identities. Rows are ordered by measurement time and well index so that a
+  kinetic read streams timepoint by timepoint.
+
+  Args:
+    protocol_run_accession_id: Restrict to outputs of this protocol run.
+    plate_resource_accession_id: Restrict to wells of this plate.
+    measurement_type: Restrict to this well measurement type.
+    data_type: Restrict to parent outputs of this data type.
+    date_range_start: Inclusive lower bound on the measurement timestamp.
+    date_range_end: Inclusive upper bound on the measurement timestamp.
+
+  Returns:
+    The SELECT statement, with columns labelled as in `WELL_EXPORT_COLUMNS`.
+
+  """
+  query = select(
+    WellDataOutput.accession_id.label("well_data_output_accession_id"),
+    FunctionDataOutput.protocol_run_accession_id,
+    WellDataOutput.function_data_output_accession_id,
+    WellDataOutput.plate_resource_accession_id,
+    FunctionDataOutput.data_type,
+    WellDataOutput.measurement_type,
+    FunctionDataOutput.measurement_timestamp,
+    WellDataOutput.well_name,
+    WellDataOutput.well_row,
+    WellDataOutput.well_column,
+    WellDataOutput.well_index,
+    WellDataOutput.data_value,
+    WellDataOutput.unit,
+  ).join(
+    FunctionDataOutput,
+    WellDataOutput.function_data_output_accession_id == FunctionDataOutput.accession_id,
+  )
+
+  conditions = []
+  if protocol_run_accession_id:
+    conditions.append(FunctionDataOutput.protocol_run_accession_id == protocol_run_accession_id)
+  if plate_resource_accession_id:
+    conditions.append(WellDataOutput.plate_resource_accession_id == plate_resource_accession_id)
+  if measurement_type:
+    conditions.append(WellDataOutput.measurement_type == measurement_type)
+  if data_type:
+    conditions.append(FunctionDataOutput.data_type == data_type)
+  if date_range_start:
+    conditions.append(FunctionDataOutput.measurement_timestamp >= date_range_start)
+  if date_range_end:
+    conditions.append(FunctionDataOutput.measurement_timestamp <= date_range_end)
+
+  if conditions:
+    query = query.filter(and_(*conditions))
+
+  return query.order_by(
+    FunctionDataOutput.measurement_timestamp,
+    WellDataOutput.plate_resource_accession_id,
+    WellDataOutput.well_index,
+    WellDataOutput.accession_id,
+  )
+
+
+def check_export_format_supported(export_format: DataExportFormatEnum) -> None:
+  """Raise if the optional dependency needed for ``export_format`` is missing.
+
+  Call this before starting a streaming response so the failure surfaces as an
+  error status instead of a truncated body.
+
+  Raises:
+    ValueError: If the format requires pyarrow and it is not installed.
+
+  """
+  if export_format not in (DataExportFormatEnum.ARROW, DataExportFormatEnum.PARQUET):
+    return
+  if pa is None:
+    msg = (
+      f"Export format '{export_format.value}' requires pyarrow. Install with: pip install pyarrow"
+    )
+    raise ValueError(msg)
+
+
+def _normalize_value(value: Any) -> Any:
+  """Convert a column value into a plain, serializable Python value."""
+  if isinstance(value, UUID):
+    return str(value)
+  if isinstance(value, datetime):
+    return value.isoformat()
+  if isinstance(value, DataOutputTypeEnum):
+    return value.value
+  return value
+
+
+def _encode_csv(rows: Sequence[Sequence[Any]], *, include_header: bool) -> bytes:
+  buffer = io.StringIO()
+  writer = csv.writer(buffer, lineterminator="\n")
+  if include_header:
+    writer.writerow(WELL_EXPORT_COLUMNS)
+  writer.writerows(rows)
+  return buffer.getvalue().encode("utf-8")
+
+
+def _encode_jsonl(rows: Sequence[Sequence[Any]]) -> bytes:
+  return "".join(
+    json.dumps(dict(zip(WELL_EXPORT_COLUMNS, row, strict=True))) + "\n" for row in rows
+  ).encode("utf-8")
+
+
+class _DrainableSink(io.RawIOBase):
+  """Write-only sink that hands out written bytes while keeping absolute offsets.
+
+  Parquet footers record absolute row-group offsets, so ``tell`` must keep
+  counting across drains even though the drained bytes are released.
+  """
+
+  def __init__(self) -> None:
+    super().__init__()
+    self._buffer = bytearray()
+    self._position = 0
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, data: Any) -> int:
+    size = len(data)
+    self._buffer.extend(data)
+    self._position += size
+    return size
+
+  def tell(self) -> int:
+    return self._position
+
+  def drain(self) -> bytes:
+    data = bytes(self._buffer)
+    self._buffer.clear()
+    return data
+
+
+class _ArrowChunkEncoder:
+  """Incrementally encode row pages as an Arrow IPC stream or a Parquet file.
+
+  Each page becomes one record batch (Arrow) or one row group (Parquet). The
+  writer's sink is drained after every page so only one page is ever buffered.
+  """
+
+  def __init__(self, export_format: DataExportFormatEnum) -> None:
+    check_export_format_supported(export_format)
+    self._schema = pa.schema(
+      [
+        ("well_data_output_accession_id", pa.string()),
+        ("protocol_run_accession_id", pa.string()),
+        ("function_data_output_accession_id", pa.string()),
+        ("plate_resource_accession_id", pa.string()),
+        ("data_type", pa.string()),
+        ("measurement_type", pa.string()),
+        ("measurement_timestamp", pa.string()),
+        ("well_name", pa.string()),
+        ("well_row", pa.int64()),
+        ("well_column", pa.int64()),
+        ("well_index", pa.int64()),
+        ("data_value", pa.float64()),
+        ("unit", pa.string()),
+      ],
+    )
+    self._sink = _DrainableSink()
+    if export_format == DataExportFormatEnum.PARQUET:
+      self._writer = pq.ParquetWriter(self._sink, self._schema)
+    else:
+      self._writer = pa.ipc.new_stream(self._sink, self._schema)
+
+  def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in WELL_EXPORT_COLUMNS]
+    batch = pa.record_batch(
+      [
+        pa.array(list(col), type=field.type)
+        for col, field in zip(columns, self._schema, strict=True)
+      ],
+      schema=self._schema,
+    )
+    self._writer.write_batch(batch)
+    return self._sink.drain()
+
+  def close(self) -> bytes:
+    self._writer.close()
+    return self._sink.drain()
+
+
+async def stream_well_data_export(
+  db: AsyncSession,
+  *,
+  export_format: DataExportFormatEnum = DataExportFormatEnum.CSV,
+  chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+  protocol_run_accession_id: UUID | None = None,
+  plate_resource_accession_id: UUID | None = None,
+  measurement_type: str | None = None,
+  data_type: DataOutputTypeEnum | None = None,
+  date_range_start: datetime | None = None,
+  date_range_end: datetime | None = None,
+) -> AsyncIterator[bytes]:
+  """Stream well data outputs as encoded chunks with bounded memory.
+
+  Rows are fetched through a server-side cursor (`AsyncSession.stream` with
+  ``yield_per``) in pages of ``chunk_size`` and each page is encoded and yielded
+  before the next one is fetched.
+
+  Args:
+    db: Database session.
+    export_format: Output encoding.
+    chunk_size: Number of rows fetched and encoded per chunk.
+    protocol_run_accession_id: Optional protocol run filter.
+    plate_resource_accession_id: Optional plate resource filter.
+    measurement_type: Optional well measurement type filter.
+    data_type: Optional data output type filter.
+    date_range_start: Optional inclusive lower bound on measurement time.
+    date_range_end: Optional inclusive upper bound on measurement time.
+
+  Yields:
+    Encoded byte chunks. Concatenated, they form one valid document in the
+    requested format.
+
+  Raises:
+    ValueError: If ``chunk_size`` is not positive or the format's optional
+      dependency is missing.
+
+  """
+  if chunk_size < 1:
+    msg = f"chunk_size must be positive, got {chunk_size}"
+    raise ValueError(msg)
+
+  query = build_well_data_export_query(
+    protocol_run_accession_id=protocol_run_accession_id,
+    plate_resource_accession_id=plate_resource_accession_id,
+    measurement_type=measurement_type,
+    data_type=data_type,
+    date_range_start=date_range_start,
+    date_range_end=date_range_end,
+  ).execution_options(yield_per=chunk_size)
+
+  arrow_encoder = (
+    _ArrowChunkEncoder(export_format)
+    if export_format in (DataExportFormatEnum.ARROW, DataExportFormatEnum.PARQUET)
+    else None
+  )
+
+  total_rows = 0
+  result = await db.stream(query)
+  try:
+    async for partition in result.partitions(chunk_size):
+      rows = [tuple(_normalize_value(value) for value in row) for row in partition]
+      if export_format == DataExportFormatEnum.CSV:
+        yield _encode_csv(rows, include_header=total_rows == 0)
+      elif export_format == DataExportFormatEnum.JSONL:
+        yield _encode_jsonl(rows)
+      elif arrow_encoder is not None:
+        yield arrow_encoder.encode(rows)
+      total_rows += len(rows)
+  finally:
+    await result.close()
+
+  if export_format == DataExportFormatEnum.CSV and total_rows == 0:
+    yield _encode_csv([], include_header=True)
+  if arrow_encoder is not None:
+    yield arrow_encoder.close()
+
+  logger.info("Streamed %d well data output rows as %s.", total_rows, export_format.value)
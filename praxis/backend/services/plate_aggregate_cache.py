@@ -0,0 +1,567 @@
+"""In-process cache of per-plate well data grids for visualization.
+
+praxis.backend.services.plate_aggregate_cache
+
+Dashboards poll plate heatmaps while kinetic reads are still running. Rather
+than reloading every `WellDataOutput` row and re-parsing plate geometry on each
+request, this module keeps one NumPy grid per (function data output, plate)
+together with running summary statistics. A plate is loaded from the database
+once; afterwards newly written well outputs are folded into the cached grids
+once their transaction commits, so requests are answered without touching the
+raw rows.
+
+Every write bumps a per-plate version counter in the key-value store. Readers
+compare it with the version their copy was built from, so a plate written by
+another worker is reloaded instead of being served stale. The shared instance
+uses a process-local store until `configure_plate_aggregate_cache` is called at
+startup.
+
+Multi-timepoint aggregations (mean, min, max, slope over time) are computed
+directly from the stacked grids.
+"""
+
+import math
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, TypeVar, cast
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+
+from praxis.backend.core.storage import KeyValueStore
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.outputs import FunctionDataOutput, WellDataOutput
+from praxis.backend.models.enums import DataOutputTypeEnum, PlateAggregationEnum
+from praxis.backend.services.plate_parsing import parse_well_name
+from praxis.backend.services.resource import resource_service
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PLATE_LAYOUT: dict[str, Any] = {
+  "rows": 8,
+  "columns": 12,
+  "total_wells": 96,
+  "format": "96-well",
+}
+
+DEFAULT_MAX_CACHED_PLATES = 256
+VERSION_KEY_PREFIX = "plate_aggregate:version:"
+
+WellValue = tuple[int, int, float | None]
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class PlateGrid:
+  """Well values of one data output on one plate, with running statistics."""
+
+  function_data_output_accession_id: Any
+  plate_resource_accession_id: UUID
+  data_type: DataOutputTypeEnum | str
+  measurement_timestamp: datetime | None
+  rows: int
+  columns: int
+  protocol_run_accession_id: UUID | None = None
+  function_call_log_accession_id: UUID | None = None
+  values: np.ndarray = field(init=False)
+  count: int = field(init=False, default=0)
+  total: float = field(init=False, default=0.0)
+  minimum: float = field(init=False, default=math.inf)
+  maximum: float = field(init=False, default=-math.inf)
+  _stats_stale: bool = field(init=False, default=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Allocate the grid, with NaN marking wells that have no value yet."""
+    self.values = np.full((self.rows, self.columns), np.nan, dtype=np.float64)
+
+  def add_wells(self, wells: Iterable[WellValue]) -> None:
+    """Fold well values into the grid, updating statistics incrementally.
+
+    Wells outside the plate geometry or without a value are ignored. A well
+    that already holds a value is overwritten and the statistics are
+    recomputed lazily on the next read.
+    """
+    for row, column, value in wells:
+      if value is None or not (0 <= row < self.rows and 0 <= column < self.columns):
+        continue
+      number = float(value)
+      if not np.isnan(self.values[row, column]):
+        self._stats_stale = True
+      self.values[row, column] = number
+      self.count += 1
+      self.total += number
+      self.minimum = min(self.minimum, number)
+      self.maximum = max(self.maximum, number)
+
+  def _refresh_stats(self) -> None:
+    valid = self.values[~np.isnan(self.values)]
+    self.count = int(valid.size)
+    self.total = float(valid.sum()) if valid.size else 0.0
+    self.minimum = float(valid.min()) if valid.size else math.inf
+    self.maximum = float(valid.max()) if valid.size else -math.inf
+    self._stats_stale = False
+
+  def summary(self) -> dict[str, float | int | None]:
+    """Return count, mean, min and max of the wells recorded so far."""
+    if self._stats_stale:
+      self._refresh_stats()
+    if not self.count:
+      return {"count": 0, "mean": None, "min": None, "max": None}
+    return {
+      "count": self.count,
+      "mean": self.total / self.count,
+      "min": self.minimum,
+      "max": self.maximum,
+    }
+
+
+def aggregate_grids(
+  grids: list[PlateGrid],
+  method: PlateAggregationEnum,
+) -> np.ndarray:
+  """Reduce a time series of grids to a single grid, ignoring missing wells.
+
+  Args:
+    grids: Grids of the same plate and geometry, in any order.
+    method: The per-well reduction. ``SLOPE`` fits value against time in
+      seconds by least squares; wells with fewer than two timepoints are NaN.
+
+  Returns:
+    A ``rows x columns`` float array.
+
+  Raises:
+    ValueError: If ``grids`` is empty.
+
+  """
+  if not grids:
+    msg = "Cannot aggregate an empty set of grids."
+    raise ValueError(msg)
+
+  ordered = sorted(grids, key=_timestamp_sort_key)
+  stack = np.stack([g.values for g in ordered])
+  valid = ~np.isnan(stack)
+  counts = valid.sum(axis=0)
+  result = np.full(stack.shape[1:], np.nan, dtype=np.float64)
+
+  if method == PlateAggregationEnum.LATEST:
+    for grid in ordered:
+      mask = ~np.isnan(grid.values)
+      result[mask] = grid.values[mask]
+    return result
+
+  has_data = counts > 0
+  if method == PlateAggregationEnum.MEAN:
+    sums = np.where(valid, stack, 0.0).sum(axis=0)
+    result[has_data] = sums[has_data] / counts[has_data]
+  elif method == PlateAggregationEnum.MAX:
+    result[has_data] = np.where(valid, stack, -np.inf).max(axis=0)[has_data]
+  elif method == PlateAggregationEnum.MIN:
+    result[has_data] = np.where(valid, stack, np.inf).min(axis=0)[has_data]
+  elif method == PlateAggregationEnum.SLOPE:
+    start = ordered[0].measurement_timestamp
+    times = np.array(
+      [
+        (g.measurement_timestamp - start).total_seconds()
+        if g.measurement_timestamp and start
+        else float(i)
+        for i, g in enumerate(ordered)
+      ],
+    ).reshape(-1, 1, 1)
+    times = np.broadcast_to(times, stack.shape)
+    safe_counts = np.maximum(counts, 1)
+    t_mean = np.where(valid, times, 0.0).sum(axis=0) / safe_counts
+    y_mean = np.where(valid, stack, 0.0).sum(axis=0) / safe_counts
+    dt = np.where(valid, times - t_mean, 0.0)
+    dy = np.where(valid, stack - y_mean, 0.0)
+    denominator = (dt * dt).sum(axis=0)
+    fit = (counts >= 2) & (denominator > 0)
+    result[fit] = (dt * dy).sum(axis=0)[fit] / denominator[fit]
+  return result
+
+
+def grid_to_rows(grid: np.ndarray) -> list[list[float | None]]:
+  """Convert a float grid to nested lists with ``None`` for missing wells."""
+  return [[None if np.isnan(v) else float(v) for v in row] for row in grid]
+
+
+def _layout_from_definition(properties: dict[str, Any] | None) -> dict[str, Any]:
+  """Derive the plate layout from resource definition properties."""
+  if not isinstance(properties, dict):
+    return dict(DEFAULT_PLATE_LAYOUT)
+  num_items_x = properties.get("num_items_x")
+  num_items_y = properties.get("num_items_y")
+  if not (isinstance(num_items_x, int) and isinstance(num_items_y, int)):
+    return dict(DEFAULT_PLATE_LAYOUT)
+  if num_items_x < 1 or num_items_y < 1:
+    return dict(DEFAULT_PLATE_LAYOUT)
+  return {
+    "rows": num_items_y,
+    "columns": num_items_x,
+    "total_wells": num_items_x * num_items_y,
+    "format": f"{num_items_x * num_items_y}-well",
+  }
+
+
+@dataclass
+class _PlateEntry:
+  """Everything cached for one plate."""
+
+  layout: dict[str, Any]
+  version: int
+  loaded_data_types: set[str] = field(default_factory=set)
+  grids: dict[Any, PlateGrid] = field(default_factory=dict)
+  pending: dict[Any, list[WellValue]] = field(default_factory=lambda: defaultdict(list))
+
+
+class PlateAggregateCache:
+  """Bounded, incrementally maintained cache of plate well grids.
+
+  Plates are evicted least-recently-used once more than ``max_plates`` are
+  cached. Only plates that have been read at least once are tracked locally;
+  writes to other plates just bump their version counter.
+
+  Usage:
+      cache = PlateAggregateCache(kv_store)
+      grids = await cache.get_grids(db, plate_id, DataOutputTypeEnum.ABSORBANCE_READING)
+      await cache.record_well_outputs(new_well_outputs)  # after committing new rows
+
+  """
+
+  def __init__(
+    self,
+    kv_store: KeyValueStore | None = None,
+    max_plates: int = DEFAULT_MAX_CACHED_PLATES,
+  ) -> None:
+    """Initialize an empty cache.
+
+    Args:
+      kv_store: Store holding the per-plate version counters. Must be shared by
+        every process that writes or reads well outputs; defaults to a
+        process-local store.
+      max_plates: Maximum number of plates kept before LRU eviction.
+
+    """
+    self.kv_store: KeyValueStore = kv_store or InMemoryKeyValueStore()
+    self.max_plates = max_plates
+    self._plates: OrderedDict[UUID, _PlateEntry] = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def __contains__(self, plate_resource_accession_id: UUID) -> bool:
+    """Whether the plate is currently tracked."""
+    return plate_resource_accession_id in self._plates
+
+  def clear(self) -> None:
+    """Drop every cached plate."""
+    self._plates.clear()
+
+  async def invalidate_plate(self, plate_resource_accession_id: UUID | None) -> None:
+    """Forget a plate in every process so the next read reloads it.
+
+    Call after the transaction that changed or deleted its wells has committed.
+    """
+    if plate_resource_accession_id is not None:
+      await self.kv_store.incr(_version_key(plate_resource_accession_id))
+      self._plates.pop(plate_resource_accession_id, None)
+
+  async def record_well_outputs(self, well_outputs: Iterable[WellDataOutput]) -> None:
+    """Fold newly committed well outputs into tracked plates.
+
+    Must only be called once the rows are committed; other processes reload
+    the plate when they next read it. Locally the values are folded in, unless
+    another process wrote to the plate since it was loaded, in which case it is
+    dropped. The parent data output's type and timestamp are not known at this
+    point, so values are parked per data output and attached to a grid on the
+    next read of the plate (one small metadata query for all new outputs).
+    """
+    by_plate: dict[UUID, list[WellDataOutput]] = defaultdict(list)
+    for well in well_outputs:
+      by_plate[well.plate_resource_accession_id].append(well)
+
+    for plate_resource_accession_id, wells in by_plate.items():
+      version = await self.kv_store.incr(_version_key(plate_resource_accession_id))
+      entry = self._plates.get(plate_resource_accession_id)
+      if entry is None:
+        continue
+      if entry.version != version - 1:
+        self._plates.pop(plate_resource_accession_id, None)
+        continue
+      entry.version = version
+      for well in wells:
+        well_value = (*_well_position(well), well.data_value)
+        grid = entry.grids.get(well.function_data_output_accession_id)
+        if grid is not None:
+          grid.add_wells([well_value])
+        else:
+          entry.pending[well.function_data_output_accession_id].append(well_value)
+
+  async def _get_entry(self, db: AsyncSession, plate_resource_accession_id: UUID) -> _PlateEntry:
+    # Read the version before loading anything, so writes racing the load
+    # leave the entry behind and force another reload.
+    version = int(await self.kv_store.get(_version_key(plate_resource_accession_id)) or 0)
+    entry = self._plates.get(plate_resource_accession_id)
+    if entry is not None and entry.version == version:
+      self._plates.move_to_end(plate_resource_accession_id)
+      return entry
+    if entry is not None:
+      logger.debug("Plate %s changed in another process; reloading.", plate_resource_accession_id)
+
+    layout = dict(DEFAULT_PLATE_LAYOUT)
+    resource = await resource_service.get(db, plate_resource_accession_id)
+    if resource and resource.resource_definition:
+      try:
+        layout = _layout_from_definition(resource.resource_definition.properties_json)
+      except (AttributeError, TypeError) as e:
+        logger.warning(
+          "Could not parse plate geometry for plate %s: %s",
+          plate_resource_accession_id,
+          e,
+        )
+
+    entry = _PlateEntry(layout=layout, version=version)
+    self._plates[plate_resource_accession_id] = entry
+    self._plates.move_to_end(plate_resource_accession_id)
+    while len(self._plates) > self.max_plates:
+      self._plates.popitem(last=False)
+    return entry
+
+  async def _load_data_type(
+    self,
+    db: AsyncSession,
+    plate_resource_accession_id: UUID,
+    data_type: DataOutputTypeEnum,
+    entry: _PlateEntry,
+  ) -> None:
+    """Load every well of one data type on the plate into grids (cold path)."""
+    query = (
+      select(WellDataOutput)
+      .join(FunctionDataOutput)
+      .options(contains_eager(WellDataOutput.function_data_output))
+      .filter(
+        and_(
+          WellDataOutput.plate_resource_accession_id == plate_resource_accession_id,
+          FunctionDataOutput.data_type == data_type,
+        ),
+      )
+    )
+    result = await db.execute(query)
+    for well in result.scalars().all():
+      grid = entry.grids.get(well.function_data_output_accession_id)
+      if grid is None:
+        grid = self._new_grid(
+          entry,
+          plate_resource_accession_id,
+          well.function_data_output_accession_id,
+          data_type,
+          well.function_data_output,
+        )
+      grid.add_wells([(*_well_position(well), well.data_value)])
+    entry.loaded_data_types.add(_type_key(data_type))
+
+  async def _resolve_pending(
+    self,
+    db: AsyncSession,
+    plate_resource_accession_id: UUID,
+    entry: _PlateEntry,
+  ) -> None:
+    """Attach parked well values to grids, fetching parent metadata once.
+
+    Values of data types that are not loaded yet are dropped, since their
+    rows are committed and the cold load of that type reads them.
+    """
+    if not entry.pending:
+      return
+    pending = dict(entry.pending)
+    entry.pending.clear()
+    result = await db.execute(
+      select(
+        FunctionDataOutput.accession_id,
+        FunctionDataOutput.data_type,
+        FunctionDataOutput.measurement_timestamp,
+        FunctionDataOutput.protocol_run_accession_id,
+        FunctionDataOutput.function_call_log_accession_id,
+      ).filter(FunctionDataOutput.accession_id.in_(list(pending))),
+    )
+    for output_id, data_type, timestamp, run_id, call_id in result.all():
+      if _type_key(data_type) not in entry.loaded_data_types:
+        continue
+      grid = entry.grids.get(output_id) or self._new_grid(
+        entry,
+        plate_resource_accession_id,
+        output_id,
+        data_type,
+        None,
+        timestamp=timestamp,
+        protocol_run_accession_id=run_id,
+        function_call_log_accession_id=call_id,
+      )
+      grid.add_wells(pending[output_id])
+
+  def _new_grid(
+    self,
+    entry: _PlateEntry,
+    plate_resource_accession_id: UUID,
+    function_data_output_accession_id: Any,
+    data_type: DataOutputTypeEnum | str,
+    function_data_output: FunctionDataOutput | None,
+    **overrides: Any,
+  ) -> PlateGrid:
+    grid = PlateGrid(
+      function_data_output_accession_id=function_data_output_accession_id,
+      plate_resource_accession_id=plate_resource_accession_id,
+      data_type=data_type,
+      measurement_timestamp=_as_utc(
+        overrides.get("timestamp", getattr(function_data_output, "measurement_timestamp", None)),
+      ),
+      rows=int(entry.layout["rows"]),
+      columns=int(entry.layout["columns"]),
+      protocol_run_accession_id=overrides.get(
+        "protocol_run_accession_id",
+        getattr(function_data_output, "protocol_run_accession_id", None),
+      ),
+      function_call_log_accession_id=overrides.get(
+        "function_call_log_accession_id",
+        getattr(function_data_output, "function_call_log_accession_id", None),
+      ),
+    )
+    entry.grids[function_data_output_accession_id] = grid
+    return grid
+
+  async def get_layout(self, db: AsyncSession, plate_resource_accession_id: UUID) -> dict[str, Any]:
+    """Return the cached plate layout, loading it on first access."""
+    entry = await self._get_entry(db, plate_resource_accession_id)
+    return dict(entry.layout)
+
+  async def get_grids(
+    self,
+    db: AsyncSession,
+    plate_resource_accession_id: UUID,
+    data_type: DataOutputTypeEnum,
+    protocol_run_accession_id: UUID | None = None,
+    function_call_log_accession_id: UUID | None = None,
+  ) -> list[PlateGrid]:
+    """Return the plate's grids of one data type, newest first.
+
+    Args:
+      db: Database session, used only on a cold load or to resolve new outputs.
+      plate_resource_accession_id: Plate resource ID.
+      data_type: Data output type to select.
+      protocol_run_accession_id: Optional protocol run filter.
+      function_call_log_accession_id: Optional function call filter.
+
+    Returns:
+      Matching grids ordered by measurement timestamp, most recent first.
+
+    """
+    entry = await self._get_entry(db, plate_resource_accession_id)
+    loaded = _type_key(data_type) in entry.loaded_data_types
+    if loaded:
+      self.hits += 1
+    else:
+      self.misses += 1
+    await self._resolve_pending(db, plate_resource_accession_id, entry)
+    if not loaded:
+      await self._load_data_type(db, plate_resource_accession_id, data_type, entry)
+
+    grids = [
+      grid
+      for grid in entry.grids.values()
+      if _type_key(grid.data_type) == _type_key(data_type)
+      and (
+        protocol_run_accession_id is None
+        or grid.protocol_run_accession_id == protocol_run_accession_id
+      )
+      and (
+        function_call_log_accession_id is None
+        or grid.function_call_log_accession_id == function_call_log_accession_id
+      )
+    ]
+    grids.sort(key=_timestamp_sort_key, reverse=True)
+    return grids
+
+
+def _well_position(well: WellDataOutput) -> tuple[int, int]:
+  """Return the (row, column) of a well, preferring its parsed name."""
+  try:
+    return parse_well_name(well.well_name)
+  except (TypeError, ValueError):
+    return int(well.well_row), int(well.well_column)
+
+
+def _as_utc(timestamp: datetime | None) -> datetime | None:
+  """Treat naive timestamps (as returned by SQLite) as UTC so grids stay comparable."""
+  if isinstance(timestamp, datetime) and timestamp.tzinfo is None:
+    return timestamp.replace(tzinfo=timezone.utc)
+  return timestamp
+
+
+def _timestamp_sort_key(grid: PlateGrid) -> tuple[bool, datetime]:
+  """Order grids by timestamp, placing grids without one first."""
+  timestamp = grid.measurement_timestamp
+  return (timestamp is not None, timestamp or datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _type_key(data_type: DataOutputTypeEnum | str) -> str:
+  return data_type.value if isinstance(data_type, DataOutputTypeEnum) else str(data_type)
+
+
+def _version_key(plate_resource_accession_id: UUID) -> str:
+  return f"{VERSION_KEY_PREFIX}{plate_resource_accession_id}"
+
+
+def _written_wells(result: Any) -> list[WellDataOutput]:
+  if result is None:
+    return []
+  return list(result) if isinstance(result, list) else [result]
+
+
+def records_well_outputs(func: F) -> F:
+  """Fold the well outputs created by ``func`` into the shared cache.
+
+  Apply on top of ``handle_db_transaction`` so the cache only sees committed rows.
+  """
+
+  @wraps(func)
+  async def wrapper(*args: Any, **kwargs: Any) -> Any:
+    result = await func(*args, **kwargs)
+    await plate_aggregate_cache.record_well_outputs(_written_wells(result))
+    return result
+
+  return cast("F", wrapper)
+
+
+def invalidates_plates(func: F) -> F:
+  """Invalidate the plates of the well outputs changed or deleted by ``func``.
+
+  Apply on top of ``handle_db_transaction`` so other processes cannot reload
+  the plate before the change is committed.
+  """
+
+  @wraps(func)
+  async def wrapper(*args: Any, **kwargs: Any) -> Any:
+    result = await func(*args, **kwargs)
+    for plate_resource_accession_id in {
+      w.plate_resource_accession_id for w in _written_wells(result)
+    }:
+      await plate_aggregate_cache.invalidate_plate(plate_resource_accession_id)
+    return result
+
+  return cast("F", wrapper)
+
+
+def configure_plate_aggregate_cache(kv_store: KeyValueStore) -> PlateAggregateCache:
+  """Keep the shared cache's plate versions in ``kv_store`` (called at application startup)."""
+  plate_aggregate_cache.kv_store = kv_store
+  plate_aggregate_cache.clear()
+  return plate_aggregate_cache
+
+
+plate_aggregate_cache = PlateAggregateCache()
@@ -10,20 +10,21 @@ attribution, spatial context, and data visualization.
 from functools import partial
 from uuid import UUID
 
-from sqlalchemy import and_, select
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from praxis.backend.models.domain.outputs import (
-  FunctionDataOutput,
+  PlateDataAggregate,
 )
 from praxis.backend.models.domain.outputs import (
   PlateDataVisualization,
 )
-from praxis.backend.models.domain.outputs import (
-  WellDataOutput,
+from praxis.backend.models.enums import DataOutputTypeEnum, PlateAggregationEnum
+from praxis.backend.services.plate_aggregate_cache import (
+  aggregate_grids,
+  grid_to_rows,
+  plate_aggregate_cache,
 )
-from praxis.backend.models.enums import DataOutputTypeEnum
-from praxis.backend.services.resource import resource_service
 from praxis.backend.utils.logging import get_logger, log_async_runtime_errors
 
 logger = get_logger(__name__)
@@ -46,6 +47,9 @@ async def read_plate_data_visualization(
 ) -> PlateDataVisualization | None:
   """Get plate data formatted for visualization.
 
+  Answered from `plate_aggregate_cache`; the database is only queried the first
+  time a plate and data type are requested, or to attach newly written outputs.
+
   Args:
       db: Database session
       plate_resource_accession_id: Plate resource ID
@@ -57,69 +61,27 @@ async def read_plate_data_visualization(
       Plate data visualization model or None if no data found
 
   """
-  # Build query for well data
-  query = (
-    select(WellDataOutput)
-    .join(FunctionDataOutput)
-    .filter(
-      and_(
-        WellDataOutput.plate_resource_accession_id == plate_resource_accession_id,
-        FunctionDataOutput.data_type == data_type,
-      ),
-    )
+  grids = await plate_aggregate_cache.get_grids(
+    db,
+    plate_resource_accession_id,
+    data_type,
+    protocol_run_accession_id=protocol_run_accession_id,
+    function_call_log_accession_id=function_call_log_accession_id,
   )
-
-  if protocol_run_accession_id:
-    query = query.filter(
-      FunctionDataOutput.protocol_run_accession_id == protocol_run_accession_id,
-    )
-
-  if function_call_log_accession_id:
-    query = query.filter(
-      FunctionDataOutput.function_call_log_accession_id == function_call_log_accession_id,
-    )
-
-  query = query.order_by(FunctionDataOutput.measurement_timestamp.desc())
-
-  result = await db.execute(query)
-  well_data_list = list(result.scalars().all())
-
-  if not well_data_list:
+  if not grids:
     return None
 
-  # Get plate information
-  resource = await resource_service.get(db, plate_resource_accession_id)
-  plate_layout = {"rows": 8, "columns": 12, "total_wells": 96, "format": "96-well"}
-
-  if resource and resource.resource_definition and resource.resource_definition.properties_json:
-    try:
-      # Safely extract dimensions from resource definition metadata
-      metadata = resource.resource_definition.properties_json
-      num_items_x = metadata.get("num_items_x")
-      num_items_y = metadata.get("num_items_y")
-
-      if num_items_x and num_items_y:
-        plate_layout = {
-          "rows": num_items_y,
-          "columns": num_items_x,
-          "total_wells": num_items_x * num_items_y,
-          "format": f"{num_items_x * num_items_y}-well",
-        }
-    except (AttributeError, KeyError) as e:
-      logger.warning(
-        "Could not parse plate geometry from resource definition for plate "
-        f"{plate_resource_accession_id}. Error: {e}",
-      )
+  plate_layout = await plate_aggregate_cache.get_layout(db, plate_resource_accession_id)
 
   # Calculate data range for visualization scaling
-  values = [wd.data_value for wd in well_data_list if wd.data_value is not None]
+  summaries = [s for s in (g.summary() for g in grids) if s["count"]]
   data_range = {
-    "min": float(min(values)) if values else 0.0,
-    "max": float(max(values)) if values else 1.0,
+    "min": float(min(s["min"] for s in summaries)) if summaries else 0.0,
+    "max": float(max(s["max"] for s in summaries)) if summaries else 1.0,
   }
 
   # Get measurement timestamp (from most recent)
-  measurement_timestamp = well_data_list[0].function_data_output.measurement_timestamp
+  measurement_timestamp = grids[0].measurement_timestamp
 
   return PlateDataVisualization(
     plate_resource_accession_id=plate_resource_accession_id,
@@ -131,3 +93,55 @@ async def read_plate_data_visualization(
     data_range=data_range,
     units=None,  # Get from data output if available
   )
+
+
+async def read_plate_data_aggregate(
+  db: AsyncSession,
+  plate_resource_accession_id: UUID,
+  data_type: DataOutputTypeEnum,
+  method: PlateAggregationEnum = PlateAggregationEnum.LATEST,
+  protocol_run_accession_id: UUID | None = None,
+  function_call_log_accession_id: UUID | None = None,
+) -> PlateDataAggregate | None:
+  """Reduce every timepoint of a plate's data to a single per-well grid.
+
+  Args:
+      db: Database session
+      plate_resource_accession_id: Plate resource ID
+      data_type: Type of data to aggregate
+      method: Per-well reduction across timepoints
+      protocol_run_accession_id: Optional protocol run filter
+      function_call_log_accession_id: Optional function call filter
+
+  Returns:
+      Aggregated plate grid or None if no data found
+
+  """
+  grids = await plate_aggregate_cache.get_grids(
+    db,
+    plate_resource_accession_id,
+    data_type,
+    protocol_run_accession_id=protocol_run_accession_id,
+    function_call_log_accession_id=function_call_log_accession_id,
+  )
+  if not grids:
+    return None
+
+  aggregated = aggregate_grids(grids, method)
+  finite = aggregated[~np.isnan(aggregated)]
+  timestamps = [g.measurement_timestamp for g in grids if g.measurement_timestamp is not None]
+
+  return PlateDataAggregate(
+    plate_resource_accession_id=plate_resource_accession_id,
+    data_type=data_type,
+    method=method,
+    timepoint_count=len(grids),
+    first_timestamp=min(timestamps) if timestamps else None,
+    last_timestamp=max(timestamps) if timestamps else None,
+    plate_layout=await plate_aggregate_cache.get_layout(db, plate_resource_accession_id),
+    grid=grid_to_rows(aggregated),
+    data_range={
+      "min": float(finite.min()) if finite.size else 0.0,
+      "max": float(finite.max()) if finite.size else 1.0,
+    },
+  )
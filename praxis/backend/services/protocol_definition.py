@@ -1,10 +1,17 @@
 """Service layer for Protocol Definition management."""
 
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.protocol import (
@@ -33,9 +40,140 @@ from praxis.backend.models.domain.protocol_source import (
 from praxis.backend.services.utils.crud_base import CRUDBase
 from praxis.backend.utils.db_decorator import handle_db_transaction
 from praxis.backend.utils.logging import get_logger
+from praxis.backend.utils.uuid import uuid7
 
 logger = get_logger(__name__)
 
+# Rows per multi-row INSERT statement; keeps bound parameters well under the
+# SQLite (32766) and PostgreSQL (65535) limits for the child tables.
+BULK_UPSERT_BATCH_SIZE = 500
+
+# Columns managed by the database or by the upsert itself rather than by callers.
+_CHILD_MANAGED_COLUMNS = frozenset(
+  {"accession_id", "created_at", "updated_at", "protocol_definition_accession_id"},
+)
+
+_DEFINITION_NON_SCALAR_FIELDS = frozenset(
+  {
+    "source_repository_name",
+    "file_system_source_name",
+    "accession_id",
+    "created_at",
+    "updated_at",
+    "assets",
+    "parameters",
+  },
+)
+
+
+@dataclass
+class ProtocolDefinitionUpsertResult:
+  """Outcome of `ProtocolDefinitionCRUDService.bulk_upsert`."""
+
+  created: list[FunctionProtocolDefinition] = field(default_factory=list)
+  updated: list[FunctionProtocolDefinition] = field(default_factory=list)
+  unchanged: list[FunctionProtocolDefinition] = field(default_factory=list)
+
+  @property
+  def definitions(self) -> list[FunctionProtocolDefinition]:
+    """All definitions touched by the upsert, written or skipped."""
+    return [*self.created, *self.updated, *self.unchanged]
+
+
+def _child_value_columns(model: type[Any]) -> dict[str, Any]:
+  """Return the caller-supplied columns of a child table mapped to their defaults."""
+  return {
+    column.name: model.model_fields[column.name].get_default(call_default_factory=True)
+    for column in model.__table__.columns
+    if column.name not in _CHILD_MANAGED_COLUMNS
+  }
+
+
+def _normalize_child_values(
+  model: type[Any],
+  data: BaseModel | dict[str, Any],
+  renamed: dict[str, str],
+) -> dict[str, Any]:
+  """Convert parameter/asset input into a complete row of ORM column values.
+
+  Pydantic field names are mapped to their ORM column names, fields without a
+  column are dropped, and missing or null values for non-nullable columns fall
+  back to the column default so every row has the same shape.
+  """
+  raw = (
+    data.model_dump(exclude={"accession_id", "created_at", "updated_at"})
+    if isinstance(data, BaseModel)
+    else dict(data)
+  )
+  for source, target in renamed.items():
+    if source in raw:
+      raw[target] = raw.pop(source)
+
+  values = _child_value_columns(model)
+  columns = model.__table__.columns
+  for name in values:
+    value = raw.get(name)
+    if value is None and not columns[name].nullable:
+      continue
+    if name == "default_value_repr" and value is not None and not isinstance(value, str):
+      value = str(value)
+    values[name] = value
+  return values
+
+
+def _parameter_values(data: BaseModel | dict[str, Any]) -> dict[str, Any]:
+  return _normalize_child_values(
+    ParameterDefinition,
+    data,
+    {
+      "constraints": "constraints_json",
+      "ui_hint": "ui_hint_json",
+      "itemized_spec": "itemized_spec_json",
+    },
+  )
+
+
+def _asset_values(data: BaseModel | dict[str, Any]) -> dict[str, Any]:
+  return _normalize_child_values(
+    AssetRequirement,
+    data,
+    {"constraints": "constraints_json", "location_constraints": "location_constraints_json"},
+  )
+
+
+def _diff_children(
+  definition_accession_id: UUID,
+  current: Iterable[Any],
+  desired: Iterable[dict[str, Any]],
+  now: datetime,
+) -> tuple[list[dict[str, Any]], list[UUID]]:
+  """Diff child rows by their natural key (definition, name).
+
+  Returns:
+    The rows to insert or update, and the accession IDs of rows to delete.
+    Rows whose values already match are omitted entirely.
+
+  """
+  current_by_name = {row.name: row for row in current}
+  desired_by_name = {values["name"]: values for values in desired}
+
+  upserts: list[dict[str, Any]] = []
+  for name, values in desired_by_name.items():
+    row = current_by_name.get(name)
+    if row is not None and all(getattr(row, key) == value for key, value in values.items()):
+      continue
+    upserts.append(
+      {
+        **values,
+        "accession_id": row.accession_id if row is not None else uuid7(),
+        "protocol_definition_accession_id": definition_accession_id,
+        "created_at": row.created_at if row is not None else now,
+        "updated_at": now,
+      },
+    )
+  stale = [row.accession_id for name, row in current_by_name.items() if name not in desired_by_name]
+  return upserts, stale
+
 
 class ProtocolDefinitionCRUDService(
   CRUDBase[
@@ -76,33 +214,14 @@ class ProtocolDefinitionCRUDService(
     parameters: list[ParameterMetadataModel] | list[dict[str, Any]],
   ) -> None:
     """Update parameters for a protocol definition (replace all)."""
-    # Create new ORM objects
-    new_params = []
-    for param_data in parameters:
-      # efficient data handling whether it's model or dict
-      param_dict = (
-        param_data.model_dump(exclude={"accession_id", "created_at", "updated_at"})
-        if isinstance(param_data, BaseModel)
-        else param_data
-      )
-
-      # Map pydantic field names to ORM field names
-      if "constraints" in param_dict:
-        param_dict["constraints_json"] = param_dict.pop("constraints")
-      if "ui_hint" in param_dict:
-        param_dict["ui_hint_json"] = param_dict.pop("ui_hint")
-      if "itemized_spec" in param_dict:
-        param_dict["itemized_spec_json"] = param_dict.pop("itemized_spec")
-
-      param_model = ParameterDefinition(
+    protocol_def.parameters = [
+      ParameterDefinition(
         protocol_definition_accession_id=protocol_def.accession_id,
         protocol_definition=protocol_def,
-        **param_dict,
+        **_parameter_values(param_data),
       )
-      new_params.append(param_model)
-
-    # Replace existing collection
-    protocol_def.parameters = new_params
+      for param_data in parameters
+    ]
 
   def _update_assets(
     self,
@@ -110,31 +229,14 @@ class ProtocolDefinitionCRUDService(
     assets: list[AssetRequirementModel] | list[dict[str, Any]],
   ) -> None:
     """Update assets for a protocol definition (replace all)."""
-    new_assets = []
-    for asset_data in assets:
-      asset_dict = (
-        asset_data.model_dump(exclude={"accession_id", "created_at", "updated_at"})
-        if isinstance(asset_data, BaseModel)
-        else asset_data
-      )
-
-      # Map pydantic field names to ORM field names
-      if "constraints" in asset_dict:
-        asset_dict["constraints_json"] = asset_dict.pop("constraints")
-      if "location_constraints" in asset_dict:
-        asset_dict["location_constraints_json"] = asset_dict.pop("location_constraints")
-      # Remove any pydantic-only fields not in ORM
-      asset_dict.pop("ui_hints", None)
-
-      asset_model = AssetRequirement(
+    protocol_def.assets = [
+      AssetRequirement(
         protocol_definition_accession_id=protocol_def.accession_id,
         protocol_definition=protocol_def,
-        **asset_dict,
+        **_asset_values(asset_data),
       )
-      new_assets.append(asset_model)
-
-    # Replace existing collection
-    protocol_def.assets = new_assets
+      for asset_data in assets
+    ]
 
   @handle_db_transaction
   async def create(
@@ -345,6 +447,250 @@ class ProtocolDefinitionCRUDService(
     )
     return updated_obj
 
+  @handle_db_transaction
+  async def bulk_upsert(
+    self,
+    db: AsyncSession,
+    *,
+    definitions: Sequence[FunctionProtocolDefinitionCreate],
+  ) -> ProtocolDefinitionUpsertResult:
+    """Create or update many protocol definitions in one transaction.
+
+    Existing definitions are matched by FQN and loaded with a single query.
+    Definitions whose ``source_hash`` matches the stored hash are skipped.
+    Parameters and assets of the remaining definitions are diffed against the
+    stored rows by their natural key ``(protocol_definition_accession_id, name)``
+    and only changed rows are written, using multi-row
+    ``INSERT ... ON CONFLICT DO UPDATE`` statements and one ``DELETE`` per
+    child table for rows that disappeared.
+
+    Args:
+      db: Database session.
+      definitions: Definitions to upsert. Later entries win on duplicate FQNs.
+
+    Returns:
+      The created, updated and unchanged definitions, with relationships loaded.
+
+    """
+    by_fqn = {definition.fqn: definition for definition in definitions}
+    result = ProtocolDefinitionUpsertResult()
+    if not by_fqn:
+      return result
+
+    repositories, file_system_sources = await self._resolve_sources(db, by_fqn.values())
+    existing = await self._load_by_fqns(db, by_fqn)
+
+    written: list[tuple[FunctionProtocolDefinition, FunctionProtocolDefinitionCreate, bool]] = []
+    for fqn, obj_in in by_fqn.items():
+      current = existing.get(fqn)
+      if current is not None and obj_in.source_hash and current.source_hash == obj_in.source_hash:
+        result.unchanged.append(current)
+        continue
+
+      repository = repositories.get(obj_in.source_repository_name or "")
+      file_system_source = file_system_sources.get(obj_in.file_system_source_name or "")
+      if not obj_in.source_repository_name and not obj_in.file_system_source_name:
+        repository = repositories["default_test_repo"]
+        file_system_source = file_system_sources["default_test_fs"]
+
+      if current is None:
+        current = FunctionProtocolDefinition(
+          **obj_in.model_dump(exclude=_DEFINITION_NON_SCALAR_FIELDS),
+          source_repository_accession_id=repository.accession_id if repository else None,
+          file_system_source_accession_id=file_system_source.accession_id
+          if file_system_source
+          else None,
+        )
+        db.add(current)
+        result.created.append(current)
+        written.append((current, obj_in, True))
+        continue
+
+      columns = self.model.__table__.columns
+      for key, value in obj_in.model_dump(
+        exclude=_DEFINITION_NON_SCALAR_FIELDS,
+        exclude_unset=True,
+      ).items():
+        if key in columns:
+          setattr(current, key, value)
+      if repository is not None:
+        current.source_repository_accession_id = repository.accession_id
+      if file_system_source is not None:
+        current.file_system_source_accession_id = file_system_source.accession_id
+      result.updated.append(current)
+      written.append((current, obj_in, False))
+
+    if not written:
+      logger.info("Bulk upsert skipped %d unchanged protocol definition(s).", len(result.unchanged))
+      return result
+
+    # Parent rows are flushed together so the child rows can reference them.
+    await db.flush()
+    await self._write_children(db, written)
+
+    reloaded = await self._load_by_fqns(db, [definition.fqn for definition, _, _ in written])
+    result.created = [reloaded[definition.fqn] for definition in result.created]
+    result.updated = [reloaded[definition.fqn] for definition in result.updated]
+
+    logger.info(
+      "Bulk upsert of protocol definitions: %d created, %d updated, %d unchanged.",
+      len(result.created),
+      len(result.updated),
+      len(result.unchanged),
+    )
+    return result
+
+  async def _resolve_sources(
+    self,
+    db: AsyncSession,
+    definitions: Iterable[FunctionProtocolDefinitionCreate],
+  ) -> tuple[dict[str, ProtocolSourceRepository], dict[str, FileSystemProtocolSource]]:
+    """Look up (or create) every source named by ``definitions`` in one query per table."""
+    repository_names: set[str] = set()
+    file_system_names: set[str] = set()
+    for definition in definitions:
+      if definition.source_repository_name:
+        repository_names.add(definition.source_repository_name)
+      if definition.file_system_source_name:
+        file_system_names.add(definition.file_system_source_name)
+      if not definition.source_repository_name and not definition.file_system_source_name:
+        repository_names.add("default_test_repo")
+        file_system_names.add("default_test_fs")
+
+    repositories: dict[str, ProtocolSourceRepository] = {}
+    if repository_names:
+      rows = await db.execute(
+        select(ProtocolSourceRepository).filter(
+          ProtocolSourceRepository.name.in_(repository_names),
+        ),
+      )
+      repositories = {repo.name: repo for repo in rows.scalars().all()}
+
+    file_system_sources: dict[str, FileSystemProtocolSource] = {}
+    if file_system_names:
+      rows = await db.execute(
+        select(FileSystemProtocolSource).filter(
+          FileSystemProtocolSource.name.in_(file_system_names),
+        ),
+      )
+      file_system_sources = {source.name: source for source in rows.scalars().all()}
+
+    for name in sorted(repository_names - repositories.keys()):
+      logger.warning("Source repository '%s' not found, creating default", name)
+      git_url = (
+        "https://github.com/test/default.git"
+        if name == "default_test_repo"
+        else f"https://github.com/default/{name}.git"
+      )
+      repositories[name] = ProtocolSourceRepository(name=name, git_url=git_url)
+      db.add(repositories[name])
+
+    for name in sorted(file_system_names - file_system_sources.keys()):
+      logger.warning("File system source '%s' not found, creating default", name)
+      base_path = "/test/protocols" if name == "default_test_fs" else "/default/protocols"
+      file_system_sources[name] = FileSystemProtocolSource(name=name, base_path=base_path)
+      db.add(file_system_sources[name])
+
+    return repositories, file_system_sources
+
+  async def _load_by_fqns(
+    self,
+    db: AsyncSession,
+    fqns: Iterable[str],
+  ) -> dict[str, FunctionProtocolDefinition]:
+    """Load definitions (with relationships) for many FQNs, keyed by FQN."""
+    fqn_list = list(fqns)
+    loaded: dict[str, FunctionProtocolDefinition] = {}
+    for start in range(0, len(fqn_list), BULK_UPSERT_BATCH_SIZE):
+      stmt = (
+        select(self.model)
+        .where(self.model.fqn.in_(fqn_list[start : start + BULK_UPSERT_BATCH_SIZE]))
+        .options(
+          selectinload(self.model.parameters),
+          selectinload(self.model.assets),
+          selectinload(self.model.source_repository),
+          selectinload(self.model.file_system_source),
+        )
+        .execution_options(populate_existing=True)
+      )
+      rows = await db.execute(stmt)
+      loaded.update({definition.fqn: definition for definition in rows.scalars().all()})
+    return loaded
+
+  async def _write_children(
+    self,
+    db: AsyncSession,
+    written: Sequence[tuple[FunctionProtocolDefinition, FunctionProtocolDefinitionCreate, bool]],
+  ) -> None:
+    """Diff and write parameter/asset rows for the definitions being written."""
+    now = datetime.now(timezone.utc)
+    parameter_rows: list[dict[str, Any]] = []
+    asset_rows: list[dict[str, Any]] = []
+    stale_parameters: list[UUID] = []
+    stale_assets: list[UUID] = []
+
+    for definition, obj_in, is_new in written:
+      if obj_in.parameters is not None:
+        rows, stale = _diff_children(
+          definition.accession_id,
+          [] if is_new else definition.parameters,
+          [_parameter_values(parameter) for parameter in obj_in.parameters],
+          now,
+        )
+        parameter_rows.extend(rows)
+        stale_parameters.extend(stale)
+      if obj_in.assets is not None:
+        rows, stale = _diff_children(
+          definition.accession_id,
+          [] if is_new else definition.assets,
+          [_asset_values(asset) for asset in obj_in.assets],
+          now,
+        )
+        asset_rows.extend(rows)
+        stale_assets.extend(stale)
+
+    for model, stale_ids in (
+      (ParameterDefinition, stale_parameters),
+      (AssetRequirement, stale_assets),
+    ):
+      for start in range(0, len(stale_ids), BULK_UPSERT_BATCH_SIZE):
+        await db.execute(
+          delete(model)
+          .where(model.accession_id.in_(stale_ids[start : start + BULK_UPSERT_BATCH_SIZE]))
+          .execution_options(synchronize_session=False),
+        )
+
+    await self._upsert_rows(db, ParameterDefinition, parameter_rows)
+    await self._upsert_rows(db, AssetRequirement, asset_rows)
+
+    logger.debug(
+      "Wrote %d parameter and %d asset row(s); deleted %d and %d.",
+      len(parameter_rows),
+      len(asset_rows),
+      len(stale_parameters),
+      len(stale_assets),
+    )
+
+  async def _upsert_rows(
+    self,
+    db: AsyncSession,
+    model: type[Any],
+    rows: Sequence[dict[str, Any]],
+  ) -> None:
+    """Write child rows with multi-row INSERT ... ON CONFLICT on their natural key."""
+    if not rows:
+      return
+    dialect = db.get_bind().dialect.name
+    insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+    update_columns = [name for name in rows[0] if name not in {"accession_id", "created_at"}]
+    for start in range(0, len(rows), BULK_UPSERT_BATCH_SIZE):
+      stmt = insert(model.__table__).values(list(rows[start : start + BULK_UPSERT_BATCH_SIZE]))
+      stmt = stmt.on_conflict_do_update(
+        index_elements=["protocol_definition_accession_id", "name"],
+        set_={name: stmt.excluded[name] for name in update_columns},
+      )
+      await db.execute(stmt)
+
   async def get_by_name(
     self,
     db: AsyncSession,
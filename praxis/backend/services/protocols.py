@@ -21,6 +21,7 @@ from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from praxis.backend.core.storage.protocols import KeyValueStore
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.protocol import (
   FunctionCallLog,
@@ -30,6 +31,7 @@ from praxis.backend.models.domain.protocol import (
   ProtocolRunUpdate,
 )
 from praxis.backend.models.enums import FunctionCallStatusEnum, ProtocolRunStatusEnum
+from praxis.backend.services.run_progress import read_run_progress
 from praxis.backend.services.utils.crud_base import CRUDBase
 from praxis.backend.services.utils.query_builder import (
   apply_date_range_filters,
@@ -160,8 +162,13 @@ class ProtocolRunService(CRUDBase[ProtocolRun, ProtocolRunCreate, ProtocolRunUpd
   async def get_protocol_run_status(
     self,
     protocol_run_id: uuid.UUID,
+    progress_store: KeyValueStore | None = None,
   ) -> dict[str, Any] | None:
-    """Get the current status of a protocol run, including real-time state."""
+    """Get the current status of a protocol run, including real-time state.
+
+    The progress estimate published by the executing process is included as
+    ``progress_estimate`` when ``progress_store`` is given.
+    """
     from praxis.backend.utils.db import AsyncSessionLocal
 
     async with AsyncSessionLocal() as db:
@@ -204,6 +211,12 @@ class ProtocolRunService(CRUDBase[ProtocolRun, ProtocolRunCreate, ProtocolRunUpd
             if isinstance(view, dict) and view.get("name") == "Deck View":
               status_info["plr_definition"] = view.get("data")
 
+      # Progress and ETA published by the process executing the run
+      if progress_store is not None:
+        estimate = await read_run_progress(progress_store, protocol_run_id)
+        if estimate is not None:
+          status_info["progress_estimate"] = estimate.to_dict()
+
       # Add cached real-time state
       cached_state = self.get_active_run_state(protocol_run_id)
       if cached_state:
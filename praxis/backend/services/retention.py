@@ -0,0 +1,579 @@
+"""Retention and compaction of the append-only history tables.
+
+``function_call_logs``, ``schedule_history``, ``asset_reservations`` and
+``well_data_outputs`` only ever grow. The ``RetentionService`` keeps them
+bounded by moving rows older than a per-table retention period to cold storage:
+
+- function call logs keep their row (status, timing, duration and lineage stay
+  queryable for metrics and estimates) but their argument, return value, state
+  and traceback payloads are archived and cleared. ``properties_json`` records
+  the archive partition so the state history of an old run can still be
+  rebuilt with ``read_call_payloads``;
+- schedule history rows are archived and deleted; every event is already
+  counted in the ``ScheduleHistoryRollup`` rows, so ``get_scheduling_metrics``
+  stays answerable for any period and a pass that stops midway loses nothing.
+  Hourly rollups before the same cutoff are then deleted too, since the daily
+  rollups cover those days;
+- terminal (released, expired or failed) asset reservations are archived and
+  deleted;
+- well data outputs are archived and deleted only if a retention period is
+  configured, since they are experimental results (off by default).
+
+Cold storage is a directory of gzip JSON-lines files partitioned by table and
+month (function call logs additionally by run), e.g.
+``schedule_history/2026-01.jsonl.gz`` or
+``function_call_logs/2026-01/<run id>.jsonl.gz``. Files are written before the
+rows are changed, so a pass that fails before commit may archive a batch twice;
+readers keep the last record per accession ID.
+
+Cutoffs are floored to UTC midnight so a day is always compacted as a whole.
+Each table is processed in batches; the background compactor commits after
+every batch to keep transactions short.
+
+Every API worker may start the background compactor, but a pass only runs
+while it holds a lease in the shared ``KeyValueStore``. The lease is renewed
+before each batch is committed, so a compactor whose lease expired stops
+instead of racing the one that took over.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import json
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import bindparam, delete, null, or_, select, update
+
+from praxis.backend.configure import PraxisConfiguration
+from praxis.backend.models.domain.outputs import WellDataOutput
+from praxis.backend.models.domain.protocol import FunctionCallLog
+from praxis.backend.models.domain.schedule import (
+  AssetReservation,
+  ScheduleHistory,
+  ScheduleHistoryRollup,
+)
+from praxis.backend.models.enums import AssetReservationStatusEnum
+from praxis.backend.services.schedule_metrics import DAILY, HOURLY, as_utc, floor_to_bucket
+from praxis.backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+  from collections.abc import Iterable, Mapping, Sequence
+
+  from sqlalchemy import ColumnElement, Table
+  from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+  from praxis.backend.core.storage.protocols import KeyValueStore
+
+logger = get_logger(__name__)
+
+DEFAULT_RETENTION_DAYS: dict[str, int | None] = {
+  "function_call_logs": 180,
+  "schedule_history": 90,
+  "asset_reservations": 30,
+  "well_data_outputs": None,
+}
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_INITIAL_DELAY_SECONDS = 60.0
+
+COMPACTOR_LEASE_KEY = "retention:compactor"
+COMPACTOR_LEASE_SECONDS = 600
+
+ARCHIVE_MARKER = "archived_payload"
+
+CALL_PAYLOAD_COLUMNS = (
+  "input_args_json",
+  "return_value_json",
+  "state_before_json",
+  "state_after_json",
+  "error_traceback_text",
+)
+
+TERMINAL_RESERVATION_STATUSES = (
+  AssetReservationStatusEnum.RELEASED,
+  AssetReservationStatusEnum.EXPIRED,
+  AssetReservationStatusEnum.FAILED,
+)
+
+
+def _month(value: datetime) -> str:
+  return as_utc(value).strftime("%Y-%m")
+
+
+def _json_default(value: Any) -> Any:
+  if isinstance(value, Enum):
+    return value.value
+  if isinstance(value, datetime | date):
+    return value.isoformat()
+  if isinstance(value, uuid.UUID):
+    return str(value)
+  return str(value)
+
+
+# =============================================================================
+# Cold Storage
+# =============================================================================
+
+
+class ColdStorageArchive:
+  """Append-only gzip JSON-lines files under a root directory.
+
+  A partition name such as ``"schedule_history/2026-01"`` is stored as
+  ``{root}/schedule_history/2026-01.jsonl.gz``. Every append adds a gzip
+  member, which readers see as one continuous stream.
+  """
+
+  SUFFIX = ".jsonl.gz"
+
+  def __init__(self, root: str | Path) -> None:
+    """Initialize the archive rooted at ``root`` (created on first write).
+
+    Raises:
+        ValueError: If ``root`` is a relative path, which would depend on the
+            working directory the server happens to be started from.
+
+    """
+    self.root = Path(root)
+    if not self.root.is_absolute():
+      msg = f"Cold storage archive directory must be an absolute path, got '{root}'"
+      raise ValueError(msg)
+
+  def path(self, partition: str) -> Path:
+    """Return the file holding ``partition``."""
+    return self.root / f"{partition}{self.SUFFIX}"
+
+  def append(self, partition: str, records: Sequence[Mapping[str, Any]]) -> Path:
+    """Append records to a partition and return its path."""
+    path = self.path(partition)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "at", encoding="utf-8") as fh:
+      for record in records:
+        fh.write(json.dumps(record, default=_json_default, separators=(",", ":")) + "\n")
+    return path
+
+  def read(self, partition: str) -> list[dict[str, Any]]:
+    """Return every record of a partition ([] if it does not exist)."""
+    path = self.path(partition)
+    if not path.exists():
+      return []
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+      return [json.loads(line) for line in fh if line.strip()]
+
+  def partitions(self, table: str) -> list[str]:
+    """Return the partitions written for ``table``, oldest first."""
+    base = self.root / table
+    if not base.exists():
+      return []
+    return sorted(
+      str(path.relative_to(self.root))[: -len(self.SUFFIX)]
+      for path in base.rglob(f"*{self.SUFFIX}")
+    )
+
+
+# =============================================================================
+# Policy and Report
+# =============================================================================
+
+
+@dataclass
+class RetentionPolicy:
+  """Retention period in days per table (None keeps rows forever)."""
+
+  days: dict[str, int | None] = field(default_factory=lambda: dict(DEFAULT_RETENTION_DAYS))
+  batch_size: int = DEFAULT_BATCH_SIZE
+
+  @classmethod
+  def with_overrides(
+    cls,
+    overrides: Mapping[str, int | None],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+  ) -> RetentionPolicy:
+    """Return the default policy with some tables' retention replaced."""
+    unknown = set(overrides) - set(DEFAULT_RETENTION_DAYS)
+    if unknown:
+      msg = f"Unknown retention tables: {', '.join(sorted(unknown))}"
+      raise ValueError(msg)
+    return cls(days={**DEFAULT_RETENTION_DAYS, **overrides}, batch_size=batch_size)
+
+  def cutoff(self, table: str, now: datetime) -> datetime | None:
+    """Return the day before which rows of ``table`` are compacted, or None."""
+    days = self.days.get(table)
+    if days is None:
+      return None
+    return floor_to_bucket(now - timedelta(days=days), DAILY)
+
+
+@dataclass
+class RetentionReport:
+  """Outcome of one compaction pass."""
+
+  cutoffs: dict[str, datetime] = field(default_factory=dict)
+  rows: dict[str, int] = field(default_factory=dict)
+  partitions: set[str] = field(default_factory=set)
+
+  @property
+  def total_rows(self) -> int:
+    """Rows compacted across all tables."""
+    return sum(self.rows.values())
+
+
+class CompactorLeaseLostError(RuntimeError):
+  """The compactor lease expired or was taken over during a pass."""
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+
+class RetentionService:
+  """Compact history tables into cold storage according to a `RetentionPolicy`.
+
+  Usage:
+      service = RetentionService(ColdStorageArchive("/var/lib/praxis/archive"))
+      report = await service.run(db)  # flushes; the caller commits
+      service.start(AsyncSessionLocal, kv_store, interval_seconds=86400)  # background passes
+
+  """
+
+  def __init__(self, archive: ColdStorageArchive, policy: RetentionPolicy | None = None) -> None:
+    """Initialize the service with an archive and a policy (defaults if None)."""
+    self.archive = archive
+    self.policy = policy or RetentionPolicy()
+    self._task: asyncio.Task[None] | None = None
+    self._owner = str(uuid.uuid4())
+    self._lease: tuple[KeyValueStore, dict[str, Any]] | None = None
+
+  async def run(
+    self,
+    db: AsyncSession,
+    now: datetime | None = None,
+    *,
+    commit: bool = False,
+  ) -> RetentionReport:
+    """Run one compaction pass over every table with a retention period.
+
+    Args:
+        db: Session to compact with.
+        now: Reference time for the cutoffs (defaults to the current time).
+        commit: Commit after every batch instead of only flushing.
+
+    """
+    now = now or datetime.now(timezone.utc)
+    report = RetentionReport()
+    steps = {
+      "function_call_logs": self.compact_function_call_logs,
+      "schedule_history": self.purge_schedule_history,
+      "asset_reservations": self.purge_asset_reservations,
+      "well_data_outputs": self.purge_well_data_outputs,
+    }
+    for table, step in steps.items():
+      cutoff = self.policy.cutoff(table, now)
+      if cutoff is None:
+        continue
+      report.cutoffs[table] = cutoff
+      report.rows[table] = await step(db, cutoff, report, commit=commit)
+    if report.total_rows:
+      logger.info("Compacted history rows: %s", report.rows)
+    return report
+
+  async def compact_function_call_logs(
+    self,
+    db: AsyncSession,
+    cutoff: datetime,
+    report: RetentionReport,
+    *,
+    commit: bool = False,
+  ) -> int:
+    """Archive and clear the payloads of call logs created before ``cutoff``."""
+    table = FunctionCallLog.__table__
+    payload = [table.c[name] for name in CALL_PAYLOAD_COLUMNS]
+    stmt = (
+      select(
+        table.c.accession_id,
+        table.c.protocol_run_accession_id,
+        table.c.sequence_in_run,
+        table.c.created_at,
+        table.c.properties_json,
+        *payload,
+      )
+      .where(table.c.created_at < cutoff, or_(*(column.isnot(None) for column in payload)))
+      .order_by(table.c.created_at, table.c.accession_id)
+      .limit(self.policy.batch_size)
+    )
+    # Cleared with SQL NULL so the rows no longer match the selection above.
+    clear = (
+      update(table)
+      .where(table.c.accession_id == bindparam("b_accession_id"))
+      .values({name: null() for name in CALL_PAYLOAD_COLUMNS})
+    )
+
+    total = 0
+    while rows := (await db.execute(stmt)).mappings().all():
+      by_partition: dict[str, list[dict[str, Any]]] = defaultdict(list)
+      updates = []
+      for row in rows:
+        partition = (
+          f"function_call_logs/{_month(row['created_at'])}/{row['protocol_run_accession_id']}"
+        )
+        by_partition[partition].append(
+          {
+            "accession_id": row["accession_id"],
+            "sequence_in_run": row["sequence_in_run"],
+            **{name: row[name] for name in CALL_PAYLOAD_COLUMNS},
+          },
+        )
+        updates.append(
+          {
+            "b_accession_id": row["accession_id"],
+            "properties_json": {**(row["properties_json"] or {}), ARCHIVE_MARKER: partition},
+          },
+        )
+      await self._archive(by_partition, report)
+      await db.execute(clear, updates)
+      total += len(rows)
+      await self._end_batch(db, commit)
+    return total
+
+  async def purge_schedule_history(
+    self,
+    db: AsyncSession,
+    cutoff: datetime,
+    report: RetentionReport,
+    *,
+    commit: bool = False,
+  ) -> int:
+    """Archive and delete schedule history events created before ``cutoff``.
+
+    The daily rollups are left untouched: they counted these events when they
+    were logged (or when rollups were backfilled), so each batch can be
+    deleted on its own. Once no raw event before ``cutoff`` is left, the
+    hourly rollups of those days are deleted, which keeps the rollup table
+    growing by days rather than hours.
+    """
+    table = ScheduleHistory.__table__
+    total = await self._archive_and_delete(
+      db, table, table.c.created_at < cutoff, report, commit=commit
+    )
+    result = await db.execute(
+      delete(ScheduleHistoryRollup).where(
+        ScheduleHistoryRollup.bucket_seconds == HOURLY,
+        ScheduleHistoryRollup.bucket_start < cutoff,
+      ),
+    )
+    report.rows["schedule_history_rollups"] = result.rowcount or 0
+    await self._end_batch(db, commit)
+    return total
+
+  async def purge_asset_reservations(
+    self,
+    db: AsyncSession,
+    cutoff: datetime,
+    report: RetentionReport,
+    *,
+    commit: bool = False,
+  ) -> int:
+    """Archive and delete terminal reservations created before ``cutoff``."""
+    table = AssetReservation.__table__
+    where = (table.c.created_at < cutoff) & table.c.status.in_(TERMINAL_RESERVATION_STATUSES)
+    return await self._archive_and_delete(db, table, where, report, commit=commit)
+
+  async def purge_well_data_outputs(
+    self,
+    db: AsyncSession,
+    cutoff: datetime,
+    report: RetentionReport,
+    *,
+    commit: bool = False,
+  ) -> int:
+    """Archive and delete well data outputs created before ``cutoff``."""
+    table = WellDataOutput.__table__
+    return await self._archive_and_delete(
+      db, table, table.c.created_at < cutoff, report, commit=commit
+    )
+
+  async def read_call_payloads(self, partitions: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Return archived call log payloads by accession ID (as a string)."""
+
+    def load() -> dict[str, dict[str, Any]]:
+      payloads: dict[str, dict[str, Any]] = {}
+      for partition in sorted(set(partitions)):
+        for record in self.archive.read(partition):
+          payloads[record["accession_id"]] = record
+      return payloads
+
+    return await asyncio.to_thread(load)
+
+  # ---------------------------------------------------------------------------
+  # Background compaction
+  # ---------------------------------------------------------------------------
+
+  def start(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    kv_store: KeyValueStore,
+    interval_seconds: float,
+    initial_delay_seconds: float = DEFAULT_INITIAL_DELAY_SECONDS,
+  ) -> None:
+    """Run a compaction pass every ``interval_seconds`` in a background task.
+
+    Passes are coordinated through ``kv_store``: processes sharing it take
+    turns, and a pass is skipped while another process holds the lease.
+    """
+    if self._task is not None and not self._task.done():
+      return
+    self._task = asyncio.create_task(
+      self._run_periodically(session_factory, kv_store, interval_seconds, initial_delay_seconds),
+      name="history-compactor",
+    )
+
+  async def stop(self) -> None:
+    """Cancel the background task, if running."""
+    if self._task is None:
+      return
+    self._task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+      await self._task
+    self._task = None
+
+  async def run_exclusive(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    kv_store: KeyValueStore,
+    now: datetime | None = None,
+  ) -> RetentionReport | None:
+    """Run one committed pass while holding the compactor lease.
+
+    Returns:
+        The pass report, or None if another process holds the lease.
+
+    Raises:
+        CompactorLeaseLostError: If the lease was lost during the pass; the
+            batch in progress is rolled back.
+
+    """
+    lease = {"owner": self._owner, "acquired_at": datetime.now(timezone.utc).isoformat()}
+    if not await kv_store.compare_and_set(
+      COMPACTOR_LEASE_KEY, None, lease, COMPACTOR_LEASE_SECONDS
+    ):
+      logger.debug("Skipping history compaction: another process holds the lease.")
+      return None
+    self._lease = (kv_store, lease)
+    try:
+      async with session_factory() as db:
+        return await self.run(db, now, commit=True)
+    finally:
+      self._lease = None
+      await kv_store.compare_and_set(COMPACTOR_LEASE_KEY, lease, None)
+
+  async def _run_periodically(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    kv_store: KeyValueStore,
+    interval_seconds: float,
+    initial_delay_seconds: float,
+  ) -> None:
+    await asyncio.sleep(initial_delay_seconds)
+    while True:
+      try:
+        await self.run_exclusive(session_factory, kv_store)
+      except Exception:
+        logger.exception("History compaction pass failed")
+      await asyncio.sleep(interval_seconds)
+
+  # ---------------------------------------------------------------------------
+  # Helpers
+  # ---------------------------------------------------------------------------
+
+  async def _archive_and_delete(
+    self,
+    db: AsyncSession,
+    table: Table,
+    where: ColumnElement[bool],
+    report: RetentionReport,
+    *,
+    commit: bool = False,
+  ) -> int:
+    """Move rows matching ``where`` to monthly partitions of ``table``, batch by batch."""
+    stmt = (
+      select(table)
+      .where(where)
+      .order_by(table.c.created_at, table.c.accession_id)
+      .limit(self.policy.batch_size)
+    )
+    total = 0
+    while rows := (await db.execute(stmt)).mappings().all():
+      by_partition: dict[str, list[dict[str, Any]]] = defaultdict(list)
+      for row in rows:
+        by_partition[f"{table.name}/{_month(row['created_at'])}"].append(dict(row))
+      await self._archive(by_partition, report)
+      await db.execute(
+        delete(table).where(table.c.accession_id.in_([r["accession_id"] for r in rows]))
+      )
+      total += len(rows)
+      await self._end_batch(db, commit)
+    return total
+
+  async def _archive(
+    self,
+    by_partition: Mapping[str, Sequence[Mapping[str, Any]]],
+    report: RetentionReport,
+  ) -> None:
+    for partition, records in by_partition.items():
+      await asyncio.to_thread(self.archive.append, partition, records)
+      report.partitions.add(partition)
+
+  async def _end_batch(self, db: AsyncSession, commit: bool) -> None:
+    if commit:
+      await self._renew_lease()
+      await db.commit()
+    else:
+      await db.flush()
+
+  async def _renew_lease(self) -> None:
+    if self._lease is None:
+      return
+    kv_store, lease = self._lease
+    if not await kv_store.compare_and_set(
+      COMPACTOR_LEASE_KEY, lease, lease, COMPACTOR_LEASE_SECONDS
+    ):
+      msg = "History compactor lease was lost; stopping the pass."
+      raise CompactorLeaseLostError(msg)
+
+
+# =============================================================================
+# Shared Instance
+# =============================================================================
+
+_service: RetentionService | None = None
+
+
+def configure_retention_service(
+  archive_directory: str | Path,
+  days: Mapping[str, int | None] | None = None,
+  batch_size: int = DEFAULT_BATCH_SIZE,
+) -> RetentionService:
+  """Set the shared service (called at application startup)."""
+  global _service
+  policy = RetentionPolicy.with_overrides(days or {}, batch_size=batch_size)
+  _service = RetentionService(ColdStorageArchive(archive_directory), policy)
+  return _service
+
+
+def get_retention_service() -> RetentionService:
+  """Return the shared service, configured from ``praxis.ini`` if needed."""
+  global _service
+  if _service is None:
+    config = PraxisConfiguration()
+    _service = configure_retention_service(
+      config.retention_archive_directory,
+      config.retention_days,
+    )
+  return _service
@@ -0,0 +1,652 @@
+"""Live progress and ETA estimation for protocol runs.
+
+Progress is followed through the ``@protocol_function`` calls of a run, since
+those are the calls the decorator reports as they complete:
+
+- the expected sequence of calls is taken from the most recent completed run of
+  the same definition, with back-to-back repeats of a block of calls folded
+  into a loop;
+- a call's duration is the time from the previous completed call of its run
+  (its own duration for the first one), so the durations of a run add up to
+  its length even though protocol functions nest. A ``DurationModel`` keeps
+  per-function statistics of them, learned from the call logs of completed
+  runs and from the calls of runs as they complete;
+- calls observed during the run are matched onto the sequence, skipping calls
+  that were not observed and repeating loops that ran more often than before.
+
+A definition that has never completed a run is expected to make one call (its
+own) lasting ``DEFAULT_OPERATION_MS`` per machine call in its computation graph,
+with loop bodies repeated by their iteration count.
+
+``RunProgressTracker.estimate`` turns the position in the sequence into a
+fractional progress and an ETA with 90% bounds. The remaining calls are taken
+as independent, so their means and variances add, and the ETA is scaled by the
+run's pace: how long its matched calls took compared with their expectation.
+
+``run_progress`` holds the trackers of the runs this process executes. The
+orchestrator starts and finishes them and the ``@protocol_function`` decorator
+reports each completed call. Every change is published to the orchestrator's
+key-value store, where ``read_run_progress`` picks it up for the run status
+(and so the execution websocket) in any process. The scheduler uses
+``estimate_duration`` for queued runs.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from praxis.backend.models.domain.protocol import (
+  FunctionCallLog,
+  FunctionProtocolDefinition,
+  ProtocolRun,
+)
+from praxis.backend.models.enums import FunctionCallStatusEnum, ProtocolRunStatusEnum
+from praxis.backend.utils.logging import get_logger
+from praxis.backend.utils.plr_static_analysis.models import ProtocolComputationGraph
+
+if TYPE_CHECKING:
+  import uuid
+  from collections.abc import Callable
+
+  from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+  from praxis.backend.core.storage.protocols import KeyValueStore
+  from praxis.backend.utils.plr_static_analysis.models import LoopNode
+
+logger = get_logger(__name__)
+
+DEFAULT_OPERATION_MS = 1000.0  # Expected duration of a call nothing is known about
+DEFAULT_CV = 1.0  # Coefficient of variation assumed until a function has two samples
+PACE_PRIOR_MS = 30_000.0  # Expected time a run's pace is shrunk towards 1 with
+LOOKAHEAD_SEGMENTS = 32  # How far past the current step an observed call may match
+MAX_LOOP_BODY = 16  # Longest block of calls folded into a loop
+HISTORY_LIMIT = 10_000  # Most recent call logs learned from at startup
+Z_90 = 1.645  # Two-sided 90% normal quantile
+RUNNING_PROGRESS_CAP = 0.99  # A run that has not finished is never reported as done
+PROGRESS_KEY_PREFIX = "run_progress:"
+PROGRESS_TTL_SECONDS = 86_400  # Published estimates of abandoned runs expire
+
+
+# =============================================================================
+# Duration model
+# =============================================================================
+
+
+@dataclass
+class DurationStats:
+  """Running count, mean and variance of durations (Welford's algorithm)."""
+
+  count: int = 0
+  mean: float = 0.0
+  m2: float = 0.0
+
+  def add(self, value_ms: float) -> None:
+    """Add one duration, in ms."""
+    self.count += 1
+    delta = value_ms - self.mean
+    self.mean += delta / self.count
+    self.m2 += delta * (value_ms - self.mean)
+
+  @property
+  def variance(self) -> float:
+    """Sample variance, or a ``DEFAULT_CV`` spread around the mean below two samples."""
+    if self.count < 2:
+      return (self.mean * DEFAULT_CV) ** 2
+    return self.m2 / (self.count - 1)
+
+
+class DurationModel:
+  """Per-protocol-function duration statistics, keyed by function FQN."""
+
+  def __init__(self) -> None:
+    """Initialize an empty model."""
+    self.stats: dict[str, DurationStats] = {}
+
+  def observe(self, function: str, duration_ms: float) -> None:
+    """Record one call duration, in ms."""
+    self.stats.setdefault(function, DurationStats()).add(duration_ms)
+
+  def estimate(
+    self,
+    function: str,
+    default_ms: float = DEFAULT_OPERATION_MS,
+  ) -> tuple[float, float]:
+    """Return the expected duration and its variance for a call, in ms and ms²."""
+    stats = self.stats.get(function)
+    if stats is not None and stats.count:
+      return stats.mean, stats.variance
+    return default_ms, (default_ms * DEFAULT_CV) ** 2
+
+
+# =============================================================================
+# Expected call sequence
+# =============================================================================
+
+
+@dataclass
+class _Step:
+  function: str
+  mean: float
+  variance: float
+
+
+@dataclass
+class _Segment:
+  """Steps run ``repeat`` times: a loop body, or a single call."""
+
+  steps: list[_Step]
+  repeat: int
+  is_loop: bool
+  mean: float = 0.0
+  variance: float = 0.0
+  mean_prefix: list[float] = field(default_factory=list)
+  variance_prefix: list[float] = field(default_factory=list)
+
+  def __post_init__(self) -> None:
+    self.mean_prefix = [0.0]
+    self.variance_prefix = [0.0]
+    for step in self.steps:
+      self.mean_prefix.append(self.mean_prefix[-1] + step.mean)
+      self.variance_prefix.append(self.variance_prefix[-1] + step.variance)
+    self.mean = self.mean_prefix[-1]
+    self.variance = self.variance_prefix[-1]
+
+  def find(self, function: str, start: int = 0) -> int | None:
+    for index in range(start, len(self.steps)):
+      if self.steps[index].function == function:
+        return index
+    return None
+
+
+def fold_repeats(calls: list[str]) -> list[tuple[list[str], int]]:
+  """Split a call sequence into (block, repeat) runs.
+
+  At each position the block repeated back-to-back over the most calls is
+  folded, e.g. ``a b c b c b c d`` becomes ``(a)×1 (b c)×3 (d)×1``.
+  """
+  runs: list[tuple[list[str], int]] = []
+  i = 0
+  while i < len(calls):
+    best_length, best_repeat = 1, 1
+    for length in range(1, min(MAX_LOOP_BODY, (len(calls) - i) // 2) + 1):
+      block = calls[i : i + length]
+      repeat = 1
+      while calls[i + repeat * length : i + (repeat + 1) * length] == block:
+        repeat += 1
+      if repeat > 1 and length * repeat > best_length * best_repeat:
+        best_length, best_repeat = length, repeat
+    runs.append((calls[i : i + best_length], best_repeat))
+    i += best_length * best_repeat
+  return runs
+
+
+def _segments(calls: list[str], model: DurationModel, default_ms: float) -> list[_Segment]:
+  """Lay the expected calls out as the sequence of segments a run executes."""
+  return [
+    _Segment(
+      [_Step(function, *model.estimate(function, default_ms)) for function in block],
+      repeat,
+      is_loop=repeat > 1,
+    )
+    for block, repeat in fold_repeats(calls)
+  ]
+
+
+def graph_call_count(graph: ProtocolComputationGraph) -> int:
+  """Number of machine calls a run of ``graph`` makes, with loop bodies repeated."""
+  operations = {op.id: op for op in graph.operations}
+  loops = {loop.id: loop for loop in graph.loops}
+
+  def count(node_ids: list[str]) -> int:
+    total = 0
+    for node_id in node_ids:
+      if node_id in loops:
+        total += count(loops[node_id].body) * _iterations(loops[node_id])
+      elif node_id in operations:
+        op = operations[node_id]
+        total += 1 + count([child for child in op.foreach_body if child != op.id])
+    return total
+
+  if not graph.execution_order:
+    return len(graph.operations)
+  return count(graph.execution_order)
+
+
+def _iterations(loop: LoopNode) -> int:
+  if loop.iteration_count is not None:
+    return loop.iteration_count
+  return loop.max_iterations or 1
+
+
+# =============================================================================
+# Per-run tracking
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ProgressEstimate:
+  """Progress of a run and the estimated time remaining, in seconds."""
+
+  fraction: float  # 0-1
+  elapsed_s: float
+  remaining_s: float
+  remaining_low_s: float  # 90% bounds
+  remaining_high_s: float
+  steps_done: int
+  steps_total: int
+  calls_matched: int
+  calls_unmatched: int
+
+  def to_dict(self) -> dict[str, Any]:
+    """Return the estimate as a JSON-serializable dict."""
+    return asdict(self)
+
+  def advanced(self, seconds: float) -> ProgressEstimate:
+    """Return the estimate as it stands ``seconds`` later with no further calls."""
+    if seconds <= 0 or self.fraction >= 1.0:
+      return self
+    elapsed = self.elapsed_s + seconds
+    remaining = max(self.remaining_s - seconds, 0.0)
+    return replace(
+      self,
+      fraction=min(elapsed / (elapsed + remaining), RUNNING_PROGRESS_CAP),
+      elapsed_s=elapsed,
+      remaining_s=remaining,
+      remaining_low_s=max(self.remaining_low_s - seconds, 0.0),
+      remaining_high_s=max(self.remaining_high_s - seconds, 0.0),
+    )
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+  """Expected duration of a whole run and its 90% bounds, in ms."""
+
+  mean_ms: float
+  low_ms: float
+  high_ms: float
+
+
+class RunProgressTracker:
+  """Follow one run through its expected call sequence.
+
+  The cursor is (segment, iteration, position): ``position`` steps of the
+  current iteration of the current segment are done.
+  """
+
+  def __init__(
+    self,
+    expected_calls: list[str],
+    model: DurationModel,
+    clock: Callable[[], float] = time.monotonic,
+    default_ms: float = DEFAULT_OPERATION_MS,
+  ) -> None:
+    """Lay out the expected calls with the model's current expectations.
+
+    Args:
+      expected_calls: FQNs of the protocol functions the run is expected to
+        complete, in completion order.
+      model: Duration statistics; updated with the run's calls.
+      clock: Monotonic clock, in seconds.
+      default_ms: Expected duration of calls the model knows nothing about.
+
+    """
+    self.model = model
+    self.clock = clock
+    self.segments = _segments(expected_calls, model, default_ms)
+    self.started_at = clock()
+    self.last_call_at: float | None = None
+    self.segment = self.iteration = self.position = 0
+    self.calls_matched = self.calls_unmatched = 0
+    self.matched_actual_ms = self.matched_expected_ms = 0.0
+    self.finished = False
+
+  # -- matching -------------------------------------------------------------
+
+  def observe_call(self, function: str, duration_ms: float | None = None) -> bool:
+    """Record a completed call; return whether it matched an expected step.
+
+    Args:
+      function: FQN of the protocol function that completed.
+      duration_ms: The call's own duration. Only used for the run's first
+        call; later calls are measured from the previous completed call.
+
+    """
+    now = self.clock()
+    if self.last_call_at is not None or duration_ms is None:
+      duration_ms = (now - (self.last_call_at or self.started_at)) * 1000
+    self.last_call_at = now
+
+    matched = self._advance(function)
+    if matched is not None:
+      self.calls_matched += 1
+      self.matched_actual_ms += duration_ms
+      self.matched_expected_ms += matched.mean
+    else:
+      self.calls_unmatched += 1
+    self.model.observe(function, duration_ms)
+    return matched is not None
+
+  def _advance(self, function: str) -> _Step | None:
+    if self.segment >= len(self.segments):
+      return None
+    current = self.segments[self.segment]
+    index = current.find(function, self.position)
+    if index is not None:
+      return self._move(self.segment, self.iteration, index)
+    # The next iteration of the current loop
+    if current.is_loop and self.iteration + 1 < current.repeat:
+      index = current.find(function)
+      if index is not None:
+        return self._move(self.segment, self.iteration + 1, index)
+    # A later segment; the steps in between were not observed
+    stop = min(len(self.segments), self.segment + 1 + LOOKAHEAD_SEGMENTS)
+    for segment_index in range(self.segment + 1, stop):
+      index = self.segments[segment_index].find(function)
+      if index is not None:
+        return self._move(segment_index, 0, index)
+    # A loop that runs more iterations than expected
+    if current.is_loop:
+      index = current.find(function)
+      if index is not None:
+        return self._move(self.segment, self.iteration + 1, index)
+    return None
+
+  def _move(self, segment_index: int, iteration: int, index: int) -> _Step:
+    segment = self.segments[segment_index]
+    segment.repeat = max(segment.repeat, iteration + 1)
+    self.segment, self.iteration, self.position = segment_index, iteration, index + 1
+    return segment.steps[index]
+
+  # -- estimation -----------------------------------------------------------
+
+  def _done(self, total: Callable[[_Segment], float], prefix: Callable[[_Segment], list]) -> float:
+    done = sum(total(s) * s.repeat for s in self.segments[: self.segment])
+    if self.segment < len(self.segments):
+      current = self.segments[self.segment]
+      done += total(current) * self.iteration + prefix(current)[self.position]
+    return done
+
+  @property
+  def pace(self) -> float:
+    """Actual over expected duration of the matched calls, shrunk towards 1."""
+    return (self.matched_actual_ms + PACE_PRIOR_MS) / (self.matched_expected_ms + PACE_PRIOR_MS)
+
+  def _totals(self) -> tuple[float, float]:
+    mean = sum(s.mean * s.repeat for s in self.segments)
+    variance = sum(s.variance * s.repeat for s in self.segments)
+    return mean, variance
+
+  def expected_total(self) -> DurationEstimate:
+    """Expected duration of the whole sequence with its 90% bounds, in ms."""
+    mean, variance = self._totals()
+    spread = Z_90 * math.sqrt(variance)
+    return DurationEstimate(mean, max(mean - spread, 0.0), mean + spread)
+
+  def estimate(self) -> ProgressEstimate:
+    """Estimate progress and remaining time as of now."""
+    now = self.clock()
+    elapsed_ms = (now - self.started_at) * 1000
+    steps_total = sum(len(s.steps) * s.repeat for s in self.segments)
+    steps_done = int(self._done(lambda s: len(s.steps), lambda s: range(len(s.steps) + 1)))
+    if self.finished:
+      remaining = spread = 0.0
+      fraction = 1.0
+    else:
+      total_mean, total_variance = self._totals()
+      done_mean = self._done(lambda s: s.mean, lambda s: s.mean_prefix)
+      done_variance = self._done(lambda s: s.variance, lambda s: s.variance_prefix)
+      pace = self.pace
+      # Time since the last completed call is already spent on the next step.
+      in_flight_ms = (now - (self.last_call_at or self.started_at)) * 1000
+      remaining = max((total_mean - done_mean) * pace - in_flight_ms, 0.0)
+      spread = Z_90 * pace * math.sqrt(max(total_variance - done_variance, 0.0))
+      fraction = elapsed_ms / (elapsed_ms + remaining) if elapsed_ms + remaining > 0 else 0.0
+      fraction = min(fraction, RUNNING_PROGRESS_CAP)
+    return ProgressEstimate(
+      fraction=fraction,
+      elapsed_s=elapsed_ms / 1000,
+      remaining_s=remaining / 1000,
+      remaining_low_s=max(remaining - spread, 0.0) / 1000,
+      remaining_high_s=(remaining + spread) / 1000,
+      steps_done=steps_done,
+      steps_total=steps_total,
+      calls_matched=self.calls_matched,
+      calls_unmatched=self.calls_unmatched,
+    )
+
+
+# =============================================================================
+# Active runs
+# =============================================================================
+
+
+def _parse_graph(
+  graph: ProtocolComputationGraph | dict[str, Any] | None,
+) -> ProtocolComputationGraph | None:
+  if graph is None or isinstance(graph, ProtocolComputationGraph):
+    return graph
+  try:
+    return ProtocolComputationGraph.model_validate(graph)
+  except ValueError:
+    logger.warning("Ignoring a computation graph that does not validate.")
+    return None
+
+
+def _progress_key(run_id: uuid.UUID) -> str:
+  return f"{PROGRESS_KEY_PREFIX}{run_id}"
+
+
+async def read_run_progress(kv_store: KeyValueStore, run_id: uuid.UUID) -> ProgressEstimate | None:
+  """Return the latest estimate published for a run, brought up to date."""
+  snapshot = await kv_store.get(_progress_key(run_id))
+  if not isinstance(snapshot, dict):
+    return None
+  published_at = snapshot.pop("published_at", None)
+  try:
+    estimate = ProgressEstimate(**snapshot)
+  except TypeError:
+    logger.warning("Ignoring a malformed progress estimate for run %s.", run_id)
+    return None
+  if published_at is None:
+    return estimate
+  return estimate.advanced(time.time() - published_at)
+
+
+@dataclass
+class _ActiveRun:
+  tracker: RunProgressTracker
+  kv_store: KeyValueStore | None
+
+
+class RunProgressService:
+  """Shared duration model and the progress trackers of runs executed here."""
+
+  def __init__(self, model: DurationModel | None = None) -> None:
+    """Initialize the service with an empty (or the given) duration model."""
+    self.model = model or DurationModel()
+    self._runs: dict[uuid.UUID, _ActiveRun] = {}
+    self.history_loaded = False
+
+  async def load_history(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: int = HISTORY_LIMIT,
+  ) -> int:
+    """Learn from the most recent calls of completed runs, once; return how many."""
+    if self.history_loaded:
+      return 0
+    self.history_loaded = True
+    stmt = (
+      select(
+        FunctionCallLog.protocol_run_accession_id,
+        FunctionProtocolDefinition.fqn,
+        FunctionCallLog.end_time,
+        FunctionCallLog.duration_ms,
+      )
+      .join(
+        FunctionProtocolDefinition,
+        FunctionCallLog.function_protocol_definition_accession_id
+        == FunctionProtocolDefinition.accession_id,
+      )
+      .join(ProtocolRun, FunctionCallLog.protocol_run_accession_id == ProtocolRun.accession_id)
+      .where(
+        ProtocolRun.status == ProtocolRunStatusEnum.COMPLETED,
+        FunctionCallLog.status == FunctionCallStatusEnum.SUCCESS,
+        FunctionCallLog.end_time.is_not(None),
+      )
+      .order_by(FunctionCallLog.created_at.desc())
+      .limit(limit)
+    )
+    try:
+      async with session_factory() as session:
+        rows = (await session.execute(stmt)).all()
+      learned = self._learn_runs(rows, cut_off=len(rows) == limit)
+    except Exception:  # pylint: disable=broad-except
+      logger.exception("Failed to load call durations for progress estimation.")
+      return 0
+    logger.info("Learned %d historical call durations for progress estimation.", learned)
+    return learned
+
+  def _learn_runs(self, rows: list[Any], *, cut_off: bool) -> int:
+    """Learn the call durations of (run, fqn, end_time, duration_ms) rows."""
+    by_run: dict[uuid.UUID, list[Any]] = {}
+    for row in rows:
+      by_run.setdefault(row.protocol_run_accession_id, []).append(row)
+    if cut_off and rows:
+      # The oldest run may be cut off; its first duration would be wrong.
+      by_run.pop(rows[-1].protocol_run_accession_id, None)
+    learned = 0
+    for calls in by_run.values():
+      calls.sort(key=lambda row: row.end_time)
+      previous = None
+      for row in calls:
+        if previous is not None:
+          duration_ms = (row.end_time - previous).total_seconds() * 1000
+        else:
+          duration_ms = row.duration_ms
+        previous = row.end_time
+        if duration_ms is not None:
+          self.model.observe(row.fqn, float(duration_ms))
+          learned += 1
+    return learned
+
+  async def expected_calls(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    definition: FunctionProtocolDefinition,
+  ) -> tuple[list[str], float]:
+    """Expected calls of a run of ``definition`` and the default duration of unknown calls.
+
+    The calls of the definition's most recent completed run are used when
+    there is one; otherwise the run is expected to make its own call only,
+    sized from the computation graph.
+    """
+    await self.load_history(session_factory)
+    latest_run = (
+      select(ProtocolRun.accession_id)
+      .where(
+        ProtocolRun.top_level_protocol_definition_accession_id == definition.accession_id,
+        ProtocolRun.status == ProtocolRunStatusEnum.COMPLETED,
+      )
+      .order_by(ProtocolRun.created_at.desc())
+      .limit(1)
+      .scalar_subquery()
+    )
+    stmt = (
+      select(FunctionProtocolDefinition.fqn)
+      .join(
+        FunctionCallLog,
+        FunctionCallLog.function_protocol_definition_accession_id
+        == FunctionProtocolDefinition.accession_id,
+      )
+      .where(
+        FunctionCallLog.protocol_run_accession_id == latest_run,
+        FunctionCallLog.status == FunctionCallStatusEnum.SUCCESS,
+        FunctionCallLog.end_time.is_not(None),
+      )
+      .order_by(FunctionCallLog.end_time, FunctionCallLog.sequence_in_run)
+    )
+    calls: list[str] = []
+    try:
+      async with session_factory() as session:
+        calls = list((await session.execute(stmt)).scalars().all())
+    except Exception:  # pylint: disable=broad-except
+      logger.exception("Failed to load the previous calls of %s.", definition.fqn)
+    if calls:
+      return calls, DEFAULT_OPERATION_MS
+    graph = _parse_graph(definition.computation_graph_json)
+    machine_calls = graph_call_count(graph) if graph is not None else 0
+    return [definition.fqn], DEFAULT_OPERATION_MS * max(machine_calls, 1)
+
+  async def start_run(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    run_id: uuid.UUID,
+    definition: FunctionProtocolDefinition,
+    kv_store: KeyValueStore | None = None,
+  ) -> RunProgressTracker:
+    """Start tracking a run, publishing its estimates to ``kv_store`` if given."""
+    calls, default_ms = await self.expected_calls(session_factory, definition)
+    tracker = RunProgressTracker(calls, self.model, default_ms=default_ms)
+    self._runs[run_id] = _ActiveRun(tracker, kv_store)
+    await self._publish(run_id)
+    return tracker
+
+  async def observe_call(
+    self,
+    run_id: uuid.UUID,
+    function: str,
+    duration_ms: float | None = None,
+  ) -> None:
+    """Report a completed protocol function call of a run."""
+    run = self._runs.get(run_id)
+    if run is None:
+      return
+    run.tracker.observe_call(function, duration_ms)
+    await self._publish(run_id)
+
+  def estimate(self, run_id: uuid.UUID) -> ProgressEstimate | None:
+    """Current estimate for a run tracked by this process."""
+    run = self._runs.get(run_id)
+    return run.tracker.estimate() if run is not None else None
+
+  async def finish_run(self, run_id: uuid.UUID) -> ProgressEstimate | None:
+    """Stop tracking a run, withdraw its published estimate and return the final one."""
+    run = self._runs.pop(run_id, None)
+    if run is None:
+      return None
+    run.tracker.finished = True
+    if run.kv_store is not None:
+      try:
+        await run.kv_store.delete(_progress_key(run_id))
+      except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed to withdraw the progress estimate of run %s.", run_id)
+    return run.tracker.estimate()
+
+  async def estimate_duration(
+    self,
+    session_factory: async_sessionmaker[AsyncSession],
+    definition: FunctionProtocolDefinition,
+  ) -> DurationEstimate:
+    """Expected duration of a run of ``definition``, for scheduling queued runs."""
+    calls, default_ms = await self.expected_calls(session_factory, definition)
+    return RunProgressTracker(calls, self.model, default_ms=default_ms).expected_total()
+
+  async def _publish(self, run_id: uuid.UUID) -> None:
+    run = self._runs.get(run_id)
+    if run is None or run.kv_store is None:
+      return
+    snapshot = {**run.tracker.estimate().to_dict(), "published_at": time.time()}
+    try:
+      await run.kv_store.set(_progress_key(run_id), snapshot, ttl_seconds=PROGRESS_TTL_SECONDS)
+    except Exception:  # pylint: disable=broad-except
+      logger.exception("Failed to publish the progress estimate of run %s.", run_id)
+
+
+# Singleton instance for convenience
+run_progress = RunProgressService()
@@ -0,0 +1,485 @@
+"""Pre-aggregated scheduling metrics.
+
+Every schedule history event is also counted into an hourly and a daily
+``ScheduleHistoryRollup`` row (one per event type and new status) by
+``record_schedule_event``, in the same transaction as the event itself. Events
+logged before rollups were maintained are counted by the migration that added
+hourly rollups, so the rollups always cover every event and compacting raw
+events never has to touch them. A rollup holds event and error counts plus the
+count, total, extremes and a histogram of run durations and queue wait times.
+
+``compute_scheduling_metrics`` answers any window with two queries: the rollups
+that tile it (daily rollups for whole days, hourly ones for the remaining whole
+hours) and the raw events of the partial hours at either end. Rows that the
+retention service has compacted only exist as rollups, so windows that start
+or end in a compacted period are resolved to whole hours there, and to whole
+days once the retention service has also deleted that day's hourly rollups.
+
+Histograms use logarithmic bins, four per doubling, so a percentile read from
+a merged histogram is within about 10% of the exact value whatever the window.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, delete, or_, select
+
+from praxis.backend.models.domain.schedule import ScheduleHistory, ScheduleHistoryRollup
+from praxis.backend.models.enums import ScheduleStatusEnum
+
+if TYPE_CHECKING:
+  from collections.abc import Iterable, Mapping
+
+  from sqlalchemy.ext.asyncio import AsyncSession
+
+HOURLY = 3600
+DAILY = 86400
+BUCKET_SIZES = (HOURLY, DAILY)
+
+BINS_PER_DOUBLING = 4
+QUEUE_WAIT_KEY = "queue_wait_ms"
+REBUILD_BATCH_SIZE = 1000
+
+
+def as_utc(value: datetime) -> datetime:
+  """Return ``value`` as an aware UTC datetime (naive values are taken as UTC)."""
+  if value.tzinfo is None:
+    return value.replace(tzinfo=timezone.utc)
+  return value.astimezone(timezone.utc)
+
+
+def floor_to_bucket(value: datetime, bucket_seconds: int) -> datetime:
+  """Return the start of the hourly or daily bucket ``value`` falls in (UTC)."""
+  value = as_utc(value).replace(minute=0, second=0, microsecond=0)
+  if bucket_seconds == DAILY:
+    value = value.replace(hour=0)
+  return value
+
+
+def _ceil_to_bucket(value: datetime, bucket_seconds: int) -> datetime:
+  floor = floor_to_bucket(value, bucket_seconds)
+  return floor if floor == as_utc(value) else floor + timedelta(seconds=bucket_seconds)
+
+
+def _enum_value(value: Any) -> Any:
+  return value.value if isinstance(value, Enum) else value
+
+
+# =============================================================================
+# Histograms
+# =============================================================================
+
+
+def histogram_bin(value_ms: float) -> int:
+  """Return the histogram bin of a duration (bin 0 holds everything below 1 ms)."""
+  if value_ms < 1:
+    return 0
+  return 1 + int(math.log2(value_ms) * BINS_PER_DOUBLING)
+
+
+def bin_midpoint(bin_index: int) -> float:
+  """Return the geometric midpoint of a histogram bin, in ms."""
+  if bin_index <= 0:
+    return 0.0
+  return 2 ** ((bin_index - 0.5) / BINS_PER_DOUBLING)
+
+
+def histogram_percentile(histogram: Mapping[int, int], quantile: float) -> float | None:
+  """Return the ``quantile`` (0-1) of a histogram, or None if it is empty."""
+  total = sum(histogram.values())
+  if total == 0:
+    return None
+  rank = quantile * total
+  seen = 0
+  for bin_index in sorted(histogram):
+    seen += histogram[bin_index]
+    if seen >= rank:
+      return bin_midpoint(bin_index)
+  return bin_midpoint(max(histogram))
+
+
+def _load_histogram(data: Mapping[str, int] | None) -> Counter[int]:
+  return Counter({int(k): v for k, v in (data or {}).items()})
+
+
+def _dump_histogram(histogram: Counter[int]) -> dict[str, int]:
+  return {str(k): v for k, v in sorted(histogram.items()) if v}
+
+
+# =============================================================================
+# Aggregates
+# =============================================================================
+
+
+@dataclass
+class _Measure:
+  """Count, total, extremes and histogram of one duration measure."""
+
+  count: int = 0
+  total_ms: int = 0
+  min_ms: int | None = None
+  max_ms: int | None = None
+  histogram: Counter[int] = field(default_factory=Counter)
+
+  def add(self, value_ms: int) -> None:
+    self.count += 1
+    self.total_ms += value_ms
+    self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+    self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+    self.histogram[histogram_bin(value_ms)] += 1
+
+  def merge(self, other: _Measure) -> None:
+    self.count += other.count
+    self.total_ms += other.total_ms
+    for value in (other.min_ms, other.max_ms):
+      if value is not None:
+        self.min_ms = value if self.min_ms is None else min(self.min_ms, value)
+        self.max_ms = value if self.max_ms is None else max(self.max_ms, value)
+    self.histogram.update(other.histogram)
+
+  def summary(self, prefix: str) -> dict[str, float | None]:
+    return {
+      f"{prefix}_avg_ms": self.total_ms / self.count if self.count else None,
+      f"{prefix}_p50_ms": histogram_percentile(self.histogram, 0.5),
+      f"{prefix}_p95_ms": histogram_percentile(self.histogram, 0.95),
+      f"{prefix}_max_ms": self.max_ms,
+    }
+
+
+@dataclass
+class RollupDelta:
+  """Aggregate of a set of schedule events, mergeable into a rollup row."""
+
+  event_count: int = 0
+  error_count: int = 0
+  duration: _Measure = field(default_factory=_Measure)
+  queue_wait: _Measure = field(default_factory=_Measure)
+
+  def add_event(
+    self,
+    has_error: bool,
+    duration_ms: int | None = None,
+    queue_wait_ms: int | None = None,
+  ) -> None:
+    """Count one event."""
+    self.event_count += 1
+    self.error_count += int(has_error)
+    if duration_ms is not None:
+      self.duration.add(duration_ms)
+    if queue_wait_ms is not None:
+      self.queue_wait.add(queue_wait_ms)
+
+  def merge(self, other: RollupDelta) -> None:
+    """Add another aggregate to this one."""
+    self.event_count += other.event_count
+    self.error_count += other.error_count
+    self.duration.merge(other.duration)
+    self.queue_wait.merge(other.queue_wait)
+
+  @classmethod
+  def from_row(cls, row: ScheduleHistoryRollup) -> RollupDelta:
+    """Read the aggregate stored in a rollup row."""
+    return cls(
+      event_count=row.event_count,
+      error_count=row.error_count,
+      duration=_Measure(
+        row.duration_count,
+        row.duration_total_ms,
+        row.duration_min_ms,
+        row.duration_max_ms,
+        _load_histogram(row.duration_histogram_json),
+      ),
+      queue_wait=_Measure(
+        row.queue_wait_count,
+        row.queue_wait_total_ms,
+        row.queue_wait_min_ms,
+        row.queue_wait_max_ms,
+        _load_histogram(row.queue_wait_histogram_json),
+      ),
+    )
+
+  def columns(self) -> dict[str, Any]:
+    """Return the aggregate as rollup column values."""
+    return {
+      "event_count": self.event_count,
+      "error_count": self.error_count,
+      "duration_count": self.duration.count,
+      "duration_total_ms": self.duration.total_ms,
+      "duration_min_ms": self.duration.min_ms,
+      "duration_max_ms": self.duration.max_ms,
+      "duration_histogram_json": _dump_histogram(self.duration.histogram),
+      "queue_wait_count": self.queue_wait.count,
+      "queue_wait_total_ms": self.queue_wait.total_ms,
+      "queue_wait_min_ms": self.queue_wait.min_ms,
+      "queue_wait_max_ms": self.queue_wait.max_ms,
+      "queue_wait_histogram_json": _dump_histogram(self.queue_wait.histogram),
+    }
+
+  def apply_to(self, row: ScheduleHistoryRollup) -> None:
+    """Add this aggregate to a rollup row."""
+    merged = RollupDelta.from_row(row)
+    merged.merge(self)
+    for name, value in merged.columns().items():
+      setattr(row, name, value)
+
+
+def _event_queue_wait(event_data: Mapping[str, Any] | None) -> int | None:
+  value = (event_data or {}).get(QUEUE_WAIT_KEY)
+  return int(value) if value is not None else None
+
+
+RollupKey = tuple[int, datetime, str, str | None]
+
+
+def count_schedule_events(deltas: dict[RollupKey, RollupDelta], events: Iterable[Any]) -> int:
+  """Count events into per-bucket aggregates keyed like rollup rows.
+
+  ``events`` are rows or objects with the ``ScheduleHistory`` columns used by
+  rollups. Returns the number of events counted.
+  """
+  counted = 0
+  for event in events:
+    for bucket_seconds in BUCKET_SIZES:
+      key = (
+        bucket_seconds,
+        floor_to_bucket(event.created_at, bucket_seconds),
+        _enum_value(event.event_type),
+        _enum_value(event.to_status),
+      )
+      if key not in deltas:
+        deltas[key] = RollupDelta()
+      deltas[key].add_event(
+        event.error_details is not None,
+        event.override_duration_ms,
+        _event_queue_wait(event.event_data_json),
+      )
+    counted += 1
+  return counted
+
+
+# =============================================================================
+# Incremental Maintenance
+# =============================================================================
+
+
+async def record_schedule_event(db: AsyncSession, event: ScheduleHistory) -> None:
+  """Count a newly logged event into its hourly and daily rollups."""
+  delta = RollupDelta()
+  delta.add_event(
+    event.error_details is not None,
+    event.override_duration_ms,
+    _event_queue_wait(event.event_data_json),
+  )
+  event_type = _enum_value(event.event_type)
+  to_status = _enum_value(event.to_status)
+  created_at = event.created_at or datetime.now(timezone.utc)
+
+  for bucket_seconds in BUCKET_SIZES:
+    bucket_start = floor_to_bucket(created_at, bucket_seconds)
+    stmt = (
+      select(ScheduleHistoryRollup)
+      .where(
+        ScheduleHistoryRollup.bucket_seconds == bucket_seconds,
+        ScheduleHistoryRollup.bucket_start == bucket_start,
+        ScheduleHistoryRollup.event_type == event_type,
+        ScheduleHistoryRollup.to_status == to_status
+        if to_status is not None
+        else ScheduleHistoryRollup.to_status.is_(None),
+      )
+      .limit(1)
+      .with_for_update()
+    )
+    row = (await db.execute(stmt)).scalars().first()
+    if row is None:
+      row = ScheduleHistoryRollup(
+        bucket_seconds=bucket_seconds,
+        bucket_start=bucket_start,
+        event_type=event_type,
+        to_status=to_status,
+      )
+      db.add(row)
+    delta.apply_to(row)
+  await db.flush()
+
+
+async def rebuild_schedule_rollups(db: AsyncSession, start: datetime, end: datetime) -> int:
+  """Recompute the rollups of whole days ``[start, end)`` from the raw events.
+
+  A repair tool for periods whose raw events are all still present: the
+  counts of events already compacted out of those days would be lost. Returns
+  the events counted.
+  """
+  start, end = floor_to_bucket(start, DAILY), floor_to_bucket(end, DAILY)
+  await db.execute(
+    delete(ScheduleHistoryRollup).where(
+      ScheduleHistoryRollup.bucket_start >= start,
+      ScheduleHistoryRollup.bucket_start < end,
+    ),
+  )
+
+  table = ScheduleHistory.__table__
+  stmt = (
+    select(
+      table.c.accession_id,
+      table.c.created_at,
+      table.c.event_type,
+      table.c.to_status,
+      table.c.error_details,
+      table.c.override_duration_ms,
+      table.c.event_data_json,
+    )
+    .where(table.c.created_at >= start, table.c.created_at < end)
+    .order_by(table.c.created_at, table.c.accession_id)
+    .limit(REBUILD_BATCH_SIZE)
+  )
+  deltas: dict[RollupKey, RollupDelta] = {}
+  counted = 0
+  batch = (await db.execute(stmt)).all()
+  while batch:
+    counted += count_schedule_events(deltas, batch)
+    last = batch[-1]
+    batch = (
+      await db.execute(
+        stmt.where(
+          or_(
+            table.c.created_at > last.created_at,
+            and_(
+              table.c.created_at == last.created_at,
+              table.c.accession_id > last.accession_id,
+            ),
+          ),
+        ),
+      )
+    ).all()
+
+  for (bucket_seconds, bucket_start, event_type, to_status), delta in deltas.items():
+    row = ScheduleHistoryRollup(
+      bucket_seconds=bucket_seconds,
+      bucket_start=bucket_start,
+      event_type=event_type,
+      to_status=to_status,
+    )
+    delta.apply_to(row)
+    db.add(row)
+  await db.flush()
+  return counted
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+
+def _plan_window(
+  start: datetime,
+  end: datetime,
+) -> tuple[list[tuple[datetime, datetime]], list[tuple[int, datetime, datetime]]]:
+  """Split ``[start, end]`` into raw event ranges and ``[from, to)`` rollup ranges."""
+  start, end = as_utc(start), as_utc(end)
+  first_hour, last_hour = _ceil_to_bucket(start, HOURLY), floor_to_bucket(end, HOURLY)
+  if first_hour >= last_hour:
+    return [(start, end)], []
+
+  raw = [(start, first_hour), (last_hour, end)]
+  first_day, last_day = _ceil_to_bucket(first_hour, DAILY), floor_to_bucket(last_hour, DAILY)
+  if first_day >= last_day:
+    return raw, [(HOURLY, first_hour, last_hour)]
+  return raw, [
+    (HOURLY, first_hour, first_day),
+    (DAILY, first_day, last_day),
+    (HOURLY, last_day, last_hour),
+  ]
+
+
+def _in_ranges(value: datetime, ranges: Iterable[tuple[datetime, datetime]]) -> bool:
+  return any(start <= value < end for start, end in ranges)
+
+
+async def compute_scheduling_metrics(
+  db: AsyncSession,
+  start_time: datetime,
+  end_time: datetime,
+) -> dict[str, Any]:
+  """Return status counts, error counts and duration/queue wait statistics for a window."""
+  raw_ranges, rollup_ranges = _plan_window(start_time, end_time)
+  status_counts: Counter[ScheduleStatusEnum | None] = Counter()
+  totals = RollupDelta()
+
+  if rollup_ranges:
+    hourly = [(a, b) for size, a, b in rollup_ranges if size == HOURLY and a < b]
+    daily = [(a, b) for size, a, b in rollup_ranges if size == DAILY and a < b]
+    # The days the hourly ranges fall in: the daily rollup stands in for a day
+    # whose hourly rollups were compacted away, which is the case exactly when
+    # the day has a daily rollup but no hourly one.
+    edge_days = [(floor_to_bucket(a, DAILY), _ceil_to_bucket(b, DAILY)) for a, b in hourly]
+    stmt = select(ScheduleHistoryRollup).where(
+      or_(
+        *(
+          and_(
+            ScheduleHistoryRollup.bucket_seconds == bucket_seconds,
+            ScheduleHistoryRollup.bucket_start >= range_start,
+            ScheduleHistoryRollup.bucket_start < range_end,
+          )
+          for bucket_seconds, ranges in ((HOURLY, edge_days), (DAILY, [*daily, *edge_days]))
+          for range_start, range_end in ranges
+        ),
+      ),
+    )
+    rollups = (await db.execute(stmt)).scalars().all()
+    days_with_hours = {
+      floor_to_bucket(rollup.bucket_start, DAILY)
+      for rollup in rollups
+      if rollup.bucket_seconds == HOURLY
+    }
+    for rollup in rollups:
+      bucket_start = as_utc(rollup.bucket_start)
+      if rollup.bucket_seconds == HOURLY:
+        counted = _in_ranges(bucket_start, hourly)
+      else:
+        counted = _in_ranges(bucket_start, daily) or bucket_start not in days_with_hours
+      if not counted:
+        continue
+      to_status = ScheduleStatusEnum(rollup.to_status) if rollup.to_status else None
+      status_counts[to_status] += rollup.event_count
+      totals.merge(RollupDelta.from_row(rollup))
+
+  # The last raw range is closed so that events at ``end_time`` are counted.
+  raw_window = [
+    and_(
+      ScheduleHistory.created_at >= range_start,
+      ScheduleHistory.created_at <= range_end
+      if i == len(raw_ranges) - 1
+      else ScheduleHistory.created_at < range_end,
+    )
+    for i, (range_start, range_end) in enumerate(raw_ranges)
+  ]
+  stmt = select(
+    ScheduleHistory.to_status,
+    ScheduleHistory.error_details,
+    ScheduleHistory.override_duration_ms,
+    ScheduleHistory.event_data_json,
+  ).where(or_(*raw_window))
+  for event in await db.execute(stmt):
+    status_counts[event.to_status] += 1
+    totals.add_event(
+      event.error_details is not None,
+      event.override_duration_ms,
+      _event_queue_wait(event.event_data_json),
+    )
+
+  return {
+    "status_counts": dict(status_counts),
+    "avg_duration_ms": totals.duration.total_ms / totals.duration.count
+    if totals.duration.count
+    else None,
+    "error_count": totals.error_count,
+    "total_events": totals.event_count,
+    **totals.duration.summary("duration"),
+    **totals.queue_wait.summary("queue_wait"),
+  }
@@ -14,7 +14,7 @@ from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import and_, asc, desc, func, select
+from sqlalchemy import asc, desc, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -40,6 +40,12 @@ from praxis.backend.models.enums import (
   ScheduleHistoryEventTriggerEnum,
   ScheduleStatusEnum,
 )
+from praxis.backend.services.schedule_metrics import (
+  QUEUE_WAIT_KEY,
+  as_utc,
+  compute_scheduling_metrics,
+  record_schedule_event,
+)
 from praxis.backend.services.utils.crud_base import CRUDBase
 from praxis.backend.services.utils.query_builder import (
   apply_date_range_filters,
@@ -54,6 +60,17 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_RUN_END_STATUSES = (
+  ScheduleStatusEnum.COMPLETED,
+  ScheduleStatusEnum.FAILED,
+  ScheduleStatusEnum.CANCELLED,
+)
+
+
+def _elapsed_ms(start: datetime, end: datetime) -> int:
+  return max(0, int((as_utc(end) - as_utc(start)).total_seconds() * 1000))
+
+
 scheduler_service_log = partial(
   log_async_runtime_errors,
   logger_instance=logger,
@@ -223,6 +240,14 @@ class ScheduleEntryCRUDService(
       return None
 
     previous_status = schedule_entry.status
+    previous_started_at = schedule_entry.execution_started_at
+    now = datetime.now(timezone.utc)
+    queue_wait_ms = run_duration_ms = None
+    if new_status == ScheduleStatusEnum.EXECUTING and schedule_entry.created_at:
+      queue_wait_ms = _elapsed_ms(schedule_entry.created_at, started_at or now)
+    elif new_status in _RUN_END_STATUSES and (started_at or previous_started_at):
+      run_duration_ms = _elapsed_ms(started_at or previous_started_at, completed_at or now)
+
     update_schema = ScheduleEntryUpdate(
       status=new_status,
       last_error_message=error_details,
@@ -239,6 +264,8 @@ class ScheduleEntryCRUDService(
       previous_status=previous_status,
       new_status=new_status,
       event_details_json={"error_details": error_details},
+      duration_ms=run_duration_ms,
+      queue_wait_ms=queue_wait_ms,
     )
 
     logger.info(
@@ -433,13 +460,13 @@ async def cleanup_expired_reservations(
   db: AsyncSession,
   current_time: datetime | None = None,
 ) -> int:
-  """Clean up expired asset reservations."""
+  """Mark active reservations past their expiry as expired, in one UPDATE."""
   if current_time is None:
     current_time = datetime.now(timezone.utc)
 
-  stmt = select(AssetReservation).filter(
-    and_(
-      AssetReservation.expires_at < current_time,
+  stmt = (
+    update(AssetReservation)
+    .where(
       AssetReservation.status.in_(
         [
           AssetReservationStatusEnum.PENDING,
@@ -447,17 +474,13 @@ async def cleanup_expired_reservations(
           AssetReservationStatusEnum.ACTIVE,
         ],
       ),
-    ),
+      AssetReservation.expires_at < current_time,
+    )
+    .values(status=AssetReservationStatusEnum.EXPIRED, released_at=current_time)
+    .execution_options(synchronize_session="fetch")
   )
-
   result = await db.execute(stmt)
-  expired_reservations = list(result.scalars().all())
-
-  count = 0
-  for reservation in expired_reservations:
-    reservation.status = AssetReservationStatusEnum.EXPIRED
-    reservation.released_at = current_time
-    count += 1
+  count = result.rowcount or 0
 
   if count > 0:
     await db.flush()
@@ -474,6 +497,7 @@ async def log_schedule_event(
   db: AsyncSession,
   schedule_entry_accession_id: uuid.UUID,
   event_type: ScheduleHistoryEventEnum,
+  *,
   previous_status: ScheduleStatusEnum | None = None,
   new_status: ScheduleStatusEnum | None = None,
   event_details_json: dict[str, Any] | None = None,
@@ -483,10 +507,18 @@ async def log_schedule_event(
   name: str | None = None,
   duration_ms: int | None = None,
   triggered_by: ScheduleHistoryEventTriggerEnum | None = None,
+  queue_wait_ms: int | None = None,
 ) -> ScheduleHistory:
-  """Log a scheduling event for history and analytics."""
+  """Log a scheduling event for history and analytics.
+
+  The event is also counted into the hourly and daily metric rollups.
+  ``queue_wait_ms`` (time from scheduling to execution start) is stored in the
+  event data.
+  """
   if name is None:
     name = "Unnamed Event"
+  if queue_wait_ms is not None:
+    event_details_json = {**(event_details_json or {}), QUEUE_WAIT_KEY: queue_wait_ms}
   history_entry = ScheduleHistory(
     name=name,
     schedule_entry_accession_id=schedule_entry_accession_id,
@@ -504,6 +536,7 @@ async def log_schedule_event(
   db.add(history_entry)
   await db.flush()
   await db.refresh(history_entry)
+  await record_schedule_event(db, history_entry)
 
   return history_entry
 
@@ -534,51 +567,11 @@ async def get_scheduling_metrics(
   start_time: datetime,
   end_time: datetime,
 ) -> dict[str, Any]:
-  """Get scheduling metrics for a time period."""
-  # Get status counts
-  status_count_stmt = (
-    select(ScheduleHistory.to_status, func.count().label("count"))
-    .filter(
-      and_(
-        ScheduleHistory.created_at >= start_time,
-        ScheduleHistory.created_at <= end_time,
-      ),
-    )
-    .group_by(ScheduleHistory.to_status)
-  )
-
-  status_result = await db.execute(status_count_stmt)
-  status_counts = {row.to_status: row[1] for row in status_result}
-
-  # Get average timing metrics
-  avg_stmt = select(
-    # Use stored/override duration column for SQL aggregation (computed properties are not SQL expressions)
-    func.avg(ScheduleHistory.override_duration_ms).label("avg_duration"),
-  ).filter(
-    and_(
-      ScheduleHistory.created_at >= start_time,
-      ScheduleHistory.created_at <= end_time,
-    ),
-  )
-
-  avg_result = await db.execute(avg_stmt)
-  avg_data = avg_result.first()
-
-  # Get error count
-  error_count_stmt = select(func.count()).filter(
-    and_(
-      ScheduleHistory.created_at >= start_time,
-      ScheduleHistory.created_at <= end_time,
-      ScheduleHistory.error_details.isnot(None),
-    ),
-  )
-
-  error_result = await db.execute(error_count_stmt)
-  error_count = error_result.scalar()
-
-  return {
-    "status_counts": status_counts,
-    "avg_duration_ms": avg_data.avg_duration if avg_data else None,
-    "error_count": error_count,
-    "total_events": (sum(list(status_counts.values())) if status_counts else 0),
-  }
+  """Get scheduling metrics for a time period.
+
+  Answered from the pre-aggregated hourly/daily rollups plus the raw events of
+  the partial hours at the window's edges. Besides status counts, the error
+  count and the average duration, the result includes p50/p95 run durations
+  and queue wait times (see ``schedule_metrics.compute_scheduling_metrics``).
+  """
+  return await compute_scheduling_metrics(db, start_time, end_time)
@@ -29,6 +29,13 @@ from praxis.backend.core.simulation import (
   ProtocolSimulator,
   is_cache_valid,
 )
+from praxis.backend.core.simulation.result_cache import (
+  SimulationResultCache,
+  get_simulation_result_cache,
+  protocol_source_hash,
+  simulation_cache_key,
+)
+from praxis.backend.utils.compute_executor import run_compute
 
 if TYPE_CHECKING:
   from collections.abc import Callable
@@ -70,6 +77,8 @@ class SimulationService:
     enable_failure_detection: bool = True,
     max_failure_states: int = 50,
     enable_bytecode_cache: bool = True,
+    result_cache: SimulationResultCache | None = None,
+    enable_result_cache: bool = True,
   ) -> None:
     """Initialize the simulation service.
 
@@ -77,6 +86,9 @@ class SimulationService:
         enable_failure_detection: Whether to run failure mode detection.
         max_failure_states: Maximum states to explore for failure detection.
         enable_bytecode_cache: Whether to cache protocol bytecode.
+        result_cache: Content-addressed result cache. Defaults to the shared
+            cache on the configured key-value store.
+        enable_result_cache: Whether to reuse results of identical simulations.
 
     """
     self._simulator = ProtocolSimulator(
@@ -85,6 +97,17 @@ class SimulationService:
     )
     self._enable_bytecode_cache = enable_bytecode_cache
     self._protocol_cache = ProtocolCache() if enable_bytecode_cache else None
+    self._result_cache = result_cache
+    self._enable_result_cache = enable_result_cache
+
+  @property
+  def result_cache(self) -> SimulationResultCache | None:
+    """The content-addressed result cache, or None if disabled."""
+    if not self._enable_result_cache:
+      return None
+    if self._result_cache is None:
+      self._result_cache = get_simulation_result_cache()
+    return self._result_cache
 
   async def simulate_protocol(
     self,
@@ -142,13 +165,32 @@ class SimulationService:
       )
       return None
 
-    # Run simulation
+    result_cache = self.result_cache
+    result_key = self._result_cache_key(protocol_func, parameter_types) if result_cache else None
+
     try:
-      result = await self._simulator.analyze_protocol(
+      # Reuse the result if identical code with the same parameter types was
+      # simulated before, possibly under another definition or by another worker.
+      if result_cache and result_key and not force_resimulate:
+        cached = await result_cache.get(result_key)
+        if cached is not None:
+          logger.debug("Simulation result cache hit for %s", protocol_model.fqn)
+          await self._cache_results(protocol_model, cached, session, protocol_func)
+          return cached
+
+      # Run simulation on the compute executor; tracing and failure detection are
+      # CPU-bound and would otherwise block the event loop.
+      result = await run_compute(
+        self._simulator.analyze_protocol_sync,
         protocol_func=protocol_func,
         parameter_types=parameter_types,
+        key="simulation",
+        use_process=False,
       )
 
+      if result_cache and result_key:
+        await result_cache.put(result_key, result)
+
       # Cache results to ORM (including bytecode)
       await self._cache_results(protocol_model, result, session, protocol_func)
 
@@ -199,6 +241,21 @@ class SimulationService:
 
     return results
 
+  def _result_cache_key(
+    self,
+    protocol_func: Callable[..., Any],
+    parameter_types: dict[str, str],
+  ) -> str | None:
+    """Return the result cache key for a simulation, or None if it can't be cached."""
+    source_hash = protocol_source_hash(protocol_func)
+    if source_hash is None:
+      return None
+    return simulation_cache_key(
+      source_hash,
+      parameter_types,
+      simulator_config=self._simulator.cache_config,
+    )
+
   def _get_protocol_function(
     self,
     protocol_model: FunctionProtocolDefinition,
@@ -1,14 +1,26 @@
-"""State management utility."""
-
-import json
+"""State management utility.
+
+A run's ``PraxisState`` is a dictionary cached in memory and persisted to a
+``KeyValueStore`` (Redis in production, SQLite or memory in lite mode) as a hash
+with one field per key, so an assignment writes only the field it changed.
+
+Persistence is write-behind: mutations mark their keys dirty and a background
+flusher writes all dirty fields together ``flush_interval_seconds`` later, so a
+protocol that updates its state inside a loop pays one store round trip per
+interval rather than a full serialization per assignment. ``flush()`` writes
+pending changes immediately; the orchestrator flushes after every protocol step
+and closes the state at the end of the run.
+"""
+
+import asyncio
+import contextlib
 import uuid
 from collections.abc import ItemsView, KeysView, ValuesView
 from typing import Any, TypeVar
 
-import redis
-from redis.exceptions import ConnectionError as RedisConnectionError
-
 from praxis.backend.configure import PraxisConfiguration
+from praxis.backend.core.storage.protocols import KeyValueStore
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.uuid import uuid7
 
@@ -16,152 +28,170 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 class PraxisState:
-  """Manages application state, persisting it to a Redis server.
+  """Manages the state of a protocol run, persisting it to a KeyValueStore.
 
   This class provides a dictionary-like interface for storing and retrieving
-  application state, with the data being automatically serialized and stored
-  in a Redis database. It uses a unique run identifier (UUID) to isolate
-  state for different application runs.
+  run state. Reads are served from memory; writes update memory at once and
+  reach the store through a write-behind flusher (see the module docstring).
+  Without a running event loop no flusher can be scheduled, and pending
+  changes are written by the next ``flush()``.
 
   Attributes:
     run_accession_id (uuid.UUID): A unique identifier for the application run.
-    redis_key (str): The key used to store the state in Redis.
-    redis_client (redis.Redis): The Redis client instance.
+    store_key (str): The key of the hash holding the state in the store.
+    flush_interval_seconds (float): How long writes are coalesced before the
+      flusher writes them.
     _data (dict[str, Any]): The internal dictionary holding the state data.
-
-  Methods:
-    __init__(
-      self,
-      config: PraxisConfiguration | None = None,
-      run_accession_id: uuid.UUID | None = None,
-      redis_host: str | None = None,
-      redis_port: int | None = None,
-      redis_db: int | None = None,
-    ):
-      Initializes a new State instance, connecting to Redis and loading any existing state.
-    _load_from_redis(self) -> dict[str, Any]:
-      Loads the state data from Redis.
-    _save_to_redis(self):
-      Saves the current state data to Redis.
-    __getitem__(self, key: str) -> Any:
-      Retrieves a value from the state data using the given key.
-    __setitem__(self, key: str, value: Any):
-      Sets a value in the state data using the given key.
-    __delitem__(self, key: str):
-      Deletes a key-value pair from the state data.
-    get(self, key: str, default: Any | None = None) -> Any | None:
-      Retrieves a value from the state data, returning a default value if the key is not found.
-    update(self, data_dict: dict[str, Any]):
-      Updates the state data with the key-value pairs from the given dictionary.
-    to_dict(self) -> dict[str, Any]:
-      Returns a copy of the internal state data dictionary.
-    clear(self):
-      Clears all state data and deletes the Redis key associated with this state.
-    __getattr__(self, name: str) -> Any:
-      Allows accessing state data as attributes.
-    __setattr__(self, name: str, value: Any):
-      Allows setting state data as attributes.
-    __repr__(self) -> str:
-      Returns a string representation of the State instance.
+    _dirty (set[str]): Keys changed or deleted since the last flush.
 
   """
 
+  _ATTRIBUTES = frozenset(
+    {
+      "run_accession_id",
+      "store_key",
+      "flush_interval_seconds",
+      "_store",
+      "_data",
+      "_dirty",
+      "_cleared",
+      "_flush_lock",
+      "_flush_task",
+    },
+  )
+
   def __init__(
     self,
-    config: PraxisConfiguration | None = None,
+    store: KeyValueStore | None = None,
     run_accession_id: uuid.UUID | None = None,
-    redis_host: str | None = None,
-    redis_port: int | None = None,
-    redis_db: int | None = None,
+    *,
+    config: PraxisConfiguration | None = None,
+    key_prefix: str = "praxis_state",
+    flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
   ) -> None:
-    """Initialize the State instance."""
-    if config is None:
-      config = PraxisConfiguration()
-
-    if run_accession_id is None:
-      run_accession_id = uuid7()
-
-    self.run_accession_id: uuid.UUID = run_accession_id
-    self.redis_key: str = f"praxis_state:{self.run_accession_id}"
-
-    _redis_host = redis_host if redis_host is not None else config.redis_host
-    _redis_port = redis_port if redis_port is not None else config.redis_port
-    _redis_db = redis_db if redis_db is not None else config.redis_db
-
-    try:
-      self.redis_client = redis.Redis(
-        host=_redis_host,
-        port=_redis_port,
-        db=_redis_db,
-        decode_responses=False,
+    """Initialize the State instance.
+
+    Call ``load()`` to read state previously persisted for the run.
+
+    Args:
+      store: The KeyValueStore backend. Defaults to the Redis server of
+        ``config``.
+      run_accession_id: A unique identifier for this run. Generated if None.
+      config: Configuration used to locate Redis when no store is given.
+      key_prefix: Prefix for the storage key.
+      flush_interval_seconds: How long writes are coalesced before flushing.
+
+    """
+    if store is None:
+      if config is None:
+        config = PraxisConfiguration()
+      store = RedisKeyValueStore(
+        host=config.redis_host,
+        port=config.redis_port,
+        db=config.redis_db,
       )
-      self.redis_client.ping()
-    except RedisConnectionError as e:
+    self._store: KeyValueStore = store
+    self.run_accession_id: uuid.UUID = run_accession_id or uuid7()
+    self.store_key: str = f"{key_prefix}:{self.run_accession_id}"
+    self.flush_interval_seconds = flush_interval_seconds
+    self._data: dict[str, Any] = {}
+    self._dirty: set[str] = set()
+    self._cleared = False
+    self._flush_lock = asyncio.Lock()
+    self._flush_task: asyncio.Task | None = None
+
+  async def load(self) -> None:
+    """Replace the cached data with the state persisted for this run."""
+    try:
+      self._data = await self._store.hgetall(self.store_key)
+    except Exception:
       logger.exception(
-        "Failed to connect to Redis for PraxisState (run_accession_id: %s) at %s:%s/%s",
+        "Failed to load state for run %s from store",
         self.run_accession_id,
-        _redis_host,
-        _redis_port,
-        _redis_db,
       )
-      msg = f"PraxisState: Failed to connect to Redis - {e}"
-      raise RedisConnectionError(msg) from e
-    else:
-      logger.info(
-        "Redis client connected for PraxisState (run_accession_id: %s) at %s:%s/%s",
-        self.run_accession_id,
-        _redis_host,
-        _redis_port,
-        _redis_db,
-      )
-
-    self._data: dict[str, Any] = self._load_from_redis()
+      self._data = {}
+    self._dirty.clear()
+    self._cleared = False
+
+  async def flush(self) -> None:
+    """Write pending changes to the store now.
+
+    Only the fields changed since the last flush are written. If the write
+    fails the changes stay pending and the error is raised.
+    """
+    async with self._flush_lock:
+      if not self._dirty and not self._cleared:
+        return
+      dirty, cleared = self._dirty, self._cleared
+      self._dirty, self._cleared = set(), False
+      writes = {key: self._data[key] for key in dirty if key in self._data}
+      deletes = [key for key in dirty if key not in self._data]
+      try:
+        if cleared:
+          await self._store.delete(self.store_key)
+        elif deletes:
+          await self._store.hdel(self.store_key, *deletes)
+        if writes:
+          await self._store.hset(self.store_key, writes)
+      except BaseException:
+        # The cached data is authoritative, so replaying the changes is safe.
+        self._dirty |= dirty
+        self._cleared = self._cleared or cleared
+        raise
+    logger.debug(
+      "Flushed %d state fields for run %s",
+      len(dirty),
+      self.run_accession_id,
+    )
 
-  def _load_from_redis(self) -> dict[str, Any]:
-    serialized_state = None
+  async def close(self) -> None:
+    """Stop the write-behind flusher and write any pending changes."""
+    if self._flush_task is not None:
+      self._flush_task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._flush_task
+      self._flush_task = None
+    await self.flush()
+
+  def _mark_dirty(self, key: str) -> None:
+    self._dirty.add(key)
+    self._schedule_flush()
+
+  def _schedule_flush(self) -> None:
+    if self._flush_task is not None and not self._flush_task.done():
+      return
     try:
-      serialized_state = self.redis_client.get(self.redis_key)
-      if serialized_state and isinstance(serialized_state, bytes):
-        return json.loads(serialized_state.decode("utf-8"))
-      return {}
-    except json.JSONDecodeError:
-      if serialized_state is None:
-        logger.warning(
-          "No state found for run %s in Redis. Returning empty state.",
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      return
+    self._flush_task = loop.create_task(self._flush_behind())
+
+  async def _flush_behind(self) -> None:
+    while self._dirty or self._cleared:
+      await asyncio.sleep(self.flush_interval_seconds)
+      try:
+        await self.flush()
+      except Exception:
+        # The changes stay pending for the next write or an explicit flush.
+        logger.exception(
+          "Failed to save state for run %s to store",
           self.run_accession_id,
         )
-        return {}
-      logger.exception(
-        "JSONDecodeError while loading state for run %s from Redis. Raw data: %s",
-        self.run_accession_id,
-        serialized_state,
-      )
-      return {}
-    except redis.RedisError:
-      logger.exception(
-        "Failed to load state for run %s from Redis",
-        self.run_accession_id,
-      )
-      return {}
+        return
 
-  def _save_to_redis(self) -> None:
-    try:
-      serialized_state = json.dumps(self._data)
-      self.redis_client.set(self.redis_key, serialized_state.encode("utf-8"))
-    except TypeError:
-      logger.exception(
-        "TypeError during JSON serialization for run %s. State data may not be "
-        "fully JSON serializable.",
-        self.run_accession_id,
-      )
-    except redis.RedisError:
-      logger.exception(
-        "Failed to save state for run %s to Redis",
-        self.run_accession_id,
-      )
-      raise
+  @staticmethod
+  def validate_item(key: str, value: Any) -> None:
+    """Raise if ``key`` or ``value`` cannot be stored in the state."""
+    if not key:
+      msg = "Key cannot be an empty string."
+      raise ValueError(msg)
+    if not isinstance(value, str | int | float | bool | dict | list | None):
+      msg = f"Value must be a JSON-serializable type, got {type(value).__name__}."
+      raise TypeError(msg)
 
   def __getitem__(self, key: str) -> Any:
     """Retrieve a value from the state data using the given key."""
@@ -177,15 +207,10 @@ class PraxisState:
 
   def __setitem__(self, key: str, value: Any) -> None:
     """Set a value in the state data using the given key."""
-    if not key:
-      msg = "Key cannot be an empty string."
-      raise ValueError(msg)
-    if not isinstance(value, str | int | float | bool | dict | list | None):
-      msg = f"Value must be a JSON-serializable type, got {type(value).__name__}."
-      raise TypeError(msg)
+    self.validate_item(key, value)
     logger.debug("Setting key '%s' in state for run %s", key, self.run_accession_id)
     self._data[key] = value
-    self._save_to_redis()
+    self._mark_dirty(key)
 
   def __delitem__(self, key: str) -> None:
     """Delete a value from the state data using the given key."""
@@ -194,7 +219,7 @@ class PraxisState:
       raise KeyError(msg)
     logger.debug("Deleting key '%s' from state for run %s", key, self.run_accession_id)
     del self._data[key]
-    self._save_to_redis()
+    self._mark_dirty(key)
 
   def set(self, key: str, value: Any) -> None:
     """Set a value in the state data. Alias for state[key] = value."""
@@ -210,8 +235,11 @@ class PraxisState:
 
   def update(self, data_dict: dict[str, Any]) -> None:
     """Update the state data with the given dictionary."""
-    self._data.update(data_dict)
-    self._save_to_redis()
+    for key, value in data_dict.items():
+      self.validate_item(key, value)
+    for key, value in data_dict.items():
+      self._data[key] = value
+      self._mark_dirty(key)
 
   def to_dict(self) -> dict[str, Any]:
     """Return a copy of the internal state data dictionary."""
@@ -219,15 +247,11 @@ class PraxisState:
     return self._data.copy()
 
   def clear(self) -> None:
-    """Clear the state data and delete it from Redis."""
+    """Clear the state data and delete it from the store."""
     self._data.clear()
-    try:
-      self.redis_client.delete(self.redis_key)
-    except redis.RedisError:
-      logger.exception(
-        "Failed to delete state for run %s from Redis",
-        self.run_accession_id,
-      )
+    self._dirty.clear()
+    self._cleared = True
+    self._schedule_flush()
 
   def __contains__(self, key: str) -> bool:
     """Check if a key exists in the state data."""
@@ -267,11 +291,10 @@ class PraxisState:
 
   def __setattr__(self, name: str, value: Any) -> None:
     """Set state data as attributes."""
-    if name in ["run_accession_id", "redis_key", "redis_client", "_data"]:
+    if name in self._ATTRIBUTES:
       super().__setattr__(name, value)
     else:
-      self._data[name] = value
-      self._save_to_redis()
+      self.__setitem__(name, value)
 
   def __repr__(self) -> str:
     """Return a string representation of the State instance."""
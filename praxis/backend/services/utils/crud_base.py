@@ -8,18 +8,14 @@ from uuid import UUID
 
 from pydantic import BaseModel
 from sqlalchemy import Enum as SAEnumType
-from sqlalchemy import inspect
+from sqlalchemy import func, inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.services.utils.query_builder import (
-  apply_date_range_filters,
-  apply_pagination,
-  apply_property_filters,
   apply_search_filters,
   apply_sorting,
-  apply_specific_id_filters,
 )
 from praxis.backend.utils.db import Base
 from praxis.backend.utils.logging import get_logger
@@ -31,6 +27,10 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 logger = get_logger(__name__)
 
+# Upper bound for "estimated" counts that fall back to counting rows. Counting
+# stops here, so the cost of an estimate does not grow with table size.
+ESTIMATED_COUNT_CAP = 10_000
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
   """Generic CRUD base class for SQLAlchemy models."""
@@ -67,14 +67,50 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
   ) -> list[ModelType]:
     """Get multiple objects with filtering, sorting, and pagination."""
     statement = select(self.model)
-    statement = apply_search_filters(statement, self.model, filters)
     if filters.sort_by:
       statement = apply_sorting(statement, self.model, filters.sort_by)
-    statement = apply_specific_id_filters(statement, filters, self.model)
-    statement = apply_pagination(statement, filters)
+    statement = apply_search_filters(statement, self.model, filters)
     result = await db.execute(statement)
     return list(result.scalars().all())
 
+  async def count(
+    self,
+    db: AsyncSession,
+    *,
+    filters: SearchFilters,
+    estimated: bool = False,
+  ) -> tuple[int, bool]:
+    """Count the objects matching the generic search filters.
+
+    Pagination parameters are ignored. With ``estimated`` set, an unfiltered
+    count on PostgreSQL is read from the planner statistics in ``pg_class``;
+    otherwise rows are counted up to `ESTIMATED_COUNT_CAP`.
+
+    Returns:
+        The count, and whether it is an estimate (or, when capped, a lower bound).
+
+    """
+    statement = apply_search_filters(select(self.model), self.model, filters, paginate=False)
+
+    if not estimated:
+      total = await db.scalar(select(func.count()).select_from(statement.subquery()))
+      return int(total or 0), False
+
+    if statement.whereclause is None and db.get_bind().dialect.name == "postgresql":
+      reltuples = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": self.model.__tablename__},
+      )
+      # reltuples is -1 for tables that have never been analyzed.
+      if reltuples is not None and reltuples >= 0:
+        return int(reltuples), True
+
+    capped = statement.with_only_columns(self.model.accession_id).limit(ESTIMATED_COUNT_CAP + 1)
+    total = int(await db.scalar(select(func.count()).select_from(capped.subquery())) or 0)
+    if total > ESTIMATED_COUNT_CAP:
+      return ESTIMATED_COUNT_CAP, True
+    return total, False
+
   async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
     """Create a new object."""
     # Check if the model supports SQLModel-style validation
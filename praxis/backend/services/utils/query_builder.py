@@ -5,10 +5,14 @@ based on a standardized SearchFilters model, promoting consistency and
 reducing boilerplate code in the service layer.
 """
 
+import base64
+import binascii
+import json
 from datetime import datetime
 from typing import Any, TypeVar
+from uuid import UUID
 
-from sqlalchemy import Select, and_
+from sqlalchemy import Select, and_, tuple_
 from sqlalchemy.orm import InstrumentedAttribute
 
 from praxis.backend.models.domain.filters import SearchFilters
@@ -17,17 +21,163 @@ from praxis.backend.utils.db import Base
 BaseModel = TypeVar("BaseModel", bound=Base)
 
 
+KEYSET_SORT_FIELDS = ("accession_id", "created_at")
+
+
+def is_keyset_pagination(filters: SearchFilters) -> bool:
+  """Return True if ``filters`` request keyset (cursor) pagination."""
+  return filters.keyset or filters.cursor is not None
+
+
+def parse_keyset_sort(sort_by: str | None) -> tuple[str, bool]:
+  """Parse ``sort_by`` into a keyset sort field and direction.
+
+  Args:
+      sort_by: ``None`` (ascending ``accession_id``), or ``accession_id`` /
+          ``created_at``, optionally prefixed with '-' for descending order.
+
+  Returns:
+      The sort field name and whether it is descending.
+
+  Raises:
+      ValueError: If the field cannot be used for keyset pagination.
+
+  """
+  if not sort_by:
+    return "accession_id", False
+  descending = sort_by.startswith("-")
+  field = sort_by[1:] if descending else sort_by
+  if field not in KEYSET_SORT_FIELDS:
+    msg = (
+      f"Keyset pagination requires sort_by to be one of {', '.join(KEYSET_SORT_FIELDS)} "
+      f"(optionally prefixed with '-'), got '{sort_by}'."
+    )
+    raise ValueError(msg)
+  return field, descending
+
+
+def validate_pagination(filters: SearchFilters) -> None:
+  """Check that ``filters`` describe a consistent pagination request.
+
+  Raises:
+      ValueError: If keyset pagination is combined with an offset, uses an
+          unsupported sort field, or carries a malformed cursor.
+
+  """
+  if not is_keyset_pagination(filters):
+    return
+  if filters.offset:
+    msg = "offset cannot be combined with keyset pagination."
+    raise ValueError(msg)
+  parse_keyset_sort(filters.sort_by)
+  if filters.cursor is not None:
+    decode_keyset_cursor(filters.cursor, filters.sort_by)
+
+
+def encode_keyset_cursor(obj: Any, sort_by: str | None) -> str:
+  """Encode the position of ``obj`` in a keyset traversal as an opaque cursor.
+
+  Args:
+      obj: The last row of the current page.
+      sort_by: The ``sort_by`` value of the request that produced the page.
+
+  Returns:
+      A URL-safe cursor string.
+
+  """
+  field, descending = parse_keyset_sort(sort_by)
+  key: list[Any] = [str(obj.accession_id)]
+  if field == "created_at":
+    key.insert(0, obj.created_at.isoformat())
+  payload = {"s": f"-{field}" if descending else field, "k": key}
+  return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str, sort_by: str | None) -> tuple[Any, ...]:
+  """Decode a cursor produced by `encode_keyset_cursor`.
+
+  Returns:
+      The keyset values, ``(accession_id,)`` or ``(created_at, accession_id)``.
+
+  Raises:
+      ValueError: If the cursor is malformed or was issued for another sort order.
+
+  """
+  field, descending = parse_keyset_sort(sort_by)
+  expected_sort = f"-{field}" if descending else field
+  try:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    cursor_sort, key = payload["s"], payload["k"]
+    values: tuple[Any, ...] = (
+      (datetime.fromisoformat(key[0]), UUID(key[1]))
+      if cursor_sort.lstrip("-") == "created_at"
+      else (UUID(key[0]),)
+    )
+  except (binascii.Error, ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+    msg = "Malformed pagination cursor."
+    raise ValueError(msg) from e
+
+  if cursor_sort != expected_sort:
+    msg = f"Cursor was issued for sort_by '{cursor_sort}', not '{expected_sort}'."
+    raise ValueError(msg)
+  return values
+
+
+def apply_keyset_pagination(
+  query: Select,
+  model_model: type[BaseModel],
+  filters: SearchFilters,
+) -> Select:
+  """Apply keyset (seek) pagination to a SQLAlchemy query.
+
+  Any existing ORDER BY is replaced by the keyset order, ``accession_id`` or
+  ``(created_at, accession_id)``, so the rows following the cursor are found
+  with an index seek instead of scanning and discarding ``offset`` rows. UUIDv7
+  accession IDs are time ordered, so ``accession_id`` is also creation order.
+
+  Args:
+      query: The SQLAlchemy Select statement.
+      model_model: The ORM model class to which the query applies.
+      filters: The SearchFilters object containing the cursor and sort order.
+
+  Returns:
+      The modified Select statement.
+
+  """
+  field, descending = parse_keyset_sort(filters.sort_by)
+  columns = [model_model.accession_id]
+  if field == "created_at":
+    columns.insert(0, model_model.created_at)
+
+  if filters.cursor is not None:
+    values = decode_keyset_cursor(filters.cursor, filters.sort_by)
+    left = tuple_(*columns) if len(columns) > 1 else columns[0]
+    right = tuple_(*values) if len(values) > 1 else values[0]
+    query = query.filter(left < right if descending else left > right)
+
+  query = query.order_by(None).order_by(
+    *(column.desc() if descending else column.asc() for column in columns),
+  )
+  return query.limit(filters.limit)
+
+
 def apply_pagination(query: Select, filters: SearchFilters) -> Select:
-  """Apply limit and offset for pagination to a SQLAlchemy query.
+  """Apply pagination to a SQLAlchemy query.
+
+  Uses limit and offset by default, or keyset pagination (see
+  `apply_keyset_pagination`) when ``filters`` request it.
 
   Args:
       query: The SQLAlchemy Select statement.
       filters: The SearchFilters object containing pagination parameters.
 
   Returns:
-      The modified Select statement with limit and offset applied.
+      The modified Select statement with pagination applied.
 
   """
+  if is_keyset_pagination(filters):
+    return apply_keyset_pagination(query, query.column_descriptions[0]["entity"], filters)
   if filters.limit > 0:
     query = query.limit(filters.limit)
   if filters.offset > 0:
@@ -175,6 +325,8 @@ def apply_search_filters(
   filters: SearchFilters,
   properties_field: str = "properties_json",
   timestamp_field: str = "timestamp_field",
+  *,
+  paginate: bool = True,
 ) -> Select:
   """Apply search filters to a SQLAlchemy query.
 
@@ -187,6 +339,7 @@ def apply_search_filters(
       filters: The SearchFilters object containing various filter parameters.
       properties_field: The name of the JSONB properties field on the ORM model.
       timestamp_field: The name of the timestamp field on the ORM model.
+      paginate: Whether to apply pagination; disable to build count queries.
 
   Returns:
       The modified Select statement with all applicable filters applied.
@@ -201,7 +354,7 @@ def apply_search_filters(
     q = apply_property_filters(q, filters, properties_col)
   if timestamp_col is not None:
     q = apply_date_range_filters(q, filters, timestamp_col)
-  return apply_pagination(q, filters)
+  return apply_pagination(q, filters) if paginate else q
 
 
 def apply_sorting(query: Select, model_model: type[BaseModel], sort_by: str | None) -> Select:
@@ -29,6 +29,7 @@ from praxis.backend.services.utils.query_builder import apply_search_filters
 from praxis.backend.utils.db_decorator import handle_db_transaction
 from praxis.backend.utils.logging import get_logger, log_async_runtime_errors
 
+from .plate_aggregate_cache import invalidates_plates, records_well_outputs
 from .plate_parsing import (
   calculate_well_index,
   parse_well_name,
@@ -54,6 +55,7 @@ class WellDataOutputCRUDService(
 ):
   """CRUD service for well data outputs."""
 
+  @records_well_outputs
   @handle_db_transaction
   async def create(
     self,
@@ -154,6 +156,7 @@ class WellDataOutputCRUDService(
     )
     return well_data_list
 
+  @invalidates_plates
   @handle_db_transaction
   async def update(
     self,
@@ -177,6 +180,7 @@ class WellDataOutputCRUDService(
     logger.info("%s Successfully updated well data output.", log_prefix)
     return db_obj
 
+  @invalidates_plates
   @handle_db_transaction
   async def remove(self, db: AsyncSession, *, accession_id: UUID) -> WellDataOutput | None:
     """Delete a well data output by ID."""
@@ -203,6 +207,7 @@ class WellDataOutputCRUDService(
     return well_output
 
 
+@records_well_outputs
 @handle_db_transaction
 async def create_well_data_outputs(
   db: AsyncSession,
@@ -261,6 +266,7 @@ async def create_well_data_outputs(
   return well_outputs
 
 
+@records_well_outputs
 @handle_db_transaction
 async def create_well_data_outputs_from_flat_array(
   db: AsyncSession,
@@ -18,7 +18,7 @@ def mock_db_session():
 
 
 @pytest.mark.asyncio
-@patch("praxis.backend.services.plate_viz.resource_service", new_callable=AsyncMock)
+@patch("praxis.backend.services.plate_aggregate_cache.resource_service", new_callable=AsyncMock)
 async def test_read_plate_data_visualization_with_geometry(
   mock_resource_service: AsyncMock,
   mock_db_session: AsyncMock,
@@ -61,7 +61,7 @@ async def test_read_plate_data_visualization_with_geometry(
 
 
 @pytest.mark.asyncio
-@patch("praxis.backend.services.plate_viz.resource_service", new_callable=AsyncMock)
+@patch("praxis.backend.services.plate_aggregate_cache.resource_service", new_callable=AsyncMock)
 async def test_read_plate_data_visualization_fallback(
   mock_resource_service: AsyncMock,
   mock_db_session: AsyncMock,
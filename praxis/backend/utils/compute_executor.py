@@ -0,0 +1,373 @@
+"""Shared executor for CPU-bound work submitted from async code.
+
+Graph replay, protocol analysis, LibCST discovery and state-history
+reconstruction are synchronous and can take seconds. Running them directly in
+an async handler blocks the event loop, stalling every other request and
+websocket served by the worker. `ComputeExecutor` runs such functions on a
+shared thread or process pool instead:
+
+- ``await run_compute(func, *args, key="simulation")`` submits a function and
+  awaits its result without blocking the loop;
+- each ``key`` (typically one per endpoint) can have a concurrency limit, so a
+  burst of heavy requests queues up instead of occupying every worker;
+- queued, running and completed counts plus wait/run times are tracked per key
+  (``metrics()``), exposed at ``GET /api/v1/compute/metrics``;
+- passing the FastAPI ``Request`` cancels the work when the client
+  disconnects. Work that is still queued is dropped; work that has already
+  started in a worker thread cannot be interrupted, so its result is discarded
+  and its concurrency slot is held until it finishes.
+
+Process pools need picklable functions and arguments. Work that closes over
+live objects (imported protocol functions, parsers) should pass
+``use_process=False`` to always run on the thread pool.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol, TypeVar
+
+from praxis.backend.utils.errors import ComputeCancelledError
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+DEFAULT_KEY = "default"
+DISCONNECT_POLL_INTERVAL_S = 0.1
+
+
+class DisconnectAware(Protocol):
+  """Anything with Starlette's ``Request.is_disconnected`` coroutine."""
+
+  async def is_disconnected(self) -> bool:
+    """Return True once the client has gone away."""
+    ...
+
+
+@dataclass
+class ComputeKeyMetrics:
+  """Counters for the work submitted under one key."""
+
+  limit: int | None = None
+  running: int = 0
+  queued: int = 0
+  max_queued: int = 0
+  submitted: int = 0
+  completed: int = 0
+  failed: int = 0
+  cancelled: int = 0
+  total_wait_s: float = 0.0
+  total_run_s: float = 0.0
+
+  def as_dict(self) -> dict[str, Any]:
+    """Return the counters with average wait and run times."""
+    finished = self.completed + self.failed
+    return {
+      "limit": self.limit,
+      "running": self.running,
+      "queued": self.queued,
+      "max_queued": self.max_queued,
+      "submitted": self.submitted,
+      "completed": self.completed,
+      "failed": self.failed,
+      "cancelled": self.cancelled,
+      "avg_wait_ms": 1000 * self.total_wait_s / self.submitted if self.submitted else 0.0,
+      "avg_run_ms": 1000 * self.total_run_s / finished if finished else 0.0,
+    }
+
+
+class _Gate:
+  """FIFO concurrency limiter that is not bound to a single event loop."""
+
+  def __init__(self, limit: int | None) -> None:
+    self.limit = limit
+    self.held = 0
+    self._waiters: deque[asyncio.Future[None]] = deque()
+
+  async def acquire(self) -> None:
+    if self.limit is None or (self.held < self.limit and not self._waiters):
+      self.held += 1
+      return
+    waiter = asyncio.get_running_loop().create_future()
+    self._waiters.append(waiter)
+    try:
+      await waiter
+    except asyncio.CancelledError:
+      if waiter.done() and not waiter.cancelled():
+        # The slot was handed over just before cancellation; pass it on.
+        self.release()
+      else:
+        with contextlib.suppress(ValueError):
+          self._waiters.remove(waiter)
+      raise
+
+  def release(self) -> None:
+    while self._waiters:
+      waiter = self._waiters.popleft()
+      if not waiter.done():
+        # Hand the slot straight to the next waiter; ``held`` is unchanged.
+        waiter.set_result(None)
+        return
+    self.held -= 1
+
+
+class ComputeExecutor:
+  """Run blocking functions on a shared pool with per-key limits and metrics.
+
+  Args:
+      kind: ``"thread"`` or ``"process"``; the pool used unless a call
+          overrides it with ``use_process``.
+      max_workers: Pool size. Defaults to the number of CPUs.
+      limits: Maximum concurrent calls per key. Keys without a limit are only
+          bounded by the pool size.
+      poll_interval_s: How often to check for client disconnects.
+
+  """
+
+  def __init__(
+    self,
+    kind: ExecutorKind = "thread",
+    max_workers: int | None = None,
+    limits: dict[str, int] | None = None,
+    poll_interval_s: float = DISCONNECT_POLL_INTERVAL_S,
+  ) -> None:
+    """Initialize the executor. Pools are created on first use."""
+    if kind not in ("thread", "process"):
+      msg = f"Unknown compute executor kind '{kind}'; expected 'thread' or 'process'."
+      raise ValueError(msg)
+    self.kind: ExecutorKind = kind
+    self.max_workers = max_workers or os.cpu_count() or 2
+    self.poll_interval_s = poll_interval_s
+    self._limits = dict(limits or {})
+    self._gates: dict[str, _Gate] = {}
+    self._metrics: dict[str, ComputeKeyMetrics] = {}
+    self._thread_pool: concurrent.futures.ThreadPoolExecutor | None = None
+    self._process_pool: concurrent.futures.ProcessPoolExecutor | None = None
+
+  def set_limit(self, key: str, limit: int | None) -> None:
+    """Set the concurrency limit for a key. Applies to calls that have not started."""
+    if limit is not None and limit < 1:
+      msg = "Concurrency limits must be positive."
+      raise ValueError(msg)
+    self._limits[key] = limit  # type: ignore[assignment]
+    self._gate(key).limit = limit
+    self._key_metrics(key).limit = limit
+
+  def metrics(self) -> dict[str, Any]:
+    """Return executor-wide and per-key queue depth and timing metrics."""
+    keys = {key: metrics.as_dict() for key, metrics in sorted(self._metrics.items())}
+    return {
+      "kind": self.kind,
+      "max_workers": self.max_workers,
+      "running": sum(m["running"] for m in keys.values()),
+      "queued": sum(m["queued"] for m in keys.values()),
+      "keys": keys,
+    }
+
+  async def run(
+    self,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    key: str = DEFAULT_KEY,
+    request: DisconnectAware | None = None,
+    use_process: bool | None = None,
+    **kwargs: Any,
+  ) -> T:
+    """Run ``func(*args, **kwargs)`` on the pool and return its result.
+
+    Args:
+        func: The blocking function. Must be picklable for process pools.
+        *args: Positional arguments for ``func``.
+        key: Concurrency-limit and metrics bucket, e.g. the endpoint name.
+        request: Request whose disconnection cancels the call.
+        use_process: Force the process (True) or thread (False) pool.
+        **kwargs: Keyword arguments for ``func``.
+
+    Raises:
+        ComputeCancelledError: If the client disconnected first.
+
+    """
+    metrics = self._key_metrics(key)
+    gate = self._gate(key)
+    metrics.submitted += 1
+    metrics.queued += 1
+    metrics.max_queued = max(metrics.max_queued, metrics.queued)
+    enqueued = time.perf_counter()
+    try:
+      await self._until_disconnect(gate.acquire(), request, key)
+    except BaseException:
+      metrics.cancelled += 1
+      raise
+    finally:
+      metrics.queued -= 1
+      metrics.total_wait_s += time.perf_counter() - enqueued
+
+    loop = asyncio.get_running_loop()
+    metrics.running += 1
+    started = time.perf_counter()
+    future = self._pool(use_process).submit(functools.partial(func, *args, **kwargs))
+    release_now = True
+    try:
+      result = await self._until_disconnect(asyncio.wrap_future(future), request, key)
+    except (asyncio.CancelledError, ComputeCancelledError):
+      metrics.cancelled += 1
+      if not future.done() and not future.cancel():
+        # Still running in a worker: keep the slot until it really finishes.
+        release_now = False
+        future.add_done_callback(lambda _: self._release_threadsafe(loop, key, started))
+      raise
+    except Exception:
+      metrics.failed += 1
+      raise
+    else:
+      metrics.completed += 1
+      return result
+    finally:
+      if release_now:
+        self._release(key, started)
+
+  def shutdown(self, wait: bool = True) -> None:
+    """Shut down the pools. Queued calls that have not started are cancelled."""
+    for pool in (self._thread_pool, self._process_pool):
+      if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+    self._thread_pool = None
+    self._process_pool = None
+
+  # ---------------------------------------------------------------------------
+
+  def _key_metrics(self, key: str) -> ComputeKeyMetrics:
+    if key not in self._metrics:
+      self._metrics[key] = ComputeKeyMetrics(limit=self._limits.get(key))
+    return self._metrics[key]
+
+  def _gate(self, key: str) -> _Gate:
+    if key not in self._gates:
+      self._gates[key] = _Gate(self._limits.get(key))
+    return self._gates[key]
+
+  def _pool(self, use_process: bool | None) -> concurrent.futures.Executor:
+    if use_process is None:
+      use_process = self.kind == "process"
+    if use_process:
+      if self._process_pool is None:
+        self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+      return self._process_pool
+    if self._thread_pool is None:
+      self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=self.max_workers, thread_name_prefix="praxis-compute"
+      )
+    return self._thread_pool
+
+  def _release(self, key: str, started: float) -> None:
+    metrics = self._metrics[key]
+    metrics.running -= 1
+    metrics.total_run_s += time.perf_counter() - started
+    self._gates[key].release()
+
+  def _release_threadsafe(self, loop: asyncio.AbstractEventLoop, key: str, started: float) -> None:
+    try:
+      loop.call_soon_threadsafe(self._release, key, started)
+    except RuntimeError:
+      # The loop is closed, so nothing can be waiting on the gate any more.
+      self._release(key, started)
+
+  async def _until_disconnect(
+    self,
+    awaitable: Any,
+    request: DisconnectAware | None,
+    key: str,
+  ) -> Any:
+    """Await ``awaitable``, cancelling it if the client disconnects first."""
+    if request is None:
+      return await awaitable
+    work = asyncio.ensure_future(awaitable)
+    watcher = asyncio.ensure_future(self._watch_disconnect(request))
+    try:
+      done, _ = await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+      work.cancel()
+      raise
+    finally:
+      watcher.cancel()
+    if work in done:
+      return work.result()
+    work.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+      await work
+    msg = f"Client disconnected; cancelled '{key}' compute call."
+    raise ComputeCancelledError(msg)
+
+  async def _watch_disconnect(self, request: DisconnectAware) -> None:
+    while True:
+      if await request.is_disconnected():
+        return
+      await asyncio.sleep(self.poll_interval_s)
+
+
+# =============================================================================
+# Shared Instance
+# =============================================================================
+
+_executor: ComputeExecutor | None = None
+
+
+def configure_compute_executor(
+  kind: ExecutorKind = "thread",
+  max_workers: int | None = None,
+  limits: dict[str, int] | None = None,
+) -> ComputeExecutor:
+  """Replace the shared executor, shutting down the previous one."""
+  global _executor
+  if _executor is not None:
+    _executor.shutdown(wait=False)
+  _executor = ComputeExecutor(kind=kind, max_workers=max_workers, limits=limits)
+  logger.info(
+    "Compute executor configured: kind=%s, max_workers=%d, limits=%s",
+    _executor.kind,
+    _executor.max_workers,
+    limits or {},
+  )
+  return _executor
+
+
+def get_compute_executor() -> ComputeExecutor:
+  """Return the shared executor, creating a default thread pool on first use."""
+  global _executor
+  if _executor is None:
+    _executor = ComputeExecutor()
+  return _executor
+
+
+def shutdown_compute_executor(wait: bool = True) -> None:
+  """Shut down the shared executor, if one was created."""
+  global _executor
+  if _executor is not None:
+    _executor.shutdown(wait=wait)
+    _executor = None
+
+
+async def run_compute(
+  func: Callable[..., T],
+  /,
+  *args: Any,
+  key: str = DEFAULT_KEY,
+  request: DisconnectAware | None = None,
+  use_process: bool | None = None,
+  **kwargs: Any,
+) -> T:
+  """Run a blocking function on the shared executor. See `ComputeExecutor.run`."""
+  return await get_compute_executor().run(
+    func, *args, key=key, request=request, use_process=use_process, **kwargs
+  )
@@ -256,3 +256,7 @@ class PraxisAPIError(PraxisError):
 
     """
     super().__init__(message)
+
+
+class ComputeCancelledError(PraxisError):
+  """Raised when offloaded compute work is cancelled because its client disconnected."""
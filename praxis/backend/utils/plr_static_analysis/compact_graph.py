@@ -0,0 +1,508 @@
+"""Columnar, memory-compact storage for protocol computation graphs.
+
+`ProtocolComputationGraph` keeps one pydantic model per node, each holding its
+own strings, lists and dicts. For graphs with many thousands of operations
+(unrolled loops, large plate maps) that costs several kilobytes per node and
+every load pays for full validation.
+
+`CompactComputationGraph` stores the same graph as columns:
+
+- every string (IDs, names, types, argument keys and values) is interned once
+  in a string table and referenced by integer index;
+- each node kind is a table of int32 columns, one per field, with enums stored
+  as member indices and optional values as sentinels;
+- list fields are CSR pairs (``offsets``, ``values``), so an operation's
+  preconditions are an adjacency array of precondition rows and a
+  precondition's ``satisfied_by`` is an operation row;
+- a ``fields_unset`` bitmask per row records which fields were left at their
+  defaults, so ``exclude_unset`` dumps of the rebuilt graph match the original.
+
+Conversion is lossless in both directions, and `to_bytes` / `from_bytes` give a
+versioned binary form whose loading is a handful of ``numpy.frombuffer`` calls.
+
+Usage:
+  compact = CompactComputationGraph.from_graph(graph)
+  data = compact.to_bytes()
+  graph = CompactComputationGraph.from_bytes(data).to_graph()
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import gc
+import itertools
+import json
+import struct
+import zlib
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from praxis.backend.utils.plr_static_analysis.models import (
+  GraphNodeType,
+  LoopNode,
+  OperationNode,
+  PreconditionType,
+  ProtocolComputationGraph,
+  ResourceNode,
+  StatePrecondition,
+)
+
+if TYPE_CHECKING:
+  from collections.abc import Iterator, Sequence
+
+MAGIC = b"PXCG"
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sBI")  # magic, format version, manifest length
+
+NONE_REF = -1  # Absent string or node reference
+NONE_INT = int(np.iinfo(np.int32).min)  # Absent optional integer
+
+# Column kinds. Scalar kinds encode one value per row; list kinds encode a
+# variable-length run per row as an ``offsets``/``values`` pair.
+_STR = "str"
+_OPT_STR = "opt_str"
+_INT = "int"
+_OPT_INT = "opt_int"
+_BOOL = "bool"
+_JSON = "json"
+_OPERATION_REF = "operation_ref"
+_STR_LIST = "str_list"
+_STR_MAP = "str_map"
+_PRECONDITION_REFS = "precondition_refs"
+_LIST_KINDS = frozenset({_STR_LIST, _STR_MAP, _PRECONDITION_REFS})
+
+_Kind = str | type[Enum]
+
+OPERATION_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+  ("id", _STR),
+  ("line_number", _INT),
+  ("method_name", _STR),
+  ("receiver_variable", _STR),
+  ("receiver_type", _OPT_STR),
+  ("arguments", _STR_MAP),
+  ("node_type", GraphNodeType),
+  ("preconditions", _PRECONDITION_REFS),
+  ("creates_state", _STR_LIST),
+  ("depends_on_params", _STR_LIST),
+  ("foreach_source", _OPT_STR),
+  ("foreach_body", _STR_LIST),
+  ("condition_expr", _OPT_STR),
+  ("true_branch", _STR_LIST),
+  ("false_branch", _STR_LIST),
+)
+LOOP_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+  ("id", _STR),
+  ("line_number", _INT),
+  ("loop_variable", _OPT_STR),
+  ("source_expression", _STR),
+  ("body", _STR_LIST),
+  ("iteration_count", _OPT_INT),
+  ("max_iterations", _OPT_INT),
+  ("inferred_from", _OPT_STR),
+)
+RESOURCE_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+  ("key", _STR),
+  ("variable_name", _STR),
+  ("declared_type", _STR),
+  ("element_type", _OPT_STR),
+  ("is_container", _BOOL),
+  ("is_parameter", _BOOL),
+  ("parental_chain", _STR_LIST),
+  ("source_expression", _OPT_STR),
+  ("items_x", _OPT_INT),
+  ("items_y", _OPT_INT),
+)
+PRECONDITION_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+  ("id", _STR),
+  ("precondition_type", PreconditionType),
+  ("resource_variable", _STR),
+  ("resource_type", _OPT_STR),
+  ("required_state", _JSON),
+  ("can_be_auto_satisfied", _BOOL),
+  ("satisfied_by", _OPERATION_REF),
+)
+GRAPH_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+  ("protocol_fqn", _STR),
+  ("protocol_name", _STR),
+  ("execution_order", _STR_LIST),
+  ("machine_types", _STR_LIST),
+  ("resource_types", _STR_LIST),
+  ("has_loops", _BOOL),
+  ("has_conditionals", _BOOL),
+)
+
+TABLES: dict[str, tuple[tuple[str, _Kind], ...]] = {
+  "graph": GRAPH_COLUMNS,
+  "operations": OPERATION_COLUMNS,
+  "loops": LOOP_COLUMNS,
+  "resources": RESOURCE_COLUMNS,
+  "preconditions": PRECONDITION_COLUMNS,
+}
+# The model each table's rows are built from. The graph table holds the graph's
+# scalar fields; its node collections are the other tables.
+TABLE_MODELS: dict[str, type[BaseModel]] = {
+  "graph": ProtocolComputationGraph,
+  "operations": OperationNode,
+  "loops": LoopNode,
+  "resources": ResourceNode,
+  "preconditions": StatePrecondition,
+}
+# Bit ``i`` is set when the ``i``-th model field was not explicitly set.
+UNSET_COLUMN = "fields_unset"
+
+Table = dict[str, np.ndarray]
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _Encoder:
+  """Interns strings and resolves node IDs to rows while building tables."""
+
+  def __init__(self, graph: ProtocolComputationGraph) -> None:
+    self.strings: list[str] = []
+    self._index: dict[str, int] = {}
+    self.operation_rows: dict[str, int] = {}
+    for row, op in enumerate(graph.operations):
+      self.operation_rows.setdefault(op.id, row)
+    self.precondition_rows: dict[str, int] = {}
+    for row, precondition in enumerate(graph.preconditions):
+      self.precondition_rows.setdefault(precondition.id, row)
+
+  def intern(self, value: str | None) -> int:
+    if value is None:
+      return NONE_REF
+    index = self._index.get(value)
+    if index is None:
+      index = self._index[value] = len(self.strings)
+      self.strings.append(value)
+    return index
+
+  def reference(self, value: str | None, rows: dict[str, int]) -> int:
+    """Row of the node with ID ``value``; IDs outside the graph keep their string."""
+    if value is None:
+      return NONE_REF
+    row = rows.get(value)
+    return row if row is not None else -(self.intern(value) + 2)
+
+  def scalar(self, kind: _Kind, value: Any) -> int:
+    if kind in (_STR, _OPT_STR):
+      return self.intern(value)
+    if kind == _INT:
+      return value
+    if kind == _OPT_INT:
+      return NONE_INT if value is None else value
+    if kind == _BOOL:
+      return int(value)
+    if kind == _JSON:
+      return self.intern(json.dumps(value))
+    if kind == _OPERATION_REF:
+      return self.reference(value, self.operation_rows)
+    return _enum_members(kind).index(value)
+
+  def run(self, kind: _Kind, value: Any) -> list[int]:
+    if kind == _STR_LIST:
+      return [self.intern(item) for item in value]
+    if kind == _STR_MAP:
+      return [self.intern(item) for pair in value.items() for item in pair]
+    return [self.reference(item, self.precondition_rows) for item in value]
+
+  def table(self, rows: Sequence[dict[str, Any]], columns: tuple[tuple[str, _Kind], ...]) -> Table:
+    table: Table = {}
+    for name, kind in columns:
+      values = [row[name] for row in rows]
+      if kind in _LIST_KINDS:
+        runs = [self.run(kind, value) for value in values]
+        offsets = np.zeros(len(runs) + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum([len(run) for run in runs])
+        table[f"{name}.offsets"] = offsets
+        table[f"{name}.values"] = np.array([item for run in runs for item in run], dtype=np.int32)
+      else:
+        table[name] = np.array([self.scalar(kind, value) for value in values], dtype=np.int32)
+    return table
+
+
+class _Decoder:
+  """Turns columns back into Python values, one whole column at a time."""
+
+  def __init__(self, strings: list[str], tables: dict[str, Table]) -> None:
+    # The trailing None makes index NONE_REF (-1) decode to None.
+    self.strings = np.array([*strings, None], dtype=object)
+    self.operation_ids = self.strings[tables["operations"]["id"]]
+    self.precondition_ids = self.strings[tables["preconditions"]["id"]]
+
+  def _references(self, refs: np.ndarray, ids: np.ndarray) -> list[str | None]:
+    return [
+      ids[ref] if ref >= 0 else None if ref == NONE_REF else self.strings[-ref - 2]
+      for ref in refs.tolist()
+    ]
+
+  def scalar(self, kind: _Kind, column: np.ndarray) -> list[Any]:
+    if kind in (_STR, _OPT_STR):
+      return self.strings[column].tolist()
+    if kind == _INT:
+      return column.tolist()
+    if kind == _OPT_INT:
+      return [None if value == NONE_INT else value for value in column.tolist()]
+    if kind == _BOOL:
+      return column.astype(bool).tolist()
+    if kind == _JSON:
+      return [json.loads(value) for value in self.strings[column].tolist()]
+    if kind == _OPERATION_REF:
+      return self._references(column, self.operation_ids)
+    return np.array(_enum_members(kind), dtype=object)[column].tolist()
+
+  def runs(self, kind: _Kind, offsets: np.ndarray, values: np.ndarray) -> list[Any]:
+    if kind == _PRECONDITION_REFS:
+      items = self._references(values, self.precondition_ids)
+    else:
+      items = self.strings[values].tolist()
+    bounds = offsets.tolist()
+    if kind == _STR_MAP:
+      return [
+        dict(zip(items[start:end:2], items[start + 1 : end : 2], strict=True))
+        for start, end in itertools.pairwise(bounds)
+      ]
+    return [items[start:end] for start, end in itertools.pairwise(bounds)]
+
+  def table(self, table: Table, columns: tuple[tuple[str, _Kind], ...]) -> list[dict[str, Any]]:
+    decoded: dict[str, list[Any]] = {}
+    for name, kind in columns:
+      if kind in _LIST_KINDS:
+        decoded[name] = self.runs(kind, table[f"{name}.offsets"], table[f"{name}.values"])
+      else:
+        decoded[name] = self.scalar(kind, table[name])
+    names = list(decoded)
+    return [dict(zip(names, row, strict=True)) for row in zip(*decoded.values(), strict=True)]
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+  enabled = gc.isenabled()
+  gc.disable()
+  try:
+    yield
+  finally:
+    if enabled:
+      gc.enable()
+
+
+def _construct(model: type[ModelT], values: dict[str, Any], fields_set: set[str]) -> ModelT:
+  """Build ``model`` from a complete dict of already-valid field values in field order.
+
+  Equivalent to ``model.model_construct(_fields_set=fields_set, **values)`` for
+  these models (no aliases, private attributes or extras) without its
+  per-field alias and default lookups, which dominate conversion time for
+  large graphs.
+  """
+  instance = model.__new__(model)
+  object.__setattr__(instance, "__dict__", values)
+  object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+  object.__setattr__(instance, "__pydantic_extra__", None)
+  object.__setattr__(instance, "__pydantic_private__", None)
+  return instance
+
+
+def _with_defaults(model: type[BaseModel], values: dict[str, Any]) -> dict[str, Any]:
+  """Order ``values`` by field, giving fields without a column their defaults."""
+  return {
+    name: values[name] if name in values else field.get_default(call_default_factory=True)
+    for name, field in model.model_fields.items()
+  }
+
+
+@functools.cache
+def _field_bits(model: type[BaseModel]) -> dict[str, int]:
+  return {name: 1 << bit for bit, name in enumerate(model.model_fields)}
+
+
+def _unset_mask(instance: BaseModel) -> int:
+  bits = _field_bits(type(instance))
+  return sum(bits[name] for name in bits.keys() - instance.model_fields_set)
+
+
+@functools.cache
+def _fields_set(model: type[BaseModel], mask: int) -> frozenset[str]:
+  return frozenset(name for name, bit in _field_bits(model).items() if not mask & bit)
+
+
+@functools.cache
+def _enum_members(enum_type: type[Enum]) -> list[Enum]:
+  return list(enum_type)
+
+
+class CompactComputationGraph:
+  """A `ProtocolComputationGraph` stored as interned strings and int32 columns.
+
+  Attributes:
+      strings: The string table every string-valued column indexes into.
+      tables: Column arrays per node kind (``graph``, ``operations``, ``loops``,
+          ``resources``, ``preconditions``), keyed by field name; list fields
+          are stored as ``<field>.offsets`` and ``<field>.values``, and each
+          table has a ``fields_unset`` bitmask column.
+
+  """
+
+  def __init__(self, strings: list[str], tables: dict[str, Table]) -> None:
+    """Wrap an existing string table and column tables."""
+    self.strings = strings
+    self.tables = tables
+
+  @classmethod
+  def from_graph(cls, graph: ProtocolComputationGraph) -> CompactComputationGraph:
+    """Encode a computation graph into columns."""
+    encoder = _Encoder(graph)
+    rows = {
+      "graph": [graph.__dict__],
+      "operations": [op.__dict__ for op in graph.operations],
+      "loops": [loop.__dict__ for loop in graph.loops],
+      "resources": [{"key": key, **node.__dict__} for key, node in graph.resources.items()],
+      "preconditions": [precondition.__dict__ for precondition in graph.preconditions],
+    }
+    instances: dict[str, Sequence[BaseModel]] = {
+      "graph": [graph],
+      "operations": graph.operations,
+      "loops": graph.loops,
+      "resources": list(graph.resources.values()),
+      "preconditions": graph.preconditions,
+    }
+    tables = {name: encoder.table(rows[name], columns) for name, columns in TABLES.items()}
+    for name, table in tables.items():
+      table[UNSET_COLUMN] = np.array([_unset_mask(i) for i in instances[name]], dtype=np.int32)
+    return cls(encoder.strings, tables)
+
+  def to_graph(self) -> ProtocolComputationGraph:
+    """Rebuild the `ProtocolComputationGraph` this compact graph was encoded from.
+
+    The values were validated when the graph was first built, so the models
+    are constructed without validating them again. Conversion only allocates
+    acyclic containers, so the cyclic garbage collector is paused meanwhile;
+    otherwise its passes over the growing heap take most of the time.
+    """
+    with _gc_paused():
+      return self._to_graph()
+
+  def _to_graph(self) -> ProtocolComputationGraph:
+    decoder = _Decoder(self.strings, self.tables)
+
+    def nodes(name: str, rows: list[dict[str, Any]] | None = None) -> list[Any]:
+      model = TABLE_MODELS[name]
+      if rows is None:
+        rows = decoder.table(self.tables[name], TABLES[name])
+      if rows and len(rows[0]) != len(model.model_fields):
+        rows = [_with_defaults(model, row) for row in rows]
+      masks = self.tables[name][UNSET_COLUMN].tolist()
+      fields_set = {mask: _fields_set(model, mask) for mask in set(masks)}
+      return [
+        _construct(model, row, set(fields_set[mask])) for row, mask in zip(rows, masks, strict=True)
+      ]
+
+    resource_rows = decoder.table(self.tables["resources"], RESOURCE_COLUMNS)
+    keys = [row.pop("key") for row in resource_rows]
+    values = {
+      **decoder.table(self.tables["graph"], GRAPH_COLUMNS)[0],
+      "operations": nodes("operations"),
+      "resources": dict(zip(keys, nodes("resources", resource_rows), strict=True)),
+      "preconditions": nodes("preconditions"),
+      "loops": nodes("loops"),
+    }
+    # Keep the field order so the graph serializes exactly as the original did
+    return _construct(
+      ProtocolComputationGraph,
+      _with_defaults(ProtocolComputationGraph, values),
+      set(_fields_set(ProtocolComputationGraph, int(self.tables["graph"][UNSET_COLUMN][0]))),
+    )
+
+  @property
+  def num_operations(self) -> int:
+    """Number of operation rows."""
+    return len(self.tables["operations"]["id"])
+
+  def operation_preconditions(self, row: int) -> np.ndarray:
+    """Precondition rows required by the operation at ``row``.
+
+    Negative entries refer to precondition IDs that are not in the graph.
+    """
+    offsets = self.tables["operations"]["preconditions.offsets"]
+    return self.tables["operations"]["preconditions.values"][offsets[row] : offsets[row + 1]]
+
+  @property
+  def nbytes(self) -> int:
+    """Approximate in-memory size of the string table and columns, in bytes."""
+    strings = sum(len(value.encode()) for value in self.strings)
+    columns = sum(array.nbytes for table in self.tables.values() for array in table.values())
+    return strings + columns
+
+  def to_bytes(self, *, compress: bool = True) -> bytes:
+    """Serialize to the versioned binary format read by `from_bytes`."""
+    encoded = [value.encode() for value in self.strings]
+    arrays: list[tuple[str, np.ndarray]] = [
+      ("strings.lengths", np.array([len(value) for value in encoded], dtype=np.int32)),
+    ]
+    arrays.extend(
+      (f"{table_name}:{column}", array)
+      for table_name, table in self.tables.items()
+      for column, array in table.items()
+    )
+    blob = b"".join(encoded)
+    manifest = json.dumps(
+      {
+        "compressed": compress,
+        "strings_nbytes": len(blob),
+        "columns": [[name, len(array)] for name, array in arrays],
+      },
+    ).encode()
+    body = b"".join([blob, *(array.astype("<i4").tobytes() for _, array in arrays)])
+    if compress:
+      body = zlib.compress(body)
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(manifest)) + manifest + body
+
+  @classmethod
+  def from_bytes(cls, data: bytes) -> CompactComputationGraph:
+    """Load a compact graph written by `to_bytes`.
+
+    Raises:
+        ValueError: If ``data`` is not a compact graph or uses an unsupported
+            format version.
+
+    """
+    if len(data) < _HEADER.size:
+      msg = "Data is too short to be a compact computation graph."
+      raise ValueError(msg)
+    magic, version, manifest_length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+      msg = "Data is not a compact computation graph."
+      raise ValueError(msg)
+    if version != FORMAT_VERSION:
+      msg = f"Unsupported compact graph format version {version} (expected {FORMAT_VERSION})."
+      raise ValueError(msg)
+    start = _HEADER.size + manifest_length
+    manifest = json.loads(data[_HEADER.size : start])
+    body = data[start:]
+    if manifest["compressed"]:
+      body = zlib.decompress(body)
+
+    offset = manifest["strings_nbytes"]
+    tables: dict[str, Table] = {name: {} for name in TABLES}
+    for name, length in manifest["columns"]:
+      array = np.frombuffer(body, dtype="<i4", count=length, offset=offset)
+      offset += length * 4
+      if name == "strings.lengths":
+        lengths = array
+      else:
+        table_name, column = name.split(":", 1)
+        tables[table_name][column] = array
+
+    edges = [0, *itertools.accumulate(lengths.tolist())]
+    strings = [body[a:b].decode() for a, b in itertools.pairwise(edges)]
+    return cls(strings, tables)
+
+
+def compact_graph(graph: ProtocolComputationGraph | dict[str, Any]) -> CompactComputationGraph:
+  """Build a `CompactComputationGraph` from a graph model or its JSON dict."""
+  if isinstance(graph, dict):
+    graph = ProtocolComputationGraph.model_validate(graph)
+  return CompactComputationGraph.from_graph(graph)
@@ -553,6 +553,31 @@ class OperationNode(BaseModel):
   false_branch: list[str] = Field(default_factory=list, description="False branch node IDs")
 
 
+class LoopNode(BaseModel):
+  """A loop in the protocol execution graph, with its body stored once.
+
+  The body lists operation and nested loop IDs for a single iteration. The
+  iteration count is exact when it is known at extraction time (e.g. unrolled
+  iterations collapsed by the tracer); otherwise it is left to be resolved
+  from `source_expression` and resource dimensions (see `BoundsAnalyzer`).
+  """
+
+  id: str = Field(description="Unique identifier for this loop")
+  line_number: int = Field(default=0, description="Source line number")
+  loop_variable: str | None = Field(default=None, description="Loop target variable name")
+  source_expression: str = Field(description="Expression being iterated (e.g., 'plate.wells()')")
+  body: list[str] = Field(
+    default_factory=list, description="Operation and loop IDs of one iteration, in order"
+  )
+  iteration_count: int | None = Field(
+    default=None, description="Exact number of iterations, if known"
+  )
+  max_iterations: int | None = Field(
+    default=None, description="Upper bound on iterations, if known"
+  )
+  inferred_from: str | None = Field(default=None, description="How the count was determined")
+
+
 class ResourceNode(BaseModel):
   """A resource referenced in the protocol.
 
@@ -624,7 +649,10 @@ class ProtocolComputationGraph(BaseModel):
     default_factory=list, description="All state preconditions"
   )
   execution_order: list[str] = Field(
-    default_factory=list, description="Operation IDs in execution order"
+    default_factory=list, description="Operation and loop IDs in execution order"
+  )
+  loops: list[LoopNode] = Field(
+    default_factory=list, description="Loops; their bodies are not repeated in execution_order"
   )
 
   # Summary fields
@@ -653,3 +681,33 @@ class ProtocolComputationGraph(BaseModel):
   def get_resource(self, var_name: str) -> ResourceNode | None:
     """Get a resource by its variable name."""
     return self.resources.get(var_name)
+
+  def get_loop(self, loop_id: str) -> LoopNode | None:
+    """Get a loop by its ID."""
+    for loop in self.loops:
+      if loop.id == loop_id:
+        return loop
+    return None
+
+  def ordered_operations(self) -> list[OperationNode]:
+    """Return operations in execution order, with each loop body listed once.
+
+    Falls back to `operations` for graphs without an execution order.
+    """
+    if not self.execution_order:
+      return list(self.operations)
+    operations = {op.id: op for op in self.operations}
+    loops = {loop.id: loop for loop in self.loops}
+    ordered: list[OperationNode] = []
+
+    def visit(node_ids: list[str]) -> None:
+      for node_id in node_ids:
+        if node_id in loops:
+          visit(loops[node_id].body)
+        elif node_id in operations:
+          op = operations[node_id]
+          ordered.append(op)
+          visit([child for child in op.foreach_body if child != op.id])
+
+    visit(self.execution_order)
+    return ordered
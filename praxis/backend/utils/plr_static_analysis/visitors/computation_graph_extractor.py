@@ -5,7 +5,7 @@ to extract a computational graph representation, including:
 - Operation nodes (method calls on machines)
 - Resource nodes (PLR resources used)
 - State preconditions (requirements for each operation)
-- Execution order
+- Execution order, with each ``for`` loop body stored once as a LoopNode
 
 The extractor tracks variable types and infers preconditions from known
 method patterns (e.g., `lh.transfer()` requires tips loaded).
@@ -17,6 +17,7 @@ import libcst as cst
 
 from praxis.backend.utils.plr_static_analysis.models import (
   GraphNodeType,
+  LoopNode,
   OperationNode,
   PreconditionType,
   ProtocolComputationGraph,
@@ -27,11 +28,7 @@ from praxis.backend.utils.plr_static_analysis.resource_hierarchy import (
   DeckLayoutType,
   get_parental_chain,
 )
-from praxis.common.type_inspection import (
-  extract_resource_types,
-  get_element_type,
-  is_container_type,
-)
+from praxis.common.type_inspection import describe_type
 
 # =============================================================================
 # Method Patterns and Preconditions
@@ -160,7 +157,7 @@ class VariableTypeTracker:
 
     # list[X][0] -> X
     if base_type.startswith("list["):
-      elem = get_element_type(base_type)
+      elem = describe_type(base_type).element_type
       if elem:
         return elem
 
@@ -236,12 +233,15 @@ class ComputationGraphExtractor(cst.CSTVisitor):
     self._resources: dict[str, ResourceNode] = {}
     self._preconditions: list[StatePrecondition] = []
     self._execution_order: list[str] = []
+    self._loops: list[LoopNode] = []
+    self._loop_stack: list[LoopNode] = []  # Innermost last
 
     # State tracking
     self._active_states: set[str] = set()  # Currently active states (e.g., "tips_loaded")
     self._machine_types: set[str] = set()
     self._op_counter = 0
     self._precond_counter = 0
+    self._loop_counter = 0
     self._has_loops = False
     self._has_conditionals = False
 
@@ -254,11 +254,12 @@ class ComputationGraphExtractor(cst.CSTVisitor):
   def _initialize_resources_from_params(self, parameter_types: dict[str, str]) -> None:
     """Create ResourceNode entries for all PLR resource parameters."""
     for param_name, type_hint in parameter_types.items():
-      resource_types = extract_resource_types(type_hint)
+      descriptor = describe_type(type_hint)
+      resource_types = descriptor.resource_types
       if resource_types:
         # This parameter is a PLR resource
-        elem_type = get_element_type(type_hint)
-        is_container = is_container_type(type_hint)
+        elem_type = descriptor.element_type
+        is_container = descriptor.is_container
 
         # Get primary resource type for parental chain
         primary_type = elem_type if elem_type else resource_types[0]
@@ -350,10 +351,38 @@ class ComputationGraphExtractor(cst.CSTVisitor):
     return receiver_name, receiver_type
 
   def visit_For(self, node: cst.For) -> bool:  # noqa: N802
-    """Track that the protocol contains loops."""
+    """Open a loop whose body collects the operations visited inside it.
+
+    The iteration count is left symbolic (the iterated expression); it is
+    resolved from resource dimensions when the graph is replayed.
+    """
     self._has_loops = True
+    self._loop_counter += 1
+    target = node.target.value if isinstance(node.target, cst.Name) else None
+    self._loop_stack.append(
+      LoopNode(
+        id=f"loop_{self._loop_counter}",
+        line_number=self._current_line,
+        loop_variable=target,
+        source_expression=self._get_expr_source(node.iter),
+      )
+    )
     return True
 
+  def leave_For(self, original_node: cst.For) -> None:  # noqa: N802
+    """Close the innermost loop and place it in its parent's sequence."""
+    if self._loop_stack:
+      loop = self._loop_stack.pop()
+      self._loops.append(loop)
+      self._append_to_sequence(loop.id)
+
+  def _append_to_sequence(self, node_id: str) -> None:
+    """Append a node to the innermost loop body, or the execution order."""
+    if self._loop_stack:
+      self._loop_stack[-1].body.append(node_id)
+    else:
+      self._execution_order.append(node_id)
+
   def visit_While(self, node: cst.While) -> bool:  # noqa: N802
     """Track that the protocol contains loops."""
     self._has_loops = True
@@ -378,9 +407,10 @@ class ComputationGraphExtractor(cst.CSTVisitor):
           self._type_tracker.set_type(var_name, inferred_type, source_expr)
 
           # If this is a PLR resource, add a ResourceNode
-          resource_types = extract_resource_types(inferred_type)
+          descriptor = describe_type(inferred_type)
+          resource_types = descriptor.resource_types
           if resource_types:
-            elem_type = get_element_type(inferred_type)
+            elem_type = descriptor.element_type
             primary_type = elem_type if elem_type else resource_types[0]
             chain = get_parental_chain(primary_type, self._deck_layout_type)
 
@@ -388,7 +418,7 @@ class ComputationGraphExtractor(cst.CSTVisitor):
               variable_name=var_name,
               declared_type=inferred_type,
               element_type=elem_type,
-              is_container=is_container_type(inferred_type),
+              is_container=descriptor.is_container,
               is_parameter=False,
               parental_chain=chain.chain,
               source_expression=source_expr,
@@ -410,7 +440,7 @@ class ComputationGraphExtractor(cst.CSTVisitor):
             key = self._get_expr_source(key_node).strip("\"'")
             return self._type_tracker.infer_subscript_type(base_type, key)
         # Default to list of element type
-        elem = get_element_type(base_type)
+        elem = describe_type(base_type).element_type
         if elem:
           return f"list[{elem}]"
       return None
@@ -487,8 +517,10 @@ class ComputationGraphExtractor(cst.CSTVisitor):
         depends_on_params=depends_on,
       )
 
+      if self._loop_stack:
+        operation.foreach_source = self._loop_stack[-1].source_expression
       self._operations.append(operation)
-      self._execution_order.append(op_id)
+      self._append_to_sequence(op_id)
 
     return True
 
@@ -550,8 +582,7 @@ class ComputationGraphExtractor(cst.CSTVisitor):
     # Collect all resource types
     resource_types: set[str] = set()
     for res in self._resources.values():
-      for rt in extract_resource_types(res.declared_type):
-        resource_types.add(rt)
+      resource_types.update(describe_type(res.declared_type).resource_types)
 
     return ProtocolComputationGraph(
       protocol_fqn=self._protocol_fqn,
@@ -560,6 +591,7 @@ class ComputationGraphExtractor(cst.CSTVisitor):
       resources=self._resources,
       preconditions=self._preconditions,
       execution_order=self._execution_order,
+      loops=self._loops,
       machine_types=sorted(self._machine_types),
       resource_types=sorted(resource_types),
       has_loops=self._has_loops,
@@ -620,7 +652,8 @@ def _walk_cst_node(node: cst.CSTNode, visitor: cst.CSTVisitor) -> None:
   """Manually walk a CST node with a visitor.
 
   LibCST's walk method is only available on Module, so we need to
-  manually traverse the tree for other node types.
+  manually traverse the tree for other node types. ``leave_`` methods are
+  called after a node's children, as LibCST does.
   """
   # Visit this node
   should_descend = True
@@ -639,6 +672,10 @@ def _walk_cst_node(node: cst.CSTNode, visitor: cst.CSTVisitor) -> None:
       if isinstance(child, cst.CSTNode):
         _walk_cst_node(child, visitor)
 
+  leave_method = getattr(visitor, f"leave_{node_type}", None)
+  if leave_method:
+    leave_method(node)
+
 
 def extract_graph_from_source(
   source: str,
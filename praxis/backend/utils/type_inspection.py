@@ -6,6 +6,8 @@ from typing import Any, Union, get_args, get_origin
 
 from praxis.common.type_inspection import (
   PLR_RESOURCE_TYPES,
+  TypeDescriptor,
+  describe_type,
   extract_resource_types,
   get_element_type,
   is_container_type,
@@ -15,6 +17,8 @@ from praxis.common.type_inspection import (
 
 __all__ = [
   "PLR_RESOURCE_TYPES",
+  "TypeDescriptor",
+  "describe_type",
   "extract_resource_types",
   "fqn_from_hint",
   "get_element_type",
@@ -1,9 +1,11 @@
 # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements,fixme,logging-fstring-interpolation
 """Utilities for inspecting and serializing Python types."""
 
+import functools
 import inspect
 import re
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, Union, get_args, get_origin
 
 # =============================================================================
@@ -42,9 +44,132 @@ _PLR_RESOURCE_PATTERN = re.compile(
   r"\b(" + "|".join(sorted(PLR_RESOURCE_TYPES, key=len, reverse=True)) + r")\b"
 )
 
+# Container type hints: list[X], Sequence[X], tuple[X, ...], ...
+_CONTAINER_PATTERN = re.compile(r"^(?:list|Sequence|tuple|set|frozenset)\[")
+_CONTAINER_ELEMENT_PATTERN = re.compile(r"^(?:list|Sequence|tuple|set|frozenset)\[([^\[\],]+)")
+
+# Machine type names, checked in order, and the machine category they denote
+MACHINE_TYPE_PATTERNS: dict[str, str] = {
+  "LiquidHandler": "liquid_handler",
+  "PlateReader": "plate_reader",
+  "HeaterShaker": "heater_shaker",
+  "Shaker": "shaker",
+  "Centrifuge": "centrifuge",
+  "Thermocycler": "thermocycler",
+  "TemperatureController": "temperature_controller",
+  "Incubator": "incubator",
+  "Pump": "pump",
+  "PumpArray": "pump_array",
+  "Fan": "fan",
+  "Sealer": "sealer",
+  "Peeler": "peeler",
+  "PowderDispenser": "powder_dispenser",
+}
+
+TYPE_DESCRIPTOR_CACHE_SIZE = 4096
+"""Number of distinct type hints whose descriptors are cached"""
+
+# =============================================================================
+# Type Descriptors
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class TypeDescriptor:
+  """What a type hint means for discovery, tracing and simulation.
+
+  Obtained from `describe_type`, which parses each hint once. Descriptors
+  are interned: every hint with the same meaning shares one object.
+  """
+
+  resource_types: tuple[str, ...] = ()
+  """Unique PLR resource type names in the hint, in order of appearance"""
+
+  is_container: bool = False
+  """Whether the hint is a container (list, tuple, Sequence, ...)"""
+
+  element_type: str | None = None
+  """PLR element type of a container hint (e.g. 'Well' for list[Well])"""
+
+  machine_type: str | None = None
+  """Machine category (e.g. 'liquid_handler'), if the hint names a machine"""
+
+  is_resource: bool = False
+  """Whether the hint is a PyLabRobot resource (see `is_pylabrobot_resource`)"""
+
+
+_INTERNED: dict[TypeDescriptor, TypeDescriptor] = {}
+# Bounded by construction: every field draws from a fixed set of names.
+
+
+def describe_type(type_or_str: Any) -> TypeDescriptor:
+  """Return the descriptor of a type hint (runtime type or string annotation).
+
+  Results are cached per hint (up to ``TYPE_DESCRIPTOR_CACHE_SIZE`` hints);
+  unhashable hints are parsed on every call.
+
+  Examples:
+      >>> describe_type("list[Well]").element_type
+      'Well'
+      >>> describe_type("LiquidHandler").machine_type
+      'liquid_handler'
+
+  """
+  try:
+    hash(type_or_str)
+  except TypeError:
+    return _intern(_describe(type_or_str))
+  return _describe_cached(type_or_str)
+
+
+@functools.lru_cache(maxsize=TYPE_DESCRIPTOR_CACHE_SIZE)
+def _describe_cached(type_or_str: Any) -> TypeDescriptor:
+  return _intern(_describe(type_or_str))
+
+
+def _intern(descriptor: TypeDescriptor) -> TypeDescriptor:
+  return _INTERNED.setdefault(descriptor, descriptor)
+
+
+def _describe(type_or_str: Any) -> TypeDescriptor:
+  """Parse a type hint into a (not yet interned) descriptor."""
+  if isinstance(type_or_str, str):
+    return TypeDescriptor(
+      resource_types=tuple(_extract_from_string(type_or_str)),
+      is_container=bool(_CONTAINER_PATTERN.match(type_or_str.strip())),
+      element_type=_get_element_type_from_string(type_or_str),
+      machine_type=_match_machine_type(type_or_str),
+      is_resource=_is_resource(type_or_str),
+    )
+
+  origin = get_origin(type_or_str)
+  return TypeDescriptor(
+    resource_types=tuple(_extract_from_runtime_type(type_or_str)),
+    is_container=origin in (list, tuple, set, frozenset) or origin is Sequence,
+    element_type=_get_element_type_from_runtime(type_or_str),
+    machine_type=_match_machine_type(getattr(type_or_str, "__name__", str(type_or_str))),
+    is_resource=_is_resource(type_or_str),
+  )
+
+
+def _match_machine_type(type_str: str) -> str | None:
+  for pattern, machine_type in MACHINE_TYPE_PATTERNS.items():
+    if pattern in type_str:
+      return machine_type
+  return None
+
+
+# =============================================================================
+# Type Hint Queries
+# =============================================================================
+
 
 def is_pylabrobot_resource(type_or_str: Any) -> bool:
   """Check if the given type or string is a Pylabrobot Resource."""
+  return describe_type(type_or_str).is_resource
+
+
+def _is_resource(type_or_str: Any) -> bool:
   if isinstance(type_or_str, str):
     return (
       "Plate" in type_or_str
@@ -57,7 +182,7 @@ def is_pylabrobot_resource(type_or_str: Any) -> bool:
   if origin is Union:
     args = get_args(type_or_str)
     # Return True if ANY arg is a resource
-    return any(is_pylabrobot_resource(arg) for arg in args if arg is not type(None))
+    return any(_is_resource(arg) for arg in args if arg is not type(None))
 
   if hasattr(type_or_str, "__module__") and "pylabrobot" in getattr(type_or_str, "__module__", ""):
     return True
@@ -92,10 +217,7 @@ def extract_resource_types(type_or_str: Any) -> list[str]:
       ['Well']
 
   """
-  if isinstance(type_or_str, str):
-    return _extract_from_string(type_or_str)
-
-  return _extract_from_runtime_type(type_or_str)
+  return list(describe_type(type_or_str).resource_types)
 
 
 def _extract_from_string(type_str: str) -> list[str]:
@@ -213,16 +335,13 @@ def get_element_type(type_or_str: Any) -> str | None:
       None
 
   """
-  if isinstance(type_or_str, str):
-    return _get_element_type_from_string(type_or_str)
-  return _get_element_type_from_runtime(type_or_str)
+  return describe_type(type_or_str).element_type
 
 
 def _get_element_type_from_string(type_str: str) -> str | None:
   """Extract element type from a string container type hint."""
   # Match patterns like list[X], Sequence[X], tuple[X, ...]
-  container_pattern = r"^(?:list|Sequence|tuple|set|frozenset)\[([^\[\],]+)"
-  match = re.match(container_pattern, type_str.strip())
+  match = _CONTAINER_ELEMENT_PATTERN.match(type_str.strip())
   if match:
     inner = match.group(1).strip()
     # Check if the inner type is a PLR resource
@@ -272,13 +391,7 @@ def is_container_type(type_or_str: Any) -> bool:
       True
 
   """
-  if isinstance(type_or_str, str):
-    return bool(
-      re.match(r"^(?:list|Sequence|tuple|set|frozenset)\[", type_or_str.strip())
-    )
-
-  origin = get_origin(type_or_str)
-  return origin in (list, tuple, set, frozenset) or origin is Sequence
+  return describe_type(type_or_str).is_container
 
 
 def serialize_type_hint(type_hint: Any) -> str:
@@ -0,0 +1,184 @@
+"""Benchmark loading and holding large computation graphs, pydantic vs columnar.
+
+Builds a synthetic `ProtocolComputationGraph` of ``--operations`` liquid
+handling operations (with loops, resources and preconditions in proportion)
+and compares:
+
+- ``size``: bytes stored as JSON (the ``computation_graph`` column today) and as
+  `CompactComputationGraph.to_bytes`;
+- ``memory``: bytes allocated to hold the pydantic graph and the compact graph;
+- ``load``: time from stored form to a usable graph — validating the JSON dict
+  or string, loading the compact bytes, and loading them back into the model.
+
+Usage:
+  python scripts/benchmark_compact_graph.py --operations 10000 --repeat 5
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+  sys.path.insert(0, str(PROJECT_ROOT))
+
+from praxis.backend.utils.plr_static_analysis.compact_graph import (  # noqa: E402
+  CompactComputationGraph,
+)
+from praxis.backend.utils.plr_static_analysis.models import (  # noqa: E402
+  LoopNode,
+  OperationNode,
+  PreconditionType,
+  ProtocolComputationGraph,
+  ResourceNode,
+  StatePrecondition,
+)
+
+METHODS = ("pick_up_tips", "aspirate", "dispense", "drop_tips")
+LOOP_BODY = 8
+
+
+def synthetic_graph(operations: int) -> ProtocolComputationGraph:
+  """Return a graph of ``operations`` operations over a few plates and tip racks."""
+  resources = {
+    name: ResourceNode(
+      variable_name=name,
+      declared_type=declared_type,
+      element_type="Well" if declared_type == "Plate" else None,
+      is_container=declared_type == "Plate",
+      parental_chain=[f"{declared_type}Carrier", "Deck"],
+      items_x=12,
+      items_y=8,
+    )
+    for name, declared_type in (
+      ("source", "Plate"),
+      ("dest", "Plate"),
+      ("tips", "TipRack"),
+    )
+  }
+  ops: list[OperationNode] = []
+  preconditions: list[StatePrecondition] = []
+  loops: list[LoopNode] = []
+  order: list[str] = []
+  for i in range(operations):
+    method = METHODS[i % len(METHODS)]
+    well = f"{'ABCDEFGH'[i % 8]}{i % 12 + 1}"
+    target = "tips" if method in ("pick_up_tips", "drop_tips") else ("source", "dest")[i % 2]
+    precondition = StatePrecondition(
+      id=f"precond_{i}",
+      precondition_type=PreconditionType.TIPS_LOADED
+      if method != "pick_up_tips"
+      else PreconditionType.RESOURCE_ON_DECK,
+      resource_variable=target,
+      resource_type=resources[target].declared_type,
+      satisfied_by=f"op_{i - i % len(METHODS)}" if method != "pick_up_tips" else None,
+    )
+    preconditions.append(precondition)
+    ops.append(
+      OperationNode(
+        id=f"op_{i}",
+        line_number=10 + i,
+        method_name=method,
+        receiver_variable="lh",
+        receiver_type="LiquidHandler",
+        arguments={"resource": f'{target}["{well}"]', "vols": "volume"},
+        preconditions=[precondition.id],
+        creates_state=[f"{target}.{method}"],
+        depends_on_params=["volume"] if method in ("aspirate", "dispense") else [],
+      ),
+    )
+    if i % (LOOP_BODY * 4) == 0:
+      loop_id = f"loop_{len(loops)}"
+      loops.append(
+        LoopNode(
+          id=loop_id,
+          line_number=10 + i,
+          loop_variable="well",
+          source_expression="source.wells()",
+          body=[f"op_{j}" for j in range(i, min(i + LOOP_BODY, operations))],
+          iteration_count=96,
+          inferred_from="items_x*items_y",
+        ),
+      )
+      order.append(loop_id)
+    elif i % (LOOP_BODY * 4) >= LOOP_BODY:
+      order.append(f"op_{i}")
+  return ProtocolComputationGraph(
+    protocol_fqn="benchmarks.synthetic",
+    protocol_name="synthetic",
+    operations=ops,
+    resources=resources,
+    preconditions=preconditions,
+    execution_order=order,
+    loops=loops,
+    machine_types=["liquid_handler"],
+    resource_types=["Plate", "TipRack", "Well"],
+    has_loops=bool(loops),
+  )
+
+
+def allocated(build) -> int:
+  """Bytes still allocated by the object ``build()`` returns."""
+  gc.collect()
+  tracemalloc.start()
+  obj = build()
+  size, _ = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  del obj
+  return size
+
+
+def median_time(load, repeat: int) -> float:
+  """Median seconds taken by ``load()``."""
+  timings = []
+  for _ in range(repeat):
+    start = time.perf_counter()
+    load()
+    timings.append(time.perf_counter() - start)
+  return statistics.median(timings)
+
+
+def main() -> None:
+  """Run the benchmark."""
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--operations", type=int, default=10_000)
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  graph = synthetic_graph(args.operations)
+  as_dict = graph.model_dump(mode="json")
+  as_json = json.dumps(as_dict)
+  compact = CompactComputationGraph.from_graph(graph)
+  as_bytes = compact.to_bytes()
+  if CompactComputationGraph.from_bytes(as_bytes).to_graph() != graph:
+    sys.exit("compact round trip does not reproduce the graph")
+
+  print(
+    f"{len(graph.operations)} operations, {len(graph.preconditions)} preconditions, "
+    f"{len(graph.loops)} loops, {len(compact.strings)} interned strings"
+  )
+  print("size")
+  print(f"  {'json':<22} {len(as_json) / 1e6:8.2f} MB")
+  print(f"  {'compact bytes':<22} {len(as_bytes) / 1e6:8.2f} MB")
+  print("memory")
+  pydantic_bytes = allocated(lambda: ProtocolComputationGraph.model_validate_json(as_json))
+  compact_bytes = allocated(lambda: CompactComputationGraph.from_bytes(as_bytes))
+  print(f"  {'pydantic graph':<22} {pydantic_bytes / 1e6:8.2f} MB")
+  print(f"  {'compact graph':<22} {compact_bytes / 1e6:8.2f} MB")
+  print(f"load (median of {args.repeat})")
+  for name, load in (
+    ("model_validate(dict)", lambda: ProtocolComputationGraph.model_validate(as_dict)),
+    ("model_validate_json", lambda: ProtocolComputationGraph.model_validate_json(as_json)),
+    ("compact from_bytes", lambda: CompactComputationGraph.from_bytes(as_bytes)),
+    ("compact to_graph", lambda: CompactComputationGraph.from_bytes(as_bytes).to_graph()),
+  ):
+    print(f"  {name:<22} {median_time(load, args.repeat) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,106 @@
+"""Benchmark offset vs. keyset pagination on a large function call log table.
+
+Seeds an in-memory SQLite database with ``--rows`` function call logs and
+times fetching one page at increasing depths with LIMIT/OFFSET and with keyset
+pagination. Offset pages get slower the deeper they are because the skipped
+rows are still read; keyset pages seek straight to the cursor and stay flat.
+
+Usage:
+  python scripts/benchmark_pagination.py --rows 200000 --limit 100
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import praxis.backend.models  # noqa: F401 - models must be imported to register with Base
+from praxis.backend.models.domain.filters import SearchFilters
+from praxis.backend.models.domain.protocol import FunctionCallLog
+from praxis.backend.models.enums import FunctionCallStatusEnum
+from praxis.backend.services.utils.query_builder import apply_pagination, encode_keyset_cursor
+from praxis.backend.utils.db import Base
+from praxis.backend.utils.uuid import uuid7
+
+SEED_BATCH_SIZE = 5000
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+  """Insert ``rows`` function call logs belonging to a single run."""
+  run_id = uuid7()
+  definition_id = uuid7()
+  start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+  for offset in range(0, rows, SEED_BATCH_SIZE):
+    batch = [
+      {
+        "accession_id": uuid7(),
+        "created_at": start + timedelta(milliseconds=index),
+        "name": f"call_{index}",
+        "sequence_in_run": index,
+        "start_time": start + timedelta(milliseconds=index),
+        "status": FunctionCallStatusEnum.SUCCESS,
+        "protocol_run_accession_id": run_id,
+        "function_protocol_definition_accession_id": definition_id,
+      }
+      for index in range(offset, min(offset + SEED_BATCH_SIZE, rows))
+    ]
+    await session.execute(insert(FunctionCallLog), batch)
+  await session.commit()
+
+
+async def time_page(session: AsyncSession, filters: SearchFilters, repeat: int) -> float:
+  """Return the best wall-clock time, in milliseconds, to fetch one page."""
+  stmt = apply_pagination(select(FunctionCallLog).order_by(FunctionCallLog.accession_id), filters)
+  best = float("inf")
+  for _ in range(repeat):
+    began = time.perf_counter()
+    result = await session.execute(stmt)
+    result.scalars().all()
+    best = min(best, time.perf_counter() - began)
+    session.expunge_all()
+  return best * 1000
+
+
+async def main(rows: int, limit: int, repeat: int) -> None:
+  """Seed the table and print page latency at several depths."""
+  engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+  async with engine.begin() as conn:
+    await conn.run_sync(Base.metadata.create_all)
+  session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+  async with session_factory() as session:
+    await seed(session, rows)
+
+    depths = [
+      depth for depth in (0, rows // 100, rows // 10, rows // 2, rows - limit) if depth >= 0
+    ]
+    print(f"{'depth':>10} {'offset ms':>12} {'keyset ms':>12}")
+    for depth in depths:
+      offset_ms = await time_page(session, SearchFilters(limit=limit, offset=depth), repeat)
+
+      cursor = None
+      if depth:
+        anchor = await session.scalar(
+          select(FunctionCallLog).order_by(FunctionCallLog.accession_id).offset(depth - 1).limit(1),
+        )
+        cursor = encode_keyset_cursor(anchor, None)
+      keyset_ms = await time_page(
+        session,
+        SearchFilters(limit=limit, keyset=True, cursor=cursor),
+        repeat,
+      )
+      print(f"{depth:>10} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+  await engine.dispose()
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--rows", type=int, default=200_000, help="Rows to seed.")
+  parser.add_argument("--limit", type=int, default=100, help="Page size.")
+  parser.add_argument("--repeat", type=int, default=5, help="Timed runs per page.")
+  args = parser.parse_args()
+  asyncio.run(main(args.rows, args.limit, args.repeat))
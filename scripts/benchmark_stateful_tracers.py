@@ -0,0 +1,143 @@
+"""Benchmark stateful tracer dispatch and simulation of the bundled protocols.
+
+Two measurements:
+
+- ``dispatch``: a `StatefulTracedMachine` executes ``--calls`` liquid-handling
+  calls (pick up, aspirate, dispense, drop) at each state level, once live and
+  once replaying the recorded calls, the way the hierarchical simulator
+  re-evaluates a trace at the symbolic and exact levels.
+- ``protocols``: each protocol under ``praxis/protocol/protocols`` is run
+  through the hierarchical simulator ``--repeat`` times.
+
+Usage:
+  python scripts/benchmark_stateful_tracers.py --calls 40000 --repeat 20
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROTOCOLS_DIR = PROJECT_ROOT / "praxis" / "protocol" / "protocols"
+if str(PROJECT_ROOT) not in sys.path:
+  sys.path.insert(0, str(PROJECT_ROOT))
+
+import libcst as cst  # noqa: E402
+
+from praxis.backend.core.simulation.pipeline import simulate_protocol_sync  # noqa: E402
+from praxis.backend.core.simulation.state_models import SimulationState  # noqa: E402
+from praxis.backend.core.simulation.stateful_tracers import StatefulTracedMachine  # noqa: E402
+from praxis.backend.core.tracing.recorder import OperationRecorder  # noqa: E402
+from praxis.backend.core.tracing.tracers import TracedWell  # noqa: E402
+from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (  # noqa: E402
+  ProtocolFunctionVisitor,
+)
+
+STATE_LEVELS = {
+  "boolean": SimulationState.default_boolean,
+  "symbolic": SimulationState.default_symbolic,
+  "exact": SimulationState.default_exact,
+}
+
+
+def _initial_state(level: str, source: str, dest: str) -> SimulationState:
+  state = STATE_LEVELS[level]()
+  if level == "exact":
+    state.liquid_state.set_volume(source, 1e9, max_capacity=1e9)
+    state.liquid_state.set_volume(dest, 0.0, max_capacity=1e9)
+  return state
+
+
+def _machine(state: SimulationState, call_log: list | None = None) -> StatefulTracedMachine:
+  return StatefulTracedMachine(
+    name="lh",
+    recorder=OperationRecorder(protocol_fqn="benchmark"),
+    declared_type="LiquidHandler",
+    machine_type="liquid_handler",
+    state=state,
+    call_log=call_log,
+  )
+
+
+def run_dispatch(calls: int) -> None:
+  """Time live calls and replayed calls at each state level."""
+  recorder = OperationRecorder(protocol_fqn="benchmark")
+  source = TracedWell(name="plate[A1]", recorder=recorder, declared_type="Well")
+  dest = TracedWell(name="plate[B1]", recorder=recorder, declared_type="Well")
+
+  print(f"dispatch ({calls} calls)")
+  for level in STATE_LEVELS:
+    call_log: list = []
+    machine = _machine(_initial_state(level, source.name, dest.name), call_log)
+    start = time.perf_counter()
+    for _ in range(calls // 4):
+      machine.pick_up_tips("tips")
+      machine.aspirate(source, 10)
+      machine.dispense(dest, 10)
+      machine.drop_tips("tips")
+    live = time.perf_counter() - start
+
+    replayer = _machine(_initial_state(level, source.name, dest.name))
+    start = time.perf_counter()
+    for call in call_log:
+      replayer.replay_call(call)
+    replay = time.perf_counter() - start
+
+    print(
+      f"  {level:<9} live {live * 1e6 / calls:6.2f} us/call"
+      f"   replay {replay * 1e6 / calls:6.2f} us/call"
+      f"   violations {len(machine.violations)}/{len(replayer.violations)}"
+    )
+
+
+def _bundled_protocols() -> list[tuple[str, object, dict[str, str]]]:
+  protocols = []
+  for path in sorted(PROTOCOLS_DIR.glob("*.py")):
+    if path.name == "__init__.py":
+      continue
+    module_name = f"praxis.protocol.protocols.{path.stem}"
+    visitor = ProtocolFunctionVisitor(module_name, str(path))
+    cst.parse_module(path.read_text()).visit(visitor)
+    module = importlib.import_module(module_name)
+    protocols.extend(
+      (
+        definition.name,
+        getattr(module, definition.name),
+        {p.name: p.type_hint for p in definition.parameters},
+      )
+      for definition in visitor.definitions
+    )
+  return protocols
+
+
+def run_protocols(repeat: int) -> None:
+  """Time the hierarchical simulation of each bundled protocol."""
+  print(f"protocols (median of {repeat})")
+  total = 0.0
+  for name, func, parameter_types in _bundled_protocols():
+    timings = []
+    for _ in range(repeat):
+      start = time.perf_counter()
+      simulate_protocol_sync(func, parameter_types)
+      timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    total += median
+    print(f"  {name:<32} {median * 1e3:8.2f} ms")
+  print(f"  {'total':<32} {total * 1e3:8.2f} ms")
+
+
+def main() -> None:
+  """Run the benchmarks."""
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--calls", type=int, default=40_000)
+  parser.add_argument("--repeat", type=int, default=20)
+  args = parser.parse_args()
+  run_dispatch(args.calls)
+  run_protocols(args.repeat)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,94 @@
+"""Benchmark type-hint analysis on the type hints of the bundled protocols.
+
+Collects the parameter type hints of every protocol under
+``praxis/protocol/protocols`` (plus the container hints tracing derives from
+them) and times the questions discovery, tracing and simulation ask about each
+hint: its resource types, whether it is a container, its element type and its
+machine category.
+
+- ``parse``: every question re-parses the hint, as each helper did on its own;
+- ``describe``: the hint is described once and the interned descriptor reused.
+
+Usage:
+  python scripts/benchmark_type_inspection.py --rounds 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PROTOCOLS_DIR = PROJECT_ROOT / "praxis" / "protocol" / "protocols"
+if str(PROJECT_ROOT) not in sys.path:
+  sys.path.insert(0, str(PROJECT_ROOT))
+
+import libcst as cst  # noqa: E402
+
+from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (  # noqa: E402
+  ProtocolFunctionVisitor,
+)
+from praxis.common import type_inspection  # noqa: E402
+from praxis.common.type_inspection import describe_type  # noqa: E402
+
+
+def bundled_type_hints() -> list[str]:
+  """Return the parameter type hints of the bundled protocols, in order."""
+  hints: list[str] = []
+  for path in sorted(PROTOCOLS_DIR.glob("*.py")):
+    if path.name == "__init__.py":
+      continue
+    visitor = ProtocolFunctionVisitor(f"praxis.protocol.protocols.{path.stem}", str(path))
+    cst.parse_module(path.read_text()).visit(visitor)
+    for definition in visitor.definitions:
+      hints.extend(p.type_hint for p in definition.parameters)
+  # Hints derived while tracing subscripts and collections of the resources
+  hints.extend(["list[Well]", "list[TipSpot]", "Well", "TipSpot"])
+  return hints
+
+
+def parse(hint: str) -> tuple:
+  """Answer each question with its own parse of the hint."""
+  return (
+    type_inspection._extract_from_string(hint),
+    type_inspection._CONTAINER_PATTERN.match(hint.strip()) is not None,
+    type_inspection._get_element_type_from_string(hint),
+    type_inspection._match_machine_type(hint),
+    type_inspection._is_resource(hint),
+  )
+
+
+def describe(hint: str) -> tuple:
+  """Answer each question from the shared descriptor."""
+  descriptor = describe_type(hint)
+  return (
+    descriptor.resource_types,
+    descriptor.is_container,
+    descriptor.element_type,
+    descriptor.machine_type,
+    descriptor.is_resource,
+  )
+
+
+def main() -> None:
+  """Run the benchmark."""
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--rounds", type=int, default=2000)
+  args = parser.parse_args()
+
+  hints = bundled_type_hints()
+  print(f"{len(hints)} hints ({len(set(hints))} distinct), {args.rounds} rounds")
+  for name, analyze in (("parse", parse), ("describe", describe)):
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+      for hint in hints:
+        analyze(hint)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<9} {elapsed * 1e9 / (args.rounds * len(hints)):8.0f} ns/hint")
+
+  distinct = {describe_type(hint) for hint in hints}
+  print(f"  {len(distinct)} interned descriptors")
+
+
+if __name__ == "__main__":
+  main()
@@ -7,29 +7,48 @@ by the browser-mode SqliteService, containing:
 2. All PLR machine definitions (from LibCST static analysis)
 3. All PLR resource definitions (from LibCST static analysis)
 4. All PLR deck definitions (from LibCST static analysis)
+5. All bundled protocol definitions, simulated and pickled for offline use
 
 Uses PLRSourceParser (LibCST-based) for static analysis without runtime imports,
 avoiding deprecation warnings and side effects.
 
+Builds are incremental. A manifest next to the database records a content hash
+of every input (the PLR sources, each protocol file, the schema and the
+generator code itself) and of every output table. On the next build, rows whose
+inputs are unchanged are copied from the previous database instead of being
+re-analyzed, so a one-line protocol edit only re-simulates that protocol. The
+work that remains runs in a process pool, rows are written with executemany in
+a single transaction, and the file is vacuumed with a page size suited to OPFS.
+Clients can compare the per-table hashes of the manifest to fetch only the
+tables that changed.
+
 Usage:
-    uv run scripts/generate_browser_db.py
+    uv run scripts/generate_browser_db.py [--full] [--workers N]
 
 Output:
     praxis/web-client/src/assets/db/praxis.db
+    praxis/web-client/src/assets/db/praxis.manifest.json
 """
 
 from __future__ import annotations
 
-from praxis.backend.utils.protocol_serialization import serialize_protocol_function
-import cloudpickle
+import argparse
+import functools
 import hashlib
+import importlib
 import json
 import sqlite3
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from uuid import uuid4
-import importlib
-import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from collections.abc import Callable, Iterable
+
+  from praxis.backend.utils.plr_static_analysis.models import DiscoveredClass
 
 # Project paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -37,6 +56,89 @@ WEB_CLIENT_ROOT = PROJECT_ROOT / "praxis" / "web-client"
 ASSETS_DB_DIR = WEB_CLIENT_ROOT / "src" / "assets" / "db"
 SCHEMA_SQL_PATH = ASSETS_DB_DIR / "schema.sql"
 OUTPUT_DB_PATH = ASSETS_DB_DIR / "praxis.db"
+MANIFEST_PATH = ASSETS_DB_DIR / "praxis.manifest.json"
+PROTOCOLS_DIR = PROJECT_ROOT / "praxis" / "protocol" / "protocols"
+
+# Bump to invalidate every previous build.
+MANIFEST_VERSION = 1
+
+# Code whose changes alter the generated rows; any change forces a full build.
+GENERATOR_SOURCES = (
+  Path(__file__).resolve(),
+  PROJECT_ROOT / "praxis" / "backend" / "utils" / "plr_static_analysis",
+  PROJECT_ROOT / "praxis" / "backend" / "core" / "simulation",
+  PROJECT_ROOT / "praxis" / "backend" / "core" / "tracing",
+  PROJECT_ROOT / "praxis" / "backend" / "utils" / "protocol_serialization.py",
+  # Imported by the packages above for type hints, categories and maintenance defaults.
+  PROJECT_ROOT / "praxis" / "common" / "type_inspection.py",
+  PROJECT_ROOT / "praxis" / "backend" / "models" / "enums" / "plr_category.py",
+  PROJECT_ROOT / "praxis" / "backend" / "models" / "pydantic_internals" / "maintenance.py",
+)
+
+# sql.js/OPFS reads the file page by page; larger pages mean fewer reads for the
+# catalog scans the browser does, at the cost of a little slack per table.
+PAGE_SIZE = 8192
+
+# Tables derived from the PLR sources, in foreign-key order.
+PLR_TABLES = (
+  "resource_definitions",
+  "deck_definition_catalog",
+  "machine_frontend_definitions",
+  "machine_definitions",
+  "machine_backend_definitions",
+)
+
+# Columns left out of table hashes so that rebuilding a row does not count as a change.
+VOLATILE_COLUMNS = frozenset({"created_at", "updated_at"})
+
+INSERT_COLUMNS = {
+  "resource_definitions": (
+    "accession_id, fqn, name, description, plr_category, is_consumable, is_reusable, vendor, "
+    "manufacturer, properties_json, created_at, updated_at"
+  ),
+  "machine_definitions": (
+    "accession_id, fqn, name, description, plr_category, machine_category, has_deck, "
+    "manufacturer, capabilities, compatible_backends, available_simulation_backends, "
+    "properties_json, created_at, updated_at"
+  ),
+  "machine_frontend_definitions": (
+    "accession_id, fqn, name, description, plr_category, machine_category, has_deck, "
+    "manufacturer, capabilities, created_at, updated_at"
+  ),
+  "deck_definition_catalog": (
+    "accession_id, fqn, name, description, plr_category, additional_properties_json, "
+    "created_at, updated_at"
+  ),
+  "machine_backend_definitions": (
+    "accession_id, fqn, name, description, manufacturer, model, is_deprecated, backend_type, "
+    "frontend_definition_accession_id, connection_config, properties_json, created_at, updated_at"
+  ),
+  "function_protocol_definitions": (
+    "accession_id, name, fqn, module_name, function_name, source_file_path, description, "
+    "category, tags, hardware_requirements_json, inferred_requirements_json, "
+    "failure_modes_json, simulation_result_json, computation_graph_json, source_hash, "
+    "requires_deck, requires_linked_indices, is_top_level, created_at, updated_at, version, "
+    "solo_execution, preconfigure_deck, deprecated"
+  ),
+  "parameter_definitions": (
+    "accession_id, protocol_definition_accession_id, name, type_hint, fqn, is_deck_param, "
+    "optional, default_value_repr, description, constraints_json, field_type, is_itemized, "
+    "itemized_spec_json, linked_to, ui_hint_json, created_at, updated_at"
+  ),
+  "protocol_asset_requirements": (
+    "accession_id, protocol_definition_accession_id, name, type_hint_str, actual_type_str, fqn, "
+    "optional, default_value_repr, description, required_plr_category, constraints_json, "
+    "location_constraints_json, created_at, updated_at"
+  ),
+  "workcells": (
+    "accession_id, name, description, physical_location, status, created_at, updated_at, "
+    "properties_json"
+  ),
+}
+
+# Rows to insert, by table. Tables are written in the order they were first added
+# and rows in the order they were added, as the original row-by-row inserts were.
+Rows = dict[str, list[tuple]]
 
 
 def generate_uuid_from_fqn(fqn: str) -> str:
@@ -54,30 +156,59 @@ def safe_json_dumps(obj: object) -> str:
     return "{}"
 
 
-def discover_resources_static(conn: sqlite3.Connection) -> int:
-  """Discover and insert all PLR resource definitions using static analysis."""
+def hash_paths(paths: Iterable[Path], root: Path | None = None) -> str:
+  """Hash the names and contents of files and of the .py files under directories."""
+  digest = hashlib.sha256()
+  for path in paths:
+    files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+    for file in files:
+      if not file.exists():
+        continue
+      name = file.relative_to(root) if root is not None else file.name
+      digest.update(f"{name}\0".encode())
+      digest.update(file.read_bytes())
+      digest.update(b"\0")
+  return digest.hexdigest()
+
+
+def write_rows(conn: sqlite3.Connection, rows: Rows) -> None:
+  """Insert collected rows with one executemany per table."""
+  for table, table_rows in rows.items():
+    if not table_rows:
+      continue
+    columns = INSERT_COLUMNS[table]
+    placeholders = ", ".join("?" * (columns.count(",") + 1))
+    conn.executemany(
+      f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({placeholders})",
+      table_rows,
+    )
+
+
+def discover_plr(kind: str) -> list[DiscoveredClass]:
+  """Run one PLR static discovery pass (parallelizable across processes)."""
   from praxis.backend.utils.plr_static_analysis import (
     PLRSourceParser,
     find_plr_source_root,
   )
 
   parser = PLRSourceParser(find_plr_source_root())
+  return getattr(parser, f"discover_{kind}")()
 
-  # Get class-based resources
-  class_resources = parser.discover_resource_classes()
-
-  # Get factory function-based resources
-  factory_resources = parser.discover_resource_factories()
 
+def resource_rows(
+  class_resources: list[DiscoveredClass],
+  factory_resources: list[DiscoveredClass],
+  now: str,
+  rows: Rows,
+) -> int:
+  """Collect resource definition rows from discovered classes and factories."""
   # Combine and deduplicate by FQN
   all_resources = {r.fqn: r for r in class_resources}
   for r in factory_resources:
     if r.fqn not in all_resources:
       all_resources[r.fqn] = r
 
-  now = datetime.now().isoformat()
   count = 0
-
   for res in all_resources.values():
     # Skip items that look like methods or private members
     if (
@@ -107,14 +238,7 @@ def discover_resources_static(conn: sqlite3.Connection) -> int:
       is_consumable = category in ["TipRack", "Trough", "Reservoir"]
       is_reusable = category in ["Plate", "Carrier", "Deck"]
 
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO resource_definitions (
-                    accession_id, fqn, name, description, plr_category,
-                    is_consumable, is_reusable, vendor, manufacturer,
-                    properties_json, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+      rows.setdefault("resource_definitions", []).append(
         (
           accession_id,
           res.fqn,
@@ -132,55 +256,46 @@ def discover_resources_static(conn: sqlite3.Connection) -> int:
       )
       count += 1
     except Exception as e:
-      print(f"  [WARN] Failed to insert resource {res.name}: {e}")
+      print(f"  [WARN] Failed to prepare resource {res.name}: {e}")
 
-  conn.commit()
-  print(f"[generate_browser_db] Inserted {count} resource definitions")
+  print(f"[generate_browser_db] Prepared {count} resource definitions")
   return count
 
 
-def discover_machines_static(conn: sqlite3.Connection) -> int:
-  """Discover and insert all PLR machine definitions using static analysis."""
+def machine_rows(machines: list[DiscoveredClass], now: str, rows: Rows) -> int:
+  """Collect machine definition rows from discovered machine classes."""
+  from praxis.backend.models.pydantic_internals.maintenance import MAINTENANCE_DEFAULTS
   from praxis.backend.utils.plr_static_analysis import (
     MACHINE_FRONTEND_TYPES,
     PLRClassType,
-    PLRSourceParser,
-    find_plr_source_root,
   )
 
-  parser = PLRSourceParser(find_plr_source_root())
-  machines = parser.discover_machine_classes()
+  # Determine machine category from class type
+  category_map = {
+    PLRClassType.LIQUID_HANDLER: "LiquidHandler",
+    PLRClassType.PLATE_READER: "PlateReader",
+    PLRClassType.HEATER_SHAKER: "HeaterShaker",
+    PLRClassType.SHAKER: "Shaker",
+    PLRClassType.TEMPERATURE_CONTROLLER: "TemperatureController",
+    PLRClassType.CENTRIFUGE: "Centrifuge",
+    PLRClassType.THERMOCYCLER: "Thermocycler",
+    PLRClassType.PUMP: "Pump",
+    PLRClassType.PUMP_ARRAY: "PumpArray",
+    PLRClassType.FAN: "Fan",
+    PLRClassType.SEALER: "Sealer",
+    PLRClassType.PEELER: "Peeler",
+    PLRClassType.POWDER_DISPENSER: "PowderDispenser",
+    PLRClassType.INCUBATOR: "Incubator",
+    PLRClassType.SCARA: "Arm",
+  }
 
-  now = datetime.now().isoformat()
   count = 0
-
   # Filter to frontend types only (exclude backends for the definition catalog)
   frontend_machines = [m for m in machines if m.class_type in MACHINE_FRONTEND_TYPES]
 
   for machine in frontend_machines:
     try:
-      from praxis.backend.models.pydantic_internals.maintenance import MAINTENANCE_DEFAULTS
-
       accession_id = generate_uuid_from_fqn(f"machine:{machine.fqn}")
-
-      # Determine machine category from class type
-      category_map = {
-        PLRClassType.LIQUID_HANDLER: "LiquidHandler",
-        PLRClassType.PLATE_READER: "PlateReader",
-        PLRClassType.HEATER_SHAKER: "HeaterShaker",
-        PLRClassType.SHAKER: "Shaker",
-        PLRClassType.TEMPERATURE_CONTROLLER: "TemperatureController",
-        PLRClassType.CENTRIFUGE: "Centrifuge",
-        PLRClassType.THERMOCYCLER: "Thermocycler",
-        PLRClassType.PUMP: "Pump",
-        PLRClassType.PUMP_ARRAY: "PumpArray",
-        PLRClassType.FAN: "Fan",
-        PLRClassType.SEALER: "Sealer",
-        PLRClassType.PEELER: "Peeler",
-        PLRClassType.POWDER_DISPENSER: "PowderDispenser",
-        PLRClassType.INCUBATOR: "Incubator",
-        PLRClassType.SCARA: "Arm",
-      }
       category = category_map.get(machine.class_type, "Unknown")
 
       # Get default maintenance schedule
@@ -194,14 +309,7 @@ def discover_machines_static(conn: sqlite3.Connection) -> int:
       # Get capabilities dict
       caps_dict = machine.to_capabilities_dict() if hasattr(machine, "to_capabilities_dict") else {}
 
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO machine_definitions (
-                    accession_id, fqn, name, description, plr_category,
-                    machine_category, has_deck, manufacturer,
-                    capabilities, compatible_backends, available_simulation_backends, properties_json, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+      rows.setdefault("machine_definitions", []).append(
         (
           accession_id,
           machine.fqn,
@@ -221,14 +329,7 @@ def discover_machines_static(conn: sqlite3.Connection) -> int:
       )
 
       # Also insert into machine_frontend_definitions for new architecture
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO machine_frontend_definitions (
-                    accession_id, fqn, name, description, plr_category,
-                    machine_category, has_deck, manufacturer,
-                    capabilities, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+      rows.setdefault("machine_frontend_definitions", []).append(
         (
           accession_id,
           machine.fqn,
@@ -250,10 +351,9 @@ def discover_machines_static(conn: sqlite3.Connection) -> int:
 
       count += 1
     except Exception as e:
-      print(f"  [WARN] Failed to insert machine {machine.name}: {e}")
+      print(f"  [WARN] Failed to prepare machine {machine.name}: {e}")
 
-  conn.commit()
-  print(f"[generate_browser_db] Inserted {count} machine definitions")
+  print(f"[generate_browser_db] Prepared {count} machine definitions")
   return count
 
 
@@ -316,22 +416,14 @@ def create_discovered_class_from_dict(d: dict) -> DiscoveredClass:
   )
 
 
-def discover_decks_static(conn: sqlite3.Connection) -> int:
-  """Discover and insert all PLR deck definitions using static analysis + fallback."""
-  from praxis.backend.utils.plr_static_analysis import (
-    DiscoveredClass,
-    PLRClassType,
-    PLRSourceParser,
-    find_plr_source_root,
-  )
-
-  parser = PLRSourceParser(find_plr_source_root())
-
-  # Get class-based resources
-  discovered_classes = parser.discover_resource_classes()
-
-  # Get factory function-based resources
-  discovered_factories = parser.discover_resource_factories()
+def deck_rows(
+  discovered_classes: list[DiscoveredClass],
+  discovered_factories: list[DiscoveredClass],
+  now: str,
+  rows: Rows,
+) -> int:
+  """Collect deck definition rows from discovered resources plus the fallback registry."""
+  from praxis.backend.utils.plr_static_analysis import PLRClassType
 
   # Filter for decks and combine
   deck_classes = [r for r in discovered_classes if r.class_type == PLRClassType.DECK]
@@ -346,22 +438,12 @@ def discover_decks_static(conn: sqlite3.Connection) -> int:
       print(f"  [INFO] Static analysis missed {critical['name']}, adding from manual registry")
       all_decks[critical["fqn"]] = create_discovered_class_from_dict(critical)
 
-  now = datetime.now().isoformat()
   count = 0
-
   for deck in all_decks.values():
     try:
-      accession_id = generate_uuid_from_fqn(f"deck:{deck.fqn}")
-
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO deck_definition_catalog (
-                    accession_id, fqn, name, description, plr_category,
-                    additional_properties_json, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+      rows.setdefault("deck_definition_catalog", []).append(
         (
-          accession_id,
+          generate_uuid_from_fqn(f"deck:{deck.fqn}"),
           deck.fqn,
           deck.name,
           deck.docstring or "",
@@ -373,242 +455,193 @@ def discover_decks_static(conn: sqlite3.Connection) -> int:
       )
       count += 1
     except Exception as e:
-      print(f"  [WARN] Failed to insert deck {deck.name}: {e}")
+      print(f"  [WARN] Failed to prepare deck {deck.name}: {e}")
 
-  conn.commit()
-  print(f"[generate_browser_db] Inserted {count} deck definitions")
+  print(f"[generate_browser_db] Prepared {count} deck definitions")
   return count
 
 
-def discover_protocols_static(conn: sqlite3.Connection) -> int:
-  """Discover and insert all protocol definitions using static analysis."""
-  from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (
-    ProtocolFunctionVisitor,
-  )
+@functools.cache
+def _protocol_simulator() -> Any:
   from praxis.backend.core.simulation.simulator import ProtocolSimulator
-  import libcst as cst
 
-  protocols_dir = PROJECT_ROOT / "praxis" / "protocol" / "protocols"
-  now = datetime.now().isoformat()
-  count = 0
+  return ProtocolSimulator()
 
-  simulator = ProtocolSimulator()
 
-  if not protocols_dir.exists():
-    return 0
+def analyze_protocol_file(protocol_file: Path, now: str) -> Rows:
+  """Analyze, simulate and pickle the protocols of one file; returns their rows.
 
-  # Define protocols asset directory
-  PROTOCOLS_ASSET_DIR = WEB_CLIENT_ROOT / "src" / "assets" / "protocols"
-  PROTOCOLS_ASSET_DIR.mkdir(parents=True, exist_ok=True)
+  Runs in a worker process, so it only depends on its arguments.
+  """
+  import libcst as cst
 
-  for protocol_file in protocols_dir.glob("*.py"):
-    if protocol_file.name.startswith("__"):
-      continue
+  from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (
+    ProtocolFunctionVisitor,
+  )
+  from praxis.backend.utils.protocol_serialization import serialize_protocol_function
 
-    try:
-      module_name = f"praxis.protocol.protocols.{protocol_file.stem}"
-      source_code = protocol_file.read_text()
-
-      # Parse with LibCST
-      tree = cst.parse_module(source_code)
-      visitor = ProtocolFunctionVisitor(module_name, str(protocol_file))
-      tree.visit(visitor)
-
-      for definition in visitor.definitions:
-        accession_id = generate_uuid_from_fqn(definition.fqn)
-
-        # Default category based on keywords
-        category = "General"
-        name_lower = definition.name.lower()
-        if "plate" in name_lower or "prep" in name_lower:
-          category = "Assay Prep"
-        elif "transfer" in name_lower:
-          category = "Liquid Handling"
-        elif "kinetic" in name_lower or "reader" in name_lower:
-          category = "Plate Reading"
-
-        # Run real simulation analysis
-        print(f"  [simulation] Analyzing {definition.fqn}...")
+  rows: Rows = {}
+  try:
+    module_name = f"praxis.protocol.protocols.{protocol_file.stem}"
+    source_code = protocol_file.read_text()
+
+    # Parse with LibCST
+    tree = cst.parse_module(source_code)
+    visitor = ProtocolFunctionVisitor(module_name, str(protocol_file))
+    tree.visit(visitor)
+
+    for definition in visitor.definitions:
+      accession_id = generate_uuid_from_fqn(definition.fqn)
+
+      # Default category based on keywords
+      category = "General"
+      name_lower = definition.name.lower()
+      if "plate" in name_lower or "prep" in name_lower:
+        category = "Assay Prep"
+      elif "transfer" in name_lower:
+        category = "Liquid Handling"
+      elif "kinetic" in name_lower or "reader" in name_lower:
+        category = "Plate Reading"
+
+      # Run real simulation analysis
+      print(f"  [simulation] Analyzing {definition.fqn}...")
+      try:
+        # Import the protocol module
+        # Ensure path is in sys.path
+        if str(PROJECT_ROOT) not in sys.path:
+          sys.path.append(str(PROJECT_ROOT))
+
+        module = importlib.import_module(module_name)
+        func = getattr(module, definition.name)
+
+        # Serialize protocol function for offline use
         try:
-          # Import the protocol module
-          # Ensure path is in sys.path
-          if str(PROJECT_ROOT) not in sys.path:
-            sys.path.append(str(PROJECT_ROOT))
-
-          module = importlib.import_module(module_name)
-          func = getattr(module, definition.name)
-
-          # Serialize protocol function for offline use
-          try:
-            serialized_data = serialize_protocol_function(func)
-            path = WEB_CLIENT_ROOT / "src" / "assets" / "protocols" / f"{accession_id}.pkl"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(serialized_data)
-            print(f"  [pickle] Generated {path}")
-          except Exception as ser_e:
-            print(f"  [pickle] ERROR: Failed to serialize {definition.fqn}: {ser_e}")
-
-          parameter_types = {p.name: p.type_hint for p in definition.parameters}
-
-          # Run analysis
-          sim_result = simulator.analyze_protocol_sync(
-            protocol_func=func, parameter_types=parameter_types
-          )
-
-          simulation_result_json = safe_json_dumps(sim_result.to_cache_dict())
-          inferred_requirements_json = safe_json_dumps(sim_result.inferred_requirements)
-          failure_modes_json = safe_json_dumps(sim_result.failure_modes)
-        except Exception as e:
-          print(f"  [simulation] ERROR: Protocol analysis failed for {definition.fqn}: {e}")
-          # Fallback to a marked-as-failed or minimal result if needed?
-          # For now, we'll keep the mock structure but with an error state if it fails
-          simulation_result_json = safe_json_dumps(
-            {
-              "passed": False,
-              "level_completed": "none",
-              "violations": [{"type": "error", "message": str(e)}],
-              "simulated_at": now,
-            }
-          )
-          inferred_requirements_json = safe_json_dumps([])
-          failure_modes_json = safe_json_dumps([])
-
-        conn.execute(
-          """
-                    INSERT OR REPLACE INTO function_protocol_definitions (
-                        accession_id, name, fqn, module_name, function_name,
-                        source_file_path, description, category, tags,
-                        hardware_requirements_json,
-                        inferred_requirements_json, failure_modes_json, simulation_result_json,
-                        computation_graph_json, source_hash, requires_deck,
-                        requires_linked_indices,
-                        is_top_level, created_at, updated_at, version,
-                        solo_execution, preconfigure_deck, deprecated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+          serialized_data = serialize_protocol_function(func)
+          path = WEB_CLIENT_ROOT / "src" / "assets" / "protocols" / f"{accession_id}.pkl"
+          path.parent.mkdir(parents=True, exist_ok=True)
+          path.write_bytes(serialized_data)
+          print(f"  [pickle] Generated {path}")
+        except Exception as ser_e:
+          print(f"  [pickle] ERROR: Failed to serialize {definition.fqn}: {ser_e}")
+
+        parameter_types = {p.name: p.type_hint for p in definition.parameters}
+
+        # Run analysis
+        sim_result = _protocol_simulator().analyze_protocol_sync(
+          protocol_func=func, parameter_types=parameter_types
+        )
+
+        simulation_result_json = safe_json_dumps(sim_result.to_cache_dict())
+        inferred_requirements_json = safe_json_dumps(sim_result.inferred_requirements)
+        failure_modes_json = safe_json_dumps(sim_result.failure_modes)
+      except Exception as e:
+        print(f"  [simulation] ERROR: Protocol analysis failed for {definition.fqn}: {e}")
+        # Keep the protocol in the catalog, marked as failing simulation
+        simulation_result_json = safe_json_dumps(
+          {
+            "passed": False,
+            "level_completed": "none",
+            "violations": [{"type": "error", "message": str(e)}],
+            "simulated_at": now,
+          }
+        )
+        inferred_requirements_json = safe_json_dumps([])
+        failure_modes_json = safe_json_dumps([])
+
+      rows.setdefault("function_protocol_definitions", []).append(
+        (
+          accession_id,
+          definition.name.replace("_", " ").title(),
+          definition.fqn,
+          definition.module_name,
+          definition.name,
+          str(protocol_file.relative_to(PROJECT_ROOT)),
+          definition.docstring,
+          category,
+          safe_json_dumps(["demo", category.lower().replace(" ", "-")]),
+          safe_json_dumps(definition.hardware_requirements or {}),
+          inferred_requirements_json,
+          failure_modes_json,
+          simulation_result_json,
+          safe_json_dumps(definition.computation_graph),
+          definition.source_hash,
+          1 if definition.requires_deck else 0,
+          1 if getattr(definition, "requires_linked_indices", False) else 0,
+          1,  # is_top_level default
+          now,
+          now,
+          "0.1.0",  # default version
+          0,  # solo_execution default
+          0,  # preconfigure_deck default
+          0,  # deprecated default
+        ),
+      )
+
+      # Parameters go to parameter_definitions (excluding assets)
+      for param in definition.parameters:
+        # Skip assets - they go to protocol_asset_requirements
+        if param.is_asset:
+          continue
+
+        rows.setdefault("parameter_definitions", []).append(
           (
+            generate_uuid_from_fqn(f"param:{definition.fqn}:{param.name}"),
             accession_id,
-            definition.name.replace("_", " ").title(),
-            definition.fqn,
-            definition.module_name,
-            definition.name,
-            str(protocol_file.relative_to(PROJECT_ROOT)),
-            definition.docstring,
-            category,
-            safe_json_dumps(["demo", category.lower().replace(" ", "-")]),
-            safe_json_dumps(definition.hardware_requirements or {}),
-            inferred_requirements_json,
-            failure_modes_json,
-            simulation_result_json,
-            safe_json_dumps(definition.computation_graph),
-            definition.source_hash,
-            1 if definition.requires_deck else 0,
-            1 if getattr(definition, "requires_linked_indices", False) else 0,
-            1,  # is_top_level default
+            param.name,
+            param.type_hint,
+            f"{definition.fqn}.{param.name}",
+            0,  # is_deck_param (simplified)
+            param.is_optional,
+            str(param.default_value) if param.default_value is not None else None,
+            "",  # description
+            safe_json_dumps(param.constraints_json if hasattr(param, "constraints_json") else {}),
+            param.field_type,
+            1 if param.is_itemized else 0,
+            safe_json_dumps(param.itemized_spec),
+            param.linked_to,
+            safe_json_dumps(param.ui_hint_json if hasattr(param, "ui_hint_json") else {}),
             now,
             now,
-            "0.1.0",  # default version
-            0,  # solo_execution default
-            0,  # preconfigure_deck default
-            0,  # deprecated default
           ),
         )
 
-        # Insert parameters into parameter_definitions table (excluding assets)
-        for param in definition.parameters:
-          # Skip assets - they go to protocol_asset_requirements
-          if param.is_asset:
-            continue
-
-          param_id = generate_uuid_from_fqn(f"param:{definition.fqn}:{param.name}")
-          conn.execute(
-            """
-                        INSERT OR REPLACE INTO parameter_definitions (
-                            accession_id, protocol_definition_accession_id, name, type_hint, fqn,
-                            is_deck_param, optional, default_value_repr, description,
-                            constraints_json, field_type, is_itemized, itemized_spec_json, linked_to, ui_hint_json,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-            (
-              param_id,
-              accession_id,
-              param.name,
-              param.type_hint,
-              f"{definition.fqn}.{param.name}",
-              0,  # is_deck_param (simplified)
-              param.is_optional,
-              str(param.default_value) if param.default_value is not None else None,
-              "",  # description
-              safe_json_dumps(param.constraints_json if hasattr(param, "constraints_json") else {}),
-              param.field_type,
-              1 if param.is_itemized else 0,
-              safe_json_dumps(param.itemized_spec),
-              param.linked_to,
-              safe_json_dumps(param.ui_hint_json if hasattr(param, "ui_hint_json") else {}),
-              now,
-              now,
-            ),
-          )
-
-        # Insert asset requirements into protocol_asset_requirements table
-        for asset in definition.raw_assets:
-          asset_id = generate_uuid_from_fqn(f"asset:{definition.fqn}:{asset['name']}")
-          conn.execute(
-            """
-                        INSERT OR REPLACE INTO protocol_asset_requirements (
-                            accession_id, protocol_definition_accession_id, name, type_hint_str,
-                            actual_type_str, fqn, optional, default_value_repr, description,
-                            required_plr_category, constraints_json, location_constraints_json, 
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-            (
-              asset_id,
-              accession_id,
-              asset["name"],
-              asset["type_hint_str"],
-              asset["actual_type_str"],
-              asset["fqn"],
-              asset.get("optional", False),
-              asset.get("default_value_repr"),
-              asset.get("description", ""),
-              asset.get("required_plr_category"),
-              safe_json_dumps({}),  # constraints (empty for now)
-              safe_json_dumps({}),  # location_constraints (empty for now)
-              now,
-              now,
-            ),
-          )
-
-        count += 1
+      # Asset requirements go to protocol_asset_requirements
+      for asset in definition.raw_assets:
+        rows.setdefault("protocol_asset_requirements", []).append(
+          (
+            generate_uuid_from_fqn(f"asset:{definition.fqn}:{asset['name']}"),
+            accession_id,
+            asset["name"],
+            asset["type_hint_str"],
+            asset["actual_type_str"],
+            asset["fqn"],
+            asset.get("optional", False),
+            asset.get("default_value_repr"),
+            asset.get("description", ""),
+            asset.get("required_plr_category"),
+            safe_json_dumps({}),  # constraints (empty for now)
+            safe_json_dumps({}),  # location_constraints (empty for now)
+            now,
+            now,
+          ),
+        )
 
-    except Exception as e:
-      print(f"  [WARN] Failed to process {protocol_file.name}: {e}")
+  except Exception as e:
+    print(f"  [WARN] Failed to process {protocol_file.name}: {e}")
 
-  conn.commit()
-  print(f"[generate_browser_db] Inserted {count} protocol definitions")
-  return count
+  return rows
 
 
-def discover_backends_static(conn: sqlite3.Connection) -> int:
-  """Discover and insert all PLR backend definitions using static analysis."""
+def backend_rows(machines: list[DiscoveredClass], now: str, rows: Rows) -> int:
+  """Collect backend definition rows (and the frontends they reference)."""
   from praxis.backend.utils.plr_static_analysis import (
     MACHINE_BACKEND_TYPES,
     PLRClassType,
-    PLRSourceParser,
-    find_plr_source_root,
   )
 
-  parser = PLRSourceParser(find_plr_source_root())
-  machines = parser.discover_machine_classes()
-
   # Filter to backend types only
   backends = [m for m in machines if m.class_type in MACHINE_BACKEND_TYPES]
 
-  now = datetime.now().isoformat()
-  count = 0
-
   # Map backend types to frontend category names
   backend_category_map = {
     PLRClassType.LH_BACKEND: "LiquidHandlerBackend",
@@ -651,15 +684,8 @@ def discover_backends_static(conn: sqlite3.Connection) -> int:
   for backend_type, frontend_fqn in backend_frontend_fqn_map.items():
     frontend_id = generate_uuid_from_fqn(f"machine:{frontend_fqn}")
     frontend_category = backend_category_map.get(backend_type, "Unknown").replace("Backend", "")
-    
-    conn.execute(
-      """
-            INSERT OR REPLACE INTO machine_frontend_definitions (
-                accession_id, fqn, name, description, plr_category,
-                machine_category, has_deck, manufacturer,
-                capabilities, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+
+    rows.setdefault("machine_frontend_definitions", []).append(
       (
         frontend_id,
         frontend_fqn,
@@ -675,27 +701,21 @@ def discover_backends_static(conn: sqlite3.Connection) -> int:
       ),
     )
 
+  count = 0
   for backend in backends:
     try:
       accession_id = generate_uuid_from_fqn(f"backend:{backend.fqn}")
-      category = backend_category_map.get(backend.class_type, "UnknownBackend")
       frontend_fqn = backend_frontend_fqn_map.get(backend.class_type)
 
       # Get capabilities dict
       caps_dict = backend.to_capabilities_dict() if hasattr(backend, "to_capabilities_dict") else {}
 
       # Determine backend type
-      backend_type = "simulator" if "Chatterbox" in backend.fqn or "simulated" in backend.fqn else "hardware"
-
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO machine_backend_definitions (
-                    accession_id, fqn, name, description, 
-                    manufacturer, model, is_deprecated, backend_type, 
-                    frontend_definition_accession_id, connection_config,
-                    properties_json, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+      backend_type = (
+        "simulator" if "Chatterbox" in backend.fqn or "simulated" in backend.fqn else "hardware"
+      )
+
+      rows.setdefault("machine_backend_definitions", []).append(
         (
           accession_id,
           backend.fqn,
@@ -703,11 +723,11 @@ def discover_backends_static(conn: sqlite3.Connection) -> int:
           backend.docstring or "",
           backend.manufacturer,
           backend.name,
-          0, # is_deprecated
+          0,  # is_deprecated
           backend_type,
           generate_uuid_from_fqn(f"machine:{frontend_fqn}"),
-          safe_json_dumps({}), # connection_config
-          safe_json_dumps(caps_dict), # properties_json (using capabilities for now)
+          safe_json_dumps({}),  # connection_config
+          safe_json_dumps(caps_dict),  # properties_json (using capabilities for now)
           now,
           now,
         ),
@@ -718,17 +738,14 @@ def discover_backends_static(conn: sqlite3.Connection) -> int:
 
       count += 1
     except Exception as e:
-      print(f"  [WARN] Failed to insert backend {backend.name}: {e}")
+      print(f"  [WARN] Failed to prepare backend {backend.name}: {e}")
 
-  conn.commit()
-  print(f"[generate_browser_db] Inserted {count} backend definitions")
+  print(f"[generate_browser_db] Prepared {count} backend definitions")
   return count
 
 
-def ensure_minimal_backends(conn: sqlite3.Connection) -> None:
+def ensure_minimal_backends(conn: sqlite3.Connection, now: str) -> None:
   """Ensure every frontend type has at least one backend definition (Simulated)."""
-  now = datetime.now().isoformat()
-
   # All known frontend types
   frontend_types = [
     ("LiquidHandler", "pylabrobot.liquid_handling.LiquidHandler"),
@@ -748,81 +765,59 @@ def ensure_minimal_backends(conn: sqlite3.Connection) -> None:
     ("Arm", "pylabrobot.scara.SCARA"),
   ]
 
+  covered = {
+    fqn
+    for (fqn,) in conn.execute(
+      "SELECT DISTINCT frontend_fqn FROM machine_definitions WHERE frontend_fqn IS NOT NULL"
+    )
+  }
+  rows: Rows = {"machine_backend_definitions": []}
   for short_name, frontend_fqn in frontend_types:
-    # Check if any backend exists for this frontend
-    cursor = conn.execute(
-      "SELECT count(*) FROM machine_definitions WHERE frontend_fqn = ?", (frontend_fqn,)
+    if frontend_fqn in covered:
+      continue
+    # Create a synthetic "Simulated" backend
+    fqn = f"pylabrobot.backends.simulated.{short_name}Backend"
+    rows["machine_backend_definitions"].append(
+      (
+        generate_uuid_from_fqn(f"backend:{fqn}"),
+        fqn,
+        f"Simulated {short_name}",
+        f"Generic simulated backend for {short_name}",
+        "PyLabRobot",
+        f"Simulated {short_name}",
+        0,
+        "simulator",
+        generate_uuid_from_fqn(f"machine:{frontend_fqn}"),
+        safe_json_dumps({}),
+        safe_json_dumps({}),
+        now,
+        now,
+      ),
     )
-    count = cursor.fetchone()[0]
-
-    if count == 0:
-      # Create a synthetic "Simulated" backend
-      fqn = f"pylabrobot.backends.simulated.{short_name}Backend"
-      accession_id = generate_uuid_from_fqn(f"backend:{fqn}")
-
-      conn.execute(
-        """
-                INSERT OR REPLACE INTO machine_backend_definitions (
-                    accession_id, fqn, name, description, 
-                    manufacturer, model, is_deprecated, backend_type, 
-                    frontend_definition_accession_id, connection_config,
-                    properties_json, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-        (
-          accession_id,
-          fqn,
-          f"Simulated {short_name}",
-          f"Generic simulated backend for {short_name}",
-          "PyLabRobot",
-          f"Simulated {short_name}",
-          0,
-          "simulator",
-          generate_uuid_from_fqn(f"machine:{frontend_fqn}"),
-          safe_json_dumps({}),
-          safe_json_dumps({}),
-          now,
-          now,
-        ),
-      )
 
-      # NOTE: We intentionally do NOT seed machine instances.
-      # Users should instantiate machines from definitions via the UI.
+    # NOTE: We intentionally do NOT seed machine instances.
+    # Users should instantiate machines from definitions via the UI.
+  write_rows(conn, rows)
 
 
-def insert_metadata(conn: sqlite3.Connection) -> None:
+def insert_metadata(conn: sqlite3.Connection, now: str) -> None:
   """Insert metadata about the database generation."""
-  now = datetime.now().isoformat()
-
-  conn.execute(
-    "INSERT OR REPLACE INTO _schema_metadata (key, value) VALUES (?, ?)",
-    ("generated_at", now),
-  )
-  conn.execute(
+  conn.executemany(
     "INSERT OR REPLACE INTO _schema_metadata (key, value) VALUES (?, ?)",
-    ("schema_version", "1.0.0"),
+    [
+      ("generated_at", now),
+      ("schema_version", "1.0.0"),
+      ("generator", "generate_browser_db.py (LibCST static analysis)"),
+    ],
   )
-  conn.execute(
-    "INSERT OR REPLACE INTO _schema_metadata (key, value) VALUES (?, ?)",
-    ("generator", "generate_browser_db.py (LibCST static analysis)"),
-  )
-  conn.commit()
 
 
-def add_sample_workcell(conn: sqlite3.Connection) -> None:
+def sample_workcell_rows(now: str, rows: Rows) -> None:
   """Add a sample workcell for demo purposes."""
-  now = datetime.now().isoformat()
-  workcell_id = str(uuid4())
-
-  conn.execute(
-    """
-        INSERT OR REPLACE INTO workcells (
-            accession_id, name, description, physical_location, status,
-            created_at, updated_at, properties_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+  rows.setdefault("workcells", []).append(
     (
-      workcell_id,
+      # Deterministic, so that rebuilding it does not change the table hash
+      generate_uuid_from_fqn("workcell:Demo Workcell"),
       "Demo Workcell",
       "A sample workcell for browser-mode demonstration",
       "Virtual Lab 1",
@@ -832,71 +827,254 @@ def add_sample_workcell(conn: sqlite3.Connection) -> None:
       "{}",
     ),
   )
-  conn.commit()
-
-
-def main() -> None:
-  """Main entry point for database generation."""
-  # Ensure output directory exists
-  ASSETS_DB_DIR.mkdir(parents=True, exist_ok=True)
 
-  # Check for schema file
-  if not SCHEMA_SQL_PATH.exists():
-    return
-
-  # Remove existing database
-  if OUTPUT_DB_PATH.exists():
-    OUTPUT_DB_PATH.unlink()
-
-  # Create new database
-  conn = sqlite3.connect(OUTPUT_DB_PATH)
 
+def load_previous_manifest(schema_hash: str, generator_hash: str) -> dict[str, Any] | None:
+  """Return the manifest of the previous build if its rows can be reused."""
+  if not (MANIFEST_PATH.exists() and OUTPUT_DB_PATH.exists()):
+    return None
   try:
-    # Load and execute schema
-    schema = SCHEMA_SQL_PATH.read_text()
-    conn.executescript(schema)
+    manifest = json.loads(MANIFEST_PATH.read_text())
+  except (OSError, json.JSONDecodeError):
+    return None
+  if (
+    manifest.get("version") != MANIFEST_VERSION
+    or manifest.get("schema_hash") != schema_hash
+    or manifest.get("generator_hash") != generator_hash
+  ):
+    print("[generate_browser_db] Schema or generator changed, rebuilding everything")
+    return None
+  return manifest
+
+
+def copy_previous_rows(
+  conn: sqlite3.Connection,
+  table: str,
+  where: str = "1",
+  params: tuple = (),
+) -> int:
+  """Copy rows of ``table`` from the attached previous build (same schema)."""
+  cursor = conn.execute(
+    f"INSERT OR REPLACE INTO main.{table} SELECT * FROM prev.{table} WHERE {where}",
+    params,
+  )
+  return cursor.rowcount
 
-    # Discover and insert PLR definitions using static analysis
-    discover_resources_static(conn)
 
-    discover_machines_static(conn)
+def reuse_protocol_file(conn: sqlite3.Connection, relative_path: str) -> bool:
+  """Copy the rows of an unchanged protocol file from the previous build.
 
-    discover_decks_static(conn)
+  Returns False (copying nothing) if one of its pickles is missing.
+  """
+  accession_ids = [
+    accession_id
+    for (accession_id,) in conn.execute(
+      "SELECT accession_id FROM prev.function_protocol_definitions WHERE source_file_path = ?",
+      (relative_path,),
+    )
+  ]
+  pickles_dir = WEB_CLIENT_ROOT / "src" / "assets" / "protocols"
+  if not accession_ids or not all(
+    (pickles_dir / f"{accession_id}.pkl").exists() for accession_id in accession_ids
+  ):
+    return False
+  of_file = (
+    "protocol_definition_accession_id IN "
+    "(SELECT accession_id FROM prev.function_protocol_definitions WHERE source_file_path = ?)"
+  )
+  copy_previous_rows(
+    conn, "function_protocol_definitions", "source_file_path = ?", (relative_path,)
+  )
+  copy_previous_rows(conn, "parameter_definitions", of_file, (relative_path,))
+  copy_previous_rows(conn, "protocol_asset_requirements", of_file, (relative_path,))
+  return True
+
+
+def table_hashes(conn: sqlite3.Connection) -> dict[str, dict[str, Any]]:
+  """Hash the content of every table, ignoring row order and volatile columns."""
+  tables = [
+    name
+    for (name,) in conn.execute(
+      "SELECT name FROM sqlite_master WHERE type = 'table' "
+      "AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' AND name != '_schema_metadata' ORDER BY name"
+    )
+  ]
+  hashes: dict[str, dict[str, Any]] = {}
+  for table in tables:
+    columns = [
+      column
+      for (_, column, *_rest) in conn.execute(f"PRAGMA table_info({table})")
+      if column not in VOLATILE_COLUMNS
+    ]
+    rows = sorted(
+      json.dumps(row, default=str)
+      for row in conn.execute(f"SELECT {', '.join(columns)} FROM {table}")
+    )
+    digest = hashlib.sha256()
+    for row in rows:
+      digest.update(row.encode())
+      digest.update(b"\n")
+    hashes[table] = {"hash": digest.hexdigest(), "rows": len(rows)}
+  return hashes
 
-    discover_protocols_static(conn)
 
-    discover_backends_static(conn)
+def _map(executor: Executor | None, fn: Callable, *iterables: Iterable) -> list:
+  return list(executor.map(fn, *iterables) if executor is not None else map(fn, *iterables))
 
-    # Ensure simulated definitions for all types (fixes SCARA etc)
-    ensure_minimal_backends(conn)
 
-    # Add sample workcell
-    add_sample_workcell(conn)
+def build(full: bool = False, workers: int | None = None) -> dict[str, Any]:
+  """Build the database incrementally and return the new manifest."""
+  schema = SCHEMA_SQL_PATH.read_text()
+  schema_hash = hashlib.sha256(schema.encode()).hexdigest()
+  generator_hash = hash_paths(GENERATOR_SOURCES, PROJECT_ROOT)
+  previous = None if full else load_previous_manifest(schema_hash, generator_hash)
+  previous_sources = previous["sources"] if previous else {}
 
-    # Update metadata
-    insert_metadata(conn)
+  from praxis.backend.utils.plr_static_analysis import find_plr_source_root
 
-    # Get database size
-    conn.commit()
-    OUTPUT_DB_PATH.stat().st_size
+  plr_root = find_plr_source_root()
+  plr_hash = hash_paths([plr_root], plr_root)
+  protocol_files = sorted(
+    file for file in PROTOCOLS_DIR.glob("*.py") if not file.name.startswith("__")
+  )
+  protocol_hashes = {
+    str(file.relative_to(PROJECT_ROOT)): hash_paths([file]) for file in protocol_files
+  }
 
-    # Show table statistics
-    cursor = conn.execute(
-      """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '_%'
-            ORDER BY name
-            """
+  now = datetime.now().isoformat()
+  tmp_path = OUTPUT_DB_PATH.with_name(f"{OUTPUT_DB_PATH.name}.tmp")
+  tmp_path.unlink(missing_ok=True)
+  conn = sqlite3.connect(tmp_path)
+  executor = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+  try:
+    conn.executescript(schema)
+    if previous is not None:
+      conn.execute("ATTACH DATABASE ? AS prev", (str(OUTPUT_DB_PATH),))
+
+    reuse_plr = previous_sources.get("plr") == plr_hash
+    stale_protocols = [
+      file
+      for file in protocol_files
+      if previous_sources.get("protocols", {}).get(str(file.relative_to(PROJECT_ROOT)))
+      != protocol_hashes[str(file.relative_to(PROJECT_ROOT))]
+    ]
+
+    # Static analysis and simulation of stale inputs run in parallel; rows of
+    # unchanged inputs are copied from the previous build below.
+    plr_futures = {}
+    if not reuse_plr and executor is not None:
+      plr_futures = {
+        kind: executor.submit(discover_plr, kind)
+        for kind in ("resource_classes", "resource_factories", "machine_classes")
+      }
+
+    with conn:
+      reused_files = []
+      for file in protocol_files:
+        if file in stale_protocols:
+          continue
+        if reuse_protocol_file(conn, str(file.relative_to(PROJECT_ROOT))):
+          reused_files.append(file)
+        else:
+          stale_protocols.append(file)
+
+      protocol_rows: Rows = {}
+      analyzed = _map(
+        executor, analyze_protocol_file, stale_protocols, [now] * len(stale_protocols)
+      )
+      for file_rows in analyzed:
+        for table, table_rows in file_rows.items():
+          protocol_rows.setdefault(table, []).extend(table_rows)
+
+      rows: Rows = {}
+      if reuse_plr:
+        for table in PLR_TABLES:
+          copy_previous_rows(conn, table)
+      else:
+        discovered = {
+          kind: plr_futures[kind].result() if plr_futures else discover_plr(kind)
+          for kind in ("resource_classes", "resource_factories", "machine_classes")
+        }
+        resource_rows(discovered["resource_classes"], discovered["resource_factories"], now, rows)
+        machine_rows(discovered["machine_classes"], now, rows)
+        deck_rows(discovered["resource_classes"], discovered["resource_factories"], now, rows)
+      for table, table_rows in protocol_rows.items():
+        rows.setdefault(table, []).extend(table_rows)
+      if not reuse_plr:
+        backend_rows(discovered["machine_classes"], now, rows)
+      sample_workcell_rows(now, rows)
+      write_rows(conn, rows)
+
+      if not reuse_plr:
+        # Ensure simulated definitions for all types (fixes SCARA etc)
+        ensure_minimal_backends(conn, now)
+      insert_metadata(conn, now)
+
+    print(
+      f"[generate_browser_db] PLR catalog {'reused' if reuse_plr else 'rebuilt'}; "
+      f"protocols: {len(reused_files)} files reused, {len(stale_protocols)} rebuilt"
     )
-    for (table_name,) in cursor.fetchall():
-      count_cursor = conn.execute(f"SELECT COUNT(*) FROM {table_name}")
-      count = count_cursor.fetchone()[0]
-      print(f"  {table_name:30}: {count}")
 
-  except Exception:
-    raise
+    if previous is not None:
+      conn.execute("DETACH DATABASE prev")
+    manifest = {
+      "version": MANIFEST_VERSION,
+      "generated_at": now,
+      "schema_hash": schema_hash,
+      "generator_hash": generator_hash,
+      "page_size": PAGE_SIZE,
+      "sources": {"plr": plr_hash, "protocols": protocol_hashes},
+      "tables": table_hashes(conn),
+    }
+
+    # A single-file database laid out for page-wise loading from OPFS.
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.execute(f"PRAGMA page_size = {PAGE_SIZE}")
+    conn.execute("VACUUM")
   finally:
     conn.close()
+    if executor is not None:
+      executor.shutdown()
+
+  tmp_path.replace(OUTPUT_DB_PATH)
+  MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+  return manifest
+
+
+def main() -> None:
+  """Main entry point for database generation."""
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument(
+    "--full",
+    action="store_true",
+    help="Ignore the previous build and re-analyze every input.",
+  )
+  parser.add_argument(
+    "--workers",
+    type=int,
+    default=None,
+    help="Worker processes for analysis and simulation (default: CPU count; 1 = no pool).",
+  )
+  args = parser.parse_args()
+
+  # Ensure output directory exists
+  ASSETS_DB_DIR.mkdir(parents=True, exist_ok=True)
+
+  # Check for schema file
+  if not SCHEMA_SQL_PATH.exists():
+    print(f"[generate_browser_db] Schema not found: {SCHEMA_SQL_PATH}")
+    return
+
+  start = time.perf_counter()
+  manifest = build(full=args.full, workers=args.workers)
+
+  # Show table statistics
+  for table_name, info in manifest["tables"].items():
+    print(f"  {table_name:30}: {info['rows']}")
+  print(
+    f"[generate_browser_db] Wrote {OUTPUT_DB_PATH} ({OUTPUT_DB_PATH.stat().st_size} bytes) "
+    f"in {time.perf_counter() - start:.1f}s"
+  )
 
 
 if __name__ == "__main__":
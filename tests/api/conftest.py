@@ -1,11 +1,12 @@
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from main import app  # Import your main FastAPI application
-from praxis.backend.api.dependencies import get_db
+from praxis.backend.api.dependencies import get_db, get_db_session_factory
 from tests.factories import (
     DeckDefinitionFactory,
     DeckFactory,
@@ -30,7 +31,13 @@ async def client(
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    # Work that opens its own sessions (e.g. streamed exports) gets the same one
+    @asynccontextmanager
+    async def test_session() -> AsyncGenerator[AsyncSession, None]:
+        yield db_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_session_factory] = lambda: test_session
 
     # Set up factories to use this session
     WorkcellFactory._meta.sqlalchemy_session = db_session
@@ -46,3 +53,4 @@ async def client(
 
     # Clean up the override
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_db_session_factory]
@@ -0,0 +1,58 @@
+"""API tests for the definition catalog snapshot endpoints."""
+
+import sqlite3
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.services.catalog_snapshot import catalog_snapshots
+from tests.helpers import create_resource_definition
+
+
+@pytest.mark.asyncio
+async def test_snapshot_etag_and_delta(
+    client: AsyncClient, db_session: AsyncSession, tmp_path,
+) -> None:
+    """A client downloads the snapshot once, then only fetches what changed."""
+    catalog_snapshots.invalidate()
+    await create_resource_definition(db_session, name="plate", fqn="test.Plate")
+
+    response = await client.get("/api/v1/catalog/snapshot")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/vnd.sqlite3"
+    version = response.headers["x-catalog-version"]
+    assert response.headers["etag"] == f'"{version}"'
+
+    path = tmp_path / "catalog.db"
+    path.write_bytes(response.content)
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute(
+            "SELECT name FROM resource_definitions WHERE fqn = 'test.Plate'",
+        ).fetchone() == ("plate",)
+    finally:
+        conn.close()
+
+    response = await client.get(
+        "/api/v1/catalog/snapshot", headers={"If-None-Match": f'"{version}"'},
+    )
+    assert response.status_code == 304
+
+    response = await client.get("/api/v1/catalog/version")
+    assert response.status_code == 200, response.text
+    assert response.json()["version"] == version
+
+    added = await create_resource_definition(db_session, name="tips", fqn="test.Tips")
+    response = await client.get("/api/v1/catalog/delta", params={"since": version})
+    assert response.status_code == 200, response.text
+    delta = response.json()
+    assert delta["from_version"] == version
+    assert delta["to_version"] == response.headers["x-catalog-version"] != version
+    table = delta["tables"]["resource_definitions"]
+    key_index = table["columns"].index("accession_id")
+    assert [row[key_index] for row in table["upserts"]] == [str(added.accession_id)]
+    assert table["deletes"] == []
+
+    response = await client.get("/api/v1/catalog/delta", params={"since": "stale"})
+    assert response.status_code == 410
@@ -0,0 +1,51 @@
+"""API tests for protocol/machine capability matching."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.machine import MachineDefinition
+from praxis.backend.services.capability_index import capability_index
+from tests.helpers import create_machine, create_protocol_definition
+
+NEEDS_96_HEAD = {
+    "requirements": [{"capability_name": "has_core96", "expected_value": True}],
+}
+
+
+@pytest.mark.asyncio
+async def test_protocol_compatibility_endpoints(
+    client: AsyncClient, db_session: AsyncSession,
+) -> None:
+    """Per-protocol results and the matrix agree on the compatible machines."""
+    definition = MachineDefinition(
+        name="star", fqn="test.STAR", plr_category="LiquidHandler",
+        capabilities={"has_core96": True},
+    )
+    db_session.add(definition)
+    await db_session.flush()
+    star = await create_machine(db_session, machine_definition_accession_id=definition.accession_id)
+    other = await create_machine(db_session)
+    protocol = await create_protocol_definition(
+        db_session, hardware_requirements_json=NEEDS_96_HEAD,
+    )
+    await capability_index.invalidate_all()
+
+    response = await client.get(f"/api/v1/protocols/{protocol.accession_id}/compatibility")
+    assert response.status_code == 200, response.text
+    results = {r["machine"]["accession_id"]: r for r in response.json()}
+    assert results[str(star.accession_id)]["compatibility"]["is_compatible"] is True
+    assert results[str(star.accession_id)]["machine"]["machine_type"] == "LiquidHandler"
+    assert results[str(other.accession_id)]["compatibility"]["is_compatible"] is False
+
+    response = await client.get(
+        "/api/v1/protocols/compatibility-matrix",
+        params={"protocol_ids": [str(protocol.accession_id)]},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["protocols"] == {str(protocol.accession_id): [str(star.accession_id)]}
+    assert {m["accession_id"] for m in data["machines"]} >= {
+        str(star.accession_id),
+        str(other.accession_id),
+    }
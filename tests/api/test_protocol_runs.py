@@ -66,6 +66,40 @@ async def test_get_multi_protocol_runs(client: AsyncClient, db_session: AsyncSes
     assert len(data) >= 3
 
 
+@pytest.mark.asyncio
+async def test_get_multi_protocol_runs_keyset(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test cursor pagination and total count headers on the run listing."""
+    # 1. SETUP: Create runs for one definition
+    protocol_def = await create_protocol_definition(db_session, name="keyset_protocol")
+    runs = [await create_protocol_run(db_session, protocol_definition=protocol_def) for _ in range(3)]
+
+    # 2. ACT: Walk the listing two rows at a time
+    first = await client.get(
+        "/api/v1/protocols/runs", params={"keyset": "true", "limit": 2, "count": "exact"},
+    )
+    second = await client.get(
+        "/api/v1/protocols/runs",
+        params={"cursor": first.headers["X-Next-Cursor"], "limit": 2},
+    )
+
+    # 3. ASSERT: Pages are contiguous and the last page has no cursor
+    assert first.status_code == 200
+    assert first.headers["X-Total-Count"] == "3"
+    assert first.headers["X-Total-Count-Estimated"] == "false"
+    assert second.status_code == 200
+    assert "X-Next-Cursor" not in second.headers
+    listed = [run["accession_id"] for run in first.json() + second.json()]
+    assert listed == sorted(str(run.accession_id) for run in runs)
+
+
+@pytest.mark.asyncio
+async def test_get_multi_protocol_runs_rejects_keyset_with_offset(client: AsyncClient) -> None:
+    """Test that mixing keyset pagination with an offset is a client error."""
+    response = await client.get("/api/v1/protocols/runs", params={"keyset": "true", "offset": 5})
+
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_update_protocol_run(client: AsyncClient, db_session: AsyncSession) -> None:
     """Test updating a protocol run's data directory path."""
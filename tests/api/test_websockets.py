@@ -1,10 +1,17 @@
 """Tests for WebSocket endpoints."""
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from praxis.backend.api.websockets import websocket_endpoint
+from praxis.backend.api.websockets import hardware_connections_endpoint, websocket_endpoint
+from praxis.backend.core.storage import StorageBackend, StorageFactory
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.services.hardware_connection_manager import (
+    EVENTS_CHANNEL,
+    HardwareConnectionManager,
+)
 
 
 class MockWebSocket:
@@ -83,6 +90,31 @@ class TestWebSocketEndpoint:
         complete_messages = [m for m in websocket.messages if m["type"] == "complete"]
         assert len(complete_messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_websocket_progress_carries_the_published_estimate(self, mock_orchestrator):
+        """The run progress is sent unchanged, with the estimate read from the state store."""
+        run_id = str(uuid.uuid4())
+        websocket = MockWebSocket()
+        websocket.app.state.orchestrator = mock_orchestrator
+        estimate = {"fraction": 0.4, "remaining_s": 30.0}
+        mock_orchestrator.protocol_run_service.get_protocol_run_status = AsyncMock(
+            return_value={
+                "status": "COMPLETED",
+                "progress": 100,
+                "progress_estimate": estimate,
+                "logs": [],
+            }
+        )
+
+        with patch("praxis.backend.api.websockets.asyncio.sleep", new_callable=AsyncMock):
+            await websocket_endpoint(websocket, run_id)
+
+        mock_orchestrator.protocol_run_service.get_protocol_run_status.assert_awaited_with(
+            uuid.UUID(run_id), progress_store=mock_orchestrator.state_store
+        )
+        progress_messages = [m for m in websocket.messages if m["type"] == "progress"]
+        assert progress_messages[0]["payload"] == {"progress": 100, "estimate": estimate}
+
     @pytest.mark.asyncio
     async def test_websocket_status_progression(self, mock_orchestrator):
         """Test that status updates are sent when status changes."""
@@ -99,7 +131,7 @@ class TestWebSocketEndpoint:
 
         status_iter = iter(statuses)
 
-        async def get_status_side_effect(run_uuid):
+        async def get_status_side_effect(run_uuid, **_kwargs):
             try:
                 return next(status_iter)
             except StopIteration:
@@ -140,7 +172,7 @@ class TestWebSocketEndpoint:
 
         logs_iter = iter(logs_progression)
 
-        async def get_status_side_effect(run_uuid):
+        async def get_status_side_effect(run_uuid, **_kwargs):
             try:
                 return next(logs_iter)
             except StopIteration:
@@ -253,7 +285,7 @@ class TestWebSocketEndpoint:
 
         status_iter = iter(statuses)
 
-        async def get_status_side_effect(run_uuid):
+        async def get_status_side_effect(run_uuid, **_kwargs):
             try:
                 return next(status_iter)
             except StopIteration:
@@ -284,7 +316,7 @@ class TestWebSocketEndpoint:
         # First call raises exception, second succeeds
         call_count = 0
 
-        async def get_status_side_effect(run_uuid):
+        async def get_status_side_effect(run_uuid, **_kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -365,3 +397,71 @@ class TestWebSocketEndpoint:
         # But should have 3 progress messages (one per poll)
         progress_messages = [m for m in websocket.messages if m["type"] == "progress"]
         assert len(progress_messages) == 3
+
+
+class MockHardwareWebSocket(MockWebSocket):
+    """Mock WebSocket whose incoming messages are fed by the test."""
+
+    def __init__(self):
+        super().__init__()
+        self.incoming = asyncio.Queue()
+        self.sent = asyncio.Queue()
+
+    async def send_json(self, data):
+        """Record a message and make it available to the test."""
+        await super().send_json(data)
+        self.sent.put_nowait(data)
+
+    async def receive(self):
+        """Return the next message sent by the client."""
+        return await self.incoming.get()
+
+    async def next_sent(self):
+        """Wait for the next message sent by the server."""
+        return await asyncio.wait_for(self.sent.get(), timeout=2)
+
+
+@pytest.fixture
+def hardware_websocket():
+    """A socket wired to a pub/sub and connection manager as created at startup."""
+    pubsub = StorageFactory.create_pubsub(StorageBackend.MEMORY)
+    websocket = MockHardwareWebSocket()
+    websocket.app.state.pubsub = pubsub
+    websocket.app.state.connection_manager = HardwareConnectionManager(
+        InMemoryKeyValueStore(), pubsub=pubsub
+    )
+    return websocket
+
+
+class TestHardwareConnectionsEndpoint:
+    """Test suite for the hardware connection event stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_events_until_the_client_disconnects(self, hardware_websocket):
+        """Events are forwarded, and a disconnect ends the stream without waiting for one."""
+        state = hardware_websocket.app.state
+        handler = asyncio.create_task(hardware_connections_endpoint(hardware_websocket))
+        assert await hardware_websocket.next_sent() == {"type": "connections", "payload": []}
+
+        await state.connection_manager.connect("serial-1", "STARBackend")
+        event = await hardware_websocket.next_sent()
+        assert event["type"] == "connection_event"
+        assert event["payload"]["device_id"] == "serial-1"
+        assert event["payload"]["status"] == "connected"
+
+        await hardware_websocket.incoming.put({"type": "websocket.disconnect", "code": 1000})
+        done, _ = await asyncio.wait({handler}, timeout=2)
+        assert handler in done
+        assert state.pubsub._channels[EVENTS_CHANNEL] == []
+
+    @pytest.mark.asyncio
+    async def test_closing_the_pubsub_closes_the_socket(self, hardware_websocket):
+        """Shutting the pub/sub down (as the application does on exit) ends open streams."""
+        handler = asyncio.create_task(hardware_connections_endpoint(hardware_websocket))
+        await hardware_websocket.next_sent()
+
+        await hardware_websocket.app.state.pubsub.close()
+        done, _ = await asyncio.wait({handler}, timeout=2)
+        assert handler in done
+        assert hardware_websocket.closed
+        assert hardware_websocket.close_code == 1001
@@ -2,10 +2,15 @@
 
 Based on test_decks.py (5/5 passing) and API_TEST_PATTERN.md
 """
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from main import app
+from praxis.backend.api.dependencies import get_db_session_factory
 from tests.helpers import create_well_data_output
 
 
@@ -102,3 +107,49 @@ async def test_delete_well_data_output(client: AsyncClient, db_session: AsyncSes
 
         # 4. ASSERT: Verify response
         assert response.status_code == 204  # No Content
+
+
+@pytest.mark.asyncio
+async def test_export_well_data_outputs_csv(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test streaming well data outputs as CSV filtered by plate."""
+    well_output = await create_well_data_output(db_session, well_name="B2", data_value=7.5)
+
+    response = await client.get(
+        "/api/v1/data-outputs/export/well-outputs",
+        params={"plate_resource_accession_id": str(well_output.plate_resource_accession_id)},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().splitlines()
+    assert len(lines) == 2
+    assert "B2" in lines[1]
+    assert "7.5" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_export_reads_through_its_own_session(
+    client: AsyncClient, db_session: AsyncSession,
+) -> None:
+    """The streamed body opens (and closes) a session instead of reusing the request's."""
+    well_output = await create_well_data_output(db_session, well_name="C3", data_value=1.5)
+    opened: list[str] = []
+
+    @asynccontextmanager
+    async def export_session() -> AsyncIterator[AsyncSession]:
+        opened.append("open")
+        yield db_session
+        opened.append("closed")
+
+    app.dependency_overrides[get_db_session_factory] = lambda: export_session
+    response = await client.get(
+        "/api/v1/data-outputs/export/well-outputs",
+        params={
+            "plate_resource_accession_id": str(well_output.plate_resource_accession_id),
+            "format": "jsonl",
+        },
+    )
+
+    assert response.status_code == 200
+    assert "C3" in response.text
+    assert opened == ["open", "closed"]
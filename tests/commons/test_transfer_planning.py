@@ -0,0 +1,163 @@
+"""Tests for the channel-parallel transfer planner."""
+
+import random
+
+import pytest
+from pylabrobot.liquid_handling import LiquidHandler
+from pylabrobot.liquid_handling.backends import LiquidHandlerChatterboxBackend
+from pylabrobot.resources import (
+  PLT_CAR_L5AC_A00,
+  TIP_CAR_480_A00,
+  CellVis_96_wellplate_350uL_Fb,
+  hamilton_96_tiprack_1000uL_filter,
+)
+from pylabrobot.resources.hamilton import STARLetDeck
+
+from praxis.backend.commons.transfer_planning import (
+  TransferTiming,
+  execute_transfer_plan,
+  plan_transfers,
+  transfer_plan_operations,
+)
+from praxis.backend.core.simulation.state_models import SimulationState
+from praxis.backend.core.simulation.stateful_tracers import StatefulTracedMachine
+from praxis.backend.core.tracing.recorder import OperationRecorder
+
+
+@pytest.fixture
+def plates():
+  return CellVis_96_wellplate_350uL_Fb("src"), CellVis_96_wellplate_350uL_Fb("dst")
+
+
+def test_same_column_transfers_share_one_batch(plates) -> None:
+  """Shuffled transfers from one column into another run on eight channels at once."""
+  src, dst = plates
+  transfers = [
+    (src.get_item(f"{row}1"), dst.get_item(f"{row}3"), 10.0 + i) for i, row in enumerate("ABCDEFGH")
+  ]
+  random.Random(0).shuffle(transfers)
+
+  plan = plan_transfers(transfers)
+
+  assert len(plan.batches) == 1
+  (batch,) = plan.batches
+  assert [w.name for w in batch.sources] == [f"src_well_{row}1" for row in "ABCDEFGH"]
+  assert batch.volumes == [10.0 + i for i in range(8)]
+  assert plan.time_saved_s == pytest.approx(7 * TransferTiming().batch_s)
+
+
+def test_channel_order_and_head_size_are_respected(plates) -> None:
+  """Crossed row orders cannot share a pickup, and batches never exceed the head."""
+  src, dst = plates
+  crossed = plan_transfers(
+    [(src.get_item("A1"), dst.get_item("H2"), 5.0), (src.get_item("B1"), dst.get_item("G2"), 5.0)],
+  )
+  assert len(crossed.batches) == 2
+
+  column = [(src.get_item(f"{row}1"), dst.get_item(f"{row}1"), 5.0) for row in "ABCDEFGH"]
+  four_channel = plan_transfers(column, num_channels=4)
+  assert [len(b.transfers) for b in four_channel.batches] == [4, 4]
+
+
+def test_full_plate_is_promoted_to_96_head(plates) -> None:
+  """An identity copy of a whole 96-well plate becomes a single 96-head batch."""
+  src, dst = plates
+  transfers = [(src.get_item(i), dst.get_item(i), 20.0) for i in range(96)]
+
+  plan = plan_transfers(transfers)
+  without_head = plan_transfers(transfers, use_96_head=False)
+
+  assert [b.kind for b in plan.batches] == ["head96"]
+  assert len(without_head.batches) == 12
+  assert plan.summary()["tip_pickups"] == 1
+
+
+def test_dependent_transfers_keep_their_order(plates) -> None:
+  """A serial dilution across columns is batched per column but never reordered."""
+  plate, _ = plates
+  transfers = [
+    (plate.get_item(f"{row}{col}"), plate.get_item(f"{row}{col + 1}"), 50.0)
+    for row in "ABCDEFGH"
+    for col in (1, 2, 3)
+  ]
+
+  plan = plan_transfers(transfers)
+
+  assert [len(b.transfers) for b in plan.batches] == [8, 8, 8]
+  assert [b.targets[0].name for b in plan.batches] == [
+    "src_well_A2",
+    "src_well_A3",
+    "src_well_A4",
+  ]
+
+
+def test_large_volumes_are_split_and_bad_volumes_rejected(plates) -> None:
+  """Volumes above the tip capacity become equal passes."""
+  src, dst = plates
+  plan = plan_transfers([(src.get_item("A1"), dst.get_item("A1"), 250.0)], max_volume=100.0)
+  assert [b.volumes for b in plan.batches] == [[250.0 / 3]] * 3
+
+  with pytest.raises(ValueError, match="positive"):
+    plan_transfers([(src.get_item("A1"), dst.get_item("A1"), 0.0)])
+
+
+@pytest.mark.asyncio
+async def test_plan_runs_on_chatterbox_backend() -> None:
+  """Planned operations are accepted by a liquid handler with the chatterbox backend."""
+  lh = LiquidHandler(backend=LiquidHandlerChatterboxBackend(num_channels=8), deck=STARLetDeck())
+  await lh.setup()
+  tip_carrier = TIP_CAR_480_A00("tip_carrier")
+  tip_carrier[0] = hamilton_96_tiprack_1000uL_filter("tips_0")
+  tip_carrier[1] = hamilton_96_tiprack_1000uL_filter("tips_1")
+  plate_carrier = PLT_CAR_L5AC_A00("plate_carrier")
+  plate_carrier[0] = src = CellVis_96_wellplate_350uL_Fb("src")
+  plate_carrier[1] = dst = CellVis_96_wellplate_350uL_Fb("dst")
+  lh.deck.assign_child_resource(tip_carrier, rails=1)
+  lh.deck.assign_child_resource(plate_carrier, rails=10)
+  tip_racks = [tip_carrier[0].resource, tip_carrier[1].resource]
+
+  transfers = [(src.get_item(i), dst.get_item(i), 10.0) for i in range(96)]
+  transfers += [(src.get_item(f"{row}1"), dst.get_item(f"{row}12"), 5.0) for row in "ABCDE"]
+  plan = plan_transfers(transfers)
+
+  await execute_transfer_plan(lh, plan, tip_racks, mix_cycles=2)
+
+  assert [b.kind for b in plan.batches] == ["head96", "channels"]
+  assert not any(lh.head[channel].has_tip for channel in range(8))
+  await lh.stop()
+
+
+@pytest.mark.asyncio
+async def test_plan_validates_against_stateful_tracer(plates) -> None:
+  """Executing a plan on the stateful tracer records no tip or liquid violations."""
+  src, dst = plates
+  machine = StatefulTracedMachine(
+    name="lh",
+    recorder=OperationRecorder(protocol_fqn="test.transfer_plan"),
+    declared_type="LiquidHandler",
+    machine_type="liquid_handler",
+    state=SimulationState.default_boolean(),
+  )
+  transfers = [(src.get_item(i), dst.get_item(i), 10.0) for i in range(96)]
+  transfers += [(src.get_item(f"{row}2"), dst.get_item(f"{row}5"), 5.0) for row in "ABC"]
+  tip_racks = [
+    hamilton_96_tiprack_1000uL_filter("tips_0"),
+    hamilton_96_tiprack_1000uL_filter("tips_1"),
+  ]
+  plan = plan_transfers(transfers)
+
+  await execute_transfer_plan(machine, plan, tip_racks, return_tips=True)
+
+  assert machine.violations == []
+  methods = [op.method for op in transfer_plan_operations(plan, tip_racks, return_tips=True)]
+  assert methods[:4] == ["pick_up_tips96", "aspirate96", "dispense96", "drop_tips96"]
+  assert methods[4:] == ["pick_up_tips", "aspirate", "dispense", "drop_tips"]
+
+
+def test_not_enough_tips_is_an_error(plates) -> None:
+  """A plan that needs more tips than the racks hold is rejected before running."""
+  src, dst = plates
+  plan = plan_transfers([(src.get_item(i), dst.get_item(i), 10.0) for i in range(96)])
+
+  with pytest.raises(ValueError, match="full tip rack"):
+    transfer_plan_operations(plan, [])
@@ -34,6 +34,7 @@ def mock_run_context(mock_db_session):
     context.run_accession_id = uuid7()
     context.current_db_session = mock_db_session
     context.current_call_log_db_accession_id = uuid7()
+    context.call_log_writer = None
     context.canonical_state = None
     context.get_and_increment_sequence_val = Mock(return_value=1)
     context.create_context_for_nested_call = Mock()
@@ -43,6 +44,7 @@ def mock_run_context(mock_db_session):
     nested_context.run_accession_id = context.run_accession_id
     nested_context.current_db_session = mock_db_session
     nested_context.current_call_log_db_accession_id = uuid7()
+    nested_context.call_log_writer = None
     context.create_context_for_nested_call.return_value = nested_context
 
     return context
@@ -93,6 +95,27 @@ class TestLogCallStart:
             assert result is None  # Should return None on error
 
 
+    @pytest.mark.asyncio
+    async def test_log_call_start_uses_call_log_writer(self, mock_run_context):
+        """With a batched writer on the context, the start is enqueued instead of written."""
+        call_id = uuid7()
+        mock_run_context.call_log_writer = Mock()
+        mock_run_context.call_log_writer.log_start = AsyncMock(return_value=call_id)
+
+        with patch("praxis.backend.core.decorators.protocol_decorator.log_function_call_start") as mock_log:
+            result = await _log_call_start(
+                context=mock_run_context,
+                function_def_db_id=uuid7(),
+                parent_log_id=None,
+                args=(),
+                kwargs={},
+            )
+
+        assert result == call_id
+        mock_run_context.call_log_writer.log_start.assert_awaited_once()
+        mock_log.assert_not_called()
+
+
 class TestProcessWrapperArguments:
     """Tests for _process_wrapper_arguments function."""
 
@@ -87,6 +87,79 @@ class TestInMemoryKeyValueStore:
         # Key should be expired
         assert await store.get("key1") is None
 
+    @pytest.mark.asyncio
+    async def test_incr(self, store: InMemoryKeyValueStore) -> None:
+        """Test atomic counter increments."""
+        assert await store.incr("counter") == 1
+        assert await store.incr("counter", 5) == 6
+        assert await store.get("counter") == 6
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, store: InMemoryKeyValueStore) -> None:
+        """Test that swaps only happen while the expected value is current."""
+        assert await store.compare_and_set("key1", None, {"v": 1}) is True
+        assert await store.compare_and_set("key1", None, {"v": 2}) is False
+        assert await store.compare_and_set("key1", {"v": 0}, {"v": 2}) is False
+        assert await store.compare_and_set("key1", {"v": 1}, {"v": 2}) is True
+        assert await store.get("key1") == {"v": 2}
+        assert await store.compare_and_set("key1", {"v": 2}, None) is True
+        assert await store.exists("key1") is False
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set_treats_expired_as_absent(
+        self, store: InMemoryKeyValueStore,
+    ) -> None:
+        """Test that an expired value no longer blocks a swap from absent."""
+        await store.compare_and_set("lease", None, "a", ttl_seconds=0.05)
+        assert await store.compare_and_set("lease", None, "b") is False
+        await asyncio.sleep(0.1)
+        assert await store.compare_and_set("lease", None, "b") is True
+
+    @pytest.mark.asyncio
+    async def test_mget_and_mset(self, store: InMemoryKeyValueStore) -> None:
+        """Test batched reads and writes."""
+        await store.mset({"a": 1, "b": {"x": 2}})
+        assert await store.mget(["a", "missing", "b"]) == [1, None, {"x": 2}]
+
+    @pytest.mark.asyncio
+    async def test_scan_pages_through_prefix(self, store: InMemoryKeyValueStore) -> None:
+        """Test that scan returns every prefixed key once, in pages."""
+        await store.mset({f"user:{i:02d}": i for i in range(25)})
+        await store.mset({"other": 0, "user": 0, "users:x": 0})
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            cursor, page = await store.scan("user:", cursor, count=10)
+            assert len(page) <= 10
+            seen.extend(page)
+            if cursor is None:
+                break
+        assert seen == [f"user:{i:02d}" for i in range(25)]
+        assert await store.keys("user:?5") == ["user:05", "user:15"]
+
+    @pytest.mark.asyncio
+    async def test_set_operations(self, store: InMemoryKeyValueStore) -> None:
+        """Test set add, remove and membership."""
+        assert await store.sadd("devices", "a", "b") == 2
+        assert await store.sadd("devices", "b", "c") == 1
+        assert await store.smembers("devices") == {"a", "b", "c"}
+        assert await store.srem("devices", "a", "z") == 1
+        assert await store.srem("devices", "b", "c") == 2
+        assert await store.exists("devices") is False
+        assert await store.smembers("devices") == set()
+
+    @pytest.mark.asyncio
+    async def test_hash_operations(self, store: InMemoryKeyValueStore) -> None:
+        """Test hash field writes, reads and removal."""
+        assert await store.hset("state", {"a": 1, "b": 2}) == 2
+        assert await store.hset("state", {"b": 3, "c": 4}) == 1
+        assert await store.hgetall("state") == {"a": 1, "b": 3, "c": 4}
+        assert await store.hdel("state", "a", "z") == 1
+        assert await store.hdel("state", "b", "c") == 2
+        assert await store.exists("state") is False
+        assert await store.hgetall("state") == {}
+
     @pytest.mark.asyncio
     async def test_close(self, store: InMemoryKeyValueStore) -> None:
         """Test closing the store."""
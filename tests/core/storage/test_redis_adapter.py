@@ -0,0 +1,92 @@
+"""Unit tests for the Redis key-value store, run against fakeredis."""
+
+import pytest
+
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
+from praxis.backend.utils.async_run import run_sync
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def store() -> RedisKeyValueStore:
+    """Create a store whose client is an in-process fake Redis."""
+    kv = RedisKeyValueStore()
+    kv._create_client = fakeredis.FakeAsyncRedis
+    return kv
+
+
+def test_from_url() -> None:
+    """Connection settings are parsed from a Redis URL."""
+    kv = RedisKeyValueStore.from_url("redis://:secret@cache.local:6380/2")
+    assert (kv._host, kv._port, kv._db, kv._password) == ("cache.local", 6380, 2, "secret")
+
+
+@pytest.mark.asyncio
+async def test_mget_mset_and_incr(store: RedisKeyValueStore) -> None:
+    """Batched reads and writes round-trip JSON values."""
+    await store.mset({"a": 1, "b": {"x": 2}}, ttl_seconds=60)
+    assert await store.mget(["a", "missing", "b"]) == [1, None, {"x": 2}]
+    assert await store.incr("counter", 3) == 3
+    assert await store.get("counter") == 3
+
+
+@pytest.mark.asyncio
+async def test_scan_escapes_prefix(store: RedisKeyValueStore) -> None:
+    """Scan matches the prefix literally and pages until complete."""
+    await store.mset({f"user:{i}": i for i in range(30)})
+    await store.mset({"user*:x": 0, "users": 0})
+
+    seen: set[str] = set()
+    cursor = None
+    while True:
+        cursor, page = await store.scan("user:", cursor, count=7)
+        seen.update(page)
+        if cursor is None:
+            break
+    assert seen == {f"user:{i}" for i in range(30)}
+    _, starred = await store.scan("user*", count=1000)
+    assert starred == ["user*:x"]
+    assert set(await store.keys("user:2?")) == {f"user:{i}" for i in range(20, 30)}
+
+
+@pytest.mark.asyncio
+async def test_set_operations(store: RedisKeyValueStore) -> None:
+    """Set operations map onto native Redis sets."""
+    assert await store.sadd("devices", "a", "b") == 2
+    assert await store.sadd("devices") == 0
+    assert await store.smembers("devices") == {"a", "b"}
+    assert await store.srem("devices", "a", "b") == 2
+    assert await store.exists("devices") is False
+
+
+@pytest.mark.asyncio
+async def test_hash_operations(store: RedisKeyValueStore) -> None:
+    """Hash operations map onto native Redis hashes with JSON field values."""
+    assert await store.hset("state", {"a": 1, "b": [1, 2]}) == 2
+    assert await store.hset("state", {}) == 0
+    assert await store.hgetall("state") == {"a": 1, "b": [1, 2]}
+    assert await store.hdel("state", "a", "b") == 2
+    assert await store.exists("state") is False
+
+
+def test_each_event_loop_gets_its_own_client() -> None:
+    """A store shared across loops (as by Celery tasks) reconnects on each new loop."""
+    server = fakeredis.FakeServer()
+    clients = []
+
+    def create_client():
+        clients.append(fakeredis.FakeAsyncRedis(server=server))
+        return clients[-1]
+
+    kv = RedisKeyValueStore()
+    kv._create_client = create_client
+
+    async def round_trip(value: int) -> object:
+        await kv.set("key", value)
+        return await kv.get("key")
+
+    assert run_sync(round_trip(1)) == 1
+    assert run_sync(round_trip(2)) == 2
+    assert len(clients) == 2
+    assert list(kv._clients.values()) == [clients[1]]
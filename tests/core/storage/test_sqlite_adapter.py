@@ -0,0 +1,133 @@
+"""Unit tests for the SQLite key-value store."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from praxis.backend.core.storage.protocols import KeyValueStore
+from praxis.backend.core.storage.sqlite_adapter import SqliteKeyValueStore
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    """Create a store backed by a fresh database file."""
+    kv = SqliteKeyValueStore(str(tmp_path / "kv.db"))
+    yield kv
+    await kv.close()
+
+
+@pytest.mark.asyncio
+async def test_implements_protocol(store: SqliteKeyValueStore) -> None:
+    """Verify the store implements the KeyValueStore protocol."""
+    assert isinstance(store, KeyValueStore)
+
+
+@pytest.mark.asyncio
+async def test_incr(store: SqliteKeyValueStore) -> None:
+    """Counters start from zero and keep JSON-readable values."""
+    assert await store.incr("counter") == 1
+    assert await store.incr("counter", 4) == 5
+    assert await store.incr("counter", -2) == 3
+    assert await store.get("counter") == 3
+
+
+@pytest.mark.asyncio
+async def test_compare_and_set(store: SqliteKeyValueStore) -> None:
+    """Swaps only happen while the expected value is current."""
+    assert await store.compare_and_set("key1", None, {"v": 1}) is True
+    assert await store.compare_and_set("key1", None, {"v": 2}) is False
+    assert await store.compare_and_set("key1", {"v": 0}, {"v": 2}) is False
+    assert await store.compare_and_set("key1", {"v": 1}, {"v": 2}) is True
+    assert await store.get("key1") == {"v": 2}
+    assert await store.compare_and_set("key1", {"v": 2}, None) is True
+    assert await store.exists("key1") is False
+    assert await store.compare_and_set("key1", None, None) is True
+
+
+@pytest.mark.asyncio
+async def test_compare_and_set_treats_expired_as_absent(store: SqliteKeyValueStore) -> None:
+    """An expired value neither matches nor blocks a swap from absent."""
+    await store.compare_and_set("lease", None, "a", ttl_seconds=0.05)
+    assert await store.compare_and_set("lease", None, "b") is False
+    await asyncio.sleep(0.1)
+    assert await store.compare_and_set("lease", "a", "c") is False
+    assert await store.compare_and_set("lease", None, "b") is True
+    assert await store.get("lease") == "b"
+
+
+@pytest.mark.asyncio
+async def test_mget_and_mset(store: SqliteKeyValueStore) -> None:
+    """Batched reads keep key order and skip expired values."""
+    await store.mset({f"k{i}": {"i": i} for i in range(600)})
+    await store.mset({"short": 1}, ttl_seconds=0.05)
+    await asyncio.sleep(0.1)
+    keys = ["k599", "missing", "short", "k0"]
+    assert await store.mget(keys) == [{"i": 599}, None, None, {"i": 0}]
+    assert len(await store.mget([f"k{i}" for i in range(600)])) == 600
+
+
+@pytest.mark.asyncio
+async def test_scan_pages_through_prefix(store: SqliteKeyValueStore) -> None:
+    """Scan returns every prefixed key (values and sets) once, in pages."""
+    await store.mset({f"user:{i:02d}": i for i in range(25)})
+    await store.mset({"other": 0, "user": 0, "users:x": 0, "user_%": 0})
+    await store.sadd("user:set", "member")
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        cursor, page = await store.scan("user:", cursor, count=10)
+        seen.extend(page)
+        if cursor is None:
+            break
+    assert seen == [*(f"user:{i:02d}" for i in range(25)), "user:set"]
+    assert await store.keys("user:?5") == ["user:05", "user:15"]
+    assert await store.keys("user_*") == ["user_%"]
+
+
+@pytest.mark.asyncio
+async def test_set_operations(store: SqliteKeyValueStore) -> None:
+    """Set members are stored natively and count as a key."""
+    assert await store.sadd("devices", "a", "b") == 2
+    assert await store.sadd("devices", "b", "c") == 1
+    assert await store.smembers("devices") == {"a", "b", "c"}
+    assert await store.exists("devices") is True
+    assert await store.srem("devices", "a", "z") == 1
+    assert await store.delete("devices") is True
+    assert await store.smembers("devices") == set()
+    assert await store.exists("devices") is False
+
+
+@pytest.mark.asyncio
+async def test_hash_operations(store: SqliteKeyValueStore) -> None:
+    """Hash fields are stored as rows and the hash counts as a key."""
+    assert await store.hset("state", {"a": 1, "b": {"x": [1, 2]}}) == 2
+    assert await store.hset("state", {"b": None, "c": "z"}) == 1
+    assert await store.hgetall("state") == {"a": 1, "b": None, "c": "z"}
+    assert await store.exists("state") is True
+    assert await store.keys("sta*") == ["state"]
+    assert await store.hdel("state", "a", "missing") == 1
+    assert await store.hgetall("state") == {"b": None, "c": "z"}
+    assert await store.delete("state") is True
+    assert await store.hgetall("state") == {}
+    assert await store.exists("state") is False
+
+
+@pytest.mark.asyncio
+async def test_compare_and_set_between_connections(tmp_path) -> None:
+    """Two stores on one file see each other's swaps."""
+    first = SqliteKeyValueStore(str(tmp_path / "shared.db"))
+    second = SqliteKeyValueStore(str(tmp_path / "shared.db"))
+    try:
+        results = await asyncio.gather(
+            *(
+                store.compare_and_set("owner", None, name)
+                for store, name in [(first, "a"), (second, "b")] * 5
+            ),
+        )
+        assert results.count(True) == 1
+        assert await second.get("owner") == await first.get("owner")
+    finally:
+        await first.close()
+        await second.close()
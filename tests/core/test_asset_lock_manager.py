@@ -1,9 +1,13 @@
 """Tests for core/asset_lock_manager.py."""
 
+import asyncio
+import time
 
 import pytest
 
-from praxis.backend.core.asset_lock_manager import AssetLockManager
+from praxis.backend.core.asset_lock_manager import LOCK_KEY_PREFIX, AssetLockManager
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.core.storage.sqlite_adapter import SqliteKeyValueStore
 from praxis.backend.models.pydantic_internals.runtime import AcquireAssetLock
 from praxis.backend.utils.uuid import uuid7
 
@@ -12,12 +16,12 @@ class TestAssetLockManagerInit:
 
     """Tests for AssetLockManager initialization."""
 
-    def test_init_creates_empty_locks_dict(self) -> None:
-        """Test that __init__ creates empty locks dictionary."""
+    @pytest.mark.asyncio
+    async def test_init_defaults_to_empty_in_memory_store(self) -> None:
+        """Test that __init__ without a store or URL uses an empty in-memory store."""
         manager = AssetLockManager()
-        assert hasattr(manager, "_locks")
-        assert isinstance(manager._locks, dict)
-        assert len(manager._locks) == 0
+        assert isinstance(manager._kv, InMemoryKeyValueStore)
+        assert await manager._kv.keys(f"{LOCK_KEY_PREFIX}*") == []
 
     def test_init_creates_manager_instance(self) -> None:
         """Test that __init__ creates AssetLockManager instance."""
@@ -55,9 +59,10 @@ class TestAcquireAssetLock:
         )
 
         await manager.acquire_asset_lock(lock_data)
-        assert len(manager._locks) == 1
-        assert "RESOURCE:resource1" in manager._locks
-        assert manager._locks["RESOURCE:resource1"] == lock_data
+        assert await manager._kv.keys(f"{LOCK_KEY_PREFIX}*") == [
+            f"{LOCK_KEY_PREFIX}RESOURCE:resource1",
+        ]
+        assert await manager.get_lock_status("RESOURCE", "resource1") == lock_data
 
     @pytest.mark.asyncio
     async def test_acquire_lock_on_locked_asset_fails(self) -> None:
@@ -96,7 +101,7 @@ class TestAcquireAssetLock:
         )
 
         await manager.acquire_asset_lock(lock_data)
-        assert "DECK:deck1" in manager._locks
+        assert await manager._kv.exists(f"{LOCK_KEY_PREFIX}DECK:deck1")
 
     @pytest.mark.asyncio
     async def test_acquire_different_assets_both_succeed(self) -> None:
@@ -120,7 +125,7 @@ class TestAcquireAssetLock:
 
         assert result1 is True
         assert result2 is True
-        assert len(manager._locks) == 2
+        assert len(await manager._kv.keys(f"{LOCK_KEY_PREFIX}*")) == 2
 
 
 class TestReleaseAssetLock:
@@ -164,14 +169,13 @@ class TestReleaseAssetLock:
             reservation_id=reservation_id,
         )
         await manager.acquire_asset_lock(lock_data)
-        assert len(manager._locks) == 1
+        assert len(await manager._kv.keys(f"{LOCK_KEY_PREFIX}*")) == 1
 
         # Release the lock
         await manager.release_asset_lock(
             "RESOURCE", "resource1", reservation_id, protocol_run_id,
         )
-        assert len(manager._locks) == 0
-        assert "RESOURCE:resource1" not in manager._locks
+        assert await manager._kv.keys(f"{LOCK_KEY_PREFIX}*") == []
 
     @pytest.mark.asyncio
     async def test_release_nonexistent_lock_returns_false(self) -> None:
@@ -206,7 +210,7 @@ class TestReleaseAssetLock:
             "DECK", "deck1", reservation_id, protocol_run_id,
         )
         assert result is True
-        assert "DECK:deck1" not in manager._locks
+        assert not await manager._kv.exists(f"{LOCK_KEY_PREFIX}DECK:deck1")
 
 
 class TestGetLockStatus:
@@ -403,3 +407,192 @@ class TestAssetLockManagerIntegration:
         # Check it's the new lock
         status = await manager.get_lock_status("MACHINE", "machine1")
         assert status.protocol_run_id == protocol_run_id2
+
+
+def _lock(asset_name: str = "machine1", protocol_run_id=None, **kwargs) -> AcquireAssetLock:
+    return AcquireAssetLock(
+        asset_type="MACHINE",
+        asset_name=asset_name,
+        protocol_run_id=protocol_run_id or uuid7(),
+        reservation_id=uuid7(),
+        **kwargs,
+    )
+
+
+class TestLeasesAndFencing:
+
+    """Tests for lease ownership, expiry and fencing tokens."""
+
+    @pytest.mark.asyncio
+    async def test_release_requires_owning_reservation(self) -> None:
+        """Test that a lock can only be released by the reservation holding it."""
+        manager = AssetLockManager()
+        lock_data = _lock()
+        await manager.acquire_asset_lock(lock_data)
+
+        assert await manager.release_asset_lock("MACHINE", "machine1", uuid7()) is False
+        assert await manager.get_lock_status("MACHINE", "machine1") == lock_data
+        assert await manager.release_asset_lock(
+            "MACHINE", "machine1", lock_data.reservation_id,
+        ) is True
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_reacquire_with_same_reservation_renews(self) -> None:
+        """Test that acquiring again under the same reservation keeps the lease."""
+        manager = AssetLockManager()
+        lock_data = _lock()
+        first = await manager.acquire(lock_data)
+        second = await manager.acquire(lock_data)
+        assert first is not None
+        assert second == first
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_fencing_tokens_increase(self) -> None:
+        """Test that each new holder of an asset gets a larger fencing token."""
+        manager = AssetLockManager()
+        tokens = []
+        for _ in range(3):
+            lock_data = _lock()
+            lease = await manager.acquire(lock_data)
+            tokens.append(lease.fencing_token)
+            assert await manager.check_fencing_token("MACHINE", "machine1", lease.fencing_token)
+            await manager.release_asset_lock("MACHINE", "machine1", lock_data.reservation_id)
+        assert tokens == sorted(set(tokens))
+        assert not await manager.check_fencing_token("MACHINE", "machine1", tokens[-1])
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_can_be_taken_over(self) -> None:
+        """Test that a lease that is not renewed expires and fences out its old holder."""
+        store = InMemoryKeyValueStore()
+        crashed = AssetLockManager(kv_store=store, heartbeat_interval_seconds=60)
+        other = AssetLockManager(kv_store=store)
+        assert await crashed.acquire(_lock("machine1")) is not None
+        crashed.lease_seconds = 0.05
+        stale = await crashed.acquire(_lock("machine2"))
+        assert await other.acquire(_lock("machine2")) is None
+        await asyncio.sleep(0.1)
+
+        fresh = await other.acquire(_lock("machine2"))
+        assert fresh is not None
+        assert fresh.fencing_token > stale.fencing_token
+        assert not await other.check_fencing_token("MACHINE", "machine2", stale.fencing_token)
+        assert await crashed.renew_leases() == 1  # only the long "machine1" lease is left
+        await crashed.close()
+        await other.close()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_lease_alive(self) -> None:
+        """Test that held leases are renewed before they expire."""
+        store = InMemoryKeyValueStore()
+        holder = AssetLockManager(kv_store=store, lease_seconds=0.1)
+        other = AssetLockManager(kv_store=store)
+        assert await holder.acquire(_lock()) is not None
+
+        await asyncio.sleep(0.35)
+        assert await other.acquire(_lock()) is None
+        await holder.close()
+        await other.close()
+
+
+class TestRunIndex:
+
+    """Tests for releasing all locks of a protocol run."""
+
+    @pytest.mark.asyncio
+    async def test_release_all_only_touches_the_run(self) -> None:
+        """Test that release_all_protocol_locks releases exactly the run's locks."""
+        manager = AssetLockManager()
+        run_id = uuid7()
+        for name in ("machine1", "machine2", "machine3"):
+            assert await manager.acquire_asset_lock(_lock(name, run_id))
+        assert await manager.acquire_asset_lock(_lock("machine4"))
+
+        assert await manager.release_all_protocol_locks(run_id) == 3
+        for name in ("machine1", "machine2", "machine3"):
+            assert await manager.get_lock_status("MACHINE", name) is None
+        assert await manager.get_lock_status("MACHINE", "machine4") is not None
+        assert not await manager._kv.exists(manager._run_index_key(run_id))
+        assert await manager.release_all_protocol_locks(run_id) == 0
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_release_all_skips_locks_taken_over(self) -> None:
+        """Test that an index entry whose lock now belongs to another run is left alone."""
+        store = InMemoryKeyValueStore()
+        manager = AssetLockManager(kv_store=store, lease_seconds=0.05)
+        run_id = uuid7()
+        await manager.acquire_asset_lock(_lock("machine1", run_id))
+        await manager.close()  # stop renewing, as if the process died
+        await asyncio.sleep(0.1)
+        successor = _lock("machine1")
+        assert await manager.acquire_asset_lock(successor)
+
+        assert await manager.release_all_protocol_locks(run_id) == 0
+        assert await manager.get_lock_status("MACHINE", "machine1") == successor
+        await manager.close()
+
+
+async def _contend(managers: list[AssetLockManager], assets: int, rounds: int) -> list:
+    """Run workers that repeatedly lock, use and release a few shared assets."""
+    in_use: set[str] = set()
+    entries: list[tuple[str, int]] = []
+
+    async def worker(manager: AssetLockManager, worker_id: int) -> None:
+        done = 0
+        while done < rounds:
+            name = f"asset{(worker_id + done) % assets}"
+            lock_data = _lock(name)
+            lease = await manager.acquire(lock_data)
+            if lease is None:
+                await asyncio.sleep(0)
+                continue
+            assert name not in in_use
+            in_use.add(name)
+            entries.append((name, lease.fencing_token))
+            await asyncio.sleep(0)
+            in_use.discard(name)
+            assert await manager.release_asset_lock("MACHINE", name, lock_data.reservation_id)
+            done += 1
+
+    await asyncio.gather(
+        *(worker(managers[i % len(managers)], i) for i in range(8)),
+    )
+    return entries
+
+
+class TestContention:
+
+    """Throughput and exclusion under contention, per store backend."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    async def test_contention_throughput(self, backend: str, tmp_path) -> None:
+        """Test that contending managers never overlap and keep fencing order."""
+        if backend == "memory":
+            shared = InMemoryKeyValueStore()
+            stores = [shared, shared]
+        else:
+            path = str(tmp_path / "locks.db")
+            stores = [SqliteKeyValueStore(path), SqliteKeyValueStore(path)]
+        managers = [AssetLockManager(kv_store=store) for store in stores]
+
+        try:
+            started = time.perf_counter()
+            entries = await asyncio.wait_for(
+                _contend(managers, assets=2, rounds=25), timeout=60,
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            for manager in managers:
+                await manager.close()
+            for store in set(stores):
+                await store.close()
+
+        assert len(entries) == 8 * 25
+        for name in ("asset0", "asset1"):
+            tokens = [token for asset, token in entries if asset == name]
+            assert tokens == sorted(set(tokens))
+        assert len(entries) / elapsed > 20  # lock/release cycles per second
@@ -0,0 +1,129 @@
+"""Tests for the deck auto-layout solver."""
+
+import pytest
+
+from praxis.backend.core.deck_config import build_deck_from_config
+from praxis.backend.core.deck_layout_solver import solve_deck_layout
+from praxis.backend.core.precondition_resolver import DeckState, PreconditionResolver
+from praxis.backend.utils.plr_static_analysis.resource_hierarchy import DeckLayoutType
+from praxis.backend.utils.plr_static_analysis.visitors.computation_graph_extractor import (
+  extract_graph_from_source,
+)
+
+REPLICATE_SOURCE = '''
+async def replicate(
+    lh: LiquidHandler,
+    source: Plate,
+    dest: Plate,
+    spare: Plate,
+    tips: TipRack,
+    buffer: Trough,
+):
+    """Stamp the source plate into dest several times; touch spare once."""
+    await lh.pick_up_tips(tips)
+    await lh.aspirate(buffer, 50)
+    await lh.dispense(spare, 50)
+    await lh.aspirate(source["A1"], 10)
+    await lh.dispense(dest["A1"], 10)
+    await lh.aspirate(source["A2"], 10)
+    await lh.dispense(dest["A2"], 10)
+    await lh.aspirate(source["A3"], 10)
+    await lh.dispense(dest["A3"], 10)
+    await lh.drop_tips(tips)
+'''
+
+RESOURCES = ["source", "dest", "spare", "tips", "buffer"]
+STARLET = "pylabrobot.resources.hamilton.STARLetDeck"
+
+
+@pytest.fixture
+def graph():
+  return extract_graph_from_source(REPLICATE_SOURCE, "replicate", "test_module")
+
+
+def _track(solution, name: str) -> str:
+  (placement,) = [p for p in solution.config.placements if p.name == name]
+  return placement.parent_name
+
+
+def test_busy_pair_shares_a_carrier(graph) -> None:
+  """Source and dest are visited alternately, so they end up on adjacent sites."""
+  solution = solve_deck_layout(graph, RESOURCES, deck_fqn=STARLET, time_budget_s=0.5)
+
+  assert solution.unplaced == []
+  assert _track(solution, "source") == _track(solution, "dest")
+  assert solution.predicted_travel_mm <= solution.initial_travel_mm
+  assert solution.predicted_travel_mm == pytest.approx(
+    solution.head_travel_mm + 2.0 * solution.gripper_travel_mm
+  )
+
+
+def test_carriers_hold_a_single_category(graph) -> None:
+  """Tip racks, troughs and plates get carriers of their own kind."""
+  solution = solve_deck_layout(graph, RESOURCES, deck_fqn=STARLET)
+
+  carriers = {p.name: p for p in solution.config.placements if p.parent_name is None}
+  assert {_track(solution, "tips"), _track(solution, "buffer")}.isdisjoint(
+    {_track(solution, "source"), _track(solution, "spare")}
+  )
+  assert carriers[_track(solution, "tips")].resource_fqn.endswith("TIP_CAR_480_A00")
+  assert carriers[_track(solution, "source")].resource_fqn.endswith("PLT_CAR_L5AC_A00")
+  assert all(p.position is not None for p in carriers.values())
+
+
+def test_config_builds_a_deck(graph) -> None:
+  """The generated config can be instantiated on a real PLR deck."""
+  fqns = dict.fromkeys(
+    ["source", "dest", "spare"], "pylabrobot.resources.CellVis_96_wellplate_350uL_Fb"
+  )
+  fqns["tips"] = "pylabrobot.resources.hamilton_96_tiprack_1000uL_filter"
+  solution = solve_deck_layout(
+    graph, ["source", "dest", "spare", "tips"], deck_fqn=STARLET, resource_fqns=fqns
+  )
+
+  deck = build_deck_from_config(solution.config)
+
+  source = deck.get_resource("source")
+  assert source.parent.parent.name == _track(solution, "source")
+  assert deck.get_resource("tips").parent.parent.name == _track(solution, "tips")
+
+
+def test_slot_deck_skips_occupied_slots(graph) -> None:
+  """On slot-based decks, occupied slots are left alone and slots are numbered."""
+  solution = solve_deck_layout(
+    graph,
+    RESOURCES,
+    deck_type=DeckLayoutType.SLOT_BASED,
+    deck_fqn="pylabrobot.resources.opentrons.OTDeck",
+    resource_positions={"waste": "slot_1"},
+  )
+
+  slots = [p.slot for p in solution.config.placements]
+  assert len(slots) == len(RESOURCES)
+  assert "1" not in slots
+  assert all(p.parent_name is None for p in solution.config.placements)
+
+
+def test_overflowing_deck_reports_unplaced(graph) -> None:
+  """Resources that do not fit are reported instead of silently dropped."""
+  positions = {f"fixed_{i}": str(slot) for i, slot in enumerate(range(1, 10))}
+  solution = solve_deck_layout(
+    graph,
+    RESOURCES,
+    deck_type=DeckLayoutType.SLOT_BASED,
+    resource_positions=positions,
+  )
+
+  assert len(solution.config.placements) == 2
+  assert len(solution.unplaced) == 3
+
+
+def test_resolver_uses_auto_layout(graph) -> None:
+  """The resolver's deck config carries site assignments and a travel score."""
+  resolver = PreconditionResolver(layout_time_budget_s=0.05)
+  result = resolver.resolve(graph, DeckState(deck_fqn=STARLET))
+
+  placed = {p.name for p in result.suggested_placements if p.parent_name is not None}
+  assert placed == set(RESOURCES)
+  assert result.predicted_travel_mm is not None
+  assert result.unplaced_resources == []
@@ -626,6 +626,7 @@ class TestInitializeRunContext:
         # Mock PraxisState to avoid Redis
         with patch("praxis.backend.core.orchestrator.protocol_preparation.PraxisState") as mock_state_class:
             mock_state = Mock()
+            mock_state.load = AsyncMock()
             mock_state.update = Mock()
             # FIX: set must be async
             mock_state.set = AsyncMock()
@@ -861,6 +862,7 @@ class TestOrchestratorExecutionFlow:
             with patch("praxis.backend.core.orchestrator.protocol_preparation.PraxisState") as mock_praxis_state_cls:
                 # Setup PraxisState mock instance
                 mock_state_instance = mock_praxis_state_cls.return_value
+                mock_state_instance.load = AsyncMock()
                 mock_state_instance.set = AsyncMock()
                 mock_state_instance.update = Mock()
 
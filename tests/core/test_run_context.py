@@ -1,7 +1,7 @@
 """Tests for core/run_context.py."""
 
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from pydantic import BaseModel
 from pylabrobot.resources import Plate
@@ -285,9 +285,9 @@ class TestSerializeArguments:
         """Test that PraxisState is serialized as placeholder."""
         from praxis.backend.services.state import PraxisState
 
-        # Create actual PraxisState instance with mocked Redis
-        with patch("praxis.backend.services.state.redis.Redis"):
-            state = PraxisState()
+        from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+
+        state = PraxisState(store=InMemoryKeyValueStore())
 
         result = serialize_arguments((state,), {})
         data = json.loads(result)
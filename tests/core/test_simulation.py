@@ -44,8 +44,12 @@ from praxis.backend.core.simulation.state_models import (
 )
 from praxis.backend.core.simulation.stateful_tracers import (
   StatefulTracedMachine,
+  compile_contract,
+  compile_dispatcher,
 )
 from praxis.backend.core.tracing.recorder import OperationRecorder
+from praxis.backend.core.tracing.tracers import TracedComparison
+from praxis.backend.utils.async_run import run_sync
 
 
 # =============================================================================
@@ -381,6 +385,66 @@ class TestStatefulTracedMachine:
     machine.drop_tips("tips")
     assert state.tip_state.tips_loaded is False
 
+  def test_methods_are_compiled_once_and_bound_per_machine(
+    self, recorder: OperationRecorder, state: SimulationState
+  ) -> None:
+    """Test that dispatch is compiled per (type, method) and kept on the machine."""
+    machine = StatefulTracedMachine(
+      name="lh",
+      recorder=recorder,
+      declared_type="LiquidHandler",
+      machine_type="liquid_handler",
+      state=state,
+    )
+
+    aspirate = machine.aspirate
+    assert machine.aspirate is aspirate
+    assert aspirate.__func__ is compile_dispatcher("liquid_handler", "aspirate")
+    assert compile_contract("liquid_handler", "aspirate") is compile_contract(
+      "liquid_handler", "aspirate"
+    )
+    assert compile_contract("liquid_handler", "not_a_method") is None
+
+    result = machine.not_a_method(1, key="value")
+    assert result.name == "lh.not_a_method()"
+    assert machine.violations == []
+
+  def test_compiled_contract_binds_positional_and_keyword_args(self) -> None:
+    """Test that arguments bind to the names the contract refers to."""
+    compiled = compile_contract("liquid_handler", "aspirate")
+    assert compiled is not None
+
+    assert compiled.bind(("well", 10), {}) == {"resource": "well", "vol": 10}
+    assert compiled.bind(("well",), {"vol": 5, "flow_rate": 1}) == {
+      "resource": "well",
+      "vol": 5,
+      "flow_rate": 1,
+    }
+
+  def test_exact_volumes_and_stop_on_violation(self, recorder: OperationRecorder) -> None:
+    """Test exact-level effects and early return when violations stop a call."""
+    state = SimulationState.default_exact()
+    state.liquid_state.set_volume("src", 100.0)
+    machine = StatefulTracedMachine(
+      name="lh",
+      recorder=recorder,
+      declared_type="LiquidHandler",
+      machine_type="liquid_handler",
+      state=state,
+      continue_on_violation=False,
+    )
+
+    machine.pick_up_tips("tips")
+    machine.aspirate("src", vol=30)
+    machine.dispense("dst", 30)
+    assert state.liquid_state.get_volume("src") == 70.0
+    assert state.liquid_state.get_volume("dst") == 30.0
+
+    machine.drop_tips("tips")
+    machine.aspirate("src", 30)
+    assert [v.violation_type for v in machine.violations] == [ViolationType.TIPS_NOT_LOADED]
+    assert state.liquid_state.get_volume("src") == 70.0
+
 
 # =============================================================================
 # Test Hierarchical Simulator
@@ -472,6 +536,72 @@ class TestHierarchicalSimulator:
     assert any(r.requirement_type == "tips_required" for r in result.inferred_requirements)
 
 
+  @pytest.mark.parametrize("run_all_levels", [False, True])
+  def test_replay_matches_re_execution(self, run_all_levels: bool) -> None:
+    """Replaying the recorded calls gives the same result as re-running the protocol."""
+
+    async def drain_protocol(lh, plate, tips):
+      await lh.aspirate(plate["A1"], 100)
+      await lh.pick_up_tips(tips)
+      for well in plate.wells():
+        await lh.aspirate(well, 150)
+        await lh.dispense(plate["B1"], 150)
+      await lh.aspirate(plate["A1"], 300)
+      await lh.drop_tips(tips)
+
+    parameter_types = {"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"}
+    results = [
+      run_sync(
+        HierarchicalSimulator(replay=replay).simulate(
+          drain_protocol, parameter_types, run_all_levels=run_all_levels
+        )
+      )
+      for replay in (True, False)
+    ]
+
+    replayed, executed = (r.model_dump(exclude={"execution_time_ms"}) for r in results)
+    assert replayed == executed
+    assert replayed["violations"]
+
+  def test_protocol_traced_once_for_all_state_levels(self) -> None:
+    """Symbolic and exact levels replay the trace instead of re-running the protocol."""
+    runs = 0
+
+    async def counted_protocol(lh, plate, tips):
+      nonlocal runs
+      runs += 1
+      await lh.pick_up_tips(tips)
+      await lh.aspirate(plate["A1"], 100)
+      await lh.dispense(plate["B1"], 100)
+      await lh.drop_tips(tips)
+
+    parameter_types = {"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"}
+    result = simulate_protocol_sync(counted_protocol, parameter_types)
+    assert result.level_completed == "exact"
+    assert runs == 2  # structural trace + stateful trace
+
+    runs = 0
+    run_sync(HierarchicalSimulator(replay=False).simulate(counted_protocol, parameter_types))
+    assert runs == 6  # structural + boolean + symbolic + 3 exact edge cases
+
+  def test_traced_conditionals_fall_back_to_re_execution(self) -> None:
+    """A protocol that branched on a traced condition is re-executed per level."""
+    runs = 0
+
+    async def branching_protocol(lh, plate, tips):
+      nonlocal runs
+      runs += 1
+      await lh.pick_up_tips(tips)
+      if TracedComparison(name="cond", recorder=lh.recorder, left="v", operator=">", right="0"):
+        await lh.aspirate(plate["A1"], 100)
+      await lh.drop_tips(tips)
+
+    parameter_types = {"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"}
+    result = simulate_protocol_sync(branching_protocol, parameter_types)
+    assert result.passed is True
+    assert runs == 6
+
+
 # =============================================================================
 # Test Bounds Analyzer
 # =============================================================================
@@ -1190,6 +1320,39 @@ class TestGraphReplayEngine:
     assert "tips_loaded" in result.final_state_summary
     assert result.final_state_summary["tips_loaded"] is True
 
+  def test_replay_loops_in_body_time(self) -> None:
+    """Test traced loops replay their body once and scale effects by the count."""
+    from praxis.backend.core.simulation.graph_replay import (
+      GraphReplayEngine,
+    )
+    from praxis.backend.core.tracing.executor import trace_protocol_sync
+
+    async def plate_wash(lh, plate, tips):
+      for _ in range(3):
+        for well in plate.wells():
+          await lh.aspirate(well, 50)
+      await lh.pick_up_tips(tips)
+      for i in range(384):
+        await lh.aspirate(plate[i], 10)
+        await lh.dispense(plate[i], 10)
+
+    graph = trace_protocol_sync(
+      plate_wash,
+      parameter_types={"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"},
+    )
+    assert len(graph.operations) == 4
+
+    result = GraphReplayEngine().replay(graph.model_dump(mode="json"))
+
+    # The aspirate before pick_up_tips is reported once, not 3 x 96 times
+    assert [v.violation_type for v in result.violations] == ["tips_not_loaded"]
+    assert result.operations_executed == 3
+    assert result.operations_represented == 3 * 96 + 1 + 384 * 2
+    counts = {loop.source_expression: loop.iteration_count for loop in result.loops}
+    assert counts == {"range(3)": 3, "plate.wells()": 96, "range(384)": 384}
+    wells_loop = next(loop for loop in result.loops if loop.source_expression == "plate.wells()")
+    assert wells_loop.aggregate_effects[0]["total_volume"] == 50 * 96
+
 
 # =============================================================================
 # Test Protocol Cache (Cloudpickle)
@@ -0,0 +1,230 @@
+"""Tests for the content-addressed simulation result cache."""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from praxis.backend.core.simulation.result_cache import (
+  KEY_EVICTION_LEASE,
+  KEY_LRU_INDEX,
+  KEY_PREFIX,
+  SimulationResultCache,
+  normalize_protocol_source,
+  protocol_source_hash,
+  simulation_cache_key,
+)
+from praxis.backend.core.simulation.simulator import ProtocolSimulationResult
+from praxis.backend.core.simulation.state_models import SimulationState
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.services.simulation_service import SimulationService
+
+PARAMETER_TYPES = {"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"}
+
+
+async def transfer_protocol(lh, plate, tips):
+  """Move liquid from A1 to B1."""
+  await lh.pick_up_tips(tips)
+  await lh.aspirate(plate["A1"], 100)
+  await lh.dispense(plate["B1"], 100)
+  await lh.drop_tips(tips)
+
+
+async def renamed_transfer_protocol(lh, plate, tips):
+  # Same code as transfer_protocol under another name and docstring.
+  await lh.pick_up_tips(tips)
+  await lh.aspirate(plate["A1"], 100)
+  await lh.dispense(plate["B1"], 100)
+  await lh.drop_tips(tips)
+
+
+class FakeSession:
+  """Records what SimulationService writes back to the definition."""
+
+  def __init__(self) -> None:
+    self.added: list[object] = []
+
+  def add(self, obj: object) -> None:
+    self.added.append(obj)
+
+  async def commit(self) -> None:
+    pass
+
+
+def _definition(function_name: str) -> SimpleNamespace:
+  return SimpleNamespace(
+    fqn=f"{__name__}.{function_name}",
+    module_name=__name__,
+    function_name=function_name,
+    source_hash=None,
+    simulation_version=None,
+    simulation_result_json=None,
+    assets=[
+      SimpleNamespace(name=name, actual_type_str=type_hint, type_hint_str=type_hint)
+      for name, type_hint in PARAMETER_TYPES.items()
+    ],
+    parameters=[],
+  )
+
+
+class TestCacheKeys:
+  """Tests for source normalization and key derivation."""
+
+  def test_equivalent_sources_share_a_hash(self) -> None:
+    """Names, docstrings, comments, indentation and decorators do not change the hash."""
+    assert protocol_source_hash(transfer_protocol) == protocol_source_hash(
+      renamed_transfer_protocol,
+    )
+    decorated = '@protocol_function(name="x", version="2")\ndef a(lh):\n  return lh.go(1)\n'
+    plain = "def b(lh):\n    # comment\n    return lh.go(1)\n"
+    assert normalize_protocol_source(decorated) == normalize_protocol_source(plain)
+    assert normalize_protocol_source(plain) != normalize_protocol_source(
+      "def b(lh):\n  return lh.go(2)\n",
+    )
+
+  def test_helpers_called_by_the_protocol_change_the_hash(self, tmp_path: Path) -> None:
+    """Identical protocol bodies in modules with different helpers do not share a hash."""
+
+    def load(name: str, volume: int) -> object:
+      path = tmp_path / f"{name}.py"
+      path.write_text(
+        f"def volume():\n  return {volume}\n\n\n"
+        "async def protocol(lh, plate):\n  await lh.aspirate(plate['A1'], volume())\n",
+      )
+      spec = importlib.util.spec_from_file_location(name, path)
+      module = importlib.util.module_from_spec(spec)
+      spec.loader.exec_module(module)
+      return module.protocol
+
+    assert protocol_source_hash(load("helpers_a", 100)) != protocol_source_hash(
+      load("helpers_b", 200),
+    )
+    assert protocol_source_hash(load("helpers_c", 100)) == protocol_source_hash(
+      load("helpers_d", 100),
+    )
+
+  def test_key_covers_every_input(self) -> None:
+    """Parameter types, initial state, simulator config and version all change the key."""
+    base = simulation_cache_key("abc", PARAMETER_TYPES)
+    reordered = dict(reversed(list(PARAMETER_TYPES.items())))
+    assert simulation_cache_key("abc", reordered) == base
+
+    variants = [
+      simulation_cache_key("abd", PARAMETER_TYPES),
+      simulation_cache_key("abc", {**PARAMETER_TYPES, "plate": "Reservoir"}),
+      simulation_cache_key("abc", PARAMETER_TYPES, SimulationState.default_exact()),
+      simulation_cache_key("abc", PARAMETER_TYPES, simulator_config={"max_failure_states": 5}),
+      simulation_cache_key("abc", PARAMETER_TYPES, simulation_version="0.0.1"),
+    ]
+    assert len({base, *variants}) == len(variants) + 1
+    assert simulation_cache_key(
+      "abc", PARAMETER_TYPES, SimulationState.default_exact()
+    ) == simulation_cache_key("abc", PARAMETER_TYPES, SimulationState.default_exact())
+
+
+class TestSimulationResultCache:
+  """Tests for storage, metrics and eviction."""
+
+  @pytest.mark.asyncio
+  async def test_hits_misses_and_lru_eviction(self) -> None:
+    """The least recently used entry is evicted once max_entries is exceeded."""
+    store = InMemoryKeyValueStore()
+    cache = SimulationResultCache(store, max_entries=2)
+    results = {key: ProtocolSimulationResult(passed=key == "a") for key in "abc"}
+
+    assert await cache.get("a") is None
+    await cache.put("a", results["a"])
+    await cache.put("b", results["b"])
+    assert (await cache.get("a")).passed is True  # "b" is now least recently used
+    await cache.put("c", results["c"])
+
+    assert await store.exists(KEY_PREFIX + "a")
+    assert not await store.exists(KEY_PREFIX + "b")
+    assert await cache.get("b") is None
+    metrics = await cache.metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 2
+    assert metrics["stores"] == 3
+    assert metrics["evictions"] == 1
+    assert metrics["entries"] == 2
+    await store.close()
+
+  @pytest.mark.asyncio
+  async def test_store_failures_degrade_to_misses(self) -> None:
+    """A broken store never raises out of the cache."""
+
+    class BrokenStore(InMemoryKeyValueStore):
+      async def get(self, key: str) -> None:
+        raise ConnectionError(key)
+
+      async def hset(self, key: str, mapping: dict) -> int:
+        raise ConnectionError(key)
+
+    cache = SimulationResultCache(BrokenStore())
+    assert await cache.get("a") is None
+    await cache.put("a", ProtocolSimulationResult())
+    assert (await cache.metrics())["errors"] >= 2
+
+  @pytest.mark.asyncio
+  async def test_concurrent_hits_keep_every_access(self) -> None:
+    """Hits from several workers each record their own access and capacity holds."""
+    store = InMemoryKeyValueStore()
+    workers = [SimulationResultCache(store, max_entries=3) for _ in range(3)]
+    for key in "abc":
+      await workers[0].put(key, ProtocolSimulationResult())
+
+    await asyncio.gather(*(worker.get(key) for worker, key in zip(workers, "abc", strict=True)))
+    assert set(await store.hgetall(KEY_LRU_INDEX)) == {"a", "b", "c"}
+
+    await workers[1].get("a")  # "b" is now least recently used
+    await asyncio.gather(
+      *(
+        worker.put(key, ProtocolSimulationResult())
+        for worker, key in zip(workers, "def", strict=True)
+      ),
+    )
+    index = await store.hgetall(KEY_LRU_INDEX)
+    assert len(index) <= 3
+    assert not await store.exists(KEY_PREFIX + "b")
+    assert not await store.exists(KEY_EVICTION_LEASE)
+    await store.close()
+
+
+class TestSimulationServiceCaching:
+  """Tests for result reuse across protocol definitions."""
+
+  @pytest.mark.asyncio
+  async def test_identical_code_is_simulated_once(self) -> None:
+    """A second definition with the same code reuses the first one's result."""
+    cache = SimulationResultCache(InMemoryKeyValueStore())
+    service = SimulationService(
+      enable_failure_detection=False,
+      enable_bytecode_cache=False,
+      result_cache=cache,
+    )
+    calls = 0
+    analyze = service._simulator.analyze_protocol_sync
+
+    def counting_analyze(**kwargs):
+      nonlocal calls
+      calls += 1
+      return analyze(**kwargs)
+
+    service._simulator.analyze_protocol_sync = counting_analyze  # type: ignore[method-assign]
+
+    first = _definition("transfer_protocol")
+    second = _definition("renamed_transfer_protocol")
+    first_result = await service.simulate_protocol(first, FakeSession())
+    second_result = await service.simulate_protocol(second, FakeSession())
+
+    assert calls == 1
+    assert first_result is not None
+    assert first_result.passed is True
+    assert second_result == first_result
+    assert second.simulation_result_json == first.simulation_result_json
+
+    await service.simulate_protocol(second, FakeSession(), force_resimulate=True)
+    assert calls == 2
+    assert (await cache.metrics())["hits"] == 1
@@ -12,7 +12,7 @@ from praxis.backend.core.tracing.executor import (
   ProtocolTracingExecutor,
   trace_protocol_sync,
 )
-from praxis.backend.core.tracing.recorder import OperationRecorder
+from praxis.backend.core.tracing.recorder import OperationRecorder, collapse_repeated_iterations
 from praxis.backend.core.tracing.tracers import (
   TracedMachine,
   TracedResource,
@@ -347,6 +347,56 @@ class TestOperationRecorder:
     # The first precondition is from aspirate, pick_up_tips satisfies future ones
     assert len(tips_preconds) == 1
 
+  def test_loop_body_recorded_once(self) -> None:
+    """Test operations inside a traced loop become the body of a LoopNode."""
+    recorder = OperationRecorder(protocol_fqn="test.protocol")
+    recorder.enter_loop(iterator_var="each_well", source_collection="plate.wells()")
+    op_id = recorder.record_operation(
+      receiver="lh",
+      receiver_type="liquid_handler",
+      method="aspirate",
+      args=["each_well", "50"],
+      kwargs={},
+    )
+    recorder.exit_loop()
+    graph = recorder.build_graph()
+
+    assert len(graph.loops) == 1
+    assert graph.loops[0].body == [op_id]
+    assert graph.loops[0].source_expression == "plate.wells()"
+    assert graph.execution_order == [graph.loops[0].id]
+    assert graph.get_operation(op_id).foreach_body == []
+
+  def test_repeated_iterations_collapse(self) -> None:
+    """Test unrolled identical iterations collapse into one counted loop."""
+    recorder = OperationRecorder(protocol_fqn="test.protocol")
+    for i in range(5):
+      recorder.record_operation("lh", "liquid_handler", "aspirate", [f"plate[{i}]", "10"], {})
+      recorder.record_operation("lh", "liquid_handler", "pick_up_tips", [f"tips[{i}]"], {})
+    recorder.record_operation("lh", "liquid_handler", "aspirate", ["plate[5]", "20"], {})
+
+    graph = recorder.build_graph()
+    assert len(graph.operations) == 3
+    assert len(graph.execution_order) == 2
+    loop = graph.get_loop(graph.execution_order[0])
+    assert loop is not None
+    assert loop.iteration_count == 5
+    assert loop.body == ["traced_op_1", "traced_op_2"]
+    # Only the first iteration's unsatisfied precondition is kept
+    tips_preconds = [
+      p for p in graph.preconditions if p.precondition_type.value == "tips_loaded"
+    ]
+    assert [p.satisfied_by for p in tips_preconds] == ["traced_op_2"]
+
+    uncollapsed = recorder.build_graph(collapse_repeats=False)
+    assert len(uncollapsed.operations) == 11
+    assert uncollapsed.loops == []
+
+    # Collapsing works on copies and leaves its input graph unchanged
+    before = uncollapsed.model_dump()
+    assert collapse_repeated_iterations(uncollapsed) is not uncollapsed
+    assert uncollapsed.model_dump() == before
+
 
 # =============================================================================
 # Test ProtocolTracingExecutor
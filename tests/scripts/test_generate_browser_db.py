@@ -0,0 +1,129 @@
+"""Tests for the incremental browser database build."""
+
+import importlib.util
+import sqlite3
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = PROJECT_ROOT / "scripts" / "generate_browser_db.py"
+
+
+def _load_script(monkeypatch):
+  spec = importlib.util.spec_from_file_location("generate_browser_db", SCRIPT)
+  module = importlib.util.module_from_spec(spec)
+  monkeypatch.setitem(sys.modules, "generate_browser_db", module)
+  spec.loader.exec_module(module)
+  return module
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+  """Load the script with its inputs and outputs redirected to ``tmp_path``.
+
+  PLR discovery and protocol simulation are replaced by fakes that record
+  which inputs were analyzed.
+  """
+  module = _load_script(monkeypatch)
+
+  protocols = tmp_path / "protocols"
+  protocols.mkdir()
+  for name in ("first", "second"):
+    (protocols / f"{name}.py").write_text(f"def {name}():\n  pass\n")
+  plr_root = tmp_path / "pylabrobot"
+  plr_root.mkdir()
+  (plr_root / "resource.py").write_text("class Plate:\n  pass\n")
+  generator_source = tmp_path / "generator.py"
+  generator_source.write_text("VERSION = 1\n")
+
+  monkeypatch.setattr(module, "PROJECT_ROOT", tmp_path)
+  monkeypatch.setattr(module, "WEB_CLIENT_ROOT", tmp_path / "web")
+  monkeypatch.setattr(module, "PROTOCOLS_DIR", protocols)
+  monkeypatch.setattr(module, "OUTPUT_DB_PATH", tmp_path / "praxis.db")
+  monkeypatch.setattr(module, "MANIFEST_PATH", tmp_path / "praxis.manifest.json")
+  monkeypatch.setattr(module, "GENERATOR_SOURCES", (generator_source,))
+  monkeypatch.setattr(
+    "praxis.backend.utils.plr_static_analysis.find_plr_source_root", lambda: plr_root
+  )
+
+  module.calls = {"plr": 0, "protocols": []}
+  pickles = tmp_path / "web" / "src" / "assets" / "protocols"
+  pickles.mkdir(parents=True)
+
+  def discover_plr(kind):
+    module.calls["plr"] += 1
+    return []
+
+  def analyze_protocol_file(protocol_file, now):
+    module.calls["protocols"].append(protocol_file.name)
+    relative_path = str(protocol_file.relative_to(tmp_path))
+    accession_id = uuid.uuid5(uuid.NAMESPACE_URL, relative_path).hex
+    (pickles / f"{accession_id}.pkl").write_bytes(protocol_file.read_bytes())
+    row = (
+      accession_id, protocol_file.stem, f"protocols.{protocol_file.stem}",
+      f"protocols.{protocol_file.stem}", protocol_file.stem, relative_path,
+      protocol_file.read_text(), None, None, None, None, None, None, None, None,
+      0, 0, 1, now, now, "1.0", 0, 0, 0,
+    )
+    return {"function_protocol_definitions": [row]}
+
+  monkeypatch.setattr(module, "discover_plr", discover_plr)
+  monkeypatch.setattr(module, "analyze_protocol_file", analyze_protocol_file)
+  module.tmp_path = tmp_path
+  return module
+
+
+def _build(generator):
+  generator.calls = {"plr": 0, "protocols": []}
+  manifest = generator.build(workers=1)
+  return manifest, generator.calls
+
+
+def _descriptions(generator):
+  with sqlite3.connect(generator.OUTPUT_DB_PATH) as conn:
+    return dict(conn.execute("SELECT name, description FROM function_protocol_definitions"))
+
+
+def test_unchanged_inputs_are_reused(generator) -> None:
+  """A second build with the same inputs re-analyzes nothing and keeps every row."""
+  first, calls = _build(generator)
+  assert calls == {"plr": 3, "protocols": ["first.py", "second.py"]}
+
+  second, calls = _build(generator)
+  assert calls == {"plr": 0, "protocols": []}
+  assert second["tables"] == first["tables"]
+  assert set(_descriptions(generator)) == {"first", "second"}
+
+
+def test_changed_inputs_are_rebuilt(generator) -> None:
+  """Only changed protocol files are re-analyzed; PLR or generator changes rebuild more."""
+  _build(generator)
+  protocols = generator.tmp_path / "protocols"
+
+  (protocols / "second.py").write_text("def second():\n  return 2\n")
+  manifest, calls = _build(generator)
+  assert calls == {"plr": 0, "protocols": ["second.py"]}
+  assert _descriptions(generator)["second"] == "def second():\n  return 2\n"
+  assert manifest["tables"]["function_protocol_definitions"]["rows"] == 2
+
+  (generator.tmp_path / "pylabrobot" / "resource.py").write_text("class Plate:\n  wells = 96\n")
+  _, calls = _build(generator)
+  assert calls == {"plr": 3, "protocols": []}
+
+  (generator.tmp_path / "generator.py").write_text("VERSION = 2\n")
+  _, calls = _build(generator)
+  assert calls == {"plr": 3, "protocols": ["first.py", "second.py"]}
+
+
+def test_generator_sources_cover_the_simulation_pipeline(monkeypatch) -> None:
+  """The packages that produce the simulated rows are part of the generator hash."""
+  sources = set(_load_script(monkeypatch).GENERATOR_SOURCES)
+  backend = PROJECT_ROOT / "praxis" / "backend"
+  assert backend / "core" / "simulation" in sources
+  assert backend / "core" / "tracing" in sources
+  assert PROJECT_ROOT / "praxis" / "common" / "type_inspection.py" in sources
+  assert backend / "models" / "pydantic_internals" / "maintenance.py" in sources
+  assert all(source.exists() for source in sources)
@@ -6,6 +6,7 @@ import pytest
 
 from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
 from praxis.backend.services.async_state import AsyncPraxisState, create_async_state
+from praxis.backend.services.state import PraxisState
 
 
 class TestAsyncPraxisState:
@@ -226,3 +227,24 @@ class TestAsyncPraxisState:
 
     with pytest.raises(KeyError):
       await state.delete_async("nonexistent")
+
+  @pytest.mark.asyncio
+  async def test_shares_layout_with_praxis_state(
+    self,
+    store: InMemoryKeyValueStore,
+    run_id: uuid.UUID,
+  ) -> None:
+    """State written by either class is read by the other from the same hash."""
+    state = await create_async_state(store=store, run_accession_id=run_id)
+    await state.update_async({"a": 1, "b": 2})
+    await state.delete_async("b")
+
+    praxis_state = PraxisState(store=store, run_accession_id=run_id)
+    await praxis_state.load()
+    assert praxis_state.to_dict() == {"a": 1}
+    assert praxis_state.store_key == state.store_key
+
+    praxis_state["c"] = [3]
+    await praxis_state.close()
+    reloaded = await create_async_state(store=store, run_accession_id=run_id)
+    assert reloaded.to_dict() == {"a": 1, "c": [3]}
@@ -0,0 +1,122 @@
+"""Tests for the batched function call log writer."""
+
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.models.domain.protocol import FunctionCallLog
+from praxis.backend.models.enums import FunctionCallStatusEnum
+from praxis.backend.services.call_log_writer import FunctionCallLogWriter
+from praxis.backend.utils.uuid import uuid7
+from tests.helpers import create_protocol_run
+
+
+def _writer(db_session: AsyncSession, **kwargs) -> FunctionCallLogWriter:
+    # Bind the writer's sessions to the test connection so the outer rollback
+    # still cleans up after it.
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    return FunctionCallLogWriter(factory, **kwargs)
+
+
+async def _logs(db_session: AsyncSession, run_id) -> list[FunctionCallLog]:
+    result = await db_session.execute(
+        select(FunctionCallLog)
+        .where(FunctionCallLog.protocol_run_accession_id == run_id)
+        .order_by(FunctionCallLog.sequence_in_run)
+        .execution_options(populate_existing=True),
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_start_and_end_in_one_batch_are_written_as_one_row(
+    db_session: AsyncSession,
+) -> None:
+    """An end record queued behind its start is folded into the INSERT."""
+    run = await create_protocol_run(db_session)
+    writer = _writer(db_session)
+
+    parent_id = await writer.log_start(
+        run.accession_id, run.top_level_protocol_definition_accession_id, 1, json.dumps({"a": 1}),
+    )
+    child_id = await writer.log_start(
+        run.accession_id,
+        run.top_level_protocol_definition_accession_id,
+        2,
+        json.dumps({}),
+        parent_function_call_log_accession_id=parent_id,
+    )
+    await writer.log_end(child_id, FunctionCallStatusEnum.SUCCESS, json.dumps(5), duration_ms=12.7)
+    await writer.log_end(
+        parent_id, FunctionCallStatusEnum.ERROR, error_message="boom", duration_ms=20.0,
+    )
+    await writer.close()
+
+    parent, child = await _logs(db_session, run.accession_id)
+    assert writer.records_written == 4
+    assert writer.records_failed == 0
+    assert parent.accession_id == parent_id
+    assert parent.input_args_json == {"a": 1}
+    assert parent.status == FunctionCallStatusEnum.ERROR
+    assert parent.error_message_text == "boom"
+    assert child.parent_function_call_log_accession_id == parent_id
+    assert child.return_value_json == 5
+    assert child.duration_ms == 12
+    assert child.end_time is not None
+
+
+@pytest.mark.asyncio
+async def test_end_after_flush_updates_written_row(db_session: AsyncSession) -> None:
+    """End records for starts written in an earlier batch become UPDATEs."""
+    run = await create_protocol_run(db_session)
+    writer = _writer(db_session)
+
+    call_id = await writer.log_start(
+        run.accession_id, run.top_level_protocol_definition_accession_id, 1, json.dumps({}),
+    )
+    await writer.flush()
+    (log,) = await _logs(db_session, run.accession_id)
+    assert log.end_time is None
+
+    await writer.log_end(call_id, FunctionCallStatusEnum.SUCCESS, duration_ms=3.0)
+    await writer.close()
+
+    (log,) = await _logs(db_session, run.accession_id)
+    assert log.end_time is not None
+    assert log.duration_ms == 3
+    assert writer.batches_written == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_counted_and_writer_keeps_running(
+    db_session: AsyncSession,
+) -> None:
+    """A batch that cannot be written does not stop later batches."""
+    run = await create_protocol_run(db_session)
+    writer = _writer(db_session, max_pending=1)
+    session_factory = writer.session_factory
+    calls = 0
+
+    def flaky_factory() -> AsyncSession:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "database unavailable"
+            raise ConnectionError(msg)
+        return session_factory()
+
+    writer.session_factory = flaky_factory  # type: ignore[assignment]
+
+    await writer.log_end(uuid7(), FunctionCallStatusEnum.SUCCESS)
+    await writer.flush()
+    await writer.log_start(
+        run.accession_id, run.top_level_protocol_definition_accession_id, 1, json.dumps({}),
+    )
+    await writer.close()
+
+    assert writer.records_failed == 1
+    assert len(await _logs(db_session, run.accession_id)) == 1
+    with pytest.raises(RuntimeError, match="closed"):
+        await writer.log_end(run.accession_id, FunctionCallStatusEnum.SUCCESS)
@@ -0,0 +1,173 @@
+"""Tests for the machine capability index."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.machine import MachineDefinition, MachineDefinitionUpdate
+from praxis.backend.services.capability_index import (
+    VERSION_KEY,
+    CapabilityIndex,
+    capability_index,
+)
+from praxis.backend.services.capability_matcher import CapabilityMatcherService
+from praxis.backend.services.machine_type_definition import MachineTypeDefinitionCRUDService
+from praxis.backend.utils.uuid import uuid7
+from tests.helpers import create_machine
+
+NEEDS_96_HEAD = {
+    "machine_type": "liquid_handler",
+    "requirements": [
+        {"capability_name": "has_core96", "expected_value": True},
+        {"capability_name": "num_channels", "expected_value": 8, "operator": "gte"},
+    ],
+}
+NEEDS_ABSORBANCE = {
+    "requirements": [
+        {"capability_name": "modes", "expected_value": "absorbance", "operator": "contains"},
+    ],
+}
+
+
+async def _machines(db_session: AsyncSession):
+    star = MachineDefinition(
+        name="star",
+        fqn="test.STAR",
+        plr_category="LiquidHandler",
+        capabilities={"has_core96": True, "num_channels": 8},
+    )
+    reader = MachineDefinition(
+        name="reader",
+        fqn="test.Reader",
+        plr_category="PlateReader",
+        capabilities={"modes": ["absorbance", "fluorescence"]},
+    )
+    db_session.add_all([star, reader])
+    await db_session.flush()
+    big = await create_machine(db_session, machine_definition_accession_id=star.accession_id)
+    small = await create_machine(
+        db_session,
+        machine_definition_accession_id=star.accession_id,
+        user_configured_capabilities={"num_channels": 4.0},
+    )
+    plate_reader = await create_machine(
+        db_session, machine_definition_accession_id=reader.accession_id,
+    )
+    return star, big, small, plate_reader
+
+
+@pytest.mark.asyncio
+async def test_index_matches_the_matcher_service(db_session: AsyncSession) -> None:
+    """Index results equal the per-machine matcher results, machine by machine."""
+    star, big, small, plate_reader = await _machines(db_session)
+    index = CapabilityIndex()
+    await index.ensure_loaded(db_session)
+    matcher = CapabilityMatcherService()
+
+    protocol_id = uuid7()
+    for requirements in (NEEDS_96_HEAD, NEEDS_ABSORBANCE, None):
+        by_machine = {m.accession_id: r for m, r in index.match(protocol_id, requirements)}
+        for machine in (big, small, plate_reader):
+            await db_session.refresh(machine, attribute_names=["machine_definition"])
+            protocol = type(
+                "P", (), {"accession_id": protocol_id, "hardware_requirements_json": requirements},
+            )
+            expected = matcher.match_protocol_to_machine(
+                protocol, machine, machine.machine_definition,
+            )
+            assert by_machine[machine.accession_id] == expected
+
+    assert index.compatible_machine_ids(NEEDS_96_HEAD) == {big.accession_id}
+    assert index.compatible_machine_ids(NEEDS_ABSORBANCE) == {plate_reader.accession_id}
+    assert index.machines[plate_reader.accession_id].machine_type == "PlateReader"
+
+
+@pytest.mark.asyncio
+async def test_matrix_answers_every_protocol_in_one_call(db_session: AsyncSession) -> None:
+    """The matrix maps each protocol to its compatible machines."""
+    _, big, _, plate_reader = await _machines(db_session)
+    index = CapabilityIndex()
+    await index.ensure_loaded(db_session)
+    ids = [uuid7(), uuid7(), uuid7()]
+
+    matrix = index.compatibility_matrix(
+        zip(ids, [NEEDS_96_HEAD, NEEDS_ABSORBANCE, None], strict=True),
+    )
+
+    assert matrix[ids[0]] == {big.accession_id}
+    assert matrix[ids[1]] == {plate_reader.accession_id}
+    assert matrix[ids[2]] == set(index.machines)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reloads_only_changed_machines(db_session: AsyncSession) -> None:
+    """Invalidated machines and definitions are picked up on the next query."""
+    star, big, small, _ = await _machines(db_session)
+    index = CapabilityIndex()
+    await index.ensure_loaded(db_session)
+    assert index.compatible_machine_ids(NEEDS_96_HEAD) == {big.accession_id}
+
+    small.user_configured_capabilities = {"num_channels": 16}
+    await db_session.flush()
+    await index.ensure_loaded(db_session)
+    assert index.compatible_machine_ids(NEEDS_96_HEAD) == {big.accession_id}  # not invalidated
+
+    await index.invalidate_machine(small.accession_id)
+    await index.ensure_loaded(db_session)
+    assert index.compatible_machine_ids(NEEDS_96_HEAD) == {big.accession_id, small.accession_id}
+
+    star.capabilities = {"has_core96": False, "num_channels": 8}
+    await db_session.flush()
+    await index.invalidate_definition(star.accession_id)
+    await index.ensure_loaded(db_session)
+    assert index.compatible_machine_ids(NEEDS_96_HEAD) == set()
+
+    await index.remove_machine(big.accession_id)
+    assert big.accession_id not in index.machines
+
+
+@pytest.mark.asyncio
+async def test_invalidations_reach_indexes_in_other_processes(db_session: AsyncSession) -> None:
+    """An index reloads once another process bumps the shared version."""
+    _, big, small, _ = await _machines(db_session)
+    kv_store = InMemoryKeyValueStore()
+    writer = CapabilityIndex(kv_store=kv_store)
+    reader = CapabilityIndex(kv_store=kv_store)
+    await writer.ensure_loaded(db_session)
+    await reader.ensure_loaded(db_session)
+
+    small.user_configured_capabilities = {"num_channels": 16}
+    await db_session.flush()
+    await writer.invalidate_machine(small.accession_id)
+
+    await reader.ensure_loaded(db_session)
+    assert reader.compatible_machine_ids(NEEDS_96_HEAD) == {big.accession_id, small.accession_id}
+
+    # The writer's copy is now behind the reader's bump and reloads in full.
+    await reader.remove_machine(big.accession_id)
+    await writer.ensure_loaded(db_session)
+    assert big.accession_id in writer.machines  # still in the database
+
+
+@pytest.mark.asyncio
+async def test_definition_writes_invalidate_after_commit(db_session: AsyncSession) -> None:
+    """Definition writes bump the shared version only once they have committed."""
+    star, _, _, _ = await _machines(db_session)
+    service = MachineTypeDefinitionCRUDService(MachineDefinition)
+    before = int(await capability_index.kv_store.get(VERSION_KEY) or 0)
+
+    await service.update(
+        db_session, db_obj=star, obj_in=MachineDefinitionUpdate(capabilities={"has_core96": False}),
+    )
+    assert int(await capability_index.kv_store.get(VERSION_KEY) or 0) == before + 1
+
+    with (
+        patch.object(db_session, "commit", side_effect=RuntimeError("commit failed")),
+        pytest.raises(ValueError, match="commit failed"),
+    ):
+        await service.update(
+            db_session, db_obj=star, obj_in=MachineDefinitionUpdate(capabilities={}),
+        )
+    assert int(await capability_index.kv_store.get(VERSION_KEY) or 0) == before + 1
@@ -0,0 +1,111 @@
+"""Tests for the definition catalog snapshot service."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.services.catalog_snapshot import (
+    CatalogSnapshotService,
+    build_sqlite_snapshot,
+    to_sqlite_value,
+)
+from tests.helpers import create_resource_definition
+
+
+def test_to_sqlite_value_matches_browser_encoding():
+    assert to_sqlite_value(True) == 1
+    assert to_sqlite_value({"a": [1]}) == '{"a": [1]}'
+    assert to_sqlite_value(None) is None
+    assert to_sqlite_value(2.5) == 2.5
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_until_the_catalog_changes(db_session: AsyncSession):
+    service = CatalogSnapshotService()
+    await create_resource_definition(db_session, name="plate_a", fqn="test.PlateA")
+
+    first = await service.current(db_session)
+    assert await service.current(db_session) is first
+
+    await create_resource_definition(db_session, name="plate_b", fqn="test.PlateB")
+    second = await service.current(db_session)
+    assert second.version != first.version
+    assert service.get(first.version) is first
+
+
+@pytest.mark.asyncio
+async def test_delta_lists_upserts_and_deletes(db_session: AsyncSession):
+    service = CatalogSnapshotService(max_age_s=0)
+    kept = await create_resource_definition(db_session, name="kept", fqn="test.Kept")
+    removed = await create_resource_definition(db_session, name="removed", fqn="test.Removed")
+    before = await service.current(db_session)
+
+    kept.description = "changed"
+    await db_session.delete(removed)
+    added = await create_resource_definition(db_session, name="added", fqn="test.Added")
+    after = await service.current(db_session)
+
+    delta = service.delta(before.version, after)
+    assert delta is not None
+    assert set(delta.tables) == {"resource_definitions"}
+    table = delta.tables["resource_definitions"]
+    key_index = table.columns.index(table.primary_key)
+    assert {row[key_index] for row in table.upserts} == {
+        str(kept.accession_id),
+        str(added.accession_id),
+    }
+    assert table.deletes == [str(removed.accession_id)]
+
+    assert service.delta(after.version, after).tables == {}
+    assert service.delta("unknown", after) is None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_rows_are_shared_between_versions(db_session: AsyncSession):
+    service = CatalogSnapshotService(max_age_s=0)
+    definition = await create_resource_definition(db_session, name="shared", fqn="test.Shared")
+    first = await service.current(db_session)
+
+    await create_resource_definition(db_session, name="other", fqn="test.Other")
+    second = await service.current(db_session)
+
+    key = str(definition.accession_id)
+    rows = "resource_definitions"
+    assert second.tables[rows].rows[key] is first.tables[rows].rows[key]
+
+
+@pytest.mark.asyncio
+async def test_history_is_bounded(db_session: AsyncSession):
+    service = CatalogSnapshotService(max_age_s=0, max_versions=2)
+    versions = []
+    for i in range(3):
+        await create_resource_definition(db_session, name=f"def_{i}", fqn=f"test.Def{i}")
+        versions.append((await service.current(db_session)).version)
+
+    assert service.get(versions[0]) is None
+    assert service.get(versions[2]) is service.latest
+
+
+@pytest.mark.asyncio
+async def test_sqlite_snapshot_contains_catalog_rows(db_session: AsyncSession, tmp_path):
+    service = CatalogSnapshotService()
+    definition = await create_resource_definition(
+        db_session, name="plate", fqn="test.Plate", properties_json={"wells": 96},
+    )
+    snapshot = await service.current(db_session)
+
+    path = tmp_path / "catalog.db"
+    path.write_bytes(build_sqlite_snapshot(snapshot))
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute(
+            "SELECT value FROM _catalog_metadata WHERE key = 'version'",
+        ).fetchone() == (snapshot.version,)
+        assert conn.execute(
+            "SELECT fqn, properties_json FROM resource_definitions WHERE accession_id = ?",
+            (str(definition.accession_id),),
+        ).fetchone() == ("test.Plate", '{"wells": 96}')
+        assert conn.execute("PRAGMA page_size").fetchone() == (8192,)
+    finally:
+        conn.close()
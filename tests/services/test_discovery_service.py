@@ -30,6 +30,9 @@ def mock_protocol_service():
     service.get_by_fqn.return_value = None
     service.create.return_value = MagicMock(accession_id=uuid.uuid4(), id=1)
     service.update.return_value = MagicMock(accession_id=uuid.uuid4(), id=1)
+    service.bulk_upsert.side_effect = lambda db, definitions: MagicMock(
+        definitions=[MagicMock(accession_id=uuid.uuid4(), fqn=d.fqn) for d in definitions]
+    )
     return service
 
 
@@ -196,7 +199,7 @@ async def test_discover_and_upsert_protocols_successfully(
   result = await discovery_service.discover_and_upsert_protocols([str(protocol_dir)])
 
   assert len(result) == 1
-  mock_protocol_service.create.assert_called_once()
+  mock_protocol_service.bulk_upsert.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -221,17 +224,49 @@ async def test_discover_and_upsert_protocols_inferred(
             pass
     """).strip())
 
-  # Mock return for create
-  mock_protocol_service.create.return_value = MagicMock(accession_id=uuid.uuid4(), id=2)
-
   result = await discovery_service.discover_and_upsert_protocols([str(protocol_dir)])
 
   assert len(result) == 1
-  mock_protocol_service.create.assert_called_once()
-  created_def = mock_protocol_service.create.call_args[1]["obj_in"]
+  mock_protocol_service.bulk_upsert.assert_called_once()
+  (created_def,) = mock_protocol_service.bulk_upsert.call_args[1]["definitions"]
   assert created_def.name == "another_mock_func"
 
 
+@pytest.mark.asyncio
+async def test_discover_and_upsert_protocols_isolates_failing_definitions(
+  discovery_service: DiscoveryService,
+  tmp_path: Path,
+  mock_protocol_service: MagicMock,
+):
+  """A definition that fails to upsert does not prevent the others from being stored."""
+  protocol_dir = tmp_path / "protocols"
+  protocol_dir.mkdir()
+  (protocol_dir / "protocols.py").write_text(dedent("""
+        def protocol_function(f): return f
+
+        @protocol_function
+        def good_protocol():
+            pass
+
+        @protocol_function
+        def bad_protocol():
+            pass
+    """).strip())
+
+  def bulk_upsert(db, definitions):
+    if any(d.name == "bad_protocol" for d in definitions):
+      raise RuntimeError("constraint violated")
+    return MagicMock(definitions=[MagicMock(fqn=d.fqn) for d in definitions])
+
+  mock_protocol_service.bulk_upsert.side_effect = bulk_upsert
+
+  result = await discovery_service.discover_and_upsert_protocols([str(protocol_dir)])
+
+  assert [r.fqn.rsplit(".", 1)[-1] for r in result] == ["good_protocol"]
+  # One attempt for the whole chunk, then one per definition
+  assert mock_protocol_service.bulk_upsert.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_discover_and_upsert_protocols_no_protocols_found(
   discovery_service: DiscoveryService, tmp_path: Path,
@@ -271,7 +306,7 @@ async def test_discover_and_upsert_protocols_import_error(
 
   result = await discovery_service.discover_and_upsert_protocols([str(protocol_dir)])
   assert len(result) == 0
-  mock_protocol_service.create.assert_not_called()
+  mock_protocol_service.bulk_upsert.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,180 @@
+"""Tests for the hardware connection state manager."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore, InMemoryPubSub
+from praxis.backend.core.storage.sqlite_adapter import SqliteKeyValueStore
+from praxis.backend.services.hardware_connection_manager import (
+    EVENTS_CHANNEL,
+    KEY_CONNECTIONS,
+    HardwareConnectionManager,
+)
+
+
+class CountingStore(InMemoryKeyValueStore):
+    """In-memory store that counts the hash round trips it serves."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    async def hset(self, key, mapping):
+        self.calls.append("hset")
+        return await super().hset(key, mapping)
+
+    async def hgetall(self, key):
+        self.calls.append("hgetall")
+        return await super().hgetall(key)
+
+
+async def _drain(subscription) -> list[dict]:
+    events = []
+    while not subscription._queue.empty():
+        events.append(await subscription.__anext__())
+    return events
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite"])
+async def stores(request, tmp_path):
+    """Two handles on one store, as two worker processes would have."""
+    if request.param == "memory":
+        shared = InMemoryKeyValueStore()
+        yield [shared, shared]
+        await shared.close()
+    else:
+        path = str(tmp_path / "kv.db")
+        handles = [SqliteKeyValueStore(path), SqliteKeyValueStore(path)]
+        yield handles
+        for handle in handles:
+            await handle.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_lifecycle(stores) -> None:
+    """Connections are listed until they are disconnected or expire."""
+    manager = HardwareConnectionManager(stores[0], ttl_seconds=60)
+    await manager.connect("dev-1", "STAR", {"port": "/dev/ttyUSB0"})
+    await manager.set_connecting("dev-2", "OT2")
+    await manager.set_error("dev-2", "timeout")
+
+    listed = {state.device_id: state for state in await manager.list_connections()}
+    assert listed["dev-1"].config == {"port": "/dev/ttyUSB0"}
+    assert listed["dev-2"].status == "error"
+
+    assert await manager.disconnect("dev-1") is True
+    assert [state.device_id for state in await manager.list_connections()] == ["dev-2"]
+    assert await manager.clear_all() == 1
+    assert await stores[0].exists(KEY_CONNECTIONS) is False
+
+
+@pytest.mark.asyncio
+async def test_expired_connections_are_removed(stores) -> None:
+    """Listing prunes devices that stopped sending heartbeats."""
+    manager = HardwareConnectionManager(stores[0], ttl_seconds=0.2)
+    await manager.connect("kept", "STAR")
+    await manager.connect("gone", "OT2")
+    await asyncio.sleep(0.15)
+    assert await manager.heartbeat("kept") is not None
+    await asyncio.sleep(0.1)
+
+    other_worker = HardwareConnectionManager(stores[1], ttl_seconds=0.2)
+    assert [state.device_id for state in await other_worker.list_connections()] == ["kept"]
+    assert set(await stores[0].hgetall(KEY_CONNECTIONS)) == {"state:kept", "beat:kept"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connects_keep_every_device(stores) -> None:
+    """Concurrent registrations from two workers are all indexed.
+
+    With the previous read-modify-write of a JSON list, interleaved
+    connects overwrote each other's index entries.
+    """
+    managers = [HardwareConnectionManager(store) for store in stores]
+    device_ids = [f"dev-{i:03d}" for i in range(100)]
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            managers[i % 2].connect(device_id, "STAR")
+            for i, device_id in enumerate(device_ids)
+        ),
+    )
+    elapsed = time.perf_counter() - started
+
+    listed = await managers[1].list_connections()
+    assert sorted(state.device_id for state in listed) == device_ids
+    assert len(device_ids) / elapsed > 50  # connects per second
+
+
+@pytest.mark.asyncio
+async def test_started_manager_batches_heartbeats() -> None:
+    """Heartbeats for many devices become one write per interval."""
+    store = CountingStore()
+    manager = HardwareConnectionManager(store, ttl_seconds=60, flush_interval_seconds=0.05)
+    device_ids = [f"dev-{i}" for i in range(10)]
+    for device_id in device_ids:
+        await manager.connect(device_id, "STAR")
+    manager.start()
+    store.calls.clear()
+
+    for _ in range(5):
+        for device_id in device_ids:
+            assert await manager.heartbeat(device_id) is not None
+    assert store.calls == []
+
+    await asyncio.sleep(0.1)
+    assert store.calls == ["hset"]
+    beats = await store.hgetall(KEY_CONNECTIONS)
+    assert beats["beat:dev-3"] == manager._known["dev-3"].last_heartbeat.isoformat()
+
+    await manager.heartbeat("dev-0")
+    await manager.stop()
+    assert store.calls[-1] == "hset"
+
+
+@pytest.mark.asyncio
+async def test_listing_is_one_bulk_read() -> None:
+    store = CountingStore()
+    manager = HardwareConnectionManager(store)
+    for i in range(20):
+        await manager.connect(f"dev-{i:02d}", "STAR")
+    store.calls.clear()
+
+    listed = await manager.list_connections()
+    assert len(listed) == 20
+    assert store.calls == ["hgetall"]
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_are_published() -> None:
+    store = InMemoryKeyValueStore()
+    pubsub = InMemoryPubSub()
+    subscription = pubsub.subscribe(EVENTS_CHANNEL)
+    manager = HardwareConnectionManager(store, ttl_seconds=0.1, pubsub=pubsub)
+
+    await manager.set_connecting("dev-1", "STAR")
+    await manager.connect("dev-1", "STAR")
+    await manager.heartbeat("dev-1")
+    await manager.set_error("dev-1", "timeout")
+    await manager.disconnect("dev-1")
+    await manager.connect("dev-2", "OT2")
+    await asyncio.sleep(0.15)
+    await manager.list_connections()
+
+    events = [
+        (event["device_id"], event["previous_status"], event["status"], event["reason"])
+        for event in await _drain(subscription)
+    ]
+    assert events == [
+        ("dev-1", None, "connecting", None),
+        ("dev-1", "connecting", "connected", None),
+        ("dev-1", "connected", "error", None),
+        ("dev-1", "error", "disconnected", None),
+        ("dev-2", None, "connected", None),
+        ("dev-2", "connected", "disconnected", "expired"),
+    ]
+    await pubsub.close()
@@ -0,0 +1,131 @@
+"""Tests for HardwareDiscoveryService."""
+
+import asyncio
+import time
+
+import pytest
+
+from praxis.backend.core.storage.memory_adapter import InMemoryPubSub
+from praxis.backend.services.hardware_discovery import (
+    DISCOVERY_EVENTS_CHANNEL,
+    ConnectionType,
+    DeviceStatus,
+    DiscoveredDevice,
+    HardwareDiscoveryService,
+)
+
+
+def _device(device_id: str, connection_type=ConnectionType.SERIAL, **kwargs) -> DiscoveredDevice:
+    return DiscoveredDevice(
+        id=device_id,
+        name=device_id,
+        connection_type=connection_type,
+        status=DeviceStatus.AVAILABLE,
+        **kwargs,
+    )
+
+
+class FakeSources:
+    """Stand-in discovery sources that count scans and take ``delay`` seconds each."""
+
+    def __init__(self, service: HardwareDiscoveryService, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.serial = [_device("serial:/dev/ttyUSB0", port="/dev/ttyUSB0")]
+        self.calls = {"serial": 0, "simulator": 0, "network": 0}
+        service.discover_serial_ports = self._source("serial", lambda: self.serial)
+        service.discover_simulators = self._source(
+            "simulator", lambda: [_device("sim:star", ConnectionType.SIMULATOR)],
+        )
+        service.discover_network_devices = self._source(
+            "network", lambda: [_device("net:ot2", ConnectionType.NETWORK, ip_address="10.0.0.2")],
+        )
+
+    def _source(self, name, devices):
+        async def discover(*args, **kwargs):
+            self.calls[name] += 1
+            await asyncio.sleep(self.delay)
+            return list(devices())
+
+        return discover
+
+
+async def _drain(subscription) -> list[dict]:
+    events = []
+    while not subscription._queue.empty():
+        events.append(await subscription.__anext__())
+    return events
+
+
+@pytest.mark.asyncio
+async def test_sources_are_scanned_concurrently() -> None:
+    service = HardwareDiscoveryService()
+    FakeSources(service, delay=0.2)
+
+    start = time.perf_counter()
+    devices = await service.discover_all()
+    elapsed = time.perf_counter() - start
+
+    assert [d.id for d in devices] == ["serial:/dev/ttyUSB0", "sim:star", "net:ot2"]
+    assert elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_scan_is_cached_and_shared() -> None:
+    service = HardwareDiscoveryService(max_age_s=60)
+    sources = FakeSources(service, delay=0.05)
+
+    first, second = await asyncio.gather(service.discover_all(), service.discover_all())
+    assert first == second
+    assert await service.discover_all() == first
+    assert sources.calls == {"serial": 1, "simulator": 1, "network": 1}
+
+    await service.discover_all(refresh=True)
+    assert sources.calls == {"serial": 2, "simulator": 2, "network": 2}
+
+
+@pytest.mark.asyncio
+async def test_background_table_tracks_serial_and_mdns_changes() -> None:
+    pubsub = InMemoryPubSub()
+    subscription = pubsub.subscribe(DISCOVERY_EVENTS_CHANNEL)
+    service = HardwareDiscoveryService(pubsub=pubsub)
+    sources = FakeSources(service)
+
+    await service.start(serial_poll_interval=0.02, browse_network=False)
+    try:
+        await asyncio.sleep(0.05)
+        assert [d.id for d in await service.discover_all()] == [
+            "serial:/dev/ttyUSB0",
+            "sim:star",
+        ]
+
+        # A port is unplugged; the next poll removes it.
+        sources.serial = []
+        await asyncio.sleep(0.05)
+
+        # An Opentrons robot announces itself, re-announces unchanged, then updates.
+        info = {"addresses": ["10.0.0.5"], "port": 31950, "server": "ot2.local.", "properties": {}}
+        service._apply_mdns_change("_opentrons._tcp.local.", "OT2._opentrons._tcp.local.", info)
+        service._apply_mdns_change("_opentrons._tcp.local.", "OT2._opentrons._tcp.local.", info)
+        info = {**info, "properties": {"robot_model": "OT-2"}}
+        service._apply_mdns_change("_opentrons._tcp.local.", "OT2._opentrons._tcp.local.", info)
+        devices = await service.discover_all()
+        assert [d.id for d in devices] == ["sim:star", "network-opentrons-10.0.0.5"]
+        assert sources.calls["network"] == 0
+
+        service._apply_mdns_change("_opentrons._tcp.local.", "OT2._opentrons._tcp.local.", None)
+        assert [d.id for d in await service.discover_all()] == ["sim:star"]
+        await asyncio.sleep(0)
+    finally:
+        await service.stop()
+
+    events = [(e["type"], e["device"]["id"]) for e in await _drain(subscription)]
+    assert events == [
+        ("added", "sim:star"),
+        ("added", "serial:/dev/ttyUSB0"),
+        ("removed", "serial:/dev/ttyUSB0"),
+        ("added", "network-opentrons-10.0.0.5"),
+        ("updated", "network-opentrons-10.0.0.5"),
+        ("removed", "network-opentrons-10.0.0.5"),
+    ]
+    assert not service.running
+    await pubsub.close()
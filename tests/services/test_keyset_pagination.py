@@ -0,0 +1,111 @@
+"""Tests for keyset pagination and counting in the shared query builder."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.filters import SearchFilters
+from praxis.backend.models.domain.protocol import ProtocolRun
+from praxis.backend.services.protocols import ProtocolRunService
+from praxis.backend.services.utils import crud_base
+from praxis.backend.services.utils.query_builder import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    validate_pagination,
+)
+from tests.helpers import create_protocol_definition, create_protocol_run
+
+START = datetime(2026, 1, 1)
+
+
+async def _walk(service: ProtocolRunService, db: AsyncSession, **filter_kwargs) -> list[list]:
+    pages = []
+    filters = SearchFilters(keyset=True, **filter_kwargs)
+    while True:
+        page = await service.get_multi(db, filters=filters)
+        pages.append(page)
+        if len(page) < filters.limit:
+            return pages
+        filters = filters.model_copy(
+            update={"cursor": encode_keyset_cursor(page[-1], filters.sort_by)},
+        )
+
+
+@pytest.mark.asyncio
+async def test_keyset_walk_visits_each_row_once(db_session: AsyncSession) -> None:
+    """Following cursors returns every row exactly once, in accession order."""
+    definition = await create_protocol_definition(db_session)
+    runs = [await create_protocol_run(db_session, protocol_definition=definition) for _ in range(7)]
+    service = ProtocolRunService(ProtocolRun)
+
+    pages = await _walk(service, db_session, limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    visited = [run.accession_id for page in pages for run in page]
+    assert visited == sorted(run.accession_id for run in runs)
+
+
+@pytest.mark.asyncio
+async def test_keyset_walk_by_created_at_descending(db_session: AsyncSession) -> None:
+    """Ties on created_at are broken by accession_id so no row is skipped."""
+    definition = await create_protocol_definition(db_session)
+    runs = [
+        await create_protocol_run(
+            db_session,
+            protocol_definition=definition,
+            created_at=START + timedelta(minutes=i // 2),
+        )
+        for i in range(5)
+    ]
+    service = ProtocolRunService(ProtocolRun)
+
+    pages = await _walk(service, db_session, limit=2, sort_by="-created_at")
+
+    visited = [run.accession_id for page in pages for run in page]
+    expected = sorted(runs, key=lambda r: (r.created_at, r.accession_id), reverse=True)
+    assert visited == [run.accession_id for run in expected]
+
+
+def test_cursor_is_bound_to_sort_order() -> None:
+    """A cursor cannot be replayed against a different sort order."""
+    run = ProtocolRun(created_at=START)
+    cursor = encode_keyset_cursor(run, "created_at")
+
+    assert decode_keyset_cursor(cursor, "created_at") == (START, run.accession_id)
+    with pytest.raises(ValueError, match="sort_by"):
+        decode_keyset_cursor(cursor, "-created_at")
+    with pytest.raises(ValueError, match="Malformed"):
+        decode_keyset_cursor("not-a-cursor", "created_at")
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        SearchFilters(keyset=True, offset=10),
+        SearchFilters(keyset=True, sort_by="name"),
+        SearchFilters(cursor="garbage"),
+    ],
+)
+def test_validate_pagination_rejects_inconsistent_requests(filters: SearchFilters) -> None:
+    """Keyset requests with offsets, unsupported sorts or bad cursors are rejected."""
+    with pytest.raises(ValueError):
+        validate_pagination(filters)
+
+
+@pytest.mark.asyncio
+async def test_count_exact_and_estimated(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Estimated counts stop at the cap and report themselves as estimates."""
+    definition = await create_protocol_definition(db_session)
+    for _ in range(4):
+        await create_protocol_run(db_session, protocol_definition=definition)
+    service = ProtocolRunService(ProtocolRun)
+    filters = SearchFilters(limit=1)
+
+    assert await service.count(db_session, filters=filters) == (4, False)
+    assert await service.count(db_session, filters=filters, estimated=True) == (4, False)
+
+    monkeypatch.setattr(crud_base, "ESTIMATED_COUNT_CAP", 2)
+    assert await service.count(db_session, filters=filters, estimated=True) == (2, True)
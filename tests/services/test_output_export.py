@@ -0,0 +1,161 @@
+"""Tests for the streaming well data export service."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.enums import DataExportFormatEnum
+from praxis.backend.services.output_export import (
+    WELL_EXPORT_COLUMNS,
+    check_export_format_supported,
+    stream_well_data_export,
+)
+from tests.helpers import (
+    create_function_data_output,
+    create_protocol_run,
+    create_resource,
+    create_well_data_output,
+)
+
+
+async def _collect(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest_asyncio.fixture
+async def kinetic_read(db_session: AsyncSession):
+    """Two timepoints of a 2x3 read on one plate, plus one unrelated well."""
+    protocol_run = await create_protocol_run(db_session)
+    plate = await create_resource(db_session)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    for timepoint in range(2):
+        output = await create_function_data_output(
+            db_session,
+            protocol_run=protocol_run,
+            measurement_timestamp=start + timedelta(minutes=timepoint),
+        )
+        for index in range(6):
+            row, column = divmod(index, 3)
+            await create_well_data_output(
+                db_session,
+                plate_resource=plate,
+                function_data_output=output,
+                well_name=f"{chr(ord('A') + row)}{column + 1}",
+                well_row=row,
+                well_column=column,
+                well_index=index,
+                measurement_type="absorbance",
+                data_value=float(timepoint * 10 + index),
+            )
+
+    await create_well_data_output(db_session, measurement_type="absorbance", data_value=-1.0)
+    return protocol_run, plate, start
+
+
+@pytest.mark.asyncio
+async def test_csv_export_is_chunked_and_filtered(db_session: AsyncSession, kinetic_read) -> None:
+    """CSV export yields one chunk per page with a single header row."""
+    protocol_run, plate, _ = kinetic_read
+
+    chunks = await _collect(
+        stream_well_data_export(
+            db_session,
+            chunk_size=5,
+            protocol_run_accession_id=protocol_run.accession_id,
+            plate_resource_accession_id=plate.accession_id,
+        ),
+    )
+
+    assert len(chunks) == 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert len(rows) == 12
+    assert tuple(rows[0].keys()) == WELL_EXPORT_COLUMNS
+    assert [float(r["data_value"]) for r in rows[:6]] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert {r["plate_resource_accession_id"] for r in rows} == {str(plate.accession_id)}
+
+
+@pytest.mark.asyncio
+async def test_jsonl_export_respects_time_range(db_session: AsyncSession, kinetic_read) -> None:
+    """Only wells measured inside the requested window are exported."""
+    protocol_run, _, start = kinetic_read
+
+    chunks = await _collect(
+        stream_well_data_export(
+            db_session,
+            export_format=DataExportFormatEnum.JSONL,
+            protocol_run_accession_id=protocol_run.accession_id,
+            date_range_start=start + timedelta(seconds=30),
+        ),
+    )
+
+    records = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert len(records) == 6
+    assert all(r["data_value"] >= 10.0 for r in records)
+    assert records[0]["well_name"] == "A1"
+
+
+@pytest.mark.asyncio
+async def test_csv_export_without_matches_emits_header(db_session: AsyncSession) -> None:
+    """An empty selection still produces a parseable CSV document."""
+    chunks = await _collect(stream_well_data_export(db_session, measurement_type="missing"))
+
+    assert b"".join(chunks).decode().strip() == ",".join(WELL_EXPORT_COLUMNS)
+
+
+@pytest.mark.asyncio
+async def test_invalid_chunk_size_raises(db_session: AsyncSession) -> None:
+    """A non-positive chunk size is rejected."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        await _collect(stream_well_data_export(db_session, chunk_size=0))
+
+
+@pytest.mark.asyncio
+async def test_arrow_export_round_trips(db_session: AsyncSession, kinetic_read) -> None:
+    """Arrow IPC chunks concatenate into a readable stream."""
+    pa = pytest.importorskip("pyarrow")
+    protocol_run, _, _ = kinetic_read
+
+    chunks = await _collect(
+        stream_well_data_export(
+            db_session,
+            export_format=DataExportFormatEnum.ARROW,
+            chunk_size=4,
+            protocol_run_accession_id=protocol_run.accession_id,
+        ),
+    )
+
+    table = pa.ipc.open_stream(b"".join(chunks)).read_all()
+    assert table.num_rows == 12
+    assert table.column_names == list(WELL_EXPORT_COLUMNS)
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_round_trips(db_session: AsyncSession, kinetic_read) -> None:
+    """Parquet row groups stream out as one valid file."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    protocol_run, _, _ = kinetic_read
+
+    chunks = await _collect(
+        stream_well_data_export(
+            db_session,
+            export_format=DataExportFormatEnum.PARQUET,
+            chunk_size=5,
+            protocol_run_accession_id=protocol_run.accession_id,
+        ),
+    )
+
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_rows == 12
+    assert parquet_file.metadata.num_row_groups == 3
+
+
+def test_csv_and_jsonl_need_no_optional_dependency() -> None:
+    """Text formats are always available."""
+    check_export_format_supported(DataExportFormatEnum.CSV)
+    check_export_format_supported(DataExportFormatEnum.JSONL)
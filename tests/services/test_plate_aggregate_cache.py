@@ -0,0 +1,259 @@
+"""Tests for the incremental plate aggregate cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.outputs import FunctionDataOutput, WellDataOutput
+from praxis.backend.models.domain.resource import Resource
+from praxis.backend.models.enums import DataOutputTypeEnum, PlateAggregationEnum
+from praxis.backend.services.plate_aggregate_cache import (
+    PlateAggregateCache,
+    PlateGrid,
+    aggregate_grids,
+    plate_aggregate_cache,
+)
+from praxis.backend.services.plate_viz import read_plate_data_aggregate
+from praxis.backend.services.well_outputs import create_well_data_outputs
+from praxis.backend.utils.uuid import uuid7
+from tests.helpers import (
+    create_function_data_output,
+    create_protocol_run,
+    create_resource,
+    create_well_data_output,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _grid(minutes: int, values: list[list[float]]) -> PlateGrid:
+    grid = PlateGrid(
+        function_data_output_accession_id=uuid7(),
+        plate_resource_accession_id=uuid7(),
+        data_type=DataOutputTypeEnum.ABSORBANCE_READING,
+        measurement_timestamp=START + timedelta(minutes=minutes),
+        rows=len(values),
+        columns=len(values[0]),
+    )
+    grid.add_wells(
+        (r, c, v) for r, row in enumerate(values) for c, v in enumerate(row) if v is not None
+    )
+    return grid
+
+
+def test_plate_grid_tracks_running_statistics() -> None:
+    """Summary statistics stay correct across incremental adds and overwrites."""
+    grid = _grid(0, [[1.0, 2.0], [3.0, None]])
+    assert grid.summary() == {"count": 3, "mean": 2.0, "min": 1.0, "max": 3.0}
+
+    grid.add_wells([(1, 1, 5.0), (0, 0, 4.0), (9, 9, 100.0)])
+
+    assert grid.summary() == {"count": 4, "mean": 3.5, "min": 2.0, "max": 5.0}
+
+
+def test_aggregate_grids_reductions() -> None:
+    """Mean, max and slope reduce across timepoints while skipping missing wells."""
+    grids = [
+        _grid(0, [[1.0, 10.0]]),
+        _grid(1, [[3.0, None]]),
+        _grid(2, [[5.0, 4.0]]),
+    ]
+
+    assert aggregate_grids(grids, PlateAggregationEnum.MEAN).tolist() == [[3.0, 7.0]]
+    assert aggregate_grids(grids, PlateAggregationEnum.MAX).tolist() == [[5.0, 10.0]]
+    assert aggregate_grids(grids, PlateAggregationEnum.LATEST).tolist() == [[5.0, 4.0]]
+    slope = aggregate_grids(grids, PlateAggregationEnum.SLOPE)
+    np.testing.assert_allclose(slope, [[2.0 / 60, -6.0 / 120]])
+
+
+def test_aggregate_grids_rejects_empty_input() -> None:
+    """Aggregating nothing is an error."""
+    with pytest.raises(ValueError, match="empty"):
+        aggregate_grids([], PlateAggregationEnum.MEAN)
+
+
+@pytest.mark.asyncio
+async def test_cache_folds_new_outputs_without_reloading(db_session: AsyncSession) -> None:
+    """New well outputs for a tracked plate are attached without a cold reload."""
+    cache = PlateAggregateCache()
+    protocol_run = await create_protocol_run(db_session)
+    plate = await create_resource(db_session)
+    first = await create_function_data_output(
+        db_session,
+        protocol_run=protocol_run,
+        data_type=DataOutputTypeEnum.ABSORBANCE_READING,
+        measurement_timestamp=START,
+    )
+    await create_well_data_output(
+        db_session, plate_resource=plate, function_data_output=first, well_name="A1", data_value=1.0
+    )
+
+    grids = await cache.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert len(grids) == 1
+    assert cache.misses == 1
+
+    second = await create_function_data_output(
+        db_session,
+        protocol_run=protocol_run,
+        data_type=DataOutputTypeEnum.ABSORBANCE_READING,
+        measurement_timestamp=START + timedelta(minutes=1),
+    )
+    new_wells = [
+        await create_well_data_output(
+            db_session,
+            plate_resource=plate,
+            function_data_output=second,
+            well_name=name,
+            well_row=0,
+            well_column=column,
+            data_value=value,
+        )
+        for column, (name, value) in enumerate([("A1", 3.0), ("A2", 7.0)])
+    ]
+    await cache.record_well_outputs(new_wells)
+
+    grids = await cache.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert [g.function_data_output_accession_id for g in grids] == [
+        second.accession_id,
+        first.accession_id,
+    ]
+    assert grids[0].summary()["max"] == 7.0
+
+    other = await cache.get_grids(
+        db_session,
+        plate.accession_id,
+        DataOutputTypeEnum.ABSORBANCE_READING,
+        protocol_run_accession_id=uuid7(),
+    )
+    assert other == []
+
+
+@pytest.mark.asyncio
+async def test_read_plate_data_aggregate_uses_service_writes(db_session: AsyncSession) -> None:
+    """Wells created through the service show up in the aggregate endpoint data."""
+    plate = await create_resource(db_session)
+    output = await create_function_data_output(
+        db_session,
+        data_type=DataOutputTypeEnum.FLUORESCENCE_READING,
+        measurement_timestamp=START,
+    )
+    await create_well_data_outputs(
+        db_session,
+        function_data_output_accession_id=output.accession_id,
+        plate_resource_accession_id=plate.accession_id,
+        well_data={"A1": 2.0, "B3": 4.0},
+    )
+
+    aggregate = await read_plate_data_aggregate(
+        db_session,
+        plate_resource_accession_id=plate.accession_id,
+        data_type=DataOutputTypeEnum.FLUORESCENCE_READING,
+        method=PlateAggregationEnum.MEAN,
+    )
+
+    assert aggregate is not None
+    assert aggregate.timepoint_count == 1
+    assert aggregate.grid[0][0] == 2.0
+    assert aggregate.grid[1][2] == 4.0
+    assert aggregate.grid[0][1] is None
+    assert aggregate.data_range == {"min": 2.0, "max": 4.0}
+
+
+async def _absorbance_output(
+    db_session: AsyncSession,
+    plate: Resource,
+    minutes: int,
+    values: dict[str, float],
+) -> tuple[FunctionDataOutput, list[WellDataOutput]]:
+    output = await create_function_data_output(
+        db_session,
+        data_type=DataOutputTypeEnum.ABSORBANCE_READING,
+        measurement_timestamp=START + timedelta(minutes=minutes),
+    )
+    wells = [
+        await create_well_data_output(
+            db_session,
+            plate_resource=plate,
+            function_data_output=output,
+            well_name=name,
+            well_row=0,
+            well_column=int(name[1:]) - 1,
+            data_value=value,
+        )
+        for name, value in values.items()
+    ]
+    return output, wells
+
+
+@pytest.mark.asyncio
+async def test_loading_another_data_type_keeps_parked_wells(db_session: AsyncSession) -> None:
+    """A cold load of one data type does not drop new wells of a loaded type."""
+    cache = PlateAggregateCache()
+    plate = await create_resource(db_session)
+    await _absorbance_output(db_session, plate, 0, {"A1": 1.0})
+    await cache.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+
+    second, wells = await _absorbance_output(db_session, plate, 1, {"A1": 2.0})
+    await cache.record_well_outputs(wells)
+    assert await cache.get_grids(
+        db_session, plate.accession_id, DataOutputTypeEnum.FLUORESCENCE_READING
+    ) == []
+
+    grids = await cache.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert cache.misses == 2
+    assert grids[0].function_data_output_accession_id == second.accession_id
+
+
+@pytest.mark.asyncio
+async def test_writes_in_another_process_reload_the_plate(db_session: AsyncSession) -> None:
+    """Caches sharing a version store reload plates written by the other one."""
+    kv_store = InMemoryKeyValueStore()
+    reader = PlateAggregateCache(kv_store)
+    writer = PlateAggregateCache(kv_store)
+    plate = await create_resource(db_session)
+    await _absorbance_output(db_session, plate, 0, {"A1": 1.0})
+    await reader.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    await writer.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+
+    _, wells = await _absorbance_output(db_session, plate, 1, {"A1": 5.0})
+    await writer.record_well_outputs(wells)
+
+    grids = await reader.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert len(grids) == 2
+    assert grids[0].summary()["max"] == 5.0
+    assert reader.misses == 2
+    grids = await writer.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert len(grids) == 2
+    assert writer.hits == 1
+
+    await reader.invalidate_plate(plate.accession_id)
+    await writer.get_grids(db_session, plate.accession_id, DataOutputTypeEnum.ABSORBANCE_READING)
+    assert writer.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_writes_never_reach_the_cache(db_session: AsyncSession) -> None:
+    """Wells are only recorded once the creating transaction has committed."""
+    plate = await create_resource(db_session)
+    output = await create_function_data_output(db_session)
+    plate_id = plate.accession_id
+    before = await plate_aggregate_cache.kv_store.get(f"plate_aggregate:version:{plate_id}")
+
+    with (
+        patch.object(db_session, "commit", side_effect=RuntimeError("commit failed")),
+        pytest.raises(ValueError, match="commit failed"),
+    ):
+        await create_well_data_outputs(
+            db_session,
+            function_data_output_accession_id=output.accession_id,
+            plate_resource_accession_id=plate_id,
+            well_data={"A1": 1.0},
+        )
+
+    assert await plate_aggregate_cache.kv_store.get(f"plate_aggregate:version:{plate_id}") == before
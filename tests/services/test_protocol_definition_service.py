@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from praxis.backend.models.domain.protocol import (
@@ -13,6 +14,7 @@ from praxis.backend.models.domain.protocol_source import (
 )
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
+from praxis.backend.utils.uuid import uuid7
 
 
 @pytest.fixture
@@ -236,3 +238,101 @@ async def test_update_protocol_definition(
     assert "assets" in updated_def.__dict__
     assert "source_repository" in updated_def.__dict__
     assert "file_system_source" in updated_def.__dict__
+
+
+def _bulk_definition(fqn: str, source_hash: str, parameters: list[dict]) -> FunctionProtocolDefinitionCreate:
+    module_name, function_name = fqn.rsplit(".", 1)
+    return FunctionProtocolDefinitionCreate(
+        name=function_name,
+        fqn=fqn,
+        source_file_path=f"/bulk/{function_name}.py",
+        module_name=module_name,
+        function_name=function_name,
+        source_hash=source_hash,
+        parameters=parameters,
+        assets=[
+            {
+                "name": "plate",
+                "type_hint_str": "Plate",
+                "protocol_definition_accession_id": uuid7(),
+            },
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_creates_and_skips_unchanged(
+    db_session: AsyncSession,
+    protocol_definition_service: ProtocolDefinitionCRUDService,
+) -> None:
+    """New definitions are created once; a re-run with the same source hash writes nothing."""
+    definitions = [
+        _bulk_definition(f"bulk.module.proto_{i}", f"hash-{i}", [{"name": "volume", "type_hint": "float"}])
+        for i in range(3)
+    ]
+
+    first = await protocol_definition_service.bulk_upsert(db_session, definitions=definitions)
+
+    assert len(first.created) == 3
+    assert not first.updated
+    assert [p.name for p in first.created[0].parameters] == ["volume"]
+    assert [a.name for a in first.created[0].assets] == ["plate"]
+    assert first.created[0].source_repository.name == "default_test_repo"
+
+    second = await protocol_definition_service.bulk_upsert(db_session, definitions=definitions)
+
+    assert not second.created
+    assert not second.updated
+    assert {d.accession_id for d in second.unchanged} == {d.accession_id for d in first.created}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_diffs_children_by_name(
+    db_session: AsyncSession,
+    protocol_definition_service: ProtocolDefinitionCRUDService,
+) -> None:
+    """Changed definitions keep unchanged child rows and replace only what differs."""
+    fqn = "bulk.module.diffed"
+    first = await protocol_definition_service.bulk_upsert(
+        db_session,
+        definitions=[
+            _bulk_definition(
+                fqn,
+                "v1",
+                [
+                    {"name": "volume", "type_hint": "float"},
+                    {"name": "speed", "type_hint": "int"},
+                ],
+            ),
+        ],
+    )
+    original = {p.name: p.accession_id for p in first.created[0].parameters}
+
+    second = await protocol_definition_service.bulk_upsert(
+        db_session,
+        definitions=[
+            _bulk_definition(
+                fqn,
+                "v2",
+                [
+                    {"name": "volume", "type_hint": "float", "description": "uL"},
+                    {"name": "cycles", "type_hint": "int"},
+                ],
+            ),
+        ],
+    )
+
+    (updated,) = second.updated
+    assert updated.accession_id == first.created[0].accession_id
+    assert updated.source_hash == "v2"
+    parameters = {p.name: p for p in updated.parameters}
+    assert set(parameters) == {"volume", "cycles"}
+    assert parameters["volume"].accession_id == original["volume"]
+    assert parameters["volume"].description == "uL"
+
+    rows = await db_session.execute(
+        select(ParameterDefinition).where(
+            ParameterDefinition.protocol_definition_accession_id == updated.accession_id,
+        ),
+    )
+    assert {p.name for p in rows.scalars().all()} == {"volume", "cycles"}
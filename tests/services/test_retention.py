@@ -0,0 +1,322 @@
+"""Tests for history retention, compaction and cold storage."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.protocol import FunctionCallLog
+from praxis.backend.models.domain.schedule import (
+    AssetReservation,
+    ScheduleHistory,
+    ScheduleHistoryRollup,
+)
+from praxis.backend.models.enums import (
+    AssetReservationStatusEnum,
+    ScheduleHistoryEventEnum,
+    ScheduleStatusEnum,
+)
+from praxis.backend.services.retention import (
+    ARCHIVE_MARKER,
+    COMPACTOR_LEASE_KEY,
+    ColdStorageArchive,
+    CompactorLeaseLostError,
+    RetentionPolicy,
+    RetentionService,
+)
+from praxis.backend.services.schedule_metrics import DAILY, HOURLY, record_schedule_event
+from praxis.backend.services.scheduler import get_scheduling_metrics
+from tests.factories_schedule import (
+    create_asset_reservation,
+    create_function_call_log,
+    create_protocol_run,
+    create_schedule_entry,
+)
+
+NOW = datetime(2026, 6, 15, 12, 0, tzinfo=timezone.utc)
+OLD = NOW - timedelta(days=200)
+
+
+def _service(tmp_path, **days) -> RetentionService:
+    return RetentionService(
+        ColdStorageArchive(tmp_path),
+        RetentionPolicy.with_overrides(days, batch_size=2),
+    )
+
+
+def _session_factory(db_session: AsyncSession):
+    @asynccontextmanager
+    async def factory():
+        yield db_session
+
+    return factory
+
+
+def test_archive_requires_absolute_path() -> None:
+    """A relative archive directory is rejected instead of following the working directory."""
+    with pytest.raises(ValueError, match="absolute path"):
+        ColdStorageArchive("./archive")
+
+
+def test_policy_cutoffs() -> None:
+    """Cutoffs are floored to UTC midnight and unknown tables are rejected."""
+    policy = RetentionPolicy.with_overrides({"schedule_history": 10})
+    assert policy.cutoff("schedule_history", NOW) == datetime(2026, 6, 5, tzinfo=timezone.utc)
+    assert policy.cutoff("well_data_outputs", NOW) is None
+    with pytest.raises(ValueError, match="Unknown retention tables"):
+        RetentionPolicy.with_overrides({"protocol_runs": 1})
+
+
+@pytest.mark.asyncio
+async def test_call_log_payloads_are_archived_and_restorable(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """Old call logs keep their row and timing but their payloads move to the archive."""
+    run = await create_protocol_run(db_session)
+    old_logs = [
+        await create_function_call_log(
+            db_session,
+            protocol_run=run,
+            sequence_in_run=i,
+            created_at=OLD,
+            duration_ms=10 + i,
+            input_args_json={"kwargs": {"volume": i}},
+            state_after_json={"_is_diff": True, "diff": {"step": i}},
+        )
+        for i in range(3)
+    ]
+    recent = await create_function_call_log(
+        db_session, protocol_run=run, sequence_in_run=3, input_args_json={"kwargs": {}},
+    )
+
+    service = _service(tmp_path)
+    report = await service.run(db_session, now=NOW)
+    assert report.rows["function_call_logs"] == 3
+
+    table = FunctionCallLog.__table__
+    rows = {
+        row.accession_id: row
+        for row in (await db_session.execute(select(table))).all()
+    }
+    for log in old_logs:
+        row = rows[log.accession_id]
+        assert row.input_args_json is None
+        assert row.state_after_json is None
+        assert row.duration_ms == log.duration_ms
+        assert row.properties_json[ARCHIVE_MARKER].startswith("function_call_logs/2025-11/")
+    assert rows[recent.accession_id].input_args_json == {"kwargs": {}}
+
+    partitions = {rows[log.accession_id].properties_json[ARCHIVE_MARKER] for log in old_logs}
+    payloads = await service.read_call_payloads(partitions)
+    assert payloads[str(old_logs[2].accession_id)]["input_args_json"] == {"kwargs": {"volume": 2}}
+
+    # Compacted rows are not selected again.
+    assert (await service.run(db_session, now=NOW)).rows["function_call_logs"] == 0
+
+
+async def _log_old_events(db_session: AsyncSession) -> None:
+    entry = await create_schedule_entry(db_session)
+    for i, status in enumerate(
+        [ScheduleStatusEnum.COMPLETED, ScheduleStatusEnum.COMPLETED, ScheduleStatusEnum.FAILED],
+    ):
+        event = ScheduleHistory(
+            schedule_entry_accession_id=entry.accession_id,
+            event_type=ScheduleHistoryEventEnum.STATUS_CHANGED,
+            to_status=status,
+            override_duration_ms=100 * (i + 1),
+            error_details="boom" if status == ScheduleStatusEnum.FAILED else None,
+            created_at=OLD + timedelta(hours=i),
+        )
+        db_session.add(event)
+        await db_session.flush()
+        await record_schedule_event(db_session, event)
+
+
+async def _assert_old_metrics(db_session: AsyncSession) -> None:
+    metrics = await get_scheduling_metrics(
+        db_session, OLD - timedelta(days=1), OLD + timedelta(days=1),
+    )
+    assert metrics["status_counts"][ScheduleStatusEnum.COMPLETED] == 2
+    assert metrics["status_counts"][ScheduleStatusEnum.FAILED] == 1
+    assert metrics["error_count"] == 1
+    assert metrics["avg_duration_ms"] == 200
+    assert metrics["total_events"] == 3
+
+
+@pytest.mark.asyncio
+async def test_schedule_history_rollups_keep_metrics(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """Metrics over a compacted period are answered from the rollups."""
+    await _log_old_events(db_session)
+
+    report = await _service(tmp_path).run(db_session, now=NOW)
+    assert report.rows["schedule_history"] == 3
+    assert "schedule_history/2025-11" in report.partitions
+
+    remaining = await db_session.execute(
+        select(ScheduleHistory.__table__.c.accession_id).where(
+            ScheduleHistory.__table__.c.created_at < NOW - timedelta(days=90),
+        ),
+    )
+    assert remaining.all() == []
+    rollups = (
+        await db_session.execute(
+            select(ScheduleHistoryRollup).where(ScheduleHistoryRollup.bucket_seconds == DAILY),
+        )
+    ).scalars().all()
+    assert sum(rollup.event_count for rollup in rollups) == 3
+    await _assert_old_metrics(db_session)
+
+
+@pytest.mark.asyncio
+async def test_hourly_rollups_are_compacted_with_the_history(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """Hourly rollups before the cutoff are deleted; partial days resolve to whole days."""
+    await _log_old_events(db_session)
+    recent = ScheduleHistory(
+        schedule_entry_accession_id=(await create_schedule_entry(db_session)).accession_id,
+        event_type=ScheduleHistoryEventEnum.STATUS_CHANGED,
+        to_status=ScheduleStatusEnum.COMPLETED,
+        created_at=NOW - timedelta(days=1),
+    )
+    db_session.add(recent)
+    await db_session.flush()
+    await record_schedule_event(db_session, recent)
+    within_day = (OLD - timedelta(hours=1), OLD + timedelta(minutes=90))
+    before = await get_scheduling_metrics(db_session, *within_day)
+    assert before["total_events"] == 2  # the 12:00 and 13:00 events
+
+    report = await _service(tmp_path).run(db_session, now=NOW)
+    assert report.rows["schedule_history_rollups"] == 3
+
+    hourly = (
+        await db_session.execute(
+            select(ScheduleHistoryRollup).where(ScheduleHistoryRollup.bucket_seconds == HOURLY),
+        )
+    ).scalars().all()
+    assert [rollup.event_count for rollup in hourly] == [1]  # the recent event's hour
+    after = await get_scheduling_metrics(db_session, *within_day)
+    assert after["total_events"] == 3  # the whole compacted day
+    await _assert_old_metrics(db_session)
+
+
+@pytest.mark.asyncio
+async def test_interrupted_schedule_history_compaction_keeps_counts(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """A pass that stops after deleting one batch leaves the metrics exact."""
+    await _log_old_events(db_session)
+    service = _service(tmp_path, function_call_logs=None, asset_reservations=None)
+    archive = service._archive
+    calls = 0
+
+    async def archive_once(by_partition, report):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            msg = "interrupted"
+            raise RuntimeError(msg)
+        await archive(by_partition, report)
+
+    service._archive = archive_once
+    with pytest.raises(RuntimeError, match="interrupted"):
+        await service.run(db_session, now=NOW)
+
+    remaining = await db_session.execute(select(ScheduleHistory.__table__.c.accession_id))
+    assert len(remaining.all()) == 1
+    await _assert_old_metrics(db_session)
+
+
+@pytest.mark.asyncio
+async def test_only_terminal_reservations_are_purged(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """Expired reservations past retention are archived; live ones are kept."""
+    expired = await create_asset_reservation(
+        db_session, status=AssetReservationStatusEnum.EXPIRED,
+    )
+    active = await create_asset_reservation(
+        db_session, status=AssetReservationStatusEnum.ACTIVE,
+    )
+    for reservation in (expired, active):
+        reservation.created_at = OLD
+    await db_session.flush()
+
+    service = _service(tmp_path)
+    report = await service.run(db_session, now=NOW)
+    assert report.rows["asset_reservations"] == 1
+
+    table = AssetReservation.__table__
+    ids = set((await db_session.execute(select(table.c.accession_id))).scalars())
+    assert expired.accession_id not in ids
+    assert active.accession_id in ids
+    archived = service.archive.read("asset_reservations/2025-11")
+    assert [record["accession_id"] for record in archived] == [str(expired.accession_id)]
+    assert archived[0]["status"] == "expired"
+
+
+async def _expired_reservations(db_session: AsyncSession, count: int) -> list[AssetReservation]:
+    reservations = [
+        await create_asset_reservation(db_session, status=AssetReservationStatusEnum.EXPIRED)
+        for _ in range(count)
+    ]
+    for reservation in reservations:
+        reservation.created_at = OLD
+    await db_session.flush()
+    return reservations
+
+
+@pytest.mark.asyncio
+async def test_compactor_skips_pass_while_another_process_holds_the_lease(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """Only the process holding the lease compacts; the lease is released afterwards."""
+    await _expired_reservations(db_session, 1)
+    kv_store = InMemoryKeyValueStore()
+    other = {"owner": "another-worker"}
+    assert await kv_store.compare_and_set(COMPACTOR_LEASE_KEY, None, other, 600)
+
+    service = _service(tmp_path)
+    factory = _session_factory(db_session)
+    assert await service.run_exclusive(factory, kv_store, now=NOW) is None
+    assert service.archive.partitions("asset_reservations") == []
+
+    assert await kv_store.compare_and_set(COMPACTOR_LEASE_KEY, other, None)
+    report = await service.run_exclusive(factory, kv_store, now=NOW)
+    assert report is not None
+    assert report.rows["asset_reservations"] == 1
+    assert await kv_store.get(COMPACTOR_LEASE_KEY) is None
+
+
+@pytest.mark.asyncio
+async def test_compactor_stops_when_its_lease_is_taken_over(
+    db_session: AsyncSession,
+    tmp_path,
+) -> None:
+    """A pass whose lease was lost stops before committing and leaves the new lease alone."""
+    await _expired_reservations(db_session, 3)
+    kv_store = InMemoryKeyValueStore()
+    service = _service(tmp_path)
+    other = {"owner": "another-worker"}
+    archive = service._archive
+
+    async def archive_after_expiry(by_partition, report):
+        # Another worker claims the lease once it has expired mid-pass.
+        await kv_store.set(COMPACTOR_LEASE_KEY, other)
+        await archive(by_partition, report)
+
+    service._archive = archive_after_expiry
+    with pytest.raises(CompactorLeaseLostError):
+        await service.run_exclusive(_session_factory(db_session), kv_store, now=NOW)
+    assert await kv_store.get(COMPACTOR_LEASE_KEY) == other
@@ -0,0 +1,316 @@
+"""Tests for live run progress estimation."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.core.decorators import praxis_run_context_cv, protocol_function
+from praxis.backend.core.run_context import PraxisRunContext
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.models.domain.protocol import FunctionCallLog, FunctionProtocolDefinition
+from praxis.backend.models.enums import FunctionCallStatusEnum, ProtocolRunStatusEnum
+from praxis.backend.services.run_progress import (
+    DEFAULT_OPERATION_MS,
+    DurationModel,
+    RunProgressService,
+    RunProgressTracker,
+    fold_repeats,
+    graph_call_count,
+    read_run_progress,
+)
+from praxis.backend.utils.plr_static_analysis.models import (
+    LoopNode,
+    OperationNode,
+    ProtocolComputationGraph,
+)
+from praxis.backend.utils.uuid import uuid7
+from tests.helpers import create_protocol_definition, create_protocol_run
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Protocol function FQNs, as the @protocol_function decorator reports them.
+PREPARE = "protocols.serial_dilution.prepare_plate"
+TRANSFER = "protocols.serial_dilution.transfer_column"
+MIX = "protocols.serial_dilution.mix_column"
+READ = "protocols.serial_dilution.read_plate"
+TOP = "protocols.serial_dilution.serial_dilution"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _calls(iterations: int = 4) -> list[str]:
+    """prepare, then (transfer, mix) ``iterations`` times, then read and the top-level call."""
+    return [PREPARE, *[TRANSFER, MIX] * iterations, READ, TOP]
+
+
+def _model() -> DurationModel:
+    model = DurationModel()
+    for function, durations in {
+        PREPARE: [1800, 2200],
+        TRANSFER: [900, 1100],
+        MIX: [900, 1100],
+        READ: [1800, 2200],
+        TOP: [0, 0],
+    }.items():
+        for duration in durations:
+            model.observe(function, duration)
+    return model
+
+
+def _op(op_id: str, method: str) -> OperationNode:
+    return OperationNode(
+        id=op_id,
+        line_number=1,
+        method_name=method,
+        receiver_variable="lh",
+        receiver_type="LiquidHandler",
+    )
+
+
+def _graph() -> ProtocolComputationGraph:
+    """pick_up_tips, then (aspirate, dispense) 4 times, then drop_tips."""
+    return ProtocolComputationGraph(
+        protocol_fqn=TOP,
+        protocol_name="serial_dilution",
+        operations=[
+            _op("op_1", "pick_up_tips"),
+            _op("op_2", "aspirate"),
+            _op("op_3", "dispense"),
+            _op("op_4", "drop_tips"),
+        ],
+        loops=[LoopNode(id="loop_1", source_expression="wells", body=["op_2", "op_3"], iteration_count=4)],
+        execution_order=["op_1", "loop_1", "op_4"],
+    )
+
+
+def test_fold_repeats_finds_loops_in_a_call_sequence() -> None:
+    assert fold_repeats(_calls(3)) == [
+        ([PREPARE], 1),
+        ([TRANSFER, MIX], 3),
+        ([READ], 1),
+        ([TOP], 1),
+    ]
+    assert fold_repeats([MIX, MIX, MIX]) == [([MIX], 3)]
+    assert fold_repeats([]) == []
+
+
+def test_duration_model_falls_back_to_the_default() -> None:
+    model = DurationModel()
+    model.observe(TRANSFER, 1000)
+    model.observe(TRANSFER, 3000)
+
+    assert model.estimate(TRANSFER) == (2000, 2_000_000)
+    assert model.estimate(MIX)[0] == DEFAULT_OPERATION_MS
+    assert model.estimate(MIX, default_ms=5000)[0] == 5000
+
+
+def test_graph_call_count_repeats_loop_bodies() -> None:
+    assert graph_call_count(_graph()) == 10
+
+
+def test_calls_are_matched_onto_the_expected_sequence() -> None:
+    clock = FakeClock()
+    tracker = RunProgressTracker(_calls(), _model(), clock=clock)
+    assert tracker.estimate().steps_total == 11
+    assert tracker.estimate().remaining_s == pytest.approx(12.0)
+
+    steps = []
+    for function in [PREPARE, TRANSFER, MIX, TRANSFER, MIX]:
+        clock.now += 1.0
+        assert tracker.observe_call(function)
+        steps.append(tracker.estimate().steps_done)
+    assert steps == [1, 2, 3, 4, 5]
+
+    # The remaining iterations were skipped: the loop ended early.
+    clock.now += 1.0
+    assert tracker.observe_call(READ)
+    assert tracker.estimate().steps_done == 10
+    assert not tracker.observe_call("protocols.other.unexpected")
+    assert tracker.estimate().calls_unmatched == 1
+    assert tracker.observe_call(TOP)
+    assert tracker.estimate().steps_done == 11
+
+
+def test_loop_running_longer_than_expected_extends_it() -> None:
+    tracker = RunProgressTracker(_calls(iterations=2), _model(), clock=FakeClock())
+    assert tracker.estimate().steps_total == 7
+
+    for function in [PREPARE, *[TRANSFER, MIX] * 3]:
+        assert tracker.observe_call(function)
+    assert tracker.estimate().steps_total == 9
+    assert tracker.observe_call(READ)
+    assert tracker.estimate().steps_done == 8
+
+
+def test_durations_are_measured_between_completed_calls() -> None:
+    clock = FakeClock()
+    model = DurationModel()
+    tracker = RunProgressTracker([PREPARE, TOP], model, clock=clock)
+
+    clock.now += 5.0
+    tracker.observe_call(PREPARE, duration_ms=3000.0)
+    clock.now += 2.0
+    tracker.observe_call(TOP, duration_ms=7000.0)
+
+    # The first call counts its own duration; the enclosing call only the time after it.
+    assert model.estimate(PREPARE)[0] == 3000.0
+    assert model.estimate(TOP)[0] == 2000.0
+
+
+def test_eta_has_bounds_and_follows_the_run_pace() -> None:
+    clock = FakeClock()
+    tracker = RunProgressTracker(_calls(), _model(), clock=clock)
+
+    estimate = tracker.estimate()
+    assert estimate.fraction == 0.0
+    assert estimate.remaining_low_s < estimate.remaining_s < estimate.remaining_high_s
+
+    # Every call takes four times as long as expected.
+    for function in [PREPARE, TRANSFER, MIX, TRANSFER, MIX]:
+        clock.now += 8.0 if function == PREPARE else 4.0
+        tracker.observe_call(function)
+    slow = tracker.estimate()
+    assert tracker.pace > 1
+    assert slow.remaining_s > 6.0  # 6 s of calls left at the expected pace
+    assert 0 < slow.fraction < 1
+
+    # Time since the last call counts towards the call in flight.
+    clock.now += 1.0
+    assert tracker.estimate().remaining_s < slow.remaining_s
+    assert tracker.estimate().fraction > slow.fraction
+
+    # A published estimate moves on the same way.
+    assert slow.advanced(1.0).remaining_s == pytest.approx(tracker.estimate().remaining_s)
+
+
+async def _completed_run(
+    db_session: AsyncSession,
+    top: FunctionProtocolDefinition,
+    child: FunctionProtocolDefinition,
+) -> None:
+    """A completed run of ``top``: ``child`` three times (2 s each), then ``top`` 1 s later."""
+    run = await create_protocol_run(
+        db_session, protocol_definition=top, status=ProtocolRunStatusEnum.COMPLETED
+    )
+    calls = [(child, 2, 2000), (child, 4, 2000), (child, 6, 2000), (top, 7, 7000)]
+    for sequence, (definition, end_s, duration_ms) in enumerate(calls, start=1):
+        db_session.add(
+            FunctionCallLog(
+                name=f"call_{uuid7()}",
+                protocol_run_accession_id=run.accession_id,
+                function_protocol_definition_accession_id=definition.accession_id,
+                sequence_in_run=sequence,
+                status=FunctionCallStatusEnum.SUCCESS,
+                start_time=START + timedelta(seconds=end_s) - timedelta(milliseconds=duration_ms),
+                end_time=START + timedelta(seconds=end_s),
+                duration_ms=duration_ms,
+            ),
+        )
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_expected_calls_come_from_the_last_completed_run(db_session: AsyncSession) -> None:
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    top = await create_protocol_definition(db_session, computation_graph_json=_graph().model_dump(mode="json"))
+    child = await create_protocol_definition(db_session)
+    service = RunProgressService()
+
+    # Never run: the top-level call only, sized from the computation graph.
+    assert await service.expected_calls(factory, top) == ([top.fqn], 10 * DEFAULT_OPERATION_MS)
+
+    await _completed_run(db_session, top, child)
+
+    calls, _ = await service.expected_calls(factory, top)
+    assert calls == [child.fqn, child.fqn, child.fqn, top.fqn]
+    assert service.history_loaded
+
+    # History was loaded before the run existed; a fresh service learns from it.
+    service = RunProgressService()
+    expected = await service.estimate_duration(factory, top)
+    assert service.model.estimate(child.fqn)[0] == 2000
+    assert service.model.estimate(top.fqn)[0] == 1000
+    assert expected.mean_ms == pytest.approx(7000)
+    assert expected.low_ms < expected.mean_ms < expected.high_ms
+
+
+@pytest.mark.asyncio
+async def test_estimates_are_shared_through_the_key_value_store(db_session: AsyncSession) -> None:
+    factory = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    top = await create_protocol_definition(db_session)
+    child = await create_protocol_definition(db_session)
+    await _completed_run(db_session, top, child)
+    kv_store = InMemoryKeyValueStore()
+    service = RunProgressService()
+    run_id = uuid7()
+
+    await service.start_run(factory, run_id, top, kv_store=kv_store)
+    await service.observe_call(run_id, child.fqn, 2000.0)
+
+    # Another process (e.g. the API serving the run status) only sees the store.
+    published = await read_run_progress(kv_store, run_id)
+    assert published is not None
+    assert published.steps_done == 1
+    assert published.steps_total == 4
+    assert 0 < published.fraction < 1
+
+    final = await service.finish_run(run_id)
+    assert final.fraction == 1.0
+    assert final.remaining_s == 0.0
+    assert service.estimate(run_id) is None
+    assert await read_run_progress(kv_store, run_id) is None
+
+
+@pytest.mark.asyncio
+async def test_decorated_calls_are_reported_by_fqn() -> None:
+    @protocol_function(name="transfer_column", is_top_level=False)
+    async def transfer_column() -> None:
+        return None
+
+    transfer_column._protocol_runtime_info.db_accession_id = uuid7()
+    fqn = transfer_column._protocol_definition.fqn
+    run_id = uuid7()
+    tracker = RunProgressTracker([fqn], DurationModel())
+    context = Mock(spec=PraxisRunContext)
+    context.run_accession_id = run_id
+    context.current_db_session = AsyncMock()
+    context.call_log_writer = None
+    context.canonical_state = None
+    context.runtime = None
+
+    with (
+        patch(
+            "praxis.backend.core.decorators.protocol_decorator._process_wrapper_arguments",
+            new_callable=AsyncMock,
+        ) as process,
+        patch(
+            "praxis.backend.core.decorators.protocol_decorator._handle_control_commands",
+            new_callable=AsyncMock,
+        ),
+        patch(
+            "praxis.backend.core.decorators.protocol_decorator.log_function_call_end",
+            new_callable=AsyncMock,
+        ),
+        patch("praxis.backend.core.decorators.protocol_decorator.run_progress") as progress,
+    ):
+        process.return_value = (uuid7(), context, praxis_run_context_cv.set(context))
+        progress.observe_call = AsyncMock(
+            side_effect=lambda _run, function, duration_ms: tracker.observe_call(function, duration_ms),
+        )
+        token = praxis_run_context_cv.set(context)
+        try:
+            await transfer_column()
+        finally:
+            praxis_run_context_cv.reset(token)
+
+    progress.observe_call.assert_awaited_once()
+    assert progress.observe_call.await_args.args[:2] == (run_id, fqn)
+    assert tracker.calls_matched == 1
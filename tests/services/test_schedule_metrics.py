@@ -0,0 +1,115 @@
+"""Tests for the pre-aggregated scheduling metrics engine."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.schedule import ScheduleHistory, ScheduleHistoryRollup
+from praxis.backend.models.enums import ScheduleHistoryEventEnum, ScheduleStatusEnum
+from praxis.backend.services.schedule_metrics import (
+    DAILY,
+    HOURLY,
+    QUEUE_WAIT_KEY,
+    compute_scheduling_metrics,
+    histogram_bin,
+    histogram_percentile,
+    rebuild_schedule_rollups,
+)
+from praxis.backend.services.scheduler import get_scheduling_metrics, schedule_entry_service
+from tests.factories_schedule import create_schedule_entry
+
+BASE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+STATUSES = [ScheduleStatusEnum.COMPLETED, ScheduleStatusEnum.FAILED, None]
+
+
+def test_histogram_percentiles_are_within_bin_accuracy() -> None:
+    """Percentiles read from the log-scale histogram are within ~10% of the exact value."""
+    histogram: dict[int, int] = {}
+    for value in range(1, 1001):
+        histogram[histogram_bin(value)] = histogram.get(histogram_bin(value), 0) + 1
+
+    assert histogram_percentile(histogram, 0.5) == pytest.approx(500, rel=0.1)
+    assert histogram_percentile(histogram, 0.95) == pytest.approx(950, rel=0.1)
+    assert histogram_percentile({}, 0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_rollup_windows_match_raw_events(db_session: AsyncSession) -> None:
+    """Windows of any alignment give the same counts as scanning the raw events."""
+    entry = await create_schedule_entry(db_session)
+    rng = random.Random(7)
+    events = []
+    for _ in range(120):
+        created_at = BASE + timedelta(minutes=rng.randrange(3 * 24 * 60))
+        status = rng.choice(STATUSES)
+        duration = rng.randrange(10, 5000) if status else None
+        events.append((created_at, status, duration))
+        db_session.add(
+            ScheduleHistory(
+                schedule_entry_accession_id=entry.accession_id,
+                event_type=ScheduleHistoryEventEnum.STATUS_CHANGED,
+                to_status=status,
+                override_duration_ms=duration,
+                error_details="boom" if status == ScheduleStatusEnum.FAILED else None,
+                event_data_json={QUEUE_WAIT_KEY: 1000} if status else None,
+                created_at=created_at,
+            ),
+        )
+    await db_session.flush()
+    assert await rebuild_schedule_rollups(db_session, BASE, BASE + timedelta(days=3)) == 120
+
+    windows = [
+        (BASE, BASE + timedelta(days=3)),
+        (BASE + timedelta(hours=5, minutes=17), BASE + timedelta(days=2, hours=3, minutes=41)),
+        (BASE + timedelta(minutes=20), BASE + timedelta(minutes=50)),
+        (BASE + timedelta(hours=23, minutes=30), BASE + timedelta(days=1, hours=2, minutes=5)),
+    ]
+    for start, end in windows:
+        selected = [event for event in events if start <= event[0] <= end]
+        metrics = await compute_scheduling_metrics(db_session, start, end)
+        durations = [duration for _, _, duration in selected if duration is not None]
+
+        assert metrics["total_events"] == len(selected)
+        assert metrics["error_count"] == sum(
+            1 for _, status, _ in selected if status == ScheduleStatusEnum.FAILED
+        )
+        for status in STATUSES:
+            expected = sum(1 for _, s, _ in selected if s == status)
+            assert metrics["status_counts"].get(status, 0) == expected
+        assert metrics["avg_duration_ms"] == pytest.approx(sum(durations) / len(durations))
+        assert metrics["duration_max_ms"] == max(durations)
+        assert metrics["duration_p50_ms"] == pytest.approx(
+            sorted(durations)[len(durations) // 2], rel=0.25,
+        )
+        assert metrics["queue_wait_p95_ms"] == pytest.approx(1000, rel=0.1)
+
+
+@pytest.mark.asyncio
+async def test_status_updates_maintain_rollups(db_session: AsyncSession) -> None:
+    """Logged events are counted into hourly and daily rollups as they happen."""
+    entry = await create_schedule_entry(db_session)
+    await schedule_entry_service.update_status(
+        db_session, entry.accession_id, ScheduleStatusEnum.EXECUTING,
+    )
+    await schedule_entry_service.update_status(
+        db_session,
+        entry.accession_id,
+        ScheduleStatusEnum.COMPLETED,
+        started_at=datetime.now(timezone.utc) - timedelta(seconds=30),
+    )
+
+    rollups = (await db_session.execute(select(ScheduleHistoryRollup))).scalars().all()
+    hourly = [rollup for rollup in rollups if rollup.bucket_seconds == HOURLY]
+    daily = [rollup for rollup in rollups if rollup.bucket_seconds == DAILY]
+    assert sum(rollup.event_count for rollup in hourly) == 2
+    assert sum(rollup.event_count for rollup in daily) == 2
+
+    now = datetime.now(timezone.utc)
+    metrics = await get_scheduling_metrics(db_session, now - timedelta(days=2), now)
+    assert metrics["total_events"] == 2
+    assert metrics["status_counts"][ScheduleStatusEnum.COMPLETED] == 1
+    assert metrics["queue_wait_max_ms"] is not None
+    assert metrics["duration_max_ms"] == pytest.approx(30_000, rel=0.05)
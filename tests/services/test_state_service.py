@@ -1,107 +1,177 @@
-import json
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from redis.exceptions import ConnectionError, RedisError
+import pytest_asyncio
 
 from praxis.backend.configure import PraxisConfiguration
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
+from praxis.backend.core.storage.sqlite_adapter import SqliteKeyValueStore
 from praxis.backend.services.state import PraxisState
 
 
-@pytest.fixture
-def mock_redis():
-    with patch("praxis.backend.services.state.redis.Redis") as mock:
-        client = MagicMock()
-        mock.return_value = client
-        yield mock
+class CountingStore(InMemoryKeyValueStore):
+    """In-memory store that records the hash writes it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hset_calls: list[dict] = []
+
+    async def hset(self, key, mapping):
+        self.hset_calls.append(dict(mapping))
+        return await super().hset(key, mapping)
+
+
+@pytest_asyncio.fixture
+async def store():
+    kv = CountingStore()
+    yield kv
+    await kv.close()
+
 
 @pytest.fixture
 def config():
     mock_config = MagicMock(spec=PraxisConfiguration)
-    mock_config.redis_host = "localhost"
-    mock_config.redis_port = 6379
-    mock_config.redis_db = 0
+    mock_config.redis_host = "redis.local"
+    mock_config.redis_port = 6380
+    mock_config.redis_db = 2
     return mock_config
 
-def test_init_state_success(mock_redis, config):
-    state = PraxisState(config=config)
-    assert state.redis_client is not None
-    mock_redis.assert_called_once()
-    state.redis_client.ping.assert_called_once()
 
-def test_init_state_connection_error(mock_redis, config):
-    mock_redis.return_value.ping.side_effect = ConnectionError("Connection failed")
-    with pytest.raises(ConnectionError):
-        PraxisState(config=config)
+def test_default_store_uses_configured_redis(config):
+    state = PraxisState(config=config)
+    assert isinstance(state._store, RedisKeyValueStore)
+    assert (state._store._host, state._store._port, state._store._db) == ("redis.local", 6380, 2)
 
-def test_state_operations(mock_redis, config):
-    client = mock_redis.return_value
-    # Mock get to return empty dict (json dumped)
-    client.get.return_value = json.dumps({}).encode("utf-8")
 
-    state = PraxisState(config=config)
+@pytest.mark.asyncio
+async def test_state_operations(store):
+    state = PraxisState(store=store)
 
-    # Set
     state["key1"] = "value1"
     assert state["key1"] == "value1"
-    # Assert save called
-    client.set.assert_called()
+    assert state.get("key1") == "value1"
 
-    # Get
-    val = state.get("key1")
-    assert val == "value1"
-
-    # Update
     state.update({"key2": "value2"})
     assert state["key2"] == "value2"
 
-    # Delete
     del state["key1"]
     assert "key1" not in state
 
-    # Clear
+    await state.flush()
+    assert await store.hgetall(state.store_key) == {"key2": "value2"}
+
     state.clear()
     assert len(state) == 0
-    client.delete.assert_called_with(state.redis_key)
+    await state.flush()
+    assert await store.exists(state.store_key) is False
 
-def test_load_from_redis(mock_redis, config):
-    client = mock_redis.return_value
-    data = {"existing": "data"}
-    client.get.return_value = json.dumps(data).encode("utf-8")
 
-    state = PraxisState(config=config)
+@pytest.mark.asyncio
+async def test_load_existing_fields(store):
+    state = PraxisState(store=store)
+    await store.hset(state.store_key, {"existing": "data"})
+
+    await state.load()
     assert state["existing"] == "data"
 
-def test_attribute_access(mock_redis, config):
-    client = mock_redis.return_value
-    client.get.return_value = json.dumps({}).encode("utf-8")
 
-    state = PraxisState(config=config)
+@pytest.mark.asyncio
+async def test_load_store_error():
+    failing = MagicMock()
+    failing.hgetall = AsyncMock(side_effect=ConnectionError("Fail"))
+    state = PraxisState(store=failing)
+
+    await state.load()
+    assert len(state) == 0
+
+
+@pytest.mark.asyncio
+async def test_attribute_access(store):
+    state = PraxisState(store=store)
     state.new_attr = "value"
     assert state["new_attr"] == "value"
     assert state.new_attr == "value"
 
-def test_invalid_value_type(mock_redis, config):
-    client = mock_redis.return_value
-    client.get.return_value = json.dumps({}).encode("utf-8")
-    state = PraxisState(config=config)
+
+@pytest.mark.asyncio
+async def test_invalid_value_type(store):
+    state = PraxisState(store=store)
 
     class Unserializable:
         pass
 
     with pytest.raises(TypeError):
         state["key"] = Unserializable()
+    with pytest.raises(TypeError):
+        state.update({"ok": 1, "key": Unserializable()})
+    with pytest.raises(ValueError):
+        state[""] = 1
+    assert len(state) == 0
 
-def test_load_json_error(mock_redis, config):
-    client = mock_redis.return_value
-    client.get.return_value = b"invalid json"
 
-    state = PraxisState(config=config)
-    assert len(state) == 0 # Should handle error and return empty
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_writes(store):
+    state = PraxisState(store=store, flush_interval_seconds=0.01)
+    state["static"] = "x"
+    await state.flush()
+    store.hset_calls.clear()
 
-def test_load_redis_error(mock_redis, config):
-    client = mock_redis.return_value
-    client.get.side_effect = RedisError("Fail")
+    for i in range(100):
+        state["counter"] = i
+    await asyncio.sleep(0.05)
 
-    state = PraxisState(config=config)
-    assert len(state) == 0
+    # One write, carrying only the field that changed.
+    assert store.hset_calls == [{"counter": 99}]
+    assert await store.hgetall(state.store_key) == {"static": "x", "counter": 99}
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_changes(store):
+    state = PraxisState(store=store, flush_interval_seconds=60)
+    state["key"] = "value"
+    assert await store.hgetall(state.store_key) == {}
+
+    await state.close()
+    assert await store.hgetall(state.store_key) == {"key": "value"}
+    assert state._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_changes_pending(store):
+    state = PraxisState(store=store, flush_interval_seconds=60)
+    state["key"] = "value"
+    store.hset = AsyncMock(side_effect=ConnectionError("down"))
+
+    with pytest.raises(ConnectionError):
+        await state.flush()
+
+    del store.hset
+    await state.close()
+    assert await store.hgetall(state.store_key) == {"key": "value"}
+
+
+def test_mutations_without_event_loop_wait_for_flush():
+    kv = InMemoryKeyValueStore()
+    state = PraxisState(store=kv)
+    state["key"] = "value"
+    assert state._flush_task is None
+
+    asyncio.run(state.flush())
+    assert asyncio.run(kv.hgetall(state.store_key)) == {"key": "value"}
+
+
+@pytest.mark.asyncio
+async def test_state_persists_as_sqlite_rows(tmp_path):
+    kv = SqliteKeyValueStore(str(tmp_path / "kv.db"))
+    try:
+        state = PraxisState(store=kv)
+        state.update({"a": 1, "b": {"nested": [1, 2]}})
+        await state.close()
+
+        reloaded = PraxisState(store=kv, run_accession_id=state.run_accession_id)
+        await reloaded.load()
+        assert reloaded.to_dict() == {"a": 1, "b": {"nested": [1, 2]}}
+    finally:
+        await kv.close()
@@ -21,7 +21,11 @@ class TestPyodideIOPatch(unittest.TestCase):
                 del sys.modules[mod]
 
     def tearDown(self):
-        sys.modules = self.original_modules
+        # Restore in place: rebinding sys.modules would detach it from the import
+        # system and break pickling of modules imported by later tests.
+        for name in set(sys.modules) - set(self.original_modules):
+            del sys.modules[name]
+        sys.modules.update(self.original_modules)
 
     def test_serial_shim_injection(self):
         import pyodide_io_patch
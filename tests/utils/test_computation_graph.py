@@ -2,6 +2,12 @@
 
 import pytest
 
+from praxis.backend.core.simulation.graph_replay import replay_graph
+from praxis.backend.utils.plr_static_analysis.compact_graph import (
+  TABLE_MODELS,
+  TABLES,
+  CompactComputationGraph,
+)
 from praxis.backend.utils.plr_static_analysis.models import (
   GraphNodeType,
   PreconditionType,
@@ -212,6 +218,23 @@ class TestComputationGraphExtractor:
     assert graph is not None
     assert graph.has_loops is True
 
+  def test_loop_body_is_stored_once(self) -> None:
+    """Test that a for loop becomes a LoopNode holding its body."""
+    graph = extract_graph_from_source(
+      LOOP_PROTOCOL_SOURCE, "multi_well_transfer", "test_module"
+    )
+    assert graph is not None
+    assert len(graph.loops) == 1
+    loop = graph.loops[0]
+    assert loop.source_expression == "enumerate(zip(source_wells, dest_wells))"
+    assert loop.iteration_count is None
+    assert [graph.get_operation(op_id).method_name for op_id in loop.body] == [
+      "aspirate",
+      "dispense",
+    ]
+    assert graph.execution_order == ["op_1", loop.id, "op_4"]
+    assert [op.id for op in graph.ordered_operations()] == ["op_1", "op_2", "op_3", "op_4"]
+
   def test_conditional_protocol_detects_conditionals(self) -> None:
     """Test that conditional protocol is detected."""
     graph = extract_graph_from_source(
@@ -416,3 +439,87 @@ async def empty_protocol(lh: LiquidHandler):
     graph = extract_graph_from_source(source, "empty_protocol", "test")
     assert graph is not None
     assert len(graph.operations) == 0
+
+
+class TestCompactComputationGraph:
+  """Tests for the columnar CompactComputationGraph."""
+
+  def _graph(self) -> ProtocolComputationGraph:
+    graph = extract_graph_from_source(
+      LOOP_PROTOCOL_SOURCE, "multi_well_transfer", "test_module"
+    )
+    assert graph is not None
+    # Exercise the values the extractor leaves empty
+    graph.operations[0].preconditions.append("external_precondition")
+    graph.preconditions[0].satisfied_by = graph.operations[0].id
+    graph.preconditions[0].required_state = {"volume": 50.0, "wells": ["A1", "A2"]}
+    graph.resources["alias"] = graph.resources["source"].model_copy(
+      update={"items_x": 12, "items_y": None}
+    )
+    return graph
+
+  def test_round_trip_is_lossless(self) -> None:
+    """Converting to columns and back reproduces the graph."""
+    graph = self._graph()
+    compact = CompactComputationGraph.from_graph(graph)
+
+    assert compact.to_graph() == graph
+    assert compact.to_graph().model_dump_json() == graph.model_dump_json()
+    assert compact.num_operations == len(graph.operations)
+
+  def test_columns_cover_every_model_field(self) -> None:
+    """Each table stores exactly its model's fields, so no field is dropped."""
+    collections = {"operations", "resources", "preconditions", "loops"}
+    for name, columns in TABLES.items():
+      model = TABLE_MODELS[name]
+      stored = {column for column, _ in columns} - {"key"}
+      expected = set(model.model_fields) - (collections if name == "graph" else set())
+      assert stored == expected, name
+      assert len(model.model_fields) < 32, name  # fits the int32 fields_unset bitmask
+
+  def test_round_trip_keeps_fields_set(self) -> None:
+    """Fields left at their defaults stay unset, so exclude_unset dumps match."""
+    graph = self._graph()
+    rebuilt = CompactComputationGraph.from_bytes(
+      CompactComputationGraph.from_graph(graph).to_bytes(),
+    ).to_graph()
+
+    assert rebuilt.model_dump(exclude_unset=True) == graph.model_dump(exclude_unset=True)
+    assert rebuilt.operations[0].model_fields_set == graph.operations[0].model_fields_set
+
+  def test_preconditions_are_adjacency_rows(self) -> None:
+    """Known precondition IDs become rows; unknown IDs are kept as strings."""
+    graph = self._graph()
+    compact = CompactComputationGraph.from_graph(graph)
+
+    rows = compact.operation_preconditions(0).tolist()
+    expected = [
+      next(i for i, p in enumerate(graph.preconditions) if p.id == precondition_id)
+      for precondition_id in graph.operations[0].preconditions[:-1]
+    ]
+    assert rows[:-1] == expected
+    assert rows[-1] < 0
+
+  def test_bytes_round_trip(self) -> None:
+    """The binary form loads back to the same graph, compressed or not."""
+    graph = self._graph()
+    compact = CompactComputationGraph.from_graph(graph)
+
+    for compress in (True, False):
+      data = compact.to_bytes(compress=compress)
+      assert CompactComputationGraph.from_bytes(data).to_graph() == graph
+
+  def test_from_bytes_rejects_other_data(self) -> None:
+    """Data without the compact graph header is refused."""
+    with pytest.raises(ValueError, match="not a compact computation graph"):
+      CompactComputationGraph.from_bytes(b'{"protocol_fqn": "x"}')
+
+  def test_replay_accepts_compact_graph(self) -> None:
+    """Replay gives the same result for the model and its compact bytes."""
+    graph = extract_graph_from_source(
+      SIMPLE_TRANSFER_SOURCE, "simple_transfer", "test_module"
+    )
+    assert graph is not None
+    data = CompactComputationGraph.from_graph(graph).to_bytes()
+
+    assert replay_graph(data).model_dump() == replay_graph(graph).model_dump()
@@ -0,0 +1,154 @@
+"""Tests for the shared compute executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from praxis.backend.utils.compute_executor import ComputeExecutor
+from praxis.backend.utils.errors import ComputeCancelledError
+
+
+class FakeRequest:
+  """Stand-in for a Starlette request that can be disconnected on demand."""
+
+  def __init__(self) -> None:
+    self.disconnected = False
+
+  async def is_disconnected(self) -> bool:
+    return self.disconnected
+
+
+@pytest.fixture
+def executor():
+  executor = ComputeExecutor(max_workers=4, limits={"heavy": 2}, poll_interval_s=0.01)
+  yield executor
+  executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_per_key_limit_and_metrics(executor: ComputeExecutor) -> None:
+  """No more than ``limit`` calls of a key run at once; the rest are queued."""
+  lock = threading.Lock()
+  active = peak = 0
+
+  def work(value: int) -> int:
+    nonlocal active, peak
+    with lock:
+      active += 1
+      peak = max(peak, active)
+    time.sleep(0.05)
+    with lock:
+      active -= 1
+    return value * 2
+
+  results = await asyncio.gather(*(executor.run(work, i, key="heavy") for i in range(5)))
+
+  assert results == [0, 2, 4, 6, 8]
+  assert peak == 2
+  metrics = executor.metrics()["keys"]["heavy"]
+  assert metrics["completed"] == 5
+  assert metrics["max_queued"] >= 3
+  assert metrics["running"] == metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(executor: ComputeExecutor) -> None:
+  """Blocking work on the executor does not delay other coroutines."""
+
+  def heavy() -> None:
+    time.sleep(0.3)
+
+  async def ticks() -> float:
+    worst = 0.0
+    for _ in range(20):
+      began = time.perf_counter()
+      await asyncio.sleep(0.005)
+      worst = max(worst, time.perf_counter() - began)
+    return worst
+
+  _, _, worst_tick = await asyncio.gather(
+    executor.run(heavy, key="heavy"), executor.run(heavy, key="heavy"), ticks()
+  )
+
+  assert worst_tick < 0.1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_queued_work(executor: ComputeExecutor) -> None:
+  """A queued call whose client disconnects never runs."""
+  executor.set_limit("single", 1)
+  release = threading.Event()
+  ran: list[str] = []
+
+  def blocker() -> None:
+    release.wait(2)
+    ran.append("blocker")
+
+  def queued() -> None:
+    ran.append("queued")
+
+  request = FakeRequest()
+  first = asyncio.ensure_future(executor.run(blocker, key="single"))
+  second = asyncio.ensure_future(executor.run(queued, key="single", request=request))
+  await asyncio.sleep(0.05)
+  request.disconnected = True
+
+  with pytest.raises(ComputeCancelledError):
+    await second
+  release.set()
+  await first
+
+  assert ran == ["blocker"]
+  metrics = executor.metrics()["keys"]["single"]
+  assert metrics["cancelled"] == 1
+  assert metrics["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_abandoned_running_work_keeps_its_slot(executor: ComputeExecutor) -> None:
+  """Disconnecting from running work frees the slot only when the worker finishes."""
+  executor.set_limit("single", 1)
+  release = threading.Event()
+  request = FakeRequest()
+
+  running = asyncio.ensure_future(
+    executor.run(release.wait, 2, key="single", request=request),
+  )
+  await asyncio.sleep(0.05)
+  request.disconnected = True
+  with pytest.raises(ComputeCancelledError):
+    await running
+
+  assert executor.metrics()["keys"]["single"]["running"] == 1
+  release.set()
+  assert await executor.run(sum, [1, 2], key="single") == 3
+  assert executor.metrics()["keys"]["single"]["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_and_are_counted(executor: ComputeExecutor) -> None:
+  """Exceptions raised by the function reach the caller."""
+
+  def fail() -> None:
+    msg = "boom"
+    raise ValueError(msg)
+
+  with pytest.raises(ValueError, match="boom"):
+    await executor.run(fail)
+
+  assert executor.metrics()["keys"]["default"]["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_picklable_functions() -> None:
+  """Process executors run module-level functions in worker processes."""
+  executor = ComputeExecutor(kind="process", max_workers=1)
+  try:
+    assert await executor.run(pow, 2, 10) == 1024
+  finally:
+    executor.shutdown()
+
+  with pytest.raises(ValueError, match="kind"):
+    ComputeExecutor(kind="fiber")  # type: ignore[arg-type]
@@ -8,6 +8,8 @@ from pylabrobot.resources import Carrier, Plate, Resource, TipRack
 
 from praxis.backend.utils.type_inspection import (
     PLR_RESOURCE_TYPES,
+    TypeDescriptor,
+    describe_type,
     extract_resource_types,
     fqn_from_hint,
     get_element_type,
@@ -424,6 +426,52 @@ class TestIsContainerType:
         assert is_container_type(int) is False
 
 
+class TestDescribeType:
+
+    """Tests for the interned type descriptors."""
+
+    def test_describes_container_hint(self) -> None:
+        """Test that a container hint is fully described."""
+        assert describe_type("list[Well]") == TypeDescriptor(
+            resource_types=("Well",),
+            is_container=True,
+            element_type="Well",
+        )
+
+    def test_describes_machine_hint(self) -> None:
+        """Test that machine hints carry their machine category."""
+        assert describe_type("LiquidHandler").machine_type == "liquid_handler"
+        assert describe_type("HeaterShaker").machine_type == "heater_shaker"
+        assert describe_type("Plate").machine_type is None
+
+    def test_same_hint_returns_same_object(self) -> None:
+        """Test that repeated lookups share one descriptor."""
+        assert describe_type("list[TipSpot]") is describe_type("list[TipSpot]")
+        assert describe_type(list[Plate]) is describe_type(list[Plate])
+
+    def test_equivalent_hints_are_interned(self) -> None:
+        """Test that hints with the same meaning share one descriptor."""
+        assert describe_type("int") is describe_type("float")
+        assert describe_type("Sequence[Well]") is describe_type("list[Well]")
+
+    def test_unhashable_hint_is_described(self) -> None:
+        """Test that unhashable hints are parsed without caching."""
+
+        class Unhashable:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __str__(self) -> str:
+                return "LiquidHandler"
+
+        assert describe_type(Unhashable()).machine_type == "liquid_handler"
+
+    def test_wrappers_return_fresh_lists(self) -> None:
+        """Test that callers can mutate results without corrupting the cache."""
+        types = extract_resource_types("tuple[Plate, TipRack]")
+        types.append("Lid")
+        assert extract_resource_types("tuple[Plate, TipRack]") == ["Plate", "TipRack"]
+
+
 class TestPLRResourceTypes:
     """Tests for PLR_RESOURCE_TYPES constant."""
 